@@ -21,10 +21,15 @@ from datetime import datetime
 import re
 import time
 import uuid
+import os
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 
 from arco.models.prospect import Prospect, Technology, Contact
 from arco.core.error_handler import ProcessingErrorHandler, with_error_handling, RetryConfig
+from arco.engines.validator_engine import ValidatorEngine
+from arco.utils.csv_cache import CSVColumnarCache, get_csv_cache, iter_rows
 from arco.utils.progress_tracker import ProgressTracker, ProgressStage
 from arco.utils.logger import get_logger
 
@@ -40,6 +45,9 @@ class BatchProcessingConfig:
     enable_progress_tracking: bool = True
     enable_duplicate_detection: bool = True
     save_intermediate_results: bool = True
+    process_workers: int = 1  # >1 parses rows on a process pool, 0 uses every CPU core
+    process_chunk_size: int = 5000  # rows per process pool task
+    resolve_domains: bool = False  # drop prospects whose domain does not resolve
 
 
 @dataclass
@@ -73,7 +81,212 @@ class ProcessingStats:
         }
 
 
-class EnhancedCSVProspectAdapter:
+# Apollo CSV field mappings (first non-empty column wins)
+APOLLO_FIELD_MAPPING = {
+    'company_name': ['Company', 'Company Name', 'Company Name for Emails'],
+    'domain': ['Website'],
+    'industry': ['Industry'],
+    'employee_count': ['# Employees', 'Number of Employees'],
+    'country': ['Company Country'],
+    'city': ['Company City'],
+    'state': ['Company State'],
+    'phone': ['Company Phone'],
+    'linkedin': ['Company Linkedin Url'],
+    'technologies': ['Technologies'],
+    'funding': ['Total Funding', 'Latest Funding Amount'],
+    'revenue': ['Annual Revenue'],
+    'description': ['Short Description'],
+    'founded_year': ['Founded Year']
+}
+
+
+class ApolloRowParser:
+    """
+    Stateless parser for Apollo CSV rows.
+    
+    Parsing is pure CPU work, so this class holds no tracker, error handler
+    or file state and can be created cheaply inside worker processes.
+    """
+    
+    def __init__(self):
+        """Initialize the row parser."""
+        self.apollo_field_mapping = APOLLO_FIELD_MAPPING
+        self._technology_categories: Dict[str, str] = {}  # the same names repeat across rows
+        self._logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+    
+    def parse_row(self, row: Dict[str, str]) -> Optional[Prospect]:
+        """
+        Parse a single CSV row into a Prospect object.
+        
+        Args:
+            row: CSV row as dictionary
+            
+        Returns:
+            Prospect object, or None if the row has neither company name nor domain
+        """
+        # Extract basic company information
+        company_name = self._get_field_value(row, 'company_name')
+        domain = self._get_field_value(row, 'domain')
+        
+        if not company_name and not domain:
+            return None
+        
+        # Clean domain
+        if domain:
+            domain = self._clean_domain(domain)
+        
+        if not domain:
+            domain = f"{company_name.replace(' ', '').lower()}.com" if company_name else "unknown.com"
+        
+        # Create prospect (only fields the Prospect model has)
+        prospect = Prospect(
+            domain=domain,
+            company_name=company_name or domain,
+            industry=self._get_field_value(row, 'industry') or "",
+            employee_count=self._parse_int(self._get_field_value(row, 'employee_count')),
+            country=self._get_field_value(row, 'country') or ""
+        )
+        
+        # Parse technologies
+        technologies_str = self._get_field_value(row, 'technologies')
+        if technologies_str:
+            prospect.technologies = self._parse_technologies(technologies_str)
+        
+        return prospect
+    
+    def _get_field_value(self, row: Dict[str, str], field_type: str) -> Optional[str]:
+        """Get field value using field mapping."""
+        possible_fields = self.apollo_field_mapping.get(field_type, [])
+        
+        for field in possible_fields:
+            if field in row and row[field] and row[field].strip():
+                return row[field].strip()
+        
+        return None
+    
+    def _clean_domain(self, domain: str) -> str:
+        """Clean and normalize domain."""
+        if not domain:
+            return ""
+        
+        # Remove protocol
+        domain = re.sub(r'^https?://', '', domain)
+        domain = re.sub(r'^www\.', '', domain)
+        
+        # Remove trailing slash and paths
+        domain = domain.split('/')[0]
+        
+        # Remove port numbers
+        domain = domain.split(':')[0]
+        
+        return domain.lower().strip()
+    
+    def _parse_int(self, value: Optional[str]) -> int:
+        """Parse integer value safely."""
+        if not value:
+            return 0
+        
+        try:
+            # Remove non-numeric characters except digits
+            cleaned = re.sub(r'[^\d]', '', str(value))
+            return int(cleaned) if cleaned else 0
+        except (ValueError, TypeError):
+            return 0
+    
+    def _parse_revenue(self, value: Optional[str]) -> Optional[int]:
+        """Parse revenue value safely."""
+        if not value or value.lower() in ['', 'unknown', 'n/a', 'null']:
+            return None
+        
+        try:
+            # Handle revenue ranges like "$1M - $5M"
+            value = str(value).upper()
+            
+            # Extract numbers and multipliers
+            if 'M' in value:
+                numbers = re.findall(r'(\d+(?:\.\d+)?)', value)
+                if numbers:
+                    return int(float(numbers[0]) * 1_000_000)
+            elif 'K' in value:
+                numbers = re.findall(r'(\d+(?:\.\d+)?)', value)
+                if numbers:
+                    return int(float(numbers[0]) * 1_000)
+            else:
+                # Try to parse as direct number
+                cleaned = re.sub(r'[^\d]', '', value)
+                return int(cleaned) if cleaned else None
+                
+        except (ValueError, TypeError):
+            pass
+        
+        return None
+    
+    def _parse_funding(self, value: Optional[str]) -> Optional[int]:
+        """Parse funding value safely."""
+        return self._parse_revenue(value)  # Same logic as revenue
+    
+    def _parse_technologies(self, technologies_str: str) -> List[Technology]:
+        """Parse technologies string into Technology objects."""
+        if not technologies_str:
+            return []
+        
+        technologies = []
+        
+        # Split by comma and clean
+        tech_names = [tech.strip() for tech in technologies_str.split(',') if tech.strip()]
+        
+        for tech_name in tech_names:
+            # Categorize technology
+            category = self._technology_categories.get(tech_name)
+            if category is None:
+                category = self._technology_categories[tech_name] = self._categorize_technology(tech_name)
+            
+            technology = Technology(
+                name=tech_name,
+                category=category,
+                detection_confidence=0.8  # High confidence from Apollo data
+            )
+            technologies.append(technology)
+        
+        return technologies
+    
+    def _categorize_technology(self, tech_name: str) -> str:
+        """Categorize technology based on name."""
+        tech_lower = tech_name.lower()
+        
+        # Analytics
+        if any(keyword in tech_lower for keyword in ['analytics', 'tracking', 'tag manager', 'pixel']):
+            return 'Analytics'
+        
+        # E-commerce
+        elif any(keyword in tech_lower for keyword in ['shopify', 'woocommerce', 'magento', 'commerce']):
+            return 'E-commerce'
+        
+        # Email/Marketing
+        elif any(keyword in tech_lower for keyword in ['klaviyo', 'mailchimp', 'email', 'marketing']):
+            return 'Email Marketing'
+        
+        # Payment
+        elif any(keyword in tech_lower for keyword in ['paypal', 'stripe', 'payment', 'afterpay']):
+            return 'Payment'
+        
+        # Cloud/Hosting
+        elif any(keyword in tech_lower for keyword in ['aws', 'cloudflare', 'hosting', 'cdn']):
+            return 'Infrastructure'
+        
+        # Social
+        elif any(keyword in tech_lower for keyword in ['facebook', 'twitter', 'social', 'instagram']):
+            return 'Social Media'
+        
+        # Development
+        elif any(keyword in tech_lower for keyword in ['jquery', 'react', 'angular', 'node', 'python']):
+            return 'Development'
+        
+        else:
+            return 'Other'
+
+
+class EnhancedCSVProspectAdapter(ApolloRowParser):
     """
     Enhanced CSV adapter for processing Apollo exports and other prospect data.
     
@@ -90,7 +303,8 @@ class EnhancedCSVProspectAdapter:
     def __init__(self, 
                  csv_path: str, 
                  config: Optional[BatchProcessingConfig] = None,
-                 error_handler: Optional[ProcessingErrorHandler] = None):
+                 error_handler: Optional[ProcessingErrorHandler] = None,
+                 csv_cache: Optional[CSVColumnarCache] = None):
         """
         Initialize the enhanced CSV adapter.
         
@@ -98,36 +312,21 @@ class EnhancedCSVProspectAdapter:
             csv_path: Path to the CSV file
             config: Batch processing configuration
             error_handler: Optional error handler for robust processing
+            csv_cache: Columnar CSV cache (defaults to the global cache)
         """
         self.csv_path = Path(csv_path)
         self.config = config or BatchProcessingConfig()
         self.error_handler = error_handler or ProcessingErrorHandler()
+        self.csv_cache = csv_cache or get_csv_cache()
+        self._frame = None  # memory-mapped table from the columnar cache
         self.progress_tracker = ProgressTracker()
-        self._logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+        ApolloRowParser.__init__(self)
         
         # Processing state
         self.stats = ProcessingStats()
         self.processed_domains = set()  # For duplicate detection
         self.session_id = str(uuid.uuid4())[:8]
         
-        # Apollo CSV field mappings
-        self.apollo_field_mapping = {
-            'company_name': ['Company', 'Company Name', 'Company Name for Emails'],
-            'domain': ['Website'],
-            'industry': ['Industry'],
-            'employee_count': ['# Employees', 'Number of Employees'],
-            'country': ['Company Country'],
-            'city': ['Company City'],
-            'state': ['Company State'],
-            'phone': ['Company Phone'],
-            'linkedin': ['Company Linkedin Url'],
-            'technologies': ['Technologies'],
-            'funding': ['Total Funding', 'Latest Funding Amount'],
-            'revenue': ['Annual Revenue'],
-            'description': ['Short Description'],
-            'founded_year': ['Founded Year']
-        }
-        
         self._logger.info(f"🚀 Enhanced CSV Adapter initialized - Session: {self.session_id}")
         self._logger.info(f"📊 Config: batch_size={self.config.batch_size}, "
                          f"rate_limit={self.config.rate_limit_delay}s, "
@@ -201,8 +400,18 @@ class EnhancedCSVProspectAdapter:
         finally:
             loop.close()
     
+    def _load_frame(self):
+        """Load the CSV through the columnar cache (once per adapter)."""
+        if self._frame is None:
+            self._frame = self.csv_cache.load(str(self.csv_path))
+        return self._frame
+    
     async def _count_csv_rows(self) -> int:
         """Count total rows in CSV for progress tracking."""
+        frame = self._load_frame()
+        if frame is not None:
+            return frame.height
+        
         try:
             with open(self.csv_path, 'r', encoding='utf-8', errors='ignore') as file:
                 return sum(1 for _ in csv.DictReader(file))
@@ -210,62 +419,75 @@ class EnhancedCSVProspectAdapter:
             self._logger.warning(f"Could not count CSV rows: {e}")
             return 0
     
+    def _iter_csv_rows(self) -> Iterator[Dict[str, Optional[str]]]:
+        """
+        Iterate over CSV rows as dictionaries.
+        
+        Rows come from the memory-mapped columnar cache, one batch at a time,
+        or from csv.DictReader when the cache is unavailable.
+        """
+        frame = self._load_frame()
+        if frame is not None:
+            for rows in iter_rows(frame, self.config.batch_size):
+                yield from rows
+            return
+        
+        with open(self.csv_path, 'r', encoding='utf-8', errors='ignore') as file:
+            yield from csv.DictReader(file)
+    
     async def _process_csv_in_batches(self) -> AsyncIterator[Tuple[List[Prospect], Dict[str, int]]]:
         """Process CSV file in batches with error handling."""
         
-        with open(self.csv_path, 'r', encoding='utf-8', errors='ignore') as file:
-            reader = csv.DictReader(file)
-            
-            batch = []
-            batch_stats = {"successful": 0, "failed": 0, "duplicates": 0}
-            row_count = 0
+        batch = []
+        batch_stats = {"successful": 0, "failed": 0, "duplicates": 0}
+        row_count = 0
+        
+        for row in self._iter_csv_rows():
+            row_count += 1
             
-            for row in reader:
-                row_count += 1
+            try:
+                # Parse prospect with error handling
+                prospect = await self._parse_prospect_row_async(row)
                 
-                try:
-                    # Parse prospect with error handling
-                    prospect = await self._parse_prospect_row_async(row)
+                if prospect:
+                    # Check for duplicates
+                    if self.config.enable_duplicate_detection:
+                        if prospect.domain in self.processed_domains:
+                            batch_stats["duplicates"] += 1
+                            self._logger.debug(f"Duplicate found: {prospect.domain}")
+                            continue
+                        else:
+                            self.processed_domains.add(prospect.domain)
                     
-                    if prospect:
-                        # Check for duplicates
-                        if self.config.enable_duplicate_detection:
-                            if prospect.domain in self.processed_domains:
-                                batch_stats["duplicates"] += 1
-                                self._logger.debug(f"Duplicate found: {prospect.domain}")
-                                continue
-                            else:
-                                self.processed_domains.add(prospect.domain)
-                        
-                        batch.append(prospect)
-                        batch_stats["successful"] += 1
-                        
-                        # Update progress tracking
-                        if self.config.enable_progress_tracking:
-                            await self._update_progress_tracking(prospect, row_count)
+                    batch.append(prospect)
+                    batch_stats["successful"] += 1
                     
-                except Exception as e:
-                    batch_stats["failed"] += 1
-                    error_msg = f"Row {row_count}: {str(e)}"
-                    self.stats.errors.append(error_msg)
-                    self._logger.warning(f"Failed to parse row {row_count}: {e}")
+                    # Update progress tracking
+                    if self.config.enable_progress_tracking:
+                        await self._update_progress_tracking(prospect, row_count)
                 
-                # Yield batch when full
-                if len(batch) >= self.config.batch_size:
-                    self._logger.debug(f"📦 Processing batch {self.stats.batches_processed + 1} "
-                                     f"({len(batch)} prospects)")
-                    yield batch, batch_stats
-                    
-                    # Reset for next batch
-                    batch = []
-                    batch_stats = {"successful": 0, "failed": 0, "duplicates": 0}
-                    self.stats.batches_processed += 1
+            except Exception as e:
+                batch_stats["failed"] += 1
+                error_msg = f"Row {row_count}: {str(e)}"
+                self.stats.errors.append(error_msg)
+                self._logger.warning(f"Failed to parse row {row_count}: {e}")
             
-            # Yield remaining prospects
-            if batch:
-                self._logger.debug(f"📦 Processing final batch ({len(batch)} prospects)")
+            # Yield batch when full
+            if len(batch) >= self.config.batch_size:
+                self._logger.debug(f"📦 Processing batch {self.stats.batches_processed + 1} "
+                                 f"({len(batch)} prospects)")
                 yield batch, batch_stats
+                
+                # Reset for next batch
+                batch = []
+                batch_stats = {"successful": 0, "failed": 0, "duplicates": 0}
                 self.stats.batches_processed += 1
+        
+        # Yield remaining prospects
+        if batch:
+            self._logger.debug(f"📦 Processing final batch ({len(batch)} prospects)")
+            yield batch, batch_stats
+            self.stats.batches_processed += 1
     
     @with_error_handling("parse_prospect_row", "csv_adapter")
     async def _parse_prospect_row_async(self, row: Dict[str, str]) -> Optional[Prospect]:
@@ -279,41 +501,54 @@ class EnhancedCSVProspectAdapter:
             Prospect object or None if parsing fails
         """
         try:
-            # Extract basic company information
-            company_name = self._get_field_value(row, 'company_name')
-            domain = self._get_field_value(row, 'domain')
-            
-            if not company_name and not domain:
-                return None
-            
-            # Clean domain
-            if domain:
-                domain = self._clean_domain(domain)
-            
-            # Create prospect (adapting to existing model structure)
-            prospect = Prospect(
-                domain=domain or f"{company_name.replace(' ', '').lower()}.com" if company_name else "unknown.com",
-                company_name=company_name,
-                website=f"https://{domain}" if domain else None,
-                description=self._get_field_value(row, 'description'),
-                industry=self._get_field_value(row, 'industry'),
-                employee_count=self._parse_int(self._get_field_value(row, 'employee_count')),
-                revenue=self._parse_revenue(self._get_field_value(row, 'revenue')),
-                country=self._get_field_value(row, 'country'),
-                city=self._get_field_value(row, 'city')
-            )
-            
-            # Parse technologies
-            technologies_str = self._get_field_value(row, 'technologies')
-            if technologies_str:
-                prospect.technologies = self._parse_technologies(technologies_str)
-            
-            return prospect
-            
+            return self.parse_row(row)
         except Exception as e:
             self._logger.warning(f"Failed to parse prospect row: {e}")
             raise  # Re-raise for error handler
     
+    async def merge_parsed_chunks(self, chunks: List[Any]) -> Tuple[List[Prospect], ProcessingStats]:
+        """
+        Merge row chunks parsed on the ingestion process pool.
+        
+        Applies the same duplicate detection, progress tracking and statistics
+        as load_prospects_async(), in row order.
+        
+        Args:
+            chunks: Results of _parse_csv_chunk() for this file, in row order
+                    (exceptions raised by a worker are re-raised)
+            
+        Returns:
+            Tuple of (prospects list, processing statistics)
+        """
+        prospects = []
+        
+        for chunk in chunks:
+            if isinstance(chunk, BaseException):
+                raise chunk
+            
+            self.stats.total_rows += chunk["rows"]
+            self.stats.failed_parses += chunk["failed"]
+            self.stats.errors.extend(chunk["errors"])
+            self.stats.processing_time += chunk["processing_time"]
+            
+            for row_number, prospect in chunk["prospects"]:
+                if self.config.enable_duplicate_detection:
+                    if prospect.domain in self.processed_domains:
+                        self.stats.duplicates_found += 1
+                        continue
+                    self.processed_domains.add(prospect.domain)
+                
+                prospects.append(prospect)
+                self.stats.successful_parses += 1
+                
+                if self.config.enable_progress_tracking:
+                    await self._update_progress_tracking(prospect, row_number)
+        
+        self.stats.batches_processed = -(-self.stats.successful_parses // max(1, self.config.batch_size))
+        self._log_final_stats()
+        
+        return prospects, self.stats
+    
     async def _update_progress_tracking(self, prospect: Prospect, row_number: int):
         """Update progress tracking for processed prospect."""
         try:
@@ -382,147 +617,135 @@ class EnhancedCSVProspectAdapter:
             "statistics": self.stats.to_dict(),
             "timestamp": datetime.now().isoformat()
         }
-    
 
+
+# Per-process state of the ingestion pool workers
+_worker_cache: Optional[CSVColumnarCache] = None
+_worker_parser: Optional[ApolloRowParser] = None
+
+
+def _init_parse_worker(cache_dir: str, cache_enabled: bool) -> None:
+    """Create the row parser and CSV cache of an ingestion pool worker."""
+    global _worker_cache, _worker_parser
+    _worker_cache = CSVColumnarCache(cache_dir=cache_dir, enabled=cache_enabled)
+    _worker_parser = ApolloRowParser()
+
+
+def _iter_chunk_rows(csv_path: str, start: int, length: Optional[int]) -> Iterator[Dict[str, Optional[str]]]:
+    """Iterate over the rows of a chunk from the columnar cache or csv.DictReader."""
+    if length is None:
+        with open(csv_path, 'r', encoding='utf-8', errors='ignore') as file:
+            yield from csv.DictReader(file)
+        return
+    
+    frame = _worker_cache.load(csv_path)
+    if frame is None:
+        raise RuntimeError(f"Columnar cache unavailable for {csv_path}")
+    yield from frame.slice(start, length).to_dicts()
+
+
+def _parse_csv_chunk(csv_path: str, start: int, length: Optional[int]) -> Dict[str, Any]:
+    """
+    Parse a chunk of CSV rows in an ingestion pool worker.
     
-    def _get_field_value(self, row: Dict[str, str], field_type: str) -> Optional[str]:
-        """Get field value using field mapping."""
-        possible_fields = self.apollo_field_mapping.get(field_type, [])
-        
-        for field in possible_fields:
-            if field in row and row[field] and row[field].strip():
-                return row[field].strip()
-        
-        return None
-    
-    def _clean_domain(self, domain: str) -> str:
-        """Clean and normalize domain."""
-        if not domain:
-            return ""
-        
-        # Remove protocol
-        domain = re.sub(r'^https?://', '', domain)
-        domain = re.sub(r'^www\.', '', domain)
-        
-        # Remove trailing slash and paths
-        domain = domain.split('/')[0]
-        
-        # Remove port numbers
-        domain = domain.split(':')[0]
-        
-        return domain.lower().strip()
-    
-    def _parse_int(self, value: Optional[str]) -> int:
-        """Parse integer value safely."""
-        if not value:
-            return 0
+    Args:
+        csv_path: Path to the CSV file
+        start: Index of the first row of the chunk
+        length: Number of rows, or None to parse the whole file with csv.DictReader
         
-        try:
-            # Remove non-numeric characters except digits
-            cleaned = re.sub(r'[^\d]', '', str(value))
-            return int(cleaned) if cleaned else 0
-        except (ValueError, TypeError):
-            return 0
+    Returns:
+        Dictionary with the parsed (row_number, prospect) pairs, row counts,
+        errors and processing time of the chunk
+    """
+    chunk_start = time.time()
+    prospects = []
+    errors = []
+    rows = 0
     
-    def _parse_revenue(self, value: Optional[str]) -> Optional[int]:
-        """Parse revenue value safely."""
-        if not value or value.lower() in ['', 'unknown', 'n/a', 'null']:
-            return None
-        
+    for row_number, row in enumerate(_iter_chunk_rows(csv_path, start, length), start + 1):
+        rows += 1
         try:
-            # Handle revenue ranges like "$1M - $5M"
-            value = str(value).upper()
-            
-            # Extract numbers and multipliers
-            if 'M' in value:
-                numbers = re.findall(r'(\d+(?:\.\d+)?)', value)
-                if numbers:
-                    return int(float(numbers[0]) * 1_000_000)
-            elif 'K' in value:
-                numbers = re.findall(r'(\d+(?:\.\d+)?)', value)
-                if numbers:
-                    return int(float(numbers[0]) * 1_000)
-            else:
-                # Try to parse as direct number
-                cleaned = re.sub(r'[^\d]', '', value)
-                return int(cleaned) if cleaned else None
-                
-        except (ValueError, TypeError):
-            pass
-        
-        return None
+            prospect = _worker_parser.parse_row(row)
+        except Exception as e:
+            errors.append(f"Row {row_number}: {str(e)}")
+            continue
+        if prospect:
+            prospects.append((row_number, prospect))
+    
+    return {
+        "prospects": prospects,
+        "rows": rows,
+        "failed": len(errors),
+        "errors": errors,
+        "processing_time": time.time() - chunk_start
+    }
+
+
+async def _parse_files_in_process_pool(csv_files: List[Path],
+                                       config: BatchProcessingConfig) -> Dict[Path, List[Any]]:
+    """
+    Parse CSV files on a process pool.
     
-    def _parse_funding(self, value: Optional[str]) -> Optional[int]:
-        """Parse funding value safely."""
-        return self._parse_revenue(value)  # Same logic as revenue
+    Files available through the columnar cache are split into chunks of
+    config.process_chunk_size rows, so a single large file is also spread
+    over every worker; other files are parsed whole by one worker.
     
-    def _parse_technologies(self, technologies_str: str) -> List[Technology]:
-        """Parse technologies string into Technology objects."""
-        if not technologies_str:
-            return []
-        
-        technologies = []
-        
-        # Split by comma and clean
-        tech_names = [tech.strip() for tech in technologies_str.split(',') if tech.strip()]
-        
-        for tech_name in tech_names:
-            # Categorize technology
-            category = self._categorize_technology(tech_name)
-            
-            technology = Technology(
-                name=tech_name,
-                category=category,
-                detection_confidence=0.8  # High confidence from Apollo data
-            )
-            technologies.append(technology)
+    Args:
+        csv_files: CSV files to parse
+        config: Batch processing configuration
         
-        return technologies
+    Returns:
+        Dictionary of CSV file to its chunk results (or worker exceptions) in row order
+    """
+    csv_cache = get_csv_cache()
+    tasks = []
+    for csv_file in csv_files:
+        frame = csv_cache.load(str(csv_file))
+        if frame is None:
+            tasks.append((csv_file, 0, None))
+            continue
+        chunk_size = max(1, config.process_chunk_size)
+        for start in range(0, frame.height, chunk_size):
+            tasks.append((csv_file, start, chunk_size))
+    
+    results = {csv_file: [] for csv_file in csv_files}
+    if not tasks:
+        return results
+    
+    workers = min(config.process_workers or os.cpu_count() or 1, len(tasks))
+    logger.info(f"⚙️ Parsing {len(tasks)} chunks on {workers} worker processes")
+    
+    # Spawn rather than fork: forking after polars has started its thread pool can deadlock
+    loop = asyncio.get_running_loop()
+    with ProcessPoolExecutor(max_workers=workers,
+                             mp_context=multiprocessing.get_context("spawn"),
+                             initializer=_init_parse_worker,
+                             initargs=(str(csv_cache.cache_dir), csv_cache.enabled)) as pool:
+        chunks = await asyncio.gather(
+            *(loop.run_in_executor(pool, _parse_csv_chunk, str(csv_file), start, length)
+              for csv_file, start, length in tasks),
+            return_exceptions=True
+        )
     
-    def _categorize_technology(self, tech_name: str) -> str:
-        """Categorize technology based on name."""
-        tech_lower = tech_name.lower()
-        
-        # Analytics
-        if any(keyword in tech_lower for keyword in ['analytics', 'tracking', 'tag manager', 'pixel']):
-            return 'Analytics'
-        
-        # E-commerce
-        elif any(keyword in tech_lower for keyword in ['shopify', 'woocommerce', 'magento', 'commerce']):
-            return 'E-commerce'
-        
-        # Email/Marketing
-        elif any(keyword in tech_lower for keyword in ['klaviyo', 'mailchimp', 'email', 'marketing']):
-            return 'Email Marketing'
-        
-        # Payment
-        elif any(keyword in tech_lower for keyword in ['paypal', 'stripe', 'payment', 'afterpay']):
-            return 'Payment'
-        
-        # Cloud/Hosting
-        elif any(keyword in tech_lower for keyword in ['aws', 'cloudflare', 'hosting', 'cdn']):
-            return 'Infrastructure'
-        
-        # Social
-        elif any(keyword in tech_lower for keyword in ['facebook', 'twitter', 'social', 'instagram']):
-            return 'Social Media'
-        
-        # Development
-        elif any(keyword in tech_lower for keyword in ['jquery', 'react', 'angular', 'node', 'python']):
-            return 'Development'
-        
-        else:
-            return 'Other'
+    for (csv_file, _, _), chunk in zip(tasks, chunks):
+        results[csv_file].append(chunk)
+    return results
 
 
 async def load_all_apollo_csvs_async(directory: str = "arco", 
-                                   config: Optional[BatchProcessingConfig] = None) -> Tuple[List[Prospect], Dict[str, Any]]:
+                                   config: Optional[BatchProcessingConfig] = None,
+                                   validator: Optional[ValidatorEngine] = None) -> Tuple[List[Prospect], Dict[str, Any]]:
     """
     Load prospects from all Apollo CSV files in the directory with enhanced async processing.
     
+    With ``config.resolve_domains`` every unique domain is pre-resolved in
+    bulk and prospects whose domain does not resolve are dropped, so no HTTP
+    work is ever spent on them.
+    
     Args:
         directory: Directory containing Apollo CSV files
         config: Batch processing configuration
+        validator: Validator engine used to pre-resolve domains (created on demand)
         
     Returns:
         Tuple of (combined list of all prospects, comprehensive processing report)
@@ -530,7 +753,7 @@ async def load_all_apollo_csvs_async(directory: str = "arco",
     logger.info(f"🔍 Loading all Apollo CSVs from {directory} with enhanced processing")
     
     directory_path = Path(directory)
-    csv_files = list(directory_path.glob("apollo-*.csv"))
+    csv_files = sorted(directory_path.glob("apollo-*.csv"))
     
     if not csv_files:
         logger.warning(f"No Apollo CSV files found in {directory}")
@@ -546,6 +769,11 @@ async def load_all_apollo_csvs_async(directory: str = "arco",
     
     logger.info(f"📊 Found {len(csv_files)} Apollo CSV files to process")
     
+    # Parse rows of every file on all cores, then merge per file below
+    parsed_chunks = None
+    if config.process_workers != 1:
+        parsed_chunks = await _parse_files_in_process_pool(csv_files, config)
+    
     for i, csv_file in enumerate(csv_files, 1):
         logger.info(f"📄 Processing file {i}/{len(csv_files)}: {csv_file.name}")
         
@@ -554,7 +782,10 @@ async def load_all_apollo_csvs_async(directory: str = "arco",
             adapter = EnhancedCSVProspectAdapter(str(csv_file), config)
             
             # Process file asynchronously
-            prospects, stats = await adapter.load_prospects_async()
+            if parsed_chunks is None:
+                prospects, stats = await adapter.load_prospects_async()
+            else:
+                prospects, stats = await adapter.merge_parsed_chunks(parsed_chunks[csv_file])
             
             # Collect results
             all_prospects.extend(prospects)
@@ -592,6 +823,14 @@ async def load_all_apollo_csvs_async(directory: str = "arco",
     
     final_prospects = list(unique_prospects.values())
     
+    # Pre-resolve every domain at once and drop the dead ones
+    unresolvable_removed = 0
+    if config.resolve_domains and final_prospects:
+        validator = validator or ValidatorEngine()
+        resolvable = await validator.filter_resolvable(final_prospects)
+        unresolvable_removed = len(final_prospects) - len(resolvable)
+        final_prospects = resolvable
+    
     # Create comprehensive report
     comprehensive_report = {
         "session_summary": {
@@ -600,17 +839,21 @@ async def load_all_apollo_csvs_async(directory: str = "arco",
             "total_prospects_loaded": len(all_prospects),
             "unique_prospects_after_deduplication": len(final_prospects),
             "global_duplicates_removed": duplicates_removed,
+            "unresolvable_domains_removed": unresolvable_removed,
             "total_processing_time": total_stats.processing_time,
             "overall_success_rate": total_stats.get_success_rate()
         },
         "aggregated_statistics": total_stats.to_dict(),
         "file_reports": processing_reports,
+        "csv_cache": get_csv_cache().get_stats(),
         "config_used": {
             "batch_size": config.batch_size,
             "rate_limit_delay": config.rate_limit_delay,
             "max_concurrent_batches": config.max_concurrent_batches,
             "enable_progress_tracking": config.enable_progress_tracking,
-            "enable_duplicate_detection": config.enable_duplicate_detection
+            "enable_duplicate_detection": config.enable_duplicate_detection,
+            "process_workers": config.process_workers,
+            "resolve_domains": config.resolve_domains
         },
         "timestamp": datetime.now().isoformat()
     }
@@ -620,6 +863,8 @@ async def load_all_apollo_csvs_async(directory: str = "arco",
     logger.info(f"   Total prospects loaded: {len(all_prospects)}")
     logger.info(f"   Unique prospects: {len(final_prospects)}")
     logger.info(f"   Global duplicates removed: {duplicates_removed}")
+    if config.resolve_domains:
+        logger.info(f"   Unresolvable domains removed: {unresolvable_removed}")
     logger.info(f"   Overall success rate: {total_stats.get_success_rate():.1f}%")
     logger.info(f"   Total processing time: {total_stats.processing_time:.2f}s")
     
@@ -7,6 +7,8 @@ error handling system.
 """
 
 from .container import ServiceContainer, get_container, configure_container
+from .http_clients import HTTPClientRegistry, get_http_clients
+from .executor import BatchExecutor, attribute_view, get_executor
 from .error_handler import (
     ProcessingErrorHandler,
     RetryConfig,
@@ -36,6 +38,15 @@ __all__ = [
     'get_container',
     'configure_container',
     
+    # HTTP Clients
+    'HTTPClientRegistry',
+    'get_http_clients',
+    
+    # Batch Executor
+    'BatchExecutor',
+    'attribute_view',
+    'get_executor',
+    
     # Error Handling
     'ProcessingErrorHandler',
     'RetryConfig',
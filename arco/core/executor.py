@@ -0,0 +1,245 @@
+"""
+Batch Executor for ARCO.
+
+This module provides a pluggable execution layer for CPU-bound batch work
+(priority scoring, lead qualification, ICP matching, financial leak
+detection). Work is split into chunks and run inline, on a thread pool or
+on a process pool, as selected by the ``executor`` config section.
+
+Chunk functions must be module-level (so process workers can import them)
+and take the chunk as their first argument. Each chunk is pickled once with
+the highest protocol, and results come back in input order whatever the
+mode and chunk size, so callers see the same output in every mode.
+
+Process workers should get as little as possible: callers pass plain
+settings rather than engines as extra arguments, and a ``view`` that
+reduces each item to the attributes the chunk function reads (see
+attribute_view()).
+"""
+
+import asyncio
+import atexit
+import logging
+import multiprocessing
+import os
+import pickle
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Optional, Sequence, TypeVar
+
+from arco.core.container import get_container
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+ChunkFunction = Callable[..., List[R]]
+
+EXECUTOR_MODES = ("inline", "thread", "process")
+DEFAULT_CHUNK_SIZE = 250
+
+
+def attribute_view(obj: Any, names: Sequence[str]) -> SimpleNamespace:
+    """
+    Copy the named attributes of an object into a small picklable record.
+
+    Attributes the object does not have stay missing, so getattr() defaults
+    and hasattr() checks behave as they do on the object itself.
+
+    Args:
+        obj: Object to copy attributes from (e.g. a Prospect)
+        names: Attribute names to copy
+
+    Returns:
+        Namespace with the copied attributes
+    """
+    return SimpleNamespace(**{name: getattr(obj, name) for name in names if hasattr(obj, name)})
+
+
+def _run_pickled_chunk(payload: bytes) -> bytes:
+    """Run a pickled (function, chunk, args) payload in a worker process."""
+    fn, chunk, args = pickle.loads(payload)
+    return pickle.dumps(fn(chunk, *args), protocol=pickle.HIGHEST_PROTOCOL)
+
+
+class BatchExecutor:
+    """
+    Runs chunk functions over batches inline, on threads or on processes.
+
+    The pool is created on first use and reused by every caller. Process
+    pools use the 'spawn' start method: forking after polars (or another
+    library) has started its own threads can deadlock the children.
+    Batches that fit in a single chunk always run inline.
+    """
+
+    def __init__(self, mode: str = "inline", max_workers: int = 0, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """
+        Initialize the executor.
+
+        Args:
+            mode: "inline", "thread" or "process"
+            max_workers: Pool size (0 uses every CPU core)
+            chunk_size: Items per chunk handed to a worker
+        """
+        if mode not in EXECUTOR_MODES:
+            raise ValueError(f"Unknown executor mode '{mode}', expected one of {EXECUTOR_MODES}")
+
+        self.mode = mode
+        self.max_workers = max_workers if max_workers > 0 else (os.cpu_count() or 1)
+        self.chunk_size = max(1, chunk_size)
+
+        self._lock = threading.Lock()
+        self._pool: Optional[Executor] = None
+        self.stats = {"batches": 0, "chunks": 0, "items": 0, "inline_batches": 0}
+
+    @classmethod
+    def from_config(cls) -> 'BatchExecutor':
+        """
+        Create an executor configured from the ``executor`` config section.
+
+        Returns:
+            BatchExecutor instance
+        """
+        from arco.config.config_manager import get_config
+
+        config = get_config()
+        return cls(
+            mode=config.get("executor.mode", "inline"),
+            max_workers=config.get("executor.max_workers", 0),
+            chunk_size=config.get("executor.chunk_size", DEFAULT_CHUNK_SIZE)
+        )
+
+    def _get_pool(self) -> Executor:
+        """Create the worker pool lazily."""
+        with self._lock:
+            if self._pool is None:
+                if self.mode == "process":
+                    self._pool = ProcessPoolExecutor(max_workers=self.max_workers,
+                                                     mp_context=multiprocessing.get_context("spawn"))
+                else:
+                    self._pool = ThreadPoolExecutor(max_workers=self.max_workers,
+                                                    thread_name_prefix="arco-batch")
+                logger.info(f"Started {self.mode} pool with {self.max_workers} workers")
+            return self._pool
+
+    def _chunks(self, items: Sequence[T], chunk_size: Optional[int]) -> List[Sequence[T]]:
+        """Split items into chunks."""
+        size = max(1, chunk_size or self.chunk_size)
+        return [items[start:start + size] for start in range(0, len(items), size)]
+
+    def _submit(self, pool: Executor, fn: ChunkFunction, chunk: Sequence[T], args: tuple,
+                view: Optional[Callable[[T], Any]] = None):
+        """Submit one chunk to the pool (process workers get the items' views)."""
+        if self.mode == "process":
+            items = [view(item) for item in chunk] if view is not None else list(chunk)
+            payload = pickle.dumps((fn, items, args), protocol=pickle.HIGHEST_PROTOCOL)
+            return pool.submit(_run_pickled_chunk, payload)
+        return pool.submit(fn, chunk, *args)
+
+    def _collect(self, chunk_results: List[Any]) -> List[R]:
+        """Concatenate chunk results in chunk order."""
+        results: List[R] = []
+        for chunk_result in chunk_results:
+            results.extend(pickle.loads(chunk_result) if self.mode == "process" else chunk_result)
+        return results
+
+    def _plan(self, items: Sequence[T], chunk_size: Optional[int]) -> Optional[List[Sequence[T]]]:
+        """Split a batch into chunks, or return None when it should run inline."""
+        items_count = len(items)
+        self.stats["batches"] += 1
+        self.stats["items"] += items_count
+
+        chunks = self._chunks(items, chunk_size)
+        if self.mode == "inline" or len(chunks) <= 1:
+            self.stats["inline_batches"] += 1
+            return None
+
+        self.stats["chunks"] += len(chunks)
+        return chunks
+
+    def map(self, fn: ChunkFunction, items: Sequence[T], *args: Any,
+            chunk_size: Optional[int] = None, view: Optional[Callable[[T], Any]] = None) -> List[R]:
+        """
+        Run a chunk function over a batch and wait for the results.
+
+        Args:
+            fn: Module-level function taking (chunk, *args) and returning one result per item
+            items: Batch of items
+            *args: Extra (picklable) arguments passed with every chunk
+            chunk_size: Items per chunk (defaults to the executor's chunk size)
+            view: Function reducing an item to what fn reads, applied to the
+                items sent to process workers (fn must accept both)
+
+        Returns:
+            One result per item, in input order
+        """
+        chunks = self._plan(items, chunk_size)
+        if chunks is None:
+            return list(fn(items, *args)) if items else []
+
+        pool = self._get_pool()
+        futures = [self._submit(pool, fn, chunk, args, view) for chunk in chunks]
+        return self._collect([future.result() for future in futures])
+
+    async def map_async(self, fn: ChunkFunction, items: Sequence[T], *args: Any,
+                        chunk_size: Optional[int] = None,
+                        view: Optional[Callable[[T], Any]] = None) -> List[R]:
+        """
+        Run a chunk function over a batch without blocking the event loop.
+
+        Inline batches still run on the calling thread.
+
+        Args:
+            fn: Module-level function taking (chunk, *args) and returning one result per item
+            items: Batch of items
+            *args: Extra (picklable) arguments passed with every chunk
+            chunk_size: Items per chunk (defaults to the executor's chunk size)
+            view: Function reducing an item to what fn reads, applied to the
+                items sent to process workers (fn must accept both)
+
+        Returns:
+            One result per item, in input order
+        """
+        chunks = self._plan(items, chunk_size)
+        if chunks is None:
+            return list(fn(items, *args)) if items else []
+
+        pool = self._get_pool()
+        futures = [asyncio.wrap_future(self._submit(pool, fn, chunk, args, view)) for chunk in chunks]
+        return self._collect(await asyncio.gather(*futures))
+
+    def shutdown(self) -> None:
+        """Stop the worker pool (a new one is started on the next batch)."""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get executor statistics.
+
+        Returns:
+            Dictionary with batch, chunk and item counts
+        """
+        return {**self.stats, "mode": self.mode, "max_workers": self.max_workers, "chunk_size": self.chunk_size}
+
+
+def get_executor() -> BatchExecutor:
+    """
+    Get the shared batch executor from the global service container.
+
+    The executor is created from config and registered as a singleton the
+    first time it is requested; its pool is shut down at interpreter exit.
+
+    Returns:
+        BatchExecutor instance
+    """
+    container = get_container()
+    if not container.is_registered(BatchExecutor):
+        executor = BatchExecutor.from_config()
+        container.register_instance(BatchExecutor, executor)
+        atexit.register(executor.shutdown)
+    return container.resolve(BatchExecutor)
@@ -0,0 +1,215 @@
+"""
+Shared HTTP Client Registry for ARCO.
+
+This module provides a process-wide registry of connection-pooled HTTP
+clients. Every engine and integration borrows its aiohttp session (or httpx
+client) from here instead of creating its own, so keep-alive connections,
+TLS sessions and the DNS cache are shared. The registry is registered in the
+global service container and can be injected into constructors.
+"""
+
+import asyncio
+import importlib.util
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Tuple
+
+import aiohttp
+import httpx
+
+from arco.core.container import get_container
+
+logger = logging.getLogger(__name__)
+
+# HTTP/2 needs the optional 'h2' package (pip install httpx[http2])
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+@dataclass
+class _LoopClients:
+    """Clients bound to a single event loop."""
+
+    loop: asyncio.AbstractEventLoop
+    connectors: Dict[bool, aiohttp.TCPConnector] = field(default_factory=dict)
+    sessions: Dict[Tuple, aiohttp.ClientSession] = field(default_factory=dict)
+    httpx_client: Optional[httpx.AsyncClient] = None
+
+
+class HTTPClientRegistry:
+    """
+    Process-wide registry of pooled aiohttp sessions and httpx clients.
+
+    aiohttp and httpx clients are bound to the event loop that created them,
+    so the registry keeps one pool per running loop. Sessions with different
+    default headers or timeouts share the same connector, and therefore the
+    same connection pool and DNS cache.
+    """
+
+    def __init__(self, limit: int = 100, limit_per_host: int = 10, dns_ttl: int = 300,
+                 keepalive_timeout: float = 30.0, timeout: float = 30.0, http2: bool = True):
+        """
+        Initialize the registry.
+
+        Args:
+            limit: Maximum number of open connections per pool
+            limit_per_host: Maximum number of open connections per host
+            dns_ttl: Seconds to cache DNS lookups
+            keepalive_timeout: Seconds to keep idle connections open
+            timeout: Default total request timeout in seconds
+            http2: Use HTTP/2 for httpx clients when 'h2' is installed
+        """
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.dns_ttl = dns_ttl
+        self.keepalive_timeout = keepalive_timeout
+        self.timeout = timeout
+        self.http2 = http2 and HTTP2_AVAILABLE
+        self._pools: Dict[int, _LoopClients] = {}
+
+    @classmethod
+    def from_config(cls) -> 'HTTPClientRegistry':
+        """
+        Create a registry configured from the ``http_client`` config section.
+
+        Returns:
+            HTTPClientRegistry instance
+        """
+        from arco.config.config_manager import get_config
+
+        config = get_config()
+        return cls(
+            limit=config.get("http_client.limit", 100),
+            limit_per_host=config.get("http_client.limit_per_host", 10),
+            dns_ttl=config.get("http_client.dns_ttl", 300),
+            keepalive_timeout=config.get("http_client.keepalive_timeout", 30.0),
+            timeout=config.get("http_client.timeout", 30.0),
+            http2=config.get("http_client.http2", True)
+        )
+
+    def _pool(self) -> _LoopClients:
+        """Get the clients for the running loop, dropping pools of closed loops."""
+        loop = asyncio.get_running_loop()
+
+        for key in [k for k, p in self._pools.items() if p.loop.is_closed()]:
+            del self._pools[key]
+
+        pool = self._pools.get(id(loop))
+        if pool is None or pool.loop is not loop:
+            pool = _LoopClients(loop=loop)
+            self._pools[id(loop)] = pool
+        return pool
+
+    def _connector(self, pool: _LoopClients, verify_ssl: bool) -> aiohttp.TCPConnector:
+        """Get (or create) the shared connector of a pool."""
+        connector = pool.connectors.get(verify_ssl)
+        if connector is None or connector.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                use_dns_cache=True,
+                ttl_dns_cache=self.dns_ttl,
+                keepalive_timeout=self.keepalive_timeout,
+                enable_cleanup_closed=True,
+                ssl=verify_ssl
+            )
+            pool.connectors[verify_ssl] = connector
+        return connector
+
+    def get_session(self, headers: Optional[Dict[str, str]] = None, timeout: Optional[float] = None,
+                    verify_ssl: bool = True) -> aiohttp.ClientSession:
+        """
+        Get a pooled aiohttp session for the running event loop.
+
+        Must be called from a coroutine. Callers must not close the session;
+        use aclose() on the registry instead.
+
+        Args:
+            headers: Default headers sent with every request
+            timeout: Default total timeout in seconds
+            verify_ssl: Whether to verify SSL certificates
+
+        Returns:
+            Shared aiohttp ClientSession
+        """
+        pool = self._pool()
+        key = (tuple(sorted((headers or {}).items())), timeout, verify_ssl)
+
+        session = pool.sessions.get(key)
+        if session is None or session.closed:
+            session = aiohttp.ClientSession(
+                connector=self._connector(pool, verify_ssl),
+                connector_owner=False,
+                headers=headers,
+                timeout=aiohttp.ClientTimeout(total=timeout or self.timeout)
+            )
+            pool.sessions[key] = session
+        return session
+
+    def get_httpx_client(self) -> httpx.AsyncClient:
+        """
+        Get the pooled httpx client for the running event loop.
+
+        Must be called from a coroutine. Pass per-request options such as
+        ``timeout`` or ``follow_redirects`` on each request.
+
+        Returns:
+            Shared httpx AsyncClient (HTTP/2 when available)
+        """
+        pool = self._pool()
+        if pool.httpx_client is None or pool.httpx_client.is_closed:
+            pool.httpx_client = httpx.AsyncClient(
+                http2=self.http2,
+                timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_connections=self.limit,
+                    max_keepalive_connections=self.limit_per_host,
+                    keepalive_expiry=self.keepalive_timeout
+                )
+            )
+        return pool.httpx_client
+
+    async def aclose(self) -> None:
+        """Close every client bound to the running event loop."""
+        pool = self._pools.pop(id(asyncio.get_running_loop()), None)
+        if pool is None:
+            return
+
+        for session in pool.sessions.values():
+            if not session.closed:
+                await session.close()
+        for connector in pool.connectors.values():
+            if not connector.closed:
+                await connector.close()
+        if pool.httpx_client is not None and not pool.httpx_client.is_closed:
+            await pool.httpx_client.aclose()
+
+        logger.debug(f"Closed {len(pool.sessions)} pooled HTTP sessions")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get registry statistics.
+
+        Returns:
+            Dictionary with pool and session counts
+        """
+        return {
+            "pools": len(self._pools),
+            "sessions": sum(len(p.sessions) for p in self._pools.values()),
+            "http2": self.http2
+        }
+
+
+def get_http_clients() -> HTTPClientRegistry:
+    """
+    Get the shared HTTP client registry from the global service container.
+
+    The registry is created from config and registered as a singleton the
+    first time it is requested.
+
+    Returns:
+        HTTPClientRegistry instance
+    """
+    container = get_container()
+    if not container.is_registered(HTTPClientRegistry):
+        container.register_instance(HTTPClientRegistry, HTTPClientRegistry.from_config())
+    return container.resolve(HTTPClientRegistry)
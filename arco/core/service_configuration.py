@@ -6,7 +6,9 @@ for the professional service layer architecture.
 """
 
 import logging
-from arco.core.container import ServiceContainer
+from arco.core.container import ServiceContainer, ServiceLifetime
+from arco.core.http_clients import HTTPClientRegistry, get_http_clients
+from arco.core.executor import BatchExecutor, get_executor
 from arco.core.error_handler import (
     ProcessingErrorHandler, 
     RetryConfig, 
@@ -66,6 +68,36 @@ def configure_error_handling(container: ServiceContainer) -> None:
     logger.info("✅ Error handling services configured")
 
 
+def configure_http_clients(container: ServiceContainer) -> None:
+    """
+    Configure the shared HTTP client registry.
+    
+    Args:
+        container: Service container to register the HTTP client registry
+    """
+    logger.info("Configuring HTTP client registry...")
+    
+    # Every container shares the process-wide connection pools
+    container.register_factory(HTTPClientRegistry, get_http_clients, ServiceLifetime.SINGLETON)
+    
+    logger.info("✅ HTTP client registry configured")
+
+
+def configure_executor(container: ServiceContainer) -> None:
+    """
+    Configure the shared batch executor for CPU-bound engine work.
+    
+    Args:
+        container: Service container to register the batch executor
+    """
+    logger.info("Configuring batch executor...")
+    
+    # Every container shares the process-wide worker pool
+    container.register_factory(BatchExecutor, get_executor, ServiceLifetime.SINGLETON)
+    
+    logger.info("✅ Batch executor configured")
+
+
 def configure_intelligence_collectors(container: ServiceContainer) -> None:
     """
     Configure intelligence collector services with error handling.
@@ -84,10 +116,6 @@ def configure_intelligence_collectors(container: ServiceContainer) -> None:
     logger.info("✅ Intelligence collectors configured")
 
 
-from arco.pipelines.standard_pipeline import StandardPipeline
-from arco.pipelines.advanced_pipeline import AdvancedPipeline
-from arco.pipelines.marketing_pipeline import MarketingPipeline
-
 def configure_core_services(container: ServiceContainer) -> None:
     """
     Configure core business services with dependency injection.
@@ -112,6 +140,11 @@ def configure_pipelines(container: ServiceContainer) -> None:
     Args:
         container: Service container to register pipeline services
     """
+    # Imported here: the pipelines' engines import arco.core (HTTP clients)
+    from arco.pipelines.standard_pipeline import StandardPipeline
+    from arco.pipelines.advanced_pipeline import AdvancedPipeline
+    from arco.pipelines.marketing_pipeline import MarketingPipeline
+    
     logger.info("Configuring pipeline services...")
     
     container.register_transient(StandardPipeline)
@@ -132,6 +165,8 @@ def configure_all_services(container: ServiceContainer) -> None:
     
     # Configure in dependency order
     configure_error_handling(container)
+    configure_http_clients(container)
+    configure_executor(container)
     configure_intelligence_collectors(container)
     configure_core_services(container)
     configure_pipelines(container)
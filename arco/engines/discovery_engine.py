@@ -15,14 +15,59 @@ import logging
 import os
 import random
 
+from arco.core.executor import attribute_view, get_executor
 from arco.engines.base import DiscoveryEngineInterface
 from arco.models.prospect import Prospect, Technology, Contact
-from arco.models.icp import ICP, get_all_icps, get_icp_by_name, get_icp_by_type, ICPType
+from arco.models.icp import ICP, TechIndex, get_all_icps, get_icp_by_name, get_icp_by_type, ICPType
 from arco.models.financial_leak import FinancialLeakDetector
 from arco.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Prospect attributes read by ICP matching, scoring and ROI calculation
+ICP_ATTRIBUTES = ('domain', 'industry', 'employee_count', 'revenue', 'country', 'technologies')
+
+# Prospect attributes read by FinancialLeakDetector.detect_financial_leaks()
+LEAK_ATTRIBUTES = ('domain', 'company_name', 'industry', 'employee_count', 'revenue', 'country', 'technologies')
+
+
+def _icp_view(prospect: Prospect) -> Any:
+    """Reduce a prospect to the attributes ICP checks read (sent to process workers)."""
+    return attribute_view(prospect, ICP_ATTRIBUTES)
+
+
+def _leak_view(prospect: Prospect) -> Any:
+    """Reduce a prospect to the attributes leak detection reads (sent to process workers)."""
+    return attribute_view(prospect, LEAK_ATTRIBUTES)
+
+
+def _icp_match_chunk(prospects: List[Prospect], icp: ICP) -> List[Optional[float]]:
+    """Score a chunk of prospects against an ICP, None for non-matching ones."""
+    return icp.compiled().score_many(prospects, require_match=True)
+
+
+def _icp_report_chunk(prospects: List[Prospect], icp: ICP) -> List[Dict[str, Any]]:
+    """Score a chunk of prospects for an ICP report (without the prospects themselves)."""
+    compiled = icp.compiled()
+    report = []
+    for prospect in prospects:
+        tech_index = TechIndex.of(prospect)
+        waste_detection = compiled.detect_saas_waste(prospect, tech_index)
+        report.append({
+            "match_score": compiled.score(prospect, tech_index),
+            "tech_score": icp.calculate_technical_footprint_score(prospect, tech_index),
+            "waste_detection": waste_detection,
+            "roi_calculation": icp.calculate_roi(prospect, tech_index, waste_detection)
+        })
+    return report
+
+
+def _financial_leaks_chunk(prospects: List[Prospect]) -> List[Dict[str, Any]]:
+    """Detect financial leaks for a chunk of prospects."""
+    leak_detector = FinancialLeakDetector()
+    return [leak_detector.detect_financial_leaks(prospect) for prospect in prospects]
+
+
 class DiscoveryEngine(DiscoveryEngineInterface):
     """
     Discovery engine that finds actual SMB prospects.
@@ -745,19 +790,14 @@ class DiscoveryEngine(DiscoveryEngineInterface):
         if not self.icp:
             return prospects
         
-        filtered_prospects = []
-        
-        for prospect in prospects:
-            # Check if the prospect matches the ICP
-            if self.icp.matches_prospect(prospect):
-                # Calculate match score
-                match_score = self.icp.calculate_match_score(prospect)
-                
-                # Only include prospects that meet the qualification threshold
-                if match_score >= self.icp.qualification_threshold:
-                    filtered_prospects.append(prospect)
+        # Match and score on the shared batch executor (None: no ICP match)
+        match_scores = get_executor().map(_icp_match_chunk, prospects, self.icp, view=_icp_view)
         
-        return filtered_prospects
+        # Only include prospects that meet the qualification threshold
+        return [
+            prospect for prospect, match_score in zip(prospects, match_scores)
+            if match_score is not None and match_score >= self.icp.qualification_threshold
+        ]
     
     def detect_financial_leaks(self, prospect: Prospect) -> Dict[str, Any]:
         """
@@ -805,13 +845,9 @@ class DiscoveryEngine(DiscoveryEngineInterface):
             }
         }
         
-        # Create financial leak detector
-        leak_detector = FinancialLeakDetector()
-        
-        # Detect financial leaks for each prospect
-        for prospect in prospects:
-            leak_results = leak_detector.detect_financial_leaks(prospect)
-            
+        # Detect financial leaks for each prospect on the shared batch executor
+        all_leak_results = get_executor().map(_financial_leaks_chunk, prospects, view=_leak_view)
+        for prospect, leak_results in zip(prospects, all_leak_results):
             # Add to results
             results["prospects"].append({
                 "domain": prospect.domain,
@@ -847,21 +883,12 @@ class DiscoveryEngine(DiscoveryEngineInterface):
         if not self.icp:
             return {"error": "No ICP set"}
         
-        # Calculate match scores for all prospects
-        scored_prospects = []
-        for prospect in prospects:
-            match_score = self.icp.calculate_match_score(prospect)
-            tech_score = self.icp.calculate_technical_footprint_score(prospect)
-            waste_detection = self.icp.detect_saas_waste(prospect)
-            roi_calculation = self.icp.calculate_roi(prospect)
-            
-            scored_prospects.append({
-                "prospect": prospect.to_dict(),
-                "match_score": match_score,
-                "tech_score": tech_score,
-                "waste_detection": waste_detection,
-                "roi_calculation": roi_calculation
-            })
+        # Calculate match scores for all prospects on the shared batch executor
+        scored_prospects = [
+            {"prospect": prospect.to_dict(), **scores}
+            for prospect, scores in zip(prospects, get_executor().map(_icp_report_chunk, prospects, self.icp,
+                                                                       view=_icp_view))
+        ]
         
         # Sort prospects by match score (highest first)
         scored_prospects.sort(key=lambda x: x["match_score"], reverse=True)
@@ -11,6 +11,7 @@ from datetime import datetime
 import asyncio
 from dataclasses import dataclass
 
+from arco.core.executor import attribute_view, get_executor
 from arco.models.prospect import Prospect, Contact, Technology
 from arco.models.icp import ICP
 from arco.models.financial_leak import FinancialLeakDetector
@@ -60,6 +61,26 @@ class LeadScore:
     disqualification_reasons: List[str]
     priority_level: int  # 1-5, where 1 is highest priority
 
+# Prospect attributes read by qualify_lead() and ICP scoring, the only ones sent to process workers
+QUALIFIED_ATTRIBUTES = (
+    'domain', 'industry', 'employee_count', 'revenue', 'country', 'technologies',
+    'contacts', 'website', 'description'
+)
+
+
+def _qualification_view(lead: Tuple[Prospect, Optional[Dict[str, Any]]]) -> Tuple[Any, Optional[Dict[str, Any]]]:
+    """Reduce a (prospect, analysis results) pair to what qualification reads (sent to process workers)."""
+    prospect, analysis_results = lead
+    return attribute_view(prospect, QUALIFIED_ATTRIBUTES), analysis_results
+
+
+def _qualify_chunk(leads: List[Tuple[Prospect, Optional[Dict[str, Any]]]],
+                   criteria: "QualificationCriteria", icp: Optional[ICP]) -> List[Tuple[bool, "LeadScore"]]:
+    """Qualify a chunk of (prospect, analysis results) pairs (runs inline or in a batch executor worker)."""
+    engine = LeadQualificationEngine(criteria)
+    return [engine.qualify_lead(prospect, icp, analysis_results) for prospect, analysis_results in leads]
+
+
 class LeadQualificationEngine:
     """Advanced lead qualification and scoring engine."""
     
@@ -405,6 +426,11 @@ class LeadQualificationEngine:
         """
         Qualify multiple leads in batch.
         
+        Leads are qualified in chunks on the shared batch executor; each
+        chunk only carries the analysis results of its own prospects, and
+        process workers get the criteria and the qualified prospect
+        attributes instead of the engine and whole prospects.
+        
         Args:
             prospects: List of prospects to qualify
             icp: ICP to score against
@@ -413,17 +439,13 @@ class LeadQualificationEngine:
         Returns:
             Dictionary mapping domain to (is_qualified, lead_score)
         """
-        results = {}
-        
-        for prospect in prospects:
-            analysis_results = None
-            if analysis_results_map:
-                analysis_results = analysis_results_map.get(prospect.domain)
-            
-            is_qualified, lead_score = self.qualify_lead(prospect, icp, analysis_results)
-            results[prospect.domain] = (is_qualified, lead_score)
+        leads = [
+            (prospect, analysis_results_map.get(prospect.domain) if analysis_results_map else None)
+            for prospect in prospects
+        ]
+        qualifications = get_executor().map(_qualify_chunk, leads, self.criteria, icp, view=_qualification_view)
         
-        return results
+        return {prospect.domain: qualification for prospect, qualification in zip(prospects, qualifications)}
     
     def get_qualification_summary(self, qualification_results: Dict[str, Tuple[bool, LeadScore]]) -> Dict[str, Any]:
         """
@@ -20,10 +20,13 @@ import logging
 from arco.engines.base import LeakEngineInterface
 from arco.models.prospect import Prospect, Technology, MarketingData
 from arco.models.leak_result import LeakResult
+from arco.models.page_snapshot import PageSnapshot
 from arco.models.qualified_prospect import QualifiedProspect, Leak, MarketingLeak
 from arco.integrations.google_analytics import GoogleAnalyticsIntegration
 from arco.integrations.google_ads import GoogleAdsIntegration
 from arco.integrations.wappalyzer import WappalyzerIntegration
+from arco.core.http_clients import HTTPClientRegistry, get_http_clients
+from arco.utils.http_cache import HTTPResponseCache, get_http_cache
 from arco.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -35,19 +38,25 @@ class LeakEngine(LeakEngineInterface):
     Removes fake financial calculations and provides actionable technical insights.
     """
     
-    def __init__(self, config_path: str = "config/production.yml"):
+    def __init__(self, config_path: str = "config/production.yml",
+                 http_cache: Optional[HTTPResponseCache] = None,
+                 http_clients: Optional[HTTPClientRegistry] = None):
         """
         Initialize the practical leak engine.
         
         Args:
             config_path: Path to the configuration file.
+            http_cache: Shared HTTP response cache (defaults to the global cache)
+            http_clients: Shared HTTP client registry (defaults to the global registry)
         """
         self.config_path = config_path
         self.session = None
+        self.http_cache = http_cache or get_http_cache()
+        self.http_clients = http_clients or get_http_clients()
         
         # Initialize real data integrations
-        self.ga_integration = GoogleAnalyticsIntegration()
-        self.wappalyzer_integration = WappalyzerIntegration()
+        self.ga_integration = GoogleAnalyticsIntegration(http_clients=self.http_clients)
+        self.wappalyzer_integration = WappalyzerIntegration(http_clients=self.http_clients)
         
         # Load technology analysis benchmarks
         self.tech_benchmarks = self._load_tech_benchmarks()
@@ -237,25 +246,29 @@ class LeakEngine(LeakEngineInterface):
         
         start_time = datetime.now()
         
-        # Ensure session is created if not already
-        if self.session is None or self.session.closed:
-            self.session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(ssl=False))
+        # Borrow the pooled session for this event loop
+        self.session = self.http_clients.get_session(verify_ssl=False)
         
         try:
-            # PHASE 1: Harmful Technologies Detection (using Wappalyzer)
-            harmful_tech_issues = await self._detect_harmful_technologies(prospect.domain)
-            
-            # PHASE 2: Web Vitals Analysis (using PageSpeed Insights)
-            web_vitals_issues = await self._analyze_web_vitals_issues(prospect.domain)
-            
-            # PHASE 3: Quick Wins Detection (simple technical problems)
-            quick_wins = await self._detect_quick_wins(prospect.domain)
-            
-            # PHASE 4: SEO Technical Issues
-            seo_issues = await self._detect_seo_technical_issues(prospect.domain)
-            
-            # PHASE 5: Security Issues Detection
-            security_issues = await self._detect_security_issues(prospect.domain)
+            # Fetch the homepage once and share it with every detector
+            snapshot = await self._fetch_page_snapshot(prospect.domain)
+            
+            # PHASES 1-5 are independent, so run them concurrently:
+            # harmful technologies (Wappalyzer), Web Vitals (PageSpeed Insights),
+            # quick wins, SEO technical issues and security issues
+            (
+                harmful_tech_issues,
+                web_vitals_issues,
+                quick_wins,
+                seo_issues,
+                security_issues
+            ) = await asyncio.gather(
+                self._detect_harmful_technologies(prospect.domain, snapshot),
+                self._analyze_web_vitals_issues(prospect.domain),
+                self._detect_quick_wins(prospect.domain, snapshot),
+                self._detect_seo_technical_issues(prospect.domain),
+                self._detect_security_issues(prospect.domain, snapshot)
+            )
             
             # Combine all technical issues (NO FAKE FINANCIAL CALCULATIONS)
             all_issues = harmful_tech_issues + web_vitals_issues + quick_wins + seo_issues + security_issues
@@ -282,12 +295,41 @@ class LeakEngine(LeakEngineInterface):
             logger.error(f"Error during technical analysis for {prospect.domain}: {e}")
             return self._create_error_result(prospect.domain, start_time)
     
-    async def _detect_harmful_technologies(self, domain: str) -> List[Leak]:
+    async def _fetch_page_snapshot(self, domain: str, timeout: int = 10) -> PageSnapshot:
+        """
+        Fetch the homepage of a domain once for all detectors.
+        
+        The fetch starts at http://{domain} and follows redirects, so the
+        snapshot also shows whether plain HTTP is redirected to HTTPS. If
+        plain HTTP cannot be reached, https://{domain} is fetched instead.
+        
+        Args:
+            domain: Domain to fetch
+            timeout: Timeout in seconds
+            
+        Returns:
+            PageSnapshot of the homepage (with error set if the fetch failed)
+        """
+        self.session = self.http_clients.get_session(verify_ssl=False)
+        
+        snapshot = await PageSnapshot.fetch(
+            self.session, f"http://{domain}", timeout=timeout, cache=self.http_cache
+        )
+        if snapshot.error:
+            snapshot = await PageSnapshot.fetch(
+                self.session, f"https://{domain}", timeout=timeout, cache=self.http_cache
+            )
+        if snapshot.error:
+            logger.warning(f"Could not fetch homepage for {domain}: {snapshot.error}")
+        return snapshot
+    
+    async def _detect_harmful_technologies(self, domain: str, snapshot: Optional[PageSnapshot] = None) -> List[Leak]:
         """
         Detect harmful technologies using Wappalyzer integration.
         
         Args:
             domain: Domain to analyze
+            snapshot: Pre-fetched homepage snapshot (optional)
             
         Returns:
             List of harmful technology issues
@@ -296,7 +338,7 @@ class LeakEngine(LeakEngineInterface):
         
         try:
             # Use Wappalyzer integration to get technology stack
-            tech_data = await self.wappalyzer_integration.analyze_url(domain)
+            tech_data = await self.wappalyzer_integration.analyze_url(domain, snapshot=snapshot)
             
             if not tech_data or 'technologies' not in tech_data:
                 logger.warning(f"No technology data available for {domain}")
@@ -485,12 +527,13 @@ class LeakEngine(LeakEngineInterface):
         
         return issues
     
-    async def _detect_quick_wins(self, domain: str) -> List[Leak]:
+    async def _detect_quick_wins(self, domain: str, snapshot: Optional[PageSnapshot] = None) -> List[Leak]:
         """
         Detect quick wins - simple technical problems that are easy to fix.
         
         Args:
             domain: Domain to analyze
+            snapshot: Pre-fetched homepage snapshot (fetched if not given)
             
         Returns:
             List of quick win issues
@@ -499,73 +542,74 @@ class LeakEngine(LeakEngineInterface):
         
         try:
             # Get website HTML for analysis
-            async with self.session.get(f"https://{domain}", timeout=10, ssl=False) as response:
-                if response.status != 200:
-                    logger.warning(f"Could not fetch {domain} for quick wins analysis")
-                    return issues
-                
-                html = await response.text()
-                html_lower = html.lower()
-                
-                # Check for missing alt text on images
-                img_count = html_lower.count('<img')
-                alt_count = html_lower.count('alt=')
-                if img_count > 0 and alt_count < img_count * 0.8:  # Less than 80% have alt text
-                    issue = Leak(
-                        type='missing_alt_text',
-                        monthly_waste=0.0,
-                        annual_savings=0.0,
-                        description=f"Missing alt text on images ({alt_count}/{img_count} images have alt text)",
-                        severity='low'
-                    )
-                    issues.append(issue)
-                
-                # Check for missing meta description
-                if 'name="description"' not in html_lower and 'property="og:description"' not in html_lower:
-                    issue = Leak(
-                        type='missing_meta_description',
-                        monthly_waste=0.0,
-                        annual_savings=0.0,
-                        description="Missing meta description tag",
-                        severity='medium'
-                    )
-                    issues.append(issue)
-                
-                # Check for missing title tag
-                if '<title>' not in html_lower:
-                    issue = Leak(
-                        type='missing_title_tag',
-                        monthly_waste=0.0,
-                        annual_savings=0.0,
-                        description="Missing title tag",
-                        severity='high'
-                    )
-                    issues.append(issue)
-                
-                # Check for uncompressed resources (simple heuristic)
-                if '.min.js' not in html_lower and '<script' in html_lower:
-                    issue = Leak(
-                        type='unminified_javascript',
-                        monthly_waste=0.0,
-                        annual_savings=0.0,
-                        description="JavaScript files appear to be unminified",
-                        severity='medium'
-                    )
-                    issues.append(issue)
-                
-                # Check for missing viewport meta tag (mobile optimization)
-                if 'name="viewport"' not in html_lower:
-                    issue = Leak(
-                        type='missing_viewport',
-                        monthly_waste=0.0,
-                        annual_savings=0.0,
-                        description="Missing viewport meta tag for mobile optimization",
-                        severity='medium'
-                    )
-                    issues.append(issue)
-                
-                logger.info(f"Quick wins analysis complete for {domain}: {len(issues)} issues found")
-                
+            if snapshot is None:
+                snapshot = await self._fetch_page_snapshot(domain)
+            
+            if not snapshot.ok:
+                logger.warning(f"Could not fetch {domain} for quick wins analysis")
+                return issues
+            
+            html_lower = snapshot.html_lower
+            
+            # Check for missing alt text on images
+            img_count = html_lower.count('<img')
+            alt_count = html_lower.count('alt=')
+            if img_count > 0 and alt_count < img_count * 0.8:  # Less than 80% have alt text
+                issue = Leak(
+                    type='missing_alt_text',
+                    monthly_waste=0.0,
+                    annual_savings=0.0,
+                    description=f"Missing alt text on images ({alt_count}/{img_count} images have alt text)",
+                    severity='low'
+                )
+                issues.append(issue)
+            
+            # Check for missing meta description
+            if 'name="description"' not in html_lower and 'property="og:description"' not in html_lower:
+                issue = Leak(
+                    type='missing_meta_description',
+                    monthly_waste=0.0,
+                    annual_savings=0.0,
+                    description="Missing meta description tag",
+                    severity='medium'
+                )
+                issues.append(issue)
+            
+            # Check for missing title tag
+            if '<title>' not in html_lower:
+                issue = Leak(
+                    type='missing_title_tag',
+                    monthly_waste=0.0,
+                    annual_savings=0.0,
+                    description="Missing title tag",
+                    severity='high'
+                )
+                issues.append(issue)
+            
+            # Check for uncompressed resources (simple heuristic)
+            if '.min.js' not in html_lower and '<script' in html_lower:
+                issue = Leak(
+                    type='unminified_javascript',
+                    monthly_waste=0.0,
+                    annual_savings=0.0,
+                    description="JavaScript files appear to be unminified",
+                    severity='medium'
+                )
+                issues.append(issue)
+            
+            # Check for missing viewport meta tag (mobile optimization)
+            if 'name="viewport"' not in html_lower:
+                issue = Leak(
+                    type='missing_viewport',
+                    monthly_waste=0.0,
+                    annual_savings=0.0,
+                    description="Missing viewport meta tag for mobile optimization",
+                    severity='medium'
+                )
+                issues.append(issue)
+            
+            logger.info(f"Quick wins analysis complete for {domain}: {len(issues)} issues found")
+            
         except Exception as e:
             logger.error(f"Error detecting quick wins for {domain}: {e}")
         
@@ -575,6 +619,8 @@ class LeakEngine(LeakEngineInterface):
         """
         Detect SEO technical issues.
         
+        robots.txt and sitemap.xml are checked concurrently.
+        
         Args:
             domain: Domain to analyze
             
@@ -584,35 +630,21 @@ class LeakEngine(LeakEngineInterface):
         issues = []
         
         try:
-            # Check robots.txt
-            try:
-                async with self.session.get(f"https://{domain}/robots.txt", timeout=5, ssl=False) as response:
-                    if response.status == 404:
-                        issue = Leak(
-                            type='missing_robots_txt',
-                            monthly_waste=0.0,
-                            annual_savings=0.0,
-                            description="Missing robots.txt file",
-                            severity='low'
-                        )
-                        issues.append(issue)
-            except:
-                pass  # Not critical if robots.txt check fails
-            
-            # Check sitemap.xml
-            try:
-                async with self.session.get(f"https://{domain}/sitemap.xml", timeout=5, ssl=False) as response:
-                    if response.status == 404:
-                        issue = Leak(
-                            type='missing_sitemap',
-                            monthly_waste=0.0,
-                            annual_savings=0.0,
-                            description="Missing sitemap.xml file",
-                            severity='medium'
-                        )
-                        issues.append(issue)
-            except:
-                pass  # Not critical if sitemap check fails
+            robots_issue, sitemap_issue = await asyncio.gather(
+                self._check_missing_resource(
+                    domain, "robots.txt",
+                    leak_type='missing_robots_txt',
+                    description="Missing robots.txt file",
+                    severity='low'
+                ),
+                self._check_missing_resource(
+                    domain, "sitemap.xml",
+                    leak_type='missing_sitemap',
+                    description="Missing sitemap.xml file",
+                    severity='medium'
+                )
+            )
+            issues.extend(issue for issue in (robots_issue, sitemap_issue) if issue)
             
             logger.info(f"SEO technical analysis complete for {domain}: {len(issues)} issues found")
             
@@ -621,12 +653,43 @@ class LeakEngine(LeakEngineInterface):
         
         return issues
     
-    async def _detect_security_issues(self, domain: str) -> List[Leak]:
+    async def _check_missing_resource(self, domain: str, path: str, leak_type: str,
+                                      description: str, severity: str) -> Optional[Leak]:
+        """
+        Report a leak if https://{domain}/{path} returns 404.
+        
+        Args:
+            domain: Domain to analyze
+            path: Resource path (e.g. robots.txt)
+            leak_type: Leak type to report
+            description: Leak description
+            severity: Leak severity
+            
+        Returns:
+            Leak if the resource is missing, None otherwise
+        """
+        try:
+            response = await self.http_cache.fetch(self.session, f"https://{domain}/{path}", timeout=5, ssl=False)
+            if response.status == 404:
+                return Leak(
+                    type=leak_type,
+                    monthly_waste=0.0,
+                    annual_savings=0.0,
+                    description=description,
+                    severity=severity
+                )
+        except Exception:
+            pass  # Not critical if the check fails
+        return None
+    
+    async def _detect_security_issues(self, domain: str, snapshot: Optional[PageSnapshot] = None) -> List[Leak]:
         """
         Detect basic security issues.
         
         Args:
             domain: Domain to analyze
+            snapshot: Pre-fetched homepage snapshot used for the redirect and
+                header checks (fetched if not given)
             
         Returns:
             List of security issues
@@ -634,58 +697,52 @@ class LeakEngine(LeakEngineInterface):
         issues = []
         
         try:
-            # Check HTTPS redirect
-            try:
-                async with self.session.get(f"http://{domain}", timeout=5, ssl=False, allow_redirects=False) as response:
-                    if response.status not in [301, 302, 307, 308]:
-                        issue = Leak(
-                            type='missing_https_redirect',
-                            monthly_waste=0.0,
-                            annual_savings=0.0,
-                            description="HTTP to HTTPS redirect not properly configured",
-                            severity='high'
-                        )
-                        issues.append(issue)
-            except:
-                pass  # Not critical if HTTP check fails
+            if snapshot is None:
+                snapshot = await self._fetch_page_snapshot(domain, timeout=5)
+            
+            # Check HTTPS redirect (not judged when plain HTTP could not be fetched)
+            if snapshot.fetched and snapshot.url.startswith("http://") and not snapshot.served_over_https:
+                issue = Leak(
+                    type='missing_https_redirect',
+                    monthly_waste=0.0,
+                    annual_savings=0.0,
+                    description="HTTP to HTTPS redirect not properly configured",
+                    severity='high'
+                )
+                issues.append(issue)
             
             # Check security headers
-            try:
-                async with self.session.get(f"https://{domain}", timeout=5, ssl=False) as response:
-                    headers = response.headers
-                    
-                    # Check for important security headers
-                    if 'strict-transport-security' not in headers:
-                        issue = Leak(
-                            type='missing_hsts_header',
-                            monthly_waste=0.0,
-                            annual_savings=0.0,
-                            description="Missing Strict-Transport-Security header",
-                            severity='medium'
-                        )
-                        issues.append(issue)
-                    
-                    if 'x-content-type-options' not in headers:
-                        issue = Leak(
-                            type='missing_content_type_options',
-                            monthly_waste=0.0,
-                            annual_savings=0.0,
-                            description="Missing X-Content-Type-Options header",
-                            severity='low'
-                        )
-                        issues.append(issue)
-                    
-                    if 'x-frame-options' not in headers and 'content-security-policy' not in headers:
-                        issue = Leak(
-                            type='missing_clickjacking_protection',
-                            monthly_waste=0.0,
-                            annual_savings=0.0,
-                            description="Missing clickjacking protection (X-Frame-Options or CSP)",
-                            severity='medium'
-                        )
-                        issues.append(issue)
-            except:
-                pass  # Not critical if security header check fails
+            if snapshot.fetched:
+                # Check for important security headers
+                if not snapshot.has_header('strict-transport-security'):
+                    issue = Leak(
+                        type='missing_hsts_header',
+                        monthly_waste=0.0,
+                        annual_savings=0.0,
+                        description="Missing Strict-Transport-Security header",
+                        severity='medium'
+                    )
+                    issues.append(issue)
+                
+                if not snapshot.has_header('x-content-type-options'):
+                    issue = Leak(
+                        type='missing_content_type_options',
+                        monthly_waste=0.0,
+                        annual_savings=0.0,
+                        description="Missing X-Content-Type-Options header",
+                        severity='low'
+                    )
+                    issues.append(issue)
+                
+                if not snapshot.has_header('x-frame-options') and not snapshot.has_header('content-security-policy'):
+                    issue = Leak(
+                        type='missing_clickjacking_protection',
+                        monthly_waste=0.0,
+                        annual_savings=0.0,
+                        description="Missing clickjacking protection (X-Frame-Options or CSP)",
+                        severity='medium'
+                    )
+                    issues.append(issue)
             
             logger.info(f"Security analysis complete for {domain}: {len(issues)} issues found")
             
@@ -831,9 +888,8 @@ class LeakEngine(LeakEngineInterface):
 
     async def close(self):
         """Clean up resources."""
-        if self.session and not self.session.closed:
-            await self.session.close()
-            self.session = None
+        # The session is owned by the shared HTTP client registry
+        self.session = None
         
         # Close integrations
         if hasattr(self.ga_integration, 'close'):
@@ -978,9 +1034,8 @@ class LeakEngine(LeakEngineInterface):
 
     async def close(self):
         """Clean up resources."""
-        if self.session and not self.session.closed:
-            await self.session.close()
-            self.session = None
+        # The session is owned by the shared HTTP client registry
+        self.session = None
         
         # Close integrations
         if hasattr(self.ga_integration, 'close'):
@@ -1125,9 +1180,8 @@ class LeakEngine(LeakEngineInterface):
 
     async def close(self):
         """Clean up resources."""
-        if self.session and not self.session.closed:
-            await self.session.close()
-            self.session = None
+        # The session is owned by the shared HTTP client registry
+        self.session = None
         
         # Close integrations
         if hasattr(self.ga_integration, 'close'):
@@ -1358,51 +1412,38 @@ class LeakEngine(LeakEngineInterface):
         leaks = []
         
         try:
-            async with self.session.get(f"https://{domain}", timeout=10, ssl=False) as response:
-                if response.status != 200:
-                    logger.warning(f"HTTP detection for {domain} failed with status {response.status}")
-                    return []
-                
-                html = await response.text()
-                html_lower = html.lower()
-                
-                # Common SaaS detection patterns
-                patterns = {
-                    'klaviyo': ['klaviyo.com', 'klaviyo-media', 'kla.js'],
-                    'gorgias': ['gorgias.com', 'gorgias-chat', 'helpdesk.gorgias'],
-                    'recharge': ['rechargepayments.com', 'recharge-api'],
-                    'typeform': ['typeform.com', 'typeform.js', 'embed.typeform'],
-                    'shopify': ['shopify.com', 'shopify-analytics', 'shopify_stats'],
-                    'hotjar': ['hotjar.com', 'hjar'],
-                    'intercom': ['intercom.io', 'intercom.js'],
-                    'zendesk': ['zendesk.com', 'zopim.com']
-                }
-                
-                for vendor, vendor_patterns in patterns.items():
-                    if any(pattern in html_lower for pattern in vendor_patterns):
-                        if vendor in self.vendor_costs:
-                            vendor_info = self.vendor_costs[vendor]
-                            default_tier = list(vendor_info.keys())[0]
-                            
-                            if default_tier != 'categories':
-                                monthly_cost = vendor_info[default_tier]
-                                annual_cost = monthly_cost * 12
-                                
-                                leak = Leak(
-                                    type='vendor_waste',
-                                    monthly_waste=monthly_cost,
-                                    annual_savings=annual_cost,
-                                    description=f"{vendor.capitalize()} subscription detected via HTTP analysis",
-                                    severity='medium'
-                                )
-                                leaks.append(leak)
-                                logger.info(f"{domain}: {vendor} detected via HTTP - ${monthly_cost}/month")
-                
-                return leaks
-                
-        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
-            logger.warning(f"HTTP SaaS detection failed for {domain}: {e}")
-            return []
+            snapshot = await self._fetch_page_snapshot(domain)
+            
+            if snapshot.error:
+                logger.warning(f"HTTP SaaS detection failed for {domain}: {snapshot.error}")
+                return []
+            
+            if snapshot.status != 200:
+                logger.warning(f"HTTP detection for {domain} failed with status {snapshot.status}")
+                return []
+            
+            # Common SaaS signatures (see arco.utils.signatures), scanned once per page
+            for vendor in snapshot.signature_hits.vendors("leak_engine"):
+                if vendor in self.vendor_costs:
+                    vendor_info = self.vendor_costs[vendor]
+                    default_tier = list(vendor_info.keys())[0]
+                    
+                    if default_tier != 'categories':
+                        monthly_cost = vendor_info[default_tier]
+                        annual_cost = monthly_cost * 12
+                        
+                        leak = Leak(
+                            type='vendor_waste',
+                            monthly_waste=monthly_cost,
+                            annual_savings=annual_cost,
+                            description=f"{vendor.capitalize()} subscription detected via HTTP analysis",
+                            severity='medium'
+                        )
+                        leaks.append(leak)
+                        logger.info(f"{domain}: {vendor} detected via HTTP - ${monthly_cost}/month")
+            
+            return leaks
+            
         except Exception as e:
             logger.warning(f"Unexpected error during HTTP SaaS detection for {domain}: {e}")
             return []
@@ -1419,32 +1460,32 @@ class LeakEngine(LeakEngineInterface):
         """
         leaks = []
         try:
-            async with self.session.get(f"https://{domain}/cart.js", timeout=5, ssl=False) as response:
-                if response.status != 200:
-                    logger.warning(f"Shopify cart.js for {domain} failed with status {response.status}")
-                    return []
-                
-                cart_data = await response.json()
-                
-                # Look for subscription indicators
-                for item in cart_data.get('items', []):
-                    if 'subscription' in str(item).lower():
-                        # Estimate ReCharge cost based on subscription volume
-                        base_cost = 300  # ReCharge standard plan
-                        annual_cost = base_cost * 12
-                        
-                        leak = Leak(
-                            type='subscription_cost',
-                            monthly_waste=base_cost,
-                            annual_savings=annual_cost,
-                            description="ReCharge subscription service detected via Shopify cart analysis",
-                            severity='high'
-                        )
-                        leaks.append(leak)
-                        break  # Only count once
-                
-                return leaks
-                
+            response = await self.http_cache.fetch(self.session, f"https://{domain}/cart.js", timeout=5, ssl=False)
+            if response.status != 200:
+                logger.warning(f"Shopify cart.js for {domain} failed with status {response.status}")
+                return []
+            
+            cart_data = response.json()
+            
+            # Look for subscription indicators
+            for item in cart_data.get('items', []):
+                if 'subscription' in str(item).lower():
+                    # Estimate ReCharge cost based on subscription volume
+                    base_cost = 300  # ReCharge standard plan
+                    annual_cost = base_cost * 12
+                    
+                    leak = Leak(
+                        type='subscription_cost',
+                        monthly_waste=base_cost,
+                        annual_savings=annual_cost,
+                        description="ReCharge subscription service detected via Shopify cart analysis",
+                        severity='high'
+                    )
+                    leaks.append(leak)
+                    break  # Only count once
+            
+            return leaks
+            
         except (aiohttp.ClientError, asyncio.TimeoutError) as e:
             logger.warning(f"Shopify subscription check failed for {domain}: {e}")
             return []
@@ -1495,28 +1536,28 @@ class LeakEngine(LeakEngineInterface):
         try:
             url = f"https://rdap.org/domain/{domain}"
             
-            async with self.session.get(url, timeout=5, ssl=False) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    
-                    # Look for creation date
-                    for event in data.get('events', []):
-                        if event.get('eventAction') == 'registration':
-                            reg_date = datetime.fromisoformat(event['eventDate'].replace('Z', '+00:00'))
-                            age_days = (datetime.now(reg_date.tzinfo) - reg_date).days
-                            
-                            # Convert to authority score (0-100)
-                            if age_days < 180:  # < 6 months = hobby
-                                return 10.0
-                            elif age_days < 365:  # < 1 year
-                                return 40.0
-                            elif age_days < 1095:  # < 3 years
-                                return 70.0
-                            else:  # 3+ years
-                                return 90.0
-                else:
-                    logger.warning(f"RDAP check for {domain} failed with status {response.status}")
+            response = await self.http_cache.fetch(self.session, url, timeout=5, ssl=False, provider="rdap")
+            if response.status == 200:
+                data = response.json()
                 
+                # Look for creation date
+                for event in data.get('events', []):
+                    if event.get('eventAction') == 'registration':
+                        reg_date = datetime.fromisoformat(event['eventDate'].replace('Z', '+00:00'))
+                        age_days = (datetime.now(reg_date.tzinfo) - reg_date).days
+                        
+                        # Convert to authority score (0-100)
+                        if age_days < 180:  # < 6 months = hobby
+                            return 10.0
+                        elif age_days < 365:  # < 1 year
+                            return 40.0
+                        elif age_days < 1095:  # < 3 years
+                            return 70.0
+                        else:  # 3+ years
+                            return 90.0
+            else:
+                logger.warning(f"RDAP check for {domain} failed with status {response.status}")
+            
         except Exception as e:
             logger.warning(f"Domain authority check failed for {domain}: {e}")
             
@@ -1534,45 +1575,48 @@ class LeakEngine(LeakEngineInterface):
         """
         leaks = []
         try:
+            snapshot = await self._fetch_page_snapshot(domain)
+            
             # For now, do a simple check of JS/CSS bloat
-            async with self.session.get(f"https://{domain}", timeout=10, ssl=False) as response:
-                if response.status == 200:
-                    html = await response.text()
-                    
-                    # Count script tags (proxy for JS bloat)
-                    script_count = html.count('<script')
-                    css_count = html.count('<link rel="stylesheet"')
+            if snapshot.error:
+                logger.warning(f"Performance check failed for {domain}: {snapshot.error}")
+            elif snapshot.status == 200:
+                html = snapshot.body
+                
+                # Count script tags (proxy for JS bloat)
+                script_count = html.count('<script')
+                css_count = html.count('<link rel="stylesheet"')
+                
+                # Simple scoring: fewer scripts/CSS = better performance
+                total_assets = script_count + css_count
+                
+                perf_score = 0.0
+                if total_assets > 50:
+                    perf_score = 20.0  # Poor performance
                     
-                    # Simple scoring: fewer scripts/CSS = better performance
-                    total_assets = script_count + css_count
+                    # Estimate revenue impact: 1% conversion loss per second of load time
+                    # Assuming 10,000 visitors/month and $50 average order value
+                    monthly_loss = 100  # Conservative estimate
+                    annual_loss = monthly_loss * 12
                     
-                    perf_score = 0.0
-                    if total_assets > 50:
-                        perf_score = 20.0  # Poor performance
-                        
-                        # Estimate revenue impact: 1% conversion loss per second of load time
-                        # Assuming 10,000 visitors/month and $50 average order value
-                        monthly_loss = 100  # Conservative estimate
-                        annual_loss = monthly_loss * 12
-                        
-                        leak = Leak(
-                            type='performance_loss',
-                            monthly_waste=monthly_loss,
-                            annual_savings=annual_loss,
-                            description=f"Performance issues detected ({total_assets} assets) causing conversion loss",
-                            severity='high' if total_assets > 70 else 'medium'
-                        )
-                        leaks.append(leak)
-                        
-                    elif total_assets > 25:
-                        perf_score = 60.0  # Average
-                    else:
-                        perf_score = 90.0  # Good performance
+                    leak = Leak(
+                        type='performance_loss',
+                        monthly_waste=monthly_loss,
+                        annual_savings=annual_loss,
+                        description=f"Performance issues detected ({total_assets} assets) causing conversion loss",
+                        severity='high' if total_assets > 70 else 'medium'
+                    )
+                    leaks.append(leak)
                     
-                    return perf_score, leaks
+                elif total_assets > 25:
+                    perf_score = 60.0  # Average
                 else:
-                    logger.warning(f"Performance check for {domain} failed with status {response.status}")
-                        
+                    perf_score = 90.0  # Good performance
+                
+                return perf_score, leaks
+            else:
+                logger.warning(f"Performance check for {domain} failed with status {snapshot.status}")
+                    
         except Exception as e:
             logger.warning(f"Performance check failed for {domain}: {e}")
             
@@ -2111,9 +2155,8 @@ class LeakEngine(LeakEngineInterface):
 
     async def close(self):
         """Clean up resources."""
-        if self.session and not self.session.closed:
-            await self.session.close()
-            self.session = None
+        # The session is owned by the shared HTTP client registry
+        self.session = None
         
         # Close marketing integrations
         if hasattr(self.ga_integration, 'close'):
@@ -6,18 +6,63 @@ most promising leads for immediate outreach, based on company size, revenue
 potential, technology maturity, and growth indicators.
 """
 
-import asyncio
 import logging
 from dataclasses import dataclass, field
 from typing import List, Dict, Tuple, Optional, Any
 from datetime import datetime
 import yaml
 
+from ..core.executor import attribute_view, get_executor
 from ..models.prospect import Prospect
 from ..utils.config_loader import ConfigLoader
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Industry keywords (substring matches on the lowercased industry)
+HIGH_VALUE_INDUSTRIES = ['saas', 'software', 'technology', 'ecommerce', 'fintech']
+MEDIUM_VALUE_INDUSTRIES = ['healthcare', 'manufacturing', 'retail', 'education']
+
+# Industry multipliers, checked in order; unknown industries get DEFAULT_INDUSTRY_MULTIPLIER
+INDUSTRY_MULTIPLIERS = [
+    (['saas', 'software', 'fintech', 'ai', 'machine learning'], 1.2),   # Strong ROI potential
+    (['ecommerce', 'technology', 'healthcare', 'education'], 1.1),      # Good potential
+    (['manufacturing', 'retail', 'consulting', 'services'], 1.0),       # Standard
+    (['non-profit', 'government', 'agriculture'], 0.8)                  # Lower priority
+]
+DEFAULT_INDUSTRY_MULTIPLIER = 0.95
+
+# Technology names (exact matches on the lowercased technology)
+ENTERPRISE_TECH = [
+    'aws', 'azure', 'google cloud', 'kubernetes', 'docker',
+    'salesforce', 'hubspot', 'marketo', 'tableau', 'snowflake'
+]
+MODERN_STACK = [
+    'react', 'vue', 'angular', 'node.js', 'python', 'go',
+    'microservices', 'api', 'graphql', 'mongodb', 'postgresql'
+]
+MARTECH_STACK = [
+    'google analytics', 'google ads', 'facebook ads', 'linkedin ads',
+    'mailchimp', 'sendgrid', 'intercom', 'zendesk', 'stripe'
+]
+LEGACY_TECH = ['jquery', 'php', 'mysql', 'apache', 'wordpress', 'drupal']
+
+# Numeric prospect attributes the vectorized path loads into float columns
+_NUMERIC_TYPES = (int, float)
+
+# Prospect attributes read by score_prospect(), the only ones sent to process workers
+SCORED_ATTRIBUTES = (
+    'company_name', 'domain', 'industry', 'employee_count', 'revenue', 'funding_stage',
+    'technologies', 'last_funding_date', 'job_postings_count', 'traffic_growth_rate',
+    'decision_maker_emails', 'contact_email', 'linkedin_profiles', 'phone_numbers', 'website'
+)
+
 
 @dataclass
 class PriorityScore:
@@ -34,18 +79,173 @@ class PriorityScore:
     calculated_at: datetime = field(default_factory=datetime.now)
 
 
+def _scoring_view(prospect: Prospect) -> Any:
+    """Reduce a prospect to the attributes scoring reads (sent to process workers)."""
+    return attribute_view(prospect, SCORED_ATTRIBUTES)
+
+
+def _score_chunk(prospects: List[Prospect], scoring_weights: Dict[str, float]) -> List[PriorityScore]:
+    """Score a chunk of prospects or their views (runs inline or in a batch executor worker)."""
+    engine = PriorityEngine.for_weights(scoring_weights)
+    scores = []
+    for prospect in prospects:
+        try:
+            scores.append(engine.score_prospect(prospect))
+        except Exception as e:
+            logger.warning(f"Scoring failed for {prospect.domain}: {e}")
+            # Create minimal score for failed prospects
+            scores.append(PriorityScore(
+                total_score=0.0,
+                confidence_level=0.0,
+                priority_tier="LOW"
+            ))
+    return scores
+
+
+def _score_chunk_vectorized(prospects: List[Prospect], scoring_weights: Dict[str, float]) -> List[PriorityScore]:
+    """Score a chunk of prospects or their views with NumPy (runs inline or in a batch executor worker)."""
+    return PriorityEngine.for_weights(scoring_weights)._score_vectorized(prospects)
+
+
+class _FeatureColumns:
+    """Column arrays of the prospect attributes used by vectorized scoring."""
+
+    def __init__(self, size: int):
+        self.size = size
+        self.employee_count = np.zeros(size)
+        self.revenue = np.zeros(size)
+        self.job_postings = np.zeros(size)
+        self.traffic_growth = np.zeros(size)
+        self.days_since_funding = np.zeros(size, dtype=np.int64)
+        self.has_funding_date = np.zeros(size, dtype=bool)
+        self.tech_count = np.zeros(size, dtype=np.int64)
+        self.enterprise_matches = np.zeros(size, dtype=np.int64)
+        self.modern_matches = np.zeros(size, dtype=np.int64)
+        self.martech_matches = np.zeros(size, dtype=np.int64)
+        self.legacy_matches = np.zeros(size, dtype=np.int64)
+        self.industry_points = np.zeros(size)
+        self.funding_stage_points = np.zeros(size)
+        self.industry_multiplier = np.zeros(size)
+        self.has_decision_maker_emails = np.zeros(size, dtype=bool)
+        self.has_contact_email = np.zeros(size, dtype=bool)
+        self.has_linkedin_profiles = np.zeros(size, dtype=bool)
+        self.has_phone_numbers = np.zeros(size, dtype=bool)
+        self.data_points = np.zeros(size, dtype=np.int64)
+        self.details: List[Optional[Dict[str, Any]]] = [None] * size
+        
+        # Keyword scans are cached per distinct industry and funding stage
+        self._industry_cache: Dict[str, Tuple[float, float]] = {}
+        self._funding_stage_cache: Dict[str, float] = {}
+        self._tech_sets = [set(ENTERPRISE_TECH), set(MODERN_STACK), set(MARTECH_STACK), set(LEGACY_TECH)]
+
+    @staticmethod
+    def _number(value: Any) -> float:
+        """Convert a numeric attribute, rejecting values the scalar path would treat differently."""
+        if not isinstance(value, _NUMERIC_TYPES):
+            raise TypeError(f"unsupported numeric value {value!r}")
+        return float(value)
+
+    def load(self, row: int, prospect: Prospect, now: datetime) -> None:
+        """
+        Load one prospect into a row of the columns.
+        
+        Raises whenever the prospect is not fully representable, in which
+        case the row is left out (details stays None).
+        """
+        industry_value = getattr(prospect, 'industry', '')
+        industry = industry_value.lower()
+        funding_stage_value = getattr(prospect, 'funding_stage', '')
+        funding_stage = funding_stage_value.lower()
+        technologies = getattr(prospect, 'technologies', [])
+        tech_count = len(technologies)
+        tech_lower = {tech.lower() for tech in technologies}
+        employee_count = getattr(prospect, 'employee_count', 0)
+        revenue = getattr(prospect, 'revenue', 0)
+        job_postings = getattr(prospect, 'job_postings_count', 0)
+        last_funding_date = getattr(prospect, 'last_funding_date', None)
+        days_since_funding = (now - last_funding_date).days if last_funding_date else 0
+        
+        employee_number = self._number(employee_count)
+        revenue_number = self._number(revenue)
+        job_postings_number = self._number(job_postings)
+        traffic_growth = self._number(getattr(prospect, 'traffic_growth_rate', 0))
+        
+        if industry not in self._industry_cache:
+            self._industry_cache[industry] = (PriorityEngine._industry_potential(industry),
+                                              PriorityEngine._industry_multiplier(industry))
+        industry_points, industry_multiplier = self._industry_cache[industry]
+        if funding_stage not in self._funding_stage_cache:
+            self._funding_stage_cache[funding_stage] = PriorityEngine._funding_stage_points(funding_stage)
+        
+        contact_email = bool(getattr(prospect, 'contact_email', None))
+        linkedin_profiles = bool(getattr(prospect, 'linkedin_profiles', None))
+        details = {
+            "company_name": prospect.company_name,
+            "domain": prospect.domain,
+            "industry": getattr(prospect, 'industry', 'unknown'),
+            "employee_count": getattr(prospect, 'employee_count', 0),
+            "revenue": getattr(prospect, 'revenue', 0),
+            "industry_multiplier": industry_multiplier
+        }
+        
+        self.employee_count[row] = employee_number
+        self.revenue[row] = revenue_number
+        self.job_postings[row] = job_postings_number
+        self.traffic_growth[row] = traffic_growth
+        self.has_funding_date[row] = bool(last_funding_date)
+        self.days_since_funding[row] = days_since_funding
+        self.tech_count[row] = tech_count
+        (self.enterprise_matches[row], self.modern_matches[row],
+         self.martech_matches[row], self.legacy_matches[row]) = (len(tech_lower & tech_set)
+                                                                 for tech_set in self._tech_sets)
+        self.industry_points[row] = industry_points
+        self.funding_stage_points[row] = self._funding_stage_cache[funding_stage]
+        self.industry_multiplier[row] = industry_multiplier
+        self.has_decision_maker_emails[row] = bool(getattr(prospect, 'decision_maker_emails', None))
+        self.has_contact_email[row] = contact_email
+        self.has_linkedin_profiles[row] = linkedin_profiles
+        self.has_phone_numbers[row] = bool(getattr(prospect, 'phone_numbers', None))
+        self.data_points[row] = sum((
+            employee_number > 0, revenue_number > 0, bool(industry_value), bool(technologies),
+            bool(funding_stage_value), bool(last_funding_date), job_postings_number > 0,
+            contact_email, linkedin_profiles, bool(getattr(prospect, 'website', ''))
+        ))
+        self.details[row] = details
+
+
 class PriorityEngine:
     """Rapid lead scoring and prioritization engine."""
 
     def __init__(self, config_path: str = "config/production.yml"):
         """Initialize the priority engine with configuration."""
-        self.config_loader = ConfigLoader()
-        self.config = self.config_loader.load_config(config_path)
+        self.config_loader = ConfigLoader(config_path)
+        self.config = self.config_loader.config or {}
         self.scoring_weights = self._load_scoring_weights()
         self.industry_criteria = self._load_industry_criteria()
         
         logger.info("PriorityEngine initialized with scoring weights")
 
+    @classmethod
+    def for_weights(cls, scoring_weights: Dict[str, float]) -> 'PriorityEngine':
+        """
+        Create an engine that only holds scoring weights, without reading config.
+        
+        Batch executor workers get the weights instead of the whole engine;
+        score_prospect() needs nothing else.
+        
+        Args:
+            scoring_weights: Weights of the scoring components
+            
+        Returns:
+            PriorityEngine instance
+        """
+        engine = cls.__new__(cls)
+        engine.config_loader = None
+        engine.config = {}
+        engine.scoring_weights = scoring_weights
+        engine.industry_criteria = {}
+        return engine
+
     def _load_scoring_weights(self) -> Dict[str, float]:
         """Load scoring weights from configuration."""
         default_weights = {
@@ -63,45 +263,214 @@ class PriorityEngine:
         return self.config.get("qualification_criteria", {})
 
     async def score_batch(self, prospects: List[Prospect]) -> List[Tuple[Prospect, PriorityScore]]:
-        """Score a batch of prospects and return sorted by priority."""
+        """
+        Score a batch of prospects and return sorted by priority.
+        
+        Scoring is CPU-bound, so the batch is fanned out in chunks on the
+        shared batch executor (inline, thread or process mode); thread and
+        process modes keep it off the event loop. Each chunk is scored with
+        NumPy when it is installed and prospect by prospect otherwise.
+        Process workers get the scoring weights and the scored prospect
+        attributes, and only the scores come back. Ties keep their input order.
+        """
         logger.info(f"Starting priority scoring for {len(prospects)} prospects")
         
-        scored_prospects = []
-        
-        # Process prospects concurrently for speed
-        tasks = [self._calculate_priority_score(prospect) for prospect in prospects]
-        scores = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        for prospect, score in zip(prospects, scores):
-            if isinstance(score, Exception):
-                logger.warning(f"Scoring failed for {prospect.domain}: {score}")
-                # Create minimal score for failed prospects
-                score = PriorityScore(
-                    total_score=0.0,
-                    confidence_level=0.0,
-                    priority_tier="LOW"
-                )
-            
-            scored_prospects.append((prospect, score))
+        chunk_function = _score_chunk_vectorized if NUMPY_AVAILABLE else _score_chunk
+        scores = await get_executor().map_async(chunk_function, prospects, self.scoring_weights,
+                                                view=_scoring_view)
+        scored_prospects = list(zip(prospects, scores))
         
         # Sort by total score descending
         scored_prospects.sort(key=lambda x: x[1].total_score, reverse=True)
         
-        logger.info(f"Priority scoring completed. Top score: {scored_prospects[0][1].total_score:.2f}")
+        if scored_prospects:
+            logger.info(f"Priority scoring completed. Top score: {scored_prospects[0][1].total_score:.2f}")
         return scored_prospects
 
+    def score_batch_vectorized(self, prospects: List[Prospect]) -> List[Tuple[Prospect, PriorityScore]]:
+        """
+        Score a batch of prospects with NumPy and return sorted by priority.
+        
+        Prospect attributes are read once into column arrays and every
+        component score, multiplier and tier is computed as an array
+        operation. Results match score_prospect() exactly (ties keep their
+        input order); prospects whose attributes the columns cannot hold are
+        scored by the scalar path.
+        
+        Args:
+            prospects: Prospects to score
+            
+        Returns:
+            List of (prospect, score) tuples, highest score first
+        """
+        logger.info(f"Starting vectorized priority scoring for {len(prospects)} prospects")
+        
+        scores = self._score_vectorized(prospects)
+        
+        totals = np.fromiter((score.total_score for score in scores), dtype=np.float64, count=len(scores))
+        order = np.argsort(-totals, kind="stable")
+        scored_prospects = [(prospects[row], scores[row]) for row in order.tolist()]
+        
+        if scored_prospects:
+            logger.info(f"Priority scoring completed. Top score: {scored_prospects[0][1].total_score:.2f}")
+        return scored_prospects
+
+    def _score_vectorized(self, prospects: List[Prospect]) -> List[PriorityScore]:
+        """Score prospects (or their views) with NumPy, in input order."""
+        now = datetime.now()
+        features = _FeatureColumns(len(prospects))
+        fallback_rows = []
+        for row, prospect in enumerate(prospects):
+            try:
+                features.load(row, prospect, now)
+            except Exception:
+                fallback_rows.append(row)
+        
+        scores = self._score_columns(features, now)
+        
+        # Prospects the columns cannot hold are scored (or fail) exactly as score_prospect would
+        if fallback_rows:
+            fallback_scores = _score_chunk([prospects[row] for row in fallback_rows], self.scoring_weights)
+            for row, score in zip(fallback_rows, fallback_scores):
+                scores[row] = score
+        return scores
+
+    def _score_columns(self, f: "_FeatureColumns", now: datetime) -> List[Optional[PriorityScore]]:
+        """Score loaded feature columns (rows that failed to load come back as None)."""
+        if f.size == 0:
+            return []
+        
+        # Company size
+        employee_points = np.select(
+            [f.employee_count >= 500, f.employee_count >= 100, f.employee_count >= 50,
+             f.employee_count >= 20, f.employee_count >= 10, f.employee_count > 0],
+            [50.0, 40.0, 30.0, 20.0, 15.0, 10.0], 0.0)
+        revenue_points = np.select(
+            [f.revenue >= 50000000, f.revenue >= 10000000, f.revenue >= 5000000,
+             f.revenue >= 1000000, f.revenue >= 500000, f.revenue > 0],
+            [50.0, 40.0, 30.0, 25.0, 20.0, 10.0], 0.0)
+        company_size = np.minimum(employee_points + revenue_points, 100.0)
+        
+        # Revenue potential
+        stack_points = np.select([f.tech_count >= 20, f.tech_count >= 10, f.tech_count >= 5],
+                                 [30.0, 20.0, 10.0], 0.0)
+        revenue_potential = np.minimum(f.industry_points + f.funding_stage_points + stack_points, 100.0)
+        
+        # Technology maturity
+        maturity = (np.minimum(f.enterprise_matches * 15, 45) +
+                    np.minimum(f.modern_matches * 10, 30) +
+                    np.minimum(f.martech_matches * 8, 25))
+        technology_maturity = np.where(f.tech_count == 0, 20.0, np.minimum(maturity, 100.0))
+        
+        # Growth indicators
+        funding_points = np.where(f.has_funding_date,
+                                  np.select([f.days_since_funding <= 365, f.days_since_funding <= 730],
+                                            [40.0, 25.0], 10.0), 0.0)
+        job_points = np.select([f.job_postings >= 20, f.job_postings >= 10, f.job_postings >= 5, f.job_postings > 0],
+                               [30.0, 20.0, 15.0, 10.0], 0.0)
+        traffic_points = np.select([f.traffic_growth > 0.5, f.traffic_growth > 0.2, f.traffic_growth > 0],
+                                   [30.0, 20.0, 10.0], 0.0)
+        growth_indicators = np.minimum(funding_points + job_points + traffic_points, 100.0)
+        
+        # Contact accessibility
+        email_points = np.select([f.has_decision_maker_emails, f.has_contact_email], [40.0, 25.0], 0.0)
+        size_points = np.select([f.employee_count <= 50, f.employee_count <= 200], [10.0, 5.0], 0.0)
+        contact_accessibility = np.minimum(
+            email_points + np.where(f.has_linkedin_profiles, 30.0, 0.0) +
+            np.where(f.has_phone_numbers, 20.0, 0.0) + size_points, 100.0)
+        
+        # Weighted total, in the same operation order as score_prospect()
+        weights = self.scoring_weights
+        base_score = (
+            company_size * weights["company_size"] +
+            revenue_potential * weights["revenue_potential"] +
+            technology_maturity * weights["technology_maturity"] +
+            growth_indicators * weights["growth_indicators"] +
+            contact_accessibility * weights["contact_accessibility"]
+        )
+        total_score = base_score * f.industry_multiplier
+        
+        # Market timing factors
+        funding_timing = np.where(f.has_funding_date,
+                                  np.select([f.days_since_funding <= 180, f.days_since_funding <= 365],
+                                            [0.15, 0.10], 0.0), 0.0)
+        hiring_timing = np.select([f.job_postings >= 15, f.job_postings >= 5], [0.10, 0.05], 0.0)
+        legacy_timing = np.where(f.legacy_matches >= 3, 0.08, 0.0)
+        if now.month in [10, 11, 12]:
+            seasonal_timing = 0.05
+        elif now.month in [1, 2]:
+            seasonal_timing = 0.03
+        else:
+            seasonal_timing = 0.0
+        total_score = total_score * (1.0 + funding_timing + hiring_timing + legacy_timing + seasonal_timing)
+        total_score = np.minimum(np.maximum(total_score, 0.0), 100.0)
+        
+        # Confidence and tier
+        confidence_level = (f.data_points / 10) * 100.0
+        adjusted_score = total_score * np.maximum(0.5, confidence_level / 100.0)
+        priority_tier = np.select(
+            [(adjusted_score >= 65.0) & (confidence_level >= 70.0),
+             (adjusted_score >= 40.0) & (confidence_level >= 50.0)],
+            ["HIGH", "MEDIUM"], "LOW")
+        
+        columns = zip(total_score.tolist(), company_size.tolist(), revenue_potential.tolist(),
+                      technology_maturity.tolist(), growth_indicators.tolist(),
+                      contact_accessibility.tolist(), confidence_level.tolist(), priority_tier.tolist(),
+                      base_score.tolist())
+        scores: List[Optional[PriorityScore]] = []
+        for row, (total, size, revenue, technology, growth, contact, confidence, tier, base) in enumerate(columns):
+            details = f.details[row]
+            if details is None:
+                scores.append(None)
+                continue
+            scores.append(PriorityScore(
+                total_score=total,
+                company_size_score=size,
+                revenue_potential_score=revenue,
+                technology_maturity_score=technology,
+                growth_indicators_score=growth,
+                contact_accessibility_score=contact,
+                confidence_level=confidence,
+                priority_tier=tier,
+                scoring_details={**details, "base_score": base},
+                calculated_at=now
+            ))
+        return scores
+
     def get_top_percentage(self, 
                           scored_prospects: List[Tuple[Prospect, PriorityScore]],
                           percentage: float = 0.1) -> List[Tuple[Prospect, PriorityScore]]:
-        """Get top percentage of prospects (default 10%)."""
+        """
+        Get top percentage of prospects (default 10%).
+        
+        The input does not need to be sorted: the top prospects are selected
+        with a partial sort and returned highest score first, ties in input
+        order.
+        """
         count = max(1, int(len(scored_prospects) * percentage))
-        top_prospects = scored_prospects[:count]
+        if NUMPY_AVAILABLE and count < len(scored_prospects):
+            totals = np.fromiter((score.total_score for _, score in scored_prospects),
+                                 dtype=np.float64, count=len(scored_prospects))
+            threshold = totals[np.argpartition(-totals, count - 1)[count - 1]]
+            
+            # Everything above the threshold, then ties in input order
+            above = np.flatnonzero(totals > threshold)
+            ties = np.flatnonzero(totals == threshold)[:count - len(above)]
+            selected = np.concatenate([above, ties])
+            selected = selected[np.lexsort((selected, -totals[selected]))]
+            top_prospects = [scored_prospects[row] for row in selected.tolist()]
+        else:
+            top_prospects = sorted(scored_prospects, key=lambda x: x[1].total_score, reverse=True)[:count]
         
         logger.info(f"Selected top {count} prospects ({percentage*100:.1f}%) for priority outreach")
         return top_prospects
 
     async def _calculate_priority_score(self, prospect: Prospect) -> PriorityScore:
         """Calculate comprehensive priority score for a prospect."""
+        return self.score_prospect(prospect)
+
+    def score_prospect(self, prospect: Prospect) -> PriorityScore:
+        """Calculate comprehensive priority score for a prospect (synchronously)."""
         try:
             # Calculate individual scoring components
             company_size_score = self._score_company_size(prospect)
@@ -202,23 +571,10 @@ class PriorityEngine:
         score = 0.0
         
         # Industry-based potential
-        industry = getattr(prospect, 'industry', '').lower()
-        high_value_industries = ['saas', 'software', 'technology', 'ecommerce', 'fintech']
-        medium_value_industries = ['healthcare', 'manufacturing', 'retail', 'education']
-        
-        if any(ind in industry for ind in high_value_industries):
-            score += 40.0
-        elif any(ind in industry for ind in medium_value_industries):
-            score += 25.0
-        else:
-            score += 15.0
+        score += self._industry_potential(getattr(prospect, 'industry', '').lower())
         
         # Growth stage indicators
-        funding_stage = getattr(prospect, 'funding_stage', '').lower()
-        if 'series' in funding_stage or 'growth' in funding_stage:
-            score += 30.0
-        elif 'seed' in funding_stage or 'angel' in funding_stage:
-            score += 20.0
+        score += self._funding_stage_points(getattr(prospect, 'funding_stage', '').lower())
         
         # Technology budget indicators
         tech_stack_size = len(getattr(prospect, 'technologies', []))
@@ -231,6 +587,24 @@ class PriorityEngine:
         
         return min(score, 100.0)
 
+    @staticmethod
+    def _industry_potential(industry: str) -> float:
+        """Revenue potential points for a lowercased industry."""
+        if any(ind in industry for ind in HIGH_VALUE_INDUSTRIES):
+            return 40.0
+        elif any(ind in industry for ind in MEDIUM_VALUE_INDUSTRIES):
+            return 25.0
+        return 15.0
+
+    @staticmethod
+    def _funding_stage_points(funding_stage: str) -> float:
+        """Revenue potential points for a lowercased funding stage."""
+        if 'series' in funding_stage or 'growth' in funding_stage:
+            return 30.0
+        elif 'seed' in funding_stage or 'angel' in funding_stage:
+            return 20.0
+        return 0.0
+
     def _score_technology_maturity(self, prospect: Prospect) -> float:
         """Score based on technology stack maturity and sophistication."""
         score = 0.0
@@ -239,36 +613,18 @@ class PriorityEngine:
         if not technologies:
             return 20.0  # Default score for unknown tech stack
         
-        # Enterprise technology indicators
-        enterprise_tech = [
-            'aws', 'azure', 'google cloud', 'kubernetes', 'docker',
-            'salesforce', 'hubspot', 'marketo', 'tableau', 'snowflake'
-        ]
-        
-        # Modern development stack
-        modern_stack = [
-            'react', 'vue', 'angular', 'node.js', 'python', 'go',
-            'microservices', 'api', 'graphql', 'mongodb', 'postgresql'
-        ]
-        
-        # Marketing technology stack
-        martech_stack = [
-            'google analytics', 'google ads', 'facebook ads', 'linkedin ads',
-            'mailchimp', 'sendgrid', 'intercom', 'zendesk', 'stripe'
-        ]
-        
         tech_lower = [tech.lower() for tech in technologies]
         
         # Score enterprise technologies
-        enterprise_matches = sum(1 for tech in enterprise_tech if any(t in tech_lower for t in [tech]))
+        enterprise_matches = sum(1 for tech in ENTERPRISE_TECH if any(t in tech_lower for t in [tech]))
         score += min(enterprise_matches * 15, 45)
         
         # Score modern development stack
-        modern_matches = sum(1 for tech in modern_stack if any(t in tech_lower for t in [tech]))
+        modern_matches = sum(1 for tech in MODERN_STACK if any(t in tech_lower for t in [tech]))
         score += min(modern_matches * 10, 30)
         
         # Score marketing technology
-        martech_matches = sum(1 for tech in martech_stack if any(t in tech_lower for t in [tech]))
+        martech_matches = sum(1 for tech in MARTECH_STACK if any(t in tech_lower for t in [tech]))
         score += min(martech_matches * 8, 25)
         
         return min(score, 100.0)
@@ -381,27 +737,17 @@ class PriorityEngine:
 
     def _get_industry_multiplier(self, prospect: Prospect) -> float:
         """Get industry-specific multiplier for realistic scoring."""
-        industry = getattr(prospect, 'industry', '').lower()
-        
-        # High-value industries with strong ROI potential
-        if any(ind in industry for ind in ['saas', 'software', 'fintech', 'ai', 'machine learning']):
-            return 1.2
-        
-        # Medium-value industries with good potential
-        elif any(ind in industry for ind in ['ecommerce', 'technology', 'healthcare', 'education']):
-            return 1.1
-        
-        # Standard industries
-        elif any(ind in industry for ind in ['manufacturing', 'retail', 'consulting', 'services']):
-            return 1.0
-        
-        # Lower priority industries
-        elif any(ind in industry for ind in ['non-profit', 'government', 'agriculture']):
-            return 0.8
+        return self._industry_multiplier(getattr(prospect, 'industry', '').lower())
+
+    @staticmethod
+    def _industry_multiplier(industry: str) -> float:
+        """Industry multiplier for a lowercased industry."""
+        for keywords, multiplier in INDUSTRY_MULTIPLIERS:
+            if any(ind in industry for ind in keywords):
+                return multiplier
         
         # Unknown industry - neutral multiplier
-        else:
-            return 0.95
+        return DEFAULT_INDUSTRY_MULTIPLIER
 
     def _apply_market_timing_factors(self, score: float, prospect: Prospect) -> float:
         """Apply market timing and urgency factors to the score."""
@@ -425,10 +771,9 @@ class PriorityEngine:
         
         # Technology debt indicators (older tech stack = more urgent need)
         technologies = getattr(prospect, 'technologies', [])
-        legacy_tech = ['jquery', 'php', 'mysql', 'apache', 'wordpress', 'drupal']
         tech_lower = [tech.lower() for tech in technologies]
         
-        legacy_matches = sum(1 for tech in legacy_tech if any(t in tech_lower for t in [tech]))
+        legacy_matches = sum(1 for tech in LEGACY_TECH if any(t in tech_lower for t in [tech]))
         if legacy_matches >= 3:
             timing_multiplier += 0.08  # Higher urgency for tech modernization
         
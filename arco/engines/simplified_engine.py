@@ -11,13 +11,14 @@ import yaml
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 import logging
-import httpx
 import os
 
 from arco.engines.base import LeakEngineInterface
 from arco.models.prospect import Prospect
 from arco.models.leak_result import LeakResult
 from arco.models.qualified_prospect import QualifiedProspect, Leak
+from arco.core.http_clients import HTTPClientRegistry, get_http_clients
+from arco.utils.http_cache import HTTPResponseCache, get_http_cache
 from arco.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -28,8 +29,17 @@ class SimplifiedEngine(LeakEngineInterface):
     Python-only implementation with no external CLI dependencies.
     """
     
-    def __init__(self):
-        """Initialize the SimplifiedEngine."""
+    def __init__(self, http_cache: Optional[HTTPResponseCache] = None,
+                 http_clients: Optional[HTTPClientRegistry] = None):
+        """
+        Initialize the SimplifiedEngine.
+        
+        Args:
+            http_cache: Shared HTTP response cache (defaults to the global cache)
+            http_clients: Shared HTTP client registry (defaults to the global registry)
+        """
+        self.http_cache = http_cache or get_http_cache()
+        self.http_clients = http_clients or get_http_clients()
         self.vendor_costs = self._load_vendor_database()
         self.min_monthly_waste = 40
         self.min_qualification_score = 60
@@ -167,31 +177,31 @@ class SimplifiedEngine(LeakEngineInterface):
         leaks = []
         
         try:
-            async with httpx.AsyncClient(timeout=10) as client:
-                # Check main page
-                response = await client.get(f"https://{domain}")
-                html_content = response.text.lower()
-                
-                # Common technology patterns
-                tech_patterns = {
-                    'klaviyo': {'cost': 150, 'category': 'email_marketing'},
-                    'typeform': {'cost': 50, 'category': 'forms'},
-                    'gorgias': {'cost': 150, 'category': 'customer_support'},
-                    'hotjar': {'cost': 99, 'category': 'analytics'},
-                    'intercom': {'cost': 99, 'category': 'live_chat'},
-                }
-                
-                for tech_name, tech_data in tech_patterns.items():
-                    if tech_name in html_content:
-                        leak = Leak(
-                            type='vendor_waste',
-                            monthly_waste=tech_data['cost'],
-                            annual_savings=tech_data['cost'] * 12,
-                            description=f"{tech_name.capitalize()} subscription detected via HTTP analysis",
-                            severity='medium'
-                        )
-                        leaks.append(leak)
-                        logger.info(f"Detected {tech_name}: ${tech_data['cost']}/month (HTTP detection)")
+            client = self.http_clients.get_httpx_client()
+            # Check main page
+            response = await self.http_cache.fetch(client, f"https://{domain}", timeout=10)
+            html_content = response.text().lower()
+            
+            # Common technology patterns
+            tech_patterns = {
+                'klaviyo': {'cost': 150, 'category': 'email_marketing'},
+                'typeform': {'cost': 50, 'category': 'forms'},
+                'gorgias': {'cost': 150, 'category': 'customer_support'},
+                'hotjar': {'cost': 99, 'category': 'analytics'},
+                'intercom': {'cost': 99, 'category': 'live_chat'},
+            }
+            
+            for tech_name, tech_data in tech_patterns.items():
+                if tech_name in html_content:
+                    leak = Leak(
+                        type='vendor_waste',
+                        monthly_waste=tech_data['cost'],
+                        annual_savings=tech_data['cost'] * 12,
+                        description=f"{tech_name.capitalize()} subscription detected via HTTP analysis",
+                        severity='medium'
+                    )
+                    leaks.append(leak)
+                    logger.info(f"Detected {tech_name}: ${tech_data['cost']}/month (HTTP detection)")
         
         except Exception as e:
             logger.warning(f"HTTP analysis failed: {e}")
@@ -203,34 +213,34 @@ class SimplifiedEngine(LeakEngineInterface):
         leaks = []
         
         try:
-            async with httpx.AsyncClient(timeout=10) as client:
-                # Check for Shopify store
-                response = await client.get(f"https://{domain}/cart.js")
+            client = self.http_clients.get_httpx_client()
+            # Check for Shopify store
+            response = await self.http_cache.fetch(client, f"https://{domain}/cart.js", timeout=10)
+            
+            if response.status == 200:
+                # Shopify store detected - common apps
+                common_apps = {
+                    'recharge': 300,  # Subscription management
+                    'klaviyo': 150,  # Email marketing
+                    'yotpo': 359,    # Reviews
+                    'gorgias': 150,  # Customer support
+                }
                 
-                if response.status_code == 200:
-                    # Shopify store detected - common apps
-                    common_apps = {
-                        'recharge': 300,  # Subscription management
-                        'klaviyo': 150,  # Email marketing
-                        'yotpo': 359,    # Reviews
-                        'gorgias': 150,  # Customer support
-                    }
+                for app_name, cost in common_apps.items():
+                    # Simplified detection - assume presence
+                    leak = Leak(
+                        type='subscription_cost',
+                        monthly_waste=cost,
+                        annual_savings=cost * 12,
+                        description=f"{app_name.capitalize()} Shopify app subscription",
+                        severity='medium'
+                    )
+                    leaks.append(leak)
+                    logger.info(f"Detected {app_name}: ${cost}/month (Shopify app)")
                     
-                    for app_name, cost in common_apps.items():
-                        # Simplified detection - assume presence
-                        leak = Leak(
-                            type='subscription_cost',
-                            monthly_waste=cost,
-                            annual_savings=cost * 12,
-                            description=f"{app_name.capitalize()} Shopify app subscription",
-                            severity='medium'
-                        )
-                        leaks.append(leak)
-                        logger.info(f"Detected {app_name}: ${cost}/month (Shopify app)")
-                        
-                        # Only add first 2 to be realistic
-                        if len(leaks) >= 2:
-                            break
+                    # Only add first 2 to be realistic
+                    if len(leaks) >= 2:
+                        break
         
         except Exception as e:
             logger.warning(f"Shopify analysis failed: {e}")
@@ -243,24 +253,24 @@ class SimplifiedEngine(LeakEngineInterface):
         
         # Performance-based waste (simplified calculation)
         try:
-            async with httpx.AsyncClient(timeout=15) as client:
-                start_time = asyncio.get_event_loop().time()
-                response = await client.get(f"https://{domain}")
-                load_time = asyncio.get_event_loop().time() - start_time
+            client = self.http_clients.get_httpx_client()
+            start_time = asyncio.get_event_loop().time()
+            response = await client.get(f"https://{domain}", timeout=15)
+            load_time = asyncio.get_event_loop().time() - start_time
+            
+            # If site loads slowly, estimate conversion loss
+            if load_time > 3.0:  # 3+ seconds is slow
+                estimated_loss = int(load_time * 50)  # $50 per extra second
                 
-                # If site loads slowly, estimate conversion loss
-                if load_time > 3.0:  # 3+ seconds is slow
-                    estimated_loss = int(load_time * 50)  # $50 per extra second
-                    
-                    leak = Leak(
-                        type='performance_loss',
-                        monthly_waste=estimated_loss,
-                        annual_savings=estimated_loss * 12,
-                        description=f"Slow site performance ({load_time:.1f}s load time) causing conversion loss",
-                        severity='high' if load_time > 5.0 else 'medium'
-                    )
-                    leaks.append(leak)
-                    logger.info(f"Performance loss: ${estimated_loss}/month ({load_time:.1f}s load)")
+                leak = Leak(
+                    type='performance_loss',
+                    monthly_waste=estimated_loss,
+                    annual_savings=estimated_loss * 12,
+                    description=f"Slow site performance ({load_time:.1f}s load time) causing conversion loss",
+                    severity='high' if load_time > 5.0 else 'medium'
+                )
+                leaks.append(leak)
+                logger.info(f"Performance loss: ${estimated_loss}/month ({load_time:.1f}s load)")
         
         except Exception as e:
             logger.warning(f"Performance analysis failed: {e}")
@@ -9,38 +9,53 @@ import logging
 import yaml
 import os
 import asyncio
-import aiohttp
-import socket
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Iterable, AsyncIterator, Tuple
 from datetime import datetime
 
+from arco.core.http_clients import HTTPClientRegistry, get_http_clients
 from arco.engines.base import ValidatorEngineInterface
 from arco.models.prospect import Prospect
+from arco.utils.dns_resolver import DNSResolver, get_dns_resolver
+from arco.utils.http_cache import HTTPResponseCache, get_http_cache
 from arco.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+DEFAULT_CONCURRENCY = 50  # prospects validated at once
+DEFAULT_PER_HOST_CONCURRENCY = 2  # requests in flight to the same domain
+
 class ValidatorEngine(ValidatorEngineInterface):
     """
     Validator engine implementation for ARCO.
     Validates prospects to ensure data accuracy and quality.
     """
     
-    def __init__(self, config_path: str = "config/production.yml"):
+    def __init__(self, config_path: str = "config/production.yml",
+                 http_cache: Optional[HTTPResponseCache] = None,
+                 http_clients: Optional[HTTPClientRegistry] = None,
+                 dns_resolver: Optional[DNSResolver] = None):
         """
         Initialize the validator engine.
         
         Args:
             config_path: Path to the configuration file.
+            http_cache: Shared HTTP response cache (defaults to the global cache)
+            http_clients: Shared HTTP client registry (defaults to the global registry)
+            dns_resolver: Shared DNS resolver (defaults to the global resolver)
         """
         self.config_path = config_path
         self.session = None
+        self.http_cache = http_cache or get_http_cache()
+        self.http_clients = http_clients or get_http_clients()
+        self.dns_resolver = dns_resolver or get_dns_resolver()
         self.validation_thresholds = {
             'domain_existence': 0.4,  # 40% of score
             'company_info': 0.3,      # 30% of score
             'technology_info': 0.2,   # 20% of score
             'contact_info': 0.1       # 10% of score
         }
+        self.concurrency = DEFAULT_CONCURRENCY
+        self.per_host_concurrency = DEFAULT_PER_HOST_CONCURRENCY
         
         logger.info(f"ValidatorEngine initialized with config: {config_path}")
         
@@ -66,6 +81,13 @@ class ValidatorEngine(ValidatorEngineInterface):
                     if 'validation' in config and 'thresholds' in config['validation']:
                         self.validation_thresholds.update(config['validation']['thresholds'])
                     
+                    # Update batch concurrency limits if specified in config
+                    validation_config = config.get('validation') or {}
+                    self.concurrency = max(1, int(validation_config.get('concurrency', self.concurrency)))
+                    self.per_host_concurrency = max(
+                        1, int(validation_config.get('per_host_concurrency', self.per_host_concurrency))
+                    )
+                    
                     logger.info(f"Loaded configuration from {path}")
                     return
             
@@ -112,6 +134,23 @@ class ValidatorEngine(ValidatorEngineInterface):
         logger.info(f"Batch validation complete for {len(validated_prospects)} prospects")
         return validated_prospects
     
+    async def filter_resolvable(self, prospects: List[Prospect]) -> List[Prospect]:
+        """
+        Drop prospects whose domain does not resolve, before any HTTP work.
+        
+        Args:
+            prospects: List of prospects to check
+            
+        Returns:
+            Prospects whose domain resolves, in input order
+        """
+        resolves = await self.dns_resolver.resolve_many(p.domain for p in prospects)
+        live = [p for p in prospects if resolves.get(p.domain)]
+        
+        if len(live) < len(prospects):
+            logger.info(f"Dropped {len(prospects) - len(live)} prospects with unresolvable domains")
+        return live
+    
     async def _validate_async(self, prospect: Prospect) -> Prospect:
         """
         Asynchronously validate a prospect.
@@ -122,9 +161,8 @@ class ValidatorEngine(ValidatorEngineInterface):
         Returns:
             Validated prospect with updated validation score
         """
-        # Ensure session is created if not already
-        if self.session is None or self.session.closed:
-            self.session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(ssl=False))
+        # Borrow the pooled session for this event loop
+        self.session = self.http_clients.get_session(verify_ssl=False)
         
         try:
             # Validate domain existence
@@ -166,30 +204,103 @@ class ValidatorEngine(ValidatorEngineInterface):
             prospects: List of prospects to validate
             
         Returns:
-            List of validated prospects with updated validation scores
+            List of validated prospects with updated validation scores, in input order
+        """
+        result: List[Optional[Prospect]] = [None] * len(prospects)
+        async for index, prospect in self._validate_stream_indexed(prospects):
+            result[index] = prospect
+        return result
+    
+    async def validate_stream(self, prospects: Iterable[Prospect],
+                              concurrency: Optional[int] = None) -> AsyncIterator[Prospect]:
+        """
+        Validate prospects with a bounded worker pool, yielding each as it finishes.
+        
+        Prospects are pulled from the iterable lazily, so downstream stages can
+        start consuming before the whole batch is validated.
+        
+        Args:
+            prospects: Prospects to validate (any iterable, consumed lazily)
+            concurrency: Maximum prospects in flight (defaults to validation.concurrency)
+            
+        Yields:
+            Validated prospects, in completion order
         """
-        # Ensure session is created if not already
-        if self.session is None or self.session.closed:
-            self.session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(ssl=False))
+        async for _, prospect in self._validate_stream_indexed(prospects, concurrency):
+            yield prospect
+    
+    async def _validate_stream_indexed(self, prospects: Iterable[Prospect],
+                                       concurrency: Optional[int] = None) -> AsyncIterator[Tuple[int, Prospect]]:
+        """
+        Validate prospects with a bounded worker pool and per-host limits.
         
-        # Create tasks for all prospects
-        tasks = [self._validate_async(prospect) for prospect in prospects]
+        Args:
+            prospects: Prospects to validate (any iterable, consumed lazily)
+            concurrency: Maximum prospects in flight (defaults to validation.concurrency)
+            
+        Yields:
+            Tuples of (input index, validated prospect), in completion order
+        """
+        concurrency = max(1, concurrency or self.concurrency)
         
-        # Run all validation tasks concurrently
-        validated_prospects = await asyncio.gather(*tasks, return_exceptions=True)
+        # Borrow the pooled session for this event loop
+        self.session = self.http_clients.get_session(verify_ssl=False)
         
-        # Handle any exceptions
-        result = []
-        for i, prospect_or_exception in enumerate(validated_prospects):
-            if isinstance(prospect_or_exception, Exception):
-                logger.error(f"Error validating prospect {prospects[i].domain}: {prospect_or_exception}")
+        source = enumerate(prospects)
+        finished: asyncio.Queue = asyncio.Queue(maxsize=concurrency)
+        host_slots: Dict[str, asyncio.Semaphore] = {}
+        host_users: Dict[str, int] = {}
+        
+        async def validate_one(prospect: Prospect) -> Prospect:
+            host = prospect.domain.lower()
+            slot = host_slots.setdefault(host, asyncio.Semaphore(self.per_host_concurrency))
+            host_users[host] = host_users.get(host, 0) + 1
+            try:
+                async with slot:
+                    return await self._validate_async(prospect)
+            except Exception as e:
+                logger.error(f"Error validating prospect {prospect.domain}: {e}")
                 # Return the original prospect with zero validation score
-                prospects[i].validation_score = 0.0
-                result.append(prospects[i])
-            else:
-                result.append(prospect_or_exception)
+                prospect.validation_score = 0.0
+                return prospect
+            finally:
+                host_users[host] -= 1
+                if not host_users[host]:
+                    del host_users[host]
+                    del host_slots[host]
         
-        return result
+        async def worker() -> None:
+            # Workers share one iterator, so each prospect is validated once
+            for index, prospect in source:
+                await finished.put((index, await validate_one(prospect)))
+        
+        async def run_workers() -> None:
+            workers = [asyncio.ensure_future(worker()) for _ in range(concurrency)]
+            cancelled = False
+            try:
+                await asyncio.gather(*workers)
+            except asyncio.CancelledError:
+                cancelled = True
+                raise
+            finally:
+                for task in workers:
+                    task.cancel()
+                # A cancelled runner means the consumer is gone and nobody
+                # would drain the queue to make room for the sentinel
+                if not cancelled:
+                    await finished.put(None)
+        
+        runner = asyncio.ensure_future(run_workers())
+        try:
+            while True:
+                item = await finished.get()
+                if item is None:
+                    break
+                yield item
+            await runner
+        finally:
+            if not runner.done():
+                runner.cancel()
     
     async def _validate_domain(self, domain: str) -> float:
         """
@@ -202,27 +313,19 @@ class ValidatorEngine(ValidatorEngineInterface):
             Validation score for domain existence (0.0-1.0)
         """
         try:
-            # Check if domain resolves
-            try:
-                socket.gethostbyname(domain)
-                dns_resolves = True
-            except socket.gaierror:
-                dns_resolves = False
+            # Check if domain resolves (without blocking the event loop)
+            if not await self.dns_resolver.resolves(domain):
+                return 0.0
             
             # Check if website responds
             try:
-                async with self.session.get(f"https://{domain}", timeout=10, ssl=False) as response:
-                    website_responds = response.status == 200
+                response = await self.http_cache.fetch(self.session, f"https://{domain}", timeout=10, ssl=False)
+                website_responds = response.status == 200
             except Exception:
                 website_responds = False
             
             # Calculate score
-            if dns_resolves and website_responds:
-                return 1.0
-            elif dns_resolves:
-                return 0.7
-            else:
-                return 0.0
+            return 1.0 if website_responds else 0.7
             
         except Exception as e:
             logger.error(f"Error validating domain {domain}: {e}")
@@ -332,6 +435,5 @@ class ValidatorEngine(ValidatorEngineInterface):
     
     async def close(self):
         """Clean up resources."""
-        if self.session and not self.session.closed:
-            await self.session.close()
-            self.session = None
\ No newline at end of file
+        # The session is owned by the shared HTTP client registry
+        self.session = None
\ No newline at end of file
@@ -11,8 +11,12 @@ import logging
 from typing import Dict, List, Optional, Any
 from datetime import datetime, timedelta
 
+from arco.config.config_manager import get_config
+from arco.core.http_clients import HTTPClientRegistry, get_http_clients
 from arco.models.prospect import AdInvestmentProfile
 from arco.core.error_handler import with_error_handling, RetryConfig, RateLimitError, APIError
+from arco.utils.http_cache import HTTPResponseCache, get_http_cache
+from arco.utils.fanout import DEFAULT_SOURCE_TIMEOUT, gather_sources, timed_out_sources
 
 
 class AdIntelligenceCollector:
@@ -25,10 +29,26 @@ class AdIntelligenceCollector:
     - Website ad tech detection
     """
     
-    def __init__(self):
-        """Initialize the ad intelligence collector."""
+    # Independent sources gathered by collect()
+    SOURCES = ("facebook", "google", "ad_tech")
+    
+    def __init__(self, http_cache: Optional[HTTPResponseCache] = None,
+                 http_clients: Optional[HTTPClientRegistry] = None,
+                 source_timeout: Optional[float] = None):
+        """
+        Initialize the ad intelligence collector.
+        
+        Args:
+            http_cache: Shared HTTP response cache (defaults to the global cache)
+            http_clients: Shared HTTP client registry (defaults to the global registry)
+            source_timeout: Timeout in seconds per source (defaults to intelligence.source_timeout)
+        """
         self._logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
         self.session: Optional[aiohttp.ClientSession] = None
+        self.http_clients = http_clients or get_http_clients()
+        self.source_timeout = (source_timeout if source_timeout is not None
+                               else get_config().get("intelligence.source_timeout", DEFAULT_SOURCE_TIMEOUT))
+        self.http_cache = http_cache or get_http_cache()
         
         # API endpoints (would be configured from environment)
         self.facebook_ad_library_url = "https://graph.facebook.com/v18.0/ads_archive"
@@ -50,31 +70,32 @@ class AdIntelligenceCollector:
             'vwo': [r'vwo\.com']
         }
     
-    async def collect(self, domain: str, company_name: str) -> AdInvestmentProfile:
+    async def collect(self, domain: str, company_name: str, timed_out: Optional[List[str]] = None) -> AdInvestmentProfile:
         """
         Collect comprehensive ad intelligence from real sources.
         
         Args:
             domain: Company domain
             company_name: Company name
+            timed_out: List the names of timed-out sources are appended to (optional)
             
         Returns:
             AdInvestmentProfile with collected data
         """
         self._logger.debug(f"🔍 Collecting ad intelligence for {company_name} ({domain})")
         
-        if not self.session:
-            self.session = aiohttp.ClientSession()
+        self.session = self.http_clients.get_session()
         
         try:
-            # Parallel collection from multiple sources
-            facebook_task = self._get_facebook_ad_data(company_name)
-            google_task = self._get_google_ads_data(domain)
-            ad_tech_task = self._detect_ad_tech(domain)
-            
-            facebook_data, google_data, ad_tech_data = await asyncio.gather(
-                facebook_task, google_task, ad_tech_task, return_exceptions=True
-            )
+            # Parallel collection from multiple sources, each under its own timeout
+            results = await gather_sources({
+                "facebook": self._get_facebook_ad_data(company_name),
+                "google": self._get_google_ads_data(domain),
+                "ad_tech": self._detect_ad_tech(domain)
+            }, timeout=self.source_timeout)
+            if timed_out is not None:
+                timed_out.extend(timed_out_sources(results, prefix="ad."))
+            facebook_data, google_data, ad_tech_data = results.values()
             
             # Process results
             facebook_active = self._is_facebook_active(facebook_data)
@@ -188,15 +209,13 @@ class AdIntelligenceCollector:
         the HTML/JavaScript for ad tech implementations.
         """
         try:
-            if not self.session:
-                self.session = aiohttp.ClientSession()
+            self.session = self.http_clients.get_session()
             
             # Fetch website homepage
             url = f"https://{domain}"
-            async with self.session.get(url, timeout=10) as response:
-                if response.status == 200:
-                    content = await response.text()
-                    return self._analyze_ad_tech_in_content(content)
+            response = await self.http_cache.fetch(self.session, url, timeout=10)
+            if response.status == 200:
+                return self._analyze_ad_tech_in_content(response.text())
             
             return None
             
@@ -312,7 +331,6 @@ class AdIntelligenceCollector:
         return 0
     
     async def close(self):
-        """Close the HTTP session."""
-        if self.session:
-            await self.session.close()
-            self.session = None
\ No newline at end of file
+        """Release the shared HTTP session."""
+        # The session is owned by the shared HTTP client registry
+        self.session = None
\ No newline at end of file
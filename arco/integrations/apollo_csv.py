@@ -16,9 +16,81 @@ from pathlib import Path
 from arco.integrations.base import DataSourceInterface
 from arco.models.prospect import Prospect, Technology, Contact
 from arco.utils.logger import get_logger
+from arco.utils.search_index import SearchIndex
 
 logger = get_logger(__name__)
 
+# Apollo columns covered by full-text search, with their index field names
+SEARCH_COLUMNS = {
+    'Company': 'company',
+    'Website': 'website',
+    'Short Description': 'description',
+    'Industry': 'industry',
+    'Keywords': 'keywords'
+}
+
+# Ranking weight of each search field
+SEARCH_FIELD_WEIGHTS = {
+    'company': 3.0,
+    'website': 2.0,
+    'industry': 2.0,
+    'keywords': 1.5,
+    'description': 1.0
+}
+
+# Query field names accepted in field-scoped terms (e.g. site:myshopify.com)
+SEARCH_FIELD_ALIASES = {
+    'site': 'website',
+    'inurl': 'website',
+    'domain': 'website',
+    'url': 'website',
+    'name': 'company',
+    'intitle': 'company'
+}
+
+
+def _new_search_index() -> SearchIndex:
+    """Create an empty search index over the Apollo search columns."""
+    return SearchIndex(SEARCH_FIELD_WEIGHTS, SEARCH_FIELD_ALIASES)
+
+
+def normalize_domain(value: str) -> str:
+    """
+    Normalize a domain or website URL to the index key.
+    
+    Args:
+        value: Domain or URL (e.g. "https://www.Example.com/about")
+        
+    Returns:
+        Lowercase host without scheme, "www.", port or path (e.g. "example.com")
+    """
+    if not value:
+        return ""
+    
+    domain = value.strip().lower()
+    if '://' in domain:
+        domain = domain.split('://', 1)[1]
+    domain = domain.split('/', 1)[0].split('?', 1)[0].split(':', 1)[0].rstrip('.')
+    if domain.startswith('www.'):
+        domain = domain[4:]
+    return domain
+
+
+def normalize_company_name(name: str) -> str:
+    """
+    Normalize a company name to the index key.
+    
+    Args:
+        name: Company name (e.g. "Acme, Inc.")
+        
+    Returns:
+        Lowercase name with punctuation removed and whitespace collapsed
+    """
+    if not name:
+        return ""
+    return ' '.join(re.sub(r'[^\w\s]', ' ', name.lower()).split())
+
+
 class ApolloCSVParser:
     """Parser for Apollo CSV exports."""
     
@@ -31,10 +103,13 @@ class ApolloCSVParser:
         """
         self.csv_path = csv_path
         self.data = []
+        self.domain_index: Dict[str, Dict[str, Any]] = {}
+        self.company_index: Dict[str, List[Dict[str, Any]]] = {}
+        self._search_index: Optional[SearchIndex] = None
         self._parse_csv()
     
     def _parse_csv(self) -> None:
-        """Parse the CSV file."""
+        """Parse the CSV file and build the lookup indexes."""
         try:
             with open(self.csv_path, 'r', encoding='utf-8') as f:
                 reader = csv.DictReader(f)
@@ -43,6 +118,23 @@ class ApolloCSVParser:
         except Exception as e:
             logger.error(f"Error parsing CSV file {self.csv_path}: {e}")
             self.data = []
+        
+        self._build_indexes()
+    
+    def _build_indexes(self) -> None:
+        """Index records by normalized domain and company name (first record wins)."""
+        self.domain_index = {}
+        self.company_index = {}
+        self._search_index = None
+        
+        for record in self.data:
+            domain = normalize_domain(record.get('Website', ''))
+            if domain:
+                self.domain_index.setdefault(domain, record)
+            
+            company = normalize_company_name(record.get('Company', ''))
+            if company:
+                self.company_index.setdefault(company, []).append(record)
     
     def get_all_records(self) -> List[Dict[str, Any]]:
         """
@@ -63,53 +155,44 @@ class ApolloCSVParser:
         Returns:
             Record with the specified domain or None if not found
         """
-        for record in self.data:
-            if record.get('Website', '').lower() == domain.lower() or \
-               record.get('Website', '').lower() == f"http://{domain.lower()}" or \
-               record.get('Website', '').lower() == f"https://{domain.lower()}":
-                return record
-        return None
+        return self.domain_index.get(normalize_domain(domain))
     
-    def search_records(self, query: str) -> List[Dict[str, Any]]:
+    def get_records_by_company(self, company_name: str) -> List[Dict[str, Any]]:
         """
-        Search records by query.
+        Get records by company name.
         
         Args:
-            query: Search query
+            company_name: Company name to search for (case and punctuation insensitive)
             
         Returns:
-            List of matching records
+            List of records with the specified company name
         """
-        results = []
-        query_lower = query.lower()
+        return list(self.company_index.get(normalize_company_name(company_name), []))
+    
+    def search_records(self, query: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Search records by query.
         
-        for record in self.data:
-            # Search in company name
-            if query_lower in record.get('Company', '').lower():
-                results.append(record)
-                continue
-            
-            # Search in domain
-            if query_lower in record.get('Website', '').lower():
-                results.append(record)
-                continue
-            
-            # Search in description
-            if query_lower in record.get('Short Description', '').lower():
-                results.append(record)
-                continue
-            
-            # Search in industry
-            if query_lower in record.get('Industry', '').lower():
-                results.append(record)
-                continue
+        Matches company name, website, description, industry and keywords
+        through an inverted index. Every term must match; unquoted terms also
+        match as prefixes, quoted terms as exact phrases, and terms can be
+        scoped to a field (e.g. 'industry:beauty "add to cart" site:myshopify.com').
+        
+        Args:
+            query: Search query
+            limit: Maximum number of results to return
             
-            # Search in keywords
-            if query_lower in record.get('Keywords', '').lower():
-                results.append(record)
-                continue
+        Returns:
+            List of matching records, best match first
+        """
+        if self._search_index is None:
+            self._search_index = _new_search_index()
+            for position, record in enumerate(self.data):
+                self._search_index.add(position, {
+                    field: record.get(column, '') for column, field in SEARCH_COLUMNS.items()
+                })
         
-        return results
+        return [self.data[position] for position, _ in self._search_index.search(query, limit)]
     
     def convert_to_prospect(self, record: Dict[str, Any]) -> Prospect:
         """
@@ -327,12 +410,17 @@ class ApolloCSVIntegration(DataSourceInterface):
         """
         self.csv_dir = csv_dir or os.path.join('arco')
         self.parsers = {}
+        self.domain_index: Dict[str, List[Tuple[ApolloCSVParser, Dict[str, Any]]]] = {}
+        self.company_index: Dict[str, List[str]] = {}
+        self._merged_records: Dict[str, Dict[str, Any]] = {}
+        self._search_index: Optional[SearchIndex] = None
         self._load_csv_files()
     
     def _load_csv_files(self) -> None:
-        """Load all CSV files in the directory."""
+        """Load all CSV files in the directory and index them."""
         try:
-            csv_files = [f for f in os.listdir(self.csv_dir) if f.endswith('.csv') and 'apollo' in f.lower()]
+            # Sorted so duplicate domains always merge in the same order
+            csv_files = sorted(f for f in os.listdir(self.csv_dir) if f.endswith('.csv') and 'apollo' in f.lower())
             
             for csv_file in csv_files:
                 csv_path = os.path.join(self.csv_dir, csv_file)
@@ -342,6 +430,66 @@ class ApolloCSVIntegration(DataSourceInterface):
             logger.info(f"Loaded {len(self.parsers)} Apollo CSV files")
         except Exception as e:
             logger.error(f"Error loading CSV files: {e}")
+        
+        self._build_indexes()
+    
+    def _build_indexes(self) -> None:
+        """
+        Index every loaded record by normalized domain and company name.
+        
+        A domain found in several files (or several times in one file) keeps
+        all of its records in load order; the merged view takes each field
+        from the first record that has a value for it.
+        """
+        self.domain_index = {}
+        self.company_index = {}
+        self._merged_records = {}
+        self._search_index = None
+        
+        for parser in self.parsers.values():
+            for record in parser.get_all_records():
+                domain = normalize_domain(record.get('Website', ''))
+                if not domain:
+                    continue
+                
+                self.domain_index.setdefault(domain, []).append((parser, record))
+                
+                company = normalize_company_name(record.get('Company', ''))
+                if company:
+                    domains = self.company_index.setdefault(company, [])
+                    if domain not in domains:
+                        domains.append(domain)
+        
+        duplicates = sum(1 for entries in self.domain_index.values() if len(entries) > 1)
+        logger.info(f"Indexed {len(self.domain_index)} Apollo domains ({duplicates} merged duplicates)")
+    
+    def _lookup(self, domain: str) -> Optional[Tuple[ApolloCSVParser, Dict[str, Any]]]:
+        """
+        Get the merged record for a domain.
+        
+        Args:
+            domain: Domain or website URL
+            
+        Returns:
+            Tuple of (parser of the first source file, merged record) or None
+        """
+        key = normalize_domain(domain)
+        entries = self.domain_index.get(key)
+        if not entries:
+            return None
+        
+        if len(entries) == 1:
+            return entries[0]
+        
+        merged = self._merged_records.get(key)
+        if merged is None:
+            merged = {}
+            for _, record in entries:
+                for field_name, value in record.items():
+                    if value and not merged.get(field_name):
+                        merged[field_name] = value
+            self._merged_records[key] = merged
+        return entries[0][0], merged
     
     def get_company_info(self, domain: str) -> Optional[Dict[str, Any]]:
         """
@@ -353,23 +501,37 @@ class ApolloCSVIntegration(DataSourceInterface):
         Returns:
             Company information or None if not found
         """
-        for parser in self.parsers.values():
-            record = parser.get_record_by_domain(domain)
-            if record:
-                return {
-                    "name": record.get('Company', ''),
-                    "website": record.get('Website', ''),
-                    "description": record.get('Short Description', ''),
-                    "industry": record.get('Industry', ''),
-                    "employee_count": parser._parse_employee_count(record.get('# Employees', '')),
-                    "revenue": parser._parse_revenue(record.get('Annual Revenue', '')),
-                    "country": record.get('Company Country', ''),
-                    "city": record.get('Company City', ''),
-                    "keywords": record.get('Keywords', ''),
-                    "founded_year": record.get('Founded Year', ''),
-                    "technologies": record.get('Technologies', '')
-                }
-        return None
+        found = self._lookup(domain)
+        if not found:
+            return None
+        
+        parser, record = found
+        return {
+            "name": record.get('Company', ''),
+            "website": record.get('Website', ''),
+            "description": record.get('Short Description', ''),
+            "industry": record.get('Industry', ''),
+            "employee_count": parser._parse_employee_count(record.get('# Employees', '')),
+            "revenue": parser._parse_revenue(record.get('Annual Revenue', '')),
+            "country": record.get('Company Country', ''),
+            "city": record.get('Company City', ''),
+            "keywords": record.get('Keywords', ''),
+            "founded_year": record.get('Founded Year', ''),
+            "technologies": record.get('Technologies', '')
+        }
+    
+    def get_company_info_by_name(self, company_name: str) -> List[Dict[str, Any]]:
+        """
+        Get company information by company name.
+        
+        Args:
+            company_name: Company name (case and punctuation insensitive)
+            
+        Returns:
+            Company information for every domain registered under that name
+        """
+        domains = self.company_index.get(normalize_company_name(company_name), [])
+        return [info for info in (self.get_company_info(domain) for domain in domains) if info]
     
     def get_contacts(self, domain: str, limit: int = 5) -> List[Dict[str, Any]]:
         """
@@ -383,13 +545,15 @@ class ApolloCSVIntegration(DataSourceInterface):
             List of contacts
         """
         contacts = []
+        seen = set()
         
-        for parser in self.parsers.values():
-            record = parser.get_record_by_domain(domain)
-            if record and record.get('Account Owner', ''):
+        for _, record in self.domain_index.get(normalize_domain(domain), []):
+            owner = record.get('Account Owner', '')
+            if owner and owner not in seen:
+                seen.add(owner)
                 contacts.append({
-                    "name": record.get('Account Owner', ''),
-                    "email": record.get('Account Owner', ''),  # Using account owner as email as a fallback
+                    "name": owner,
+                    "email": owner,  # Using account owner as email as a fallback
                     "linkedin": record.get('Company Linkedin Url', '')
                 })
         
@@ -406,12 +570,13 @@ class ApolloCSVIntegration(DataSourceInterface):
             List of technologies
         """
         technologies = []
+        seen = set()
         
-        for parser in self.parsers.values():
-            record = parser.get_record_by_domain(domain)
-            if record and record.get('Technologies', ''):
-                tech_tuples = parser._parse_technologies(record.get('Technologies', ''))
-                for tech_name, tech_category in tech_tuples:
+        for parser, record in self.domain_index.get(normalize_domain(domain), []):
+            tech_tuples = parser._parse_technologies(record.get('Technologies', ''))
+            for tech_name, tech_category in tech_tuples:
+                if tech_name.lower() not in seen:
+                    seen.add(tech_name.lower())
                     technologies.append({
                         "name": tech_name,
                         "category": tech_category
@@ -421,35 +586,36 @@ class ApolloCSVIntegration(DataSourceInterface):
     
     def search_companies(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
         """
-        Search companies by query.
+        Search companies by query across all loaded CSV files.
         
         Args:
-            query: Search query
+            query: Search query (see ApolloCSVParser.search_records for the syntax)
             limit: Maximum number of results to return
             
         Returns:
-            List of matching companies
-        """
-        results = []
-        
-        for parser in self.parsers.values():
-            records = parser.search_records(query)
-            for record in records:
-                results.append({
-                    "name": record.get('Company', ''),
-                    "domain": parser._extract_domain(record.get('Website', '')),
-                    "website": record.get('Website', ''),
-                    "description": record.get('Short Description', ''),
-                    "industry": record.get('Industry', '')
+            List of matching companies (one per domain), best match first
+        """
+        if self._search_index is None:
+            self._search_index = _new_search_index()
+            for domain, entries in self.domain_index.items():
+                # Index the text of every source record of a merged domain
+                self._search_index.add(domain, {
+                    field: ' '.join(record.get(column, '') for _, record in entries)
+                    for column, field in SEARCH_COLUMNS.items()
                 })
-                
-                if len(results) >= limit:
-                    break
-            
-            if len(results) >= limit:
-                break
         
-        return results[:limit]
+        results = []
+        for domain, _ in self._search_index.search(query, limit):
+            _, record = self._lookup(domain)
+            results.append({
+                "name": record.get('Company', ''),
+                "domain": domain,
+                "website": record.get('Website', ''),
+                "description": record.get('Short Description', ''),
+                "industry": record.get('Industry', '')
+            })
+        
+        return results
     
     def get_all_prospects(self) -> List[Prospect]:
         """
@@ -478,8 +644,9 @@ class ApolloCSVIntegration(DataSourceInterface):
         Returns:
             Prospect with the specified domain or None if not found
         """
-        for parser in self.parsers.values():
-            record = parser.get_record_by_domain(domain)
-            if record:
-                return parser.convert_to_prospect(record)
-        return None
\ No newline at end of file
+        found = self._lookup(domain)
+        if not found:
+            return None
+        
+        parser, record = found
+        return parser.convert_to_prospect(record)
\ No newline at end of file
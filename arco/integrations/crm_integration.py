@@ -17,6 +17,7 @@ from abc import ABC, abstractmethod
 from arco.utils.logger import get_logger
 from arco.models.prospect import Prospect
 from arco.models.financial_leak import FinancialLeakDetector
+from arco.utils.rate_limiter import get_rate_limiter
 
 logger = get_logger(__name__)
 
@@ -102,6 +103,7 @@ class HubSpotIntegration(CRMIntegrationInterface):
         self.initialized = False
         self.rate_limit_remaining = 100
         self.rate_limit_reset = 0
+        self.rate_limiter = get_rate_limiter()
     
     def initialize(self, api_key: str, **kwargs) -> bool:
         """
@@ -140,12 +142,8 @@ class HubSpotIntegration(CRMIntegrationInterface):
         if not self.initialized:
             raise ValueError("HubSpot integration not initialized")
         
-        # Check rate limit
-        if self.rate_limit_remaining <= 0:
-            wait_time = max(0, self.rate_limit_reset - time.time())
-            if wait_time > 0:
-                logger.warning(f"Rate limit reached, waiting {wait_time:.1f} seconds")
-                time.sleep(wait_time)
+        # Wait for a HubSpot quota slot (shared by all callers)
+        self.rate_limiter.acquire_sync("hubspot")
         
         # Make request
         url = f"{self.base_url}{endpoint}"
@@ -164,6 +162,9 @@ class HubSpotIntegration(CRMIntegrationInterface):
         # Update rate limit info
         self.rate_limit_remaining = int(response.headers.get("X-HubSpot-RateLimit-Remaining", "100"))
         self.rate_limit_reset = int(response.headers.get("X-HubSpot-RateLimit-Reset", "0"))
+        self.rate_limiter.record_response("hubspot", response.status_code, response.headers)
+        if self.rate_limit_remaining <= 0:
+            self.rate_limiter.pause("hubspot", self.rate_limit_reset - time.time())
         
         # Check for errors
         if response.status_code >= 400:
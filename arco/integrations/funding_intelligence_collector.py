@@ -11,7 +11,10 @@ import logging
 from typing import Dict, List, Optional, Any
 from datetime import datetime, timedelta
 
+from arco.config.config_manager import get_config
+from arco.core.http_clients import HTTPClientRegistry, get_http_clients
 from arco.models.prospect import FundingProfile
+from arco.utils.fanout import DEFAULT_SOURCE_TIMEOUT, gather_sources, timed_out_sources
 
 
 class FundingIntelligenceCollector:
@@ -25,10 +28,23 @@ class FundingIntelligenceCollector:
     - SEC filings (for larger rounds)
     """
     
-    def __init__(self):
-        """Initialize the funding intelligence collector."""
+    # Independent sources gathered by collect()
+    SOURCES = ("crunchbase", "pitchbook", "public_announcements")
+    
+    def __init__(self, http_clients: Optional[HTTPClientRegistry] = None,
+                 source_timeout: Optional[float] = None):
+        """
+        Initialize the funding intelligence collector.
+        
+        Args:
+            http_clients: Shared HTTP client registry (defaults to the global registry)
+            source_timeout: Timeout in seconds per source (defaults to intelligence.source_timeout)
+        """
         self._logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
         self.session: Optional[aiohttp.ClientSession] = None
+        self.http_clients = http_clients or get_http_clients()
+        self.source_timeout = (source_timeout if source_timeout is not None
+                               else get_config().get("intelligence.source_timeout", DEFAULT_SOURCE_TIMEOUT))
         
         # API endpoints (would be configured from environment)
         self.crunchbase_api_url = "https://api.crunchbase.com/api/v4"
@@ -47,31 +63,31 @@ class FundingIntelligenceCollector:
             'acquisition': ['acquisition', 'merger', 'buyout']
         }
     
-    async def collect(self, company_name: str) -> FundingProfile:
+    async def collect(self, company_name: str, timed_out: Optional[List[str]] = None) -> FundingProfile:
         """
         Collect comprehensive funding intelligence.
         
         Args:
             company_name: Name of the company
+            timed_out: List the names of timed-out sources are appended to (optional)
             
         Returns:
             FundingProfile with collected funding data
         """
         self._logger.debug(f"💰 Collecting funding intelligence for {company_name}")
         
-        if not self.session:
-            self.session = aiohttp.ClientSession()
+        self.session = self.http_clients.get_session()
         
         try:
-            # Parallel collection from multiple sources
-            crunchbase_task = self._get_crunchbase_data(company_name)
-            pitchbook_task = self._get_pitchbook_data(company_name)
-            public_announcements_task = self._search_public_announcements(company_name)
-            
-            crunchbase_data, pitchbook_data, public_data = await asyncio.gather(
-                crunchbase_task, pitchbook_task, public_announcements_task, 
-                return_exceptions=True
-            )
+            # Parallel collection from multiple sources, each under its own timeout
+            results = await gather_sources({
+                "crunchbase": self._get_crunchbase_data(company_name),
+                "pitchbook": self._get_pitchbook_data(company_name),
+                "public_announcements": self._search_public_announcements(company_name)
+            }, timeout=self.source_timeout)
+            if timed_out is not None:
+                timed_out.extend(timed_out_sources(results, prefix="funding."))
+            crunchbase_data, pitchbook_data, public_data = results.values()
             
             # Process and combine data
             profile = self._process_funding_data(
@@ -301,7 +317,6 @@ class FundingIntelligenceCollector:
             return []
     
     async def close(self):
-        """Close the HTTP session."""
-        if self.session:
-            await self.session.close()
-            self.session = None
\ No newline at end of file
+        """Release the shared HTTP session."""
+        # The session is owned by the shared HTTP client registry
+        self.session = None
\ No newline at end of file
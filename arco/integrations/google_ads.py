@@ -15,6 +15,7 @@ import logging
 
 from ..models.prospect import AdSpendData
 from ..utils.logger import get_logger
+from ..utils.rate_limiter import get_rate_limiter
 
 logger = get_logger(__name__)
 
@@ -38,6 +39,7 @@ class GoogleAdsIntegration:
         self.refresh_token = refresh_token or os.getenv('GOOGLE_ADS_REFRESH_TOKEN')
         
         self.session = None
+        self.rate_limiter = get_rate_limiter()
         self.access_token = None
         self.token_expires_at = None
         
@@ -137,15 +139,18 @@ class GoogleAdsIntegration:
                 
                 payload = {'query': query}
                 
+                # Wait for a Google Ads quota slot (shared by all callers)
+                await self.rate_limiter.acquire("google_ads")
+                
                 async with asyncio.wait_for(
                     self.session.post(url, headers=headers, json=payload),
                     timeout=30.0
                 ) as response:
+                    self.rate_limiter.record_response("google_ads", response.status, response.headers)
                     
-                    if response.status == 429:  # Rate limited
+                    if response.status == 429:  # Rate limited; the limiter pauses Google Ads for everyone
                         logger.warning(f"Rate limited for customer {customer_id}, attempt {attempt + 1}/{max_retries}")
                         if attempt < max_retries - 1:
-                            await asyncio.sleep(retry_delay * (2 ** attempt))
                             continue
                         return self._get_estimated_campaign_metrics(domain)
                     
@@ -390,7 +395,10 @@ class GoogleAdsIntegration:
             
             payload = {'query': query}
             
+            await self.rate_limiter.acquire("google_ads")
+            
             async with self.session.post(url, headers=headers, json=payload) as response:
+                self.rate_limiter.record_response("google_ads", response.status, response.headers)
                 if response.status == 200:
                     data = await response.json()
                     return self._parse_keyword_performance(data, domain)
@@ -14,7 +14,10 @@ from datetime import datetime, timedelta
 import logging
 
 from .base import APIClientInterface
+from ..core.http_clients import HTTPClientRegistry, get_http_clients
 from ..models.prospect import WebVitals, AdSpendData, MarketingData
+from ..utils.pagespeed_store import PageSpeedStore, get_pagespeed_store
+from ..utils.rate_limiter import get_rate_limiter
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -22,17 +25,24 @@ logger = get_logger(__name__)
 class GoogleAnalyticsIntegration(APIClientInterface):
     """Google Analytics 4 API integration for real marketing data collection."""
     
-    def __init__(self, credentials_path: Optional[str] = None, api_key: Optional[str] = None):
+    def __init__(self, credentials_path: Optional[str] = None, api_key: Optional[str] = None,
+                 pagespeed_store: Optional[PageSpeedStore] = None,
+                 http_clients: Optional[HTTPClientRegistry] = None):
         """
         Initialize Google Analytics integration.
         
         Args:
             credentials_path: Path to Google service account credentials JSON
             api_key: Google API key for public APIs
+            pagespeed_store: Shared PageSpeed result store (defaults to the global store)
+            http_clients: Shared HTTP client registry (defaults to the global registry)
         """
         self.credentials_path = credentials_path
         self.api_key = api_key or os.getenv('GOOGLE_API_KEY')
         self.session = None
+        self.http_clients = http_clients or get_http_clients()
+        self.pagespeed_store = pagespeed_store or get_pagespeed_store()
+        self.rate_limiter = get_rate_limiter()
         self.base_url = "https://analyticsreporting.googleapis.com/v4"
         self.pagespeed_url = "https://www.googleapis.com/pagespeedonline/v5"
         
@@ -40,22 +50,24 @@ class GoogleAnalyticsIntegration(APIClientInterface):
     
     async def _init_session(self) -> None:
         """Initialize HTTP session with proper headers."""
-        if not self.session or self.session.closed:
-            self.session = aiohttp.ClientSession(
-                timeout=aiohttp.ClientTimeout(total=30),
-                headers={
-                    'User-Agent': 'ARCO-Marketing-Analyzer/1.0',
-                    'Accept': 'application/json'
-                }
-            )
+        self.session = self.http_clients.get_session(
+            timeout=30,
+            headers={
+                'User-Agent': 'ARCO-Marketing-Analyzer/1.0',
+                'Accept': 'application/json'
+            }
+        )
     
-    async def get_web_vitals(self, domain: str) -> Optional[WebVitals]:
+    async def get_web_vitals(self, domain: str, strategy: str = "mobile") -> Optional[WebVitals]:
         """
         Get Core Web Vitals for a domain using PageSpeed Insights API.
         Collects LCP, FID, CLS, TTFB metrics with proper error handling and timeout management.
+        Results come from the PageSpeed store, so repeated calls for the same
+        domain share one PSI request.
         
         Args:
             domain: Domain to analyze
+            strategy: Analysis strategy ("mobile" or "desktop")
             
         Returns:
             WebVitals object with real performance data or None
@@ -64,6 +76,32 @@ class GoogleAnalyticsIntegration(APIClientInterface):
             logger.warning("No Google API key provided, cannot fetch web vitals")
             return None
         
+        try:
+            record = await self.pagespeed_store.get(
+                domain, strategy, lambda: self._fetch_pagespeed(domain, strategy)
+            )
+        except Exception as e:
+            logger.error(f"Unexpected error fetching web vitals for {domain}: {e}")
+            return None
+        
+        if record is None:
+            return None
+        
+        result = self._parse_pagespeed_data(record.lighthouse, domain)
+        result.collection_date = datetime.fromtimestamp(record.fetched_at)
+        return result
+    
+    async def _fetch_pagespeed(self, domain: str, strategy: str = "mobile") -> Optional[Dict[str, Any]]:
+        """
+        Fetch the raw PageSpeed Insights response for a domain.
+        
+        Args:
+            domain: Domain to analyze
+            strategy: Analysis strategy ("mobile" or "desktop")
+            
+        Returns:
+            Raw PSI JSON response or None
+        """
         max_retries = 3
         retry_delay = 1.0
         
@@ -73,7 +111,7 @@ class GoogleAnalyticsIntegration(APIClientInterface):
                 params = {
                     'url': f"https://{domain}",
                     'category': 'performance',
-                    'strategy': 'mobile'  # Focus on mobile performance
+                    'strategy': strategy
                 }
                 
                 # Add API key for authentication
@@ -85,12 +123,15 @@ class GoogleAnalyticsIntegration(APIClientInterface):
                 # Enhanced timeout management with specific timeout for web vitals collection
                 timeout = aiohttp.ClientTimeout(total=45, connect=10, sock_read=30)
                 
+                # Wait for a PageSpeed quota slot (shared by all callers)
+                await self.rate_limiter.acquire("pagespeed")
+                
                 async with self.session.get(url, params=params, timeout=timeout) as response:
+                    self.rate_limiter.record_response("pagespeed", response.status, response.headers)
                     
-                    if response.status == 429:  # Rate limited
+                    if response.status == 429:  # Rate limited; the limiter pauses PSI for everyone
                         logger.warning(f"Rate limited for {domain}, attempt {attempt + 1}/{max_retries}")
                         if attempt < max_retries - 1:
-                            await asyncio.sleep(retry_delay * (2 ** attempt))  # Exponential backoff
                             continue
                         return None
                     
@@ -102,18 +143,19 @@ class GoogleAnalyticsIntegration(APIClientInterface):
                         return None
                     
                     data = await response.json()
-                    result = self._parse_pagespeed_data(data, domain)
+                
+                lcp_audit = data.get('lighthouseResult', {}).get('audits', {}).get('largest-contentful-paint', {})
+                
+                if lcp_audit.get('numericValue') is not None:  # Validate we got meaningful data
+                    logger.info(f"Successfully collected web vitals for {domain} (LCP: {lcp_audit['numericValue'] / 1000:.2f}s)")
+                    return data
+                else:
+                    logger.warning(f"Invalid web vitals data for {domain}, attempt {attempt + 1}/{max_retries}")
+                    if attempt < max_retries - 1:
+                        await asyncio.sleep(retry_delay)
+                        continue
+                    return data
                     
-                    if result and result.lcp is not None:  # Validate we got meaningful data
-                        logger.info(f"Successfully collected web vitals for {domain} (LCP: {result.lcp:.2f}s)")
-                        return result
-                    else:
-                        logger.warning(f"Invalid web vitals data for {domain}, attempt {attempt + 1}/{max_retries}")
-                        if attempt < max_retries - 1:
-                            await asyncio.sleep(retry_delay)
-                            continue
-                        return result
-                        
             except asyncio.TimeoutError:
                 logger.warning(f"Timeout fetching web vitals for {domain}, attempt {attempt + 1}/{max_retries}")
                 if attempt < max_retries - 1:
@@ -941,7 +983,6 @@ class GoogleAnalyticsIntegration(APIClientInterface):
         }
     
     async def close(self) -> None:
-        """Close the HTTP session."""
-        if self.session and not self.session.closed:
-            await self.session.close()
-            self.session = None
\ No newline at end of file
+        """Release the shared HTTP session."""
+        # The session is owned by the shared HTTP client registry
+        self.session = None
\ No newline at end of file
@@ -15,6 +15,8 @@ import asyncio
 
 from arco.integrations.base import APIClientInterface
 from arco.utils.retry import RetryConfig, with_retry, with_retry_async, FallbackChain
+from arco.utils.pagespeed_store import PageSpeedStore, get_pagespeed_store
+from arco.utils.rate_limiter import get_rate_limiter
 
 logger = logging.getLogger(__name__)
 
@@ -88,7 +90,9 @@ class GoogleSearchAPI(APIClientInterface):
         @with_retry(config=retry_config)
         def _execute_search() -> List[Dict[str, Any]]:
             with httpx.Client(timeout=retry_config.retry_delay * 2) as client:
+                get_rate_limiter().acquire_sync("google_search")
                 response = client.get(self.base_url, params=params)
+                get_rate_limiter().record_response("google_search", response.status_code, response.headers)
                 
                 if response.status_code != 200:
                     logger.error(f"Google Search API error: {response.status_code}")
@@ -177,7 +181,9 @@ class GoogleSearchAPI(APIClientInterface):
         
         async def _execute_search() -> Dict[str, Any]:
             async with httpx.AsyncClient(timeout=config.retry_delay * 2) as client:
+                await get_rate_limiter().acquire("google_search")
                 response = await client.get(self.base_url, params=params)
+                get_rate_limiter().record_response("google_search", response.status_code, response.headers)
                 
                 if response.status_code != 200:
                     if response.status_code in config.retry_on_status_codes:
@@ -220,9 +226,15 @@ class GoogleSearchAPI(APIClientInterface):
 class GooglePageSpeedAPI(APIClientInterface):
     """Google PageSpeed Insights API integration for ARCO."""
     
-    def __init__(self):
-        """Initialize the Google PageSpeed API integration."""
+    def __init__(self, pagespeed_store: Optional[PageSpeedStore] = None):
+        """
+        Initialize the Google PageSpeed API integration.
+        
+        Args:
+            pagespeed_store: Shared PageSpeed result store (defaults to the global store)
+        """
         self.api_key = None
+        self.pagespeed_store = pagespeed_store or get_pagespeed_store()
         self.base_url = "https://www.googleapis.com/pagespeedonline/v5/runPagespeed"
         self.rate_limit_info = {
             "limit": 25000,  # Default daily limit for free tier
@@ -299,7 +311,9 @@ class GooglePageSpeedAPI(APIClientInterface):
         @with_retry(config=config)
         def _execute_analysis() -> Dict[str, Any]:
             with httpx.Client(timeout=config.retry_delay * 5) as client:
+                get_rate_limiter().acquire_sync("pagespeed")
                 response = client.get(self.base_url, params=params)
+                get_rate_limiter().record_response("pagespeed", response.status_code, response.headers)
                 
                 if response.status_code != 200:
                     logger.error(f"PageSpeed API error: {response.status_code}")
@@ -312,32 +326,7 @@ class GooglePageSpeedAPI(APIClientInterface):
                 # Update rate limit info
                 self.rate_limit_info["remaining"] -= 1
                 
-                # Extract key metrics
-                lighthouse_result = data.get("lighthouseResult", {})
-                categories = lighthouse_result.get("categories", {})
-                performance = categories.get("performance", {})
-                
-                # Extract audits
-                audits = lighthouse_result.get("audits", {})
-                
-                # Extract key performance metrics
-                metrics = {}
-                for metric_key in ["first-contentful-paint", "largest-contentful-paint", 
-                                  "total-blocking-time", "cumulative-layout-shift",
-                                  "speed-index", "interactive"]:
-                    if metric_key in audits:
-                        metrics[metric_key] = {
-                            "score": audits[metric_key].get("score"),
-                            "value": audits[metric_key].get("numericValue"),
-                            "display_value": audits[metric_key].get("displayValue")
-                        }
-                
-                return {
-                    "performance_score": performance.get("score", 0) * 100,
-                    "metrics": metrics,
-                    "strategy": strategy,
-                    "analyzed_url": url
-                }
+                return self._summarize_analysis(data, strategy, url)
         
         try:
             return _execute_analysis()
@@ -349,6 +338,9 @@ class GooglePageSpeedAPI(APIClientInterface):
         """
         Analyze a URL using Google PageSpeed Insights API asynchronously.
         
+        Results are served from the PageSpeed store when available, and
+        concurrent requests for the same domain share one API call.
+        
         Args:
             url: URL to analyze
             strategy: Analysis strategy ("mobile" or "desktop")
@@ -375,52 +367,72 @@ class GooglePageSpeedAPI(APIClientInterface):
         
         async def _execute_analysis() -> Dict[str, Any]:
             async with httpx.AsyncClient(timeout=config.retry_delay * 5) as client:
+                await get_rate_limiter().acquire("pagespeed")
                 response = await client.get(self.base_url, params=params)
+                get_rate_limiter().record_response("pagespeed", response.status_code, response.headers)
                 
                 if response.status_code != 200:
                     logger.error(f"PageSpeed API error: {response.status_code}")
                     if response.status_code in config.retry_on_status_codes:
                         raise ConnectionError(f"Retryable status code: {response.status_code}")
-                    return {"error": f"API error: {response.status_code}"}
-                
-                data = response.json()
+                    raise ValueError(f"API error: {response.status_code}")
                 
                 # Update rate limit info
                 self.rate_limit_info["remaining"] -= 1
                 
-                # Extract key metrics
-                lighthouse_result = data.get("lighthouseResult", {})
-                categories = lighthouse_result.get("categories", {})
-                performance = categories.get("performance", {})
-                
-                # Extract audits
-                audits = lighthouse_result.get("audits", {})
-                
-                # Extract key performance metrics
-                metrics = {}
-                for metric_key in ["first-contentful-paint", "largest-contentful-paint", 
-                                  "total-blocking-time", "cumulative-layout-shift",
-                                  "speed-index", "interactive"]:
-                    if metric_key in audits:
-                        metrics[metric_key] = {
-                            "score": audits[metric_key].get("score"),
-                            "value": audits[metric_key].get("numericValue"),
-                            "display_value": audits[metric_key].get("displayValue")
-                        }
-                
-                return {
-                    "performance_score": performance.get("score", 0) * 100,
-                    "metrics": metrics,
-                    "strategy": strategy,
-                    "analyzed_url": url
-                }
+                return response.json()
         
         try:
-            return await with_retry_async(_execute_analysis, config=config)
+            record = await self.pagespeed_store.get(
+                url, strategy, lambda: with_retry_async(_execute_analysis, config=config)
+            )
+            if record is None:
+                return {"error": "No PageSpeed data available"}
+            return self._summarize_analysis(record.lighthouse, strategy, url)
         except Exception as e:
             logger.error(f"PageSpeed API request failed after retries: {e}")
             return {"error": str(e)}
     
+    @staticmethod
+    def _summarize_analysis(data: Dict[str, Any], strategy: str, url: str) -> Dict[str, Any]:
+        """
+        Extract the performance score and key metrics from a PSI response.
+        
+        Args:
+            data: Raw PageSpeed API response
+            strategy: Analysis strategy
+            url: Analyzed URL
+            
+        Returns:
+            Dictionary with PageSpeed analysis results
+        """
+        # Extract key metrics
+        lighthouse_result = data.get("lighthouseResult", {})
+        categories = lighthouse_result.get("categories", {})
+        performance = categories.get("performance", {})
+        
+        # Extract audits
+        audits = lighthouse_result.get("audits", {})
+        
+        # Extract key performance metrics
+        metrics = {}
+        for metric_key in ["first-contentful-paint", "largest-contentful-paint", 
+                          "total-blocking-time", "cumulative-layout-shift",
+                          "speed-index", "interactive"]:
+            if metric_key in audits:
+                metrics[metric_key] = {
+                    "score": audits[metric_key].get("score"),
+                    "value": audits[metric_key].get("numericValue"),
+                    "display_value": audits[metric_key].get("displayValue")
+                }
+        
+        return {
+            "performance_score": performance.get("score", 0) * 100,
+            "metrics": metrics,
+            "strategy": strategy,
+            "analyzed_url": url
+        }
+    
     def calculate_performance_loss(self, performance_score: float, estimated_revenue: float) -> Dict[str, Any]:
         """
         Calculate estimated revenue loss due to poor performance.
@@ -12,7 +12,10 @@ import re
 from typing import Dict, List, Optional, Any
 from datetime import datetime, timedelta
 
+from arco.config.config_manager import get_config
+from arco.core.http_clients import HTTPClientRegistry, get_http_clients
 from arco.models.prospect import HiringActivity
+from arco.utils.fanout import DEFAULT_SOURCE_TIMEOUT, gather_sources, timed_out_sources
 
 
 class HiringIntelligenceCollector:
@@ -26,10 +29,23 @@ class HiringIntelligenceCollector:
     - Growth signal indicators
     """
     
-    def __init__(self):
-        """Initialize the hiring intelligence collector."""
+    # Independent sources gathered by collect()
+    SOURCES = ("linkedin", "indeed", "company_careers")
+    
+    def __init__(self, http_clients: Optional[HTTPClientRegistry] = None,
+                 source_timeout: Optional[float] = None):
+        """
+        Initialize the hiring intelligence collector.
+        
+        Args:
+            http_clients: Shared HTTP client registry (defaults to the global registry)
+            source_timeout: Timeout in seconds per source (defaults to intelligence.source_timeout)
+        """
         self._logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
         self.session: Optional[aiohttp.ClientSession] = None
+        self.http_clients = http_clients or get_http_clients()
+        self.source_timeout = (source_timeout if source_timeout is not None
+                               else get_config().get("intelligence.source_timeout", DEFAULT_SOURCE_TIMEOUT))
         
         # Technology job keywords
         self.tech_keywords = {
@@ -60,31 +76,31 @@ class HiringIntelligenceCollector:
             'company_careers': None  # Company career pages
         }
     
-    async def collect(self, company_name: str) -> HiringActivity:
+    async def collect(self, company_name: str, timed_out: Optional[List[str]] = None) -> HiringActivity:
         """
         Collect comprehensive hiring intelligence.
         
         Args:
             company_name: Name of the company
+            timed_out: List the names of timed-out sources are appended to (optional)
             
         Returns:
             HiringActivity with collected hiring data
         """
         self._logger.debug(f"👥 Collecting hiring intelligence for {company_name}")
         
-        if not self.session:
-            self.session = aiohttp.ClientSession()
+        self.session = self.http_clients.get_session()
         
         try:
-            # Parallel collection from multiple sources
-            linkedin_task = self._get_linkedin_jobs(company_name)
-            indeed_task = self._get_indeed_jobs(company_name)
-            company_careers_task = self._get_company_career_page_jobs(company_name)
-            
-            linkedin_data, indeed_data, careers_data = await asyncio.gather(
-                linkedin_task, indeed_task, company_careers_task,
-                return_exceptions=True
-            )
+            # Parallel collection from multiple sources, each under its own timeout
+            results = await gather_sources({
+                "linkedin": self._get_linkedin_jobs(company_name),
+                "indeed": self._get_indeed_jobs(company_name),
+                "company_careers": self._get_company_career_page_jobs(company_name)
+            }, timeout=self.source_timeout)
+            if timed_out is not None:
+                timed_out.extend(timed_out_sources(results, prefix="hiring."))
+            linkedin_data, indeed_data, careers_data = results.values()
             
             # Process and combine data
             activity = self._process_hiring_data(
@@ -382,7 +398,6 @@ class HiringIntelligenceCollector:
             return "None"
     
     async def close(self):
-        """Close the HTTP session."""
-        if self.session:
-            await self.session.close()
-            self.session = None
\ No newline at end of file
+        """Release the shared HTTP session."""
+        # The session is owned by the shared HTTP client registry
+        self.session = None
\ No newline at end of file
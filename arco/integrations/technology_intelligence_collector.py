@@ -12,7 +12,11 @@ import re
 from typing import Dict, List, Optional, Any
 from datetime import datetime, timedelta
 
+from arco.config.config_manager import get_config
+from arco.core.http_clients import HTTPClientRegistry, get_http_clients
 from arco.models.prospect import TechnologyInvestment
+from arco.utils.http_cache import HTTPResponseCache, get_http_cache
+from arco.utils.fanout import DEFAULT_SOURCE_TIMEOUT, gather_sources, timed_out_sources
 
 
 class TechnologyIntelligenceCollector:
@@ -26,10 +30,26 @@ class TechnologyIntelligenceCollector:
     - Modernization activities
     """
     
-    def __init__(self):
-        """Initialize the technology intelligence collector."""
+    # Independent sources gathered by collect()
+    SOURCES = ("current_tech", "website_changes", "integrations")
+    
+    def __init__(self, http_cache: Optional[HTTPResponseCache] = None,
+                 http_clients: Optional[HTTPClientRegistry] = None,
+                 source_timeout: Optional[float] = None):
+        """
+        Initialize the technology intelligence collector.
+        
+        Args:
+            http_cache: Shared HTTP response cache (defaults to the global cache)
+            http_clients: Shared HTTP client registry (defaults to the global registry)
+            source_timeout: Timeout in seconds per source (defaults to intelligence.source_timeout)
+        """
         self._logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
         self.session: Optional[aiohttp.ClientSession] = None
+        self.http_clients = http_clients or get_http_clients()
+        self.source_timeout = (source_timeout if source_timeout is not None
+                               else get_config().get("intelligence.source_timeout", DEFAULT_SOURCE_TIMEOUT))
+        self.http_cache = http_cache or get_http_cache()
         
         # Technology detection patterns
         self.tech_patterns = {
@@ -82,31 +102,31 @@ class TechnologyIntelligenceCollector:
             'modern_js': [r'es6', r'es2015', r'async/await', r'import.*from']
         }
     
-    async def collect(self, domain: str) -> TechnologyInvestment:
+    async def collect(self, domain: str, timed_out: Optional[List[str]] = None) -> TechnologyInvestment:
         """
         Collect comprehensive technology intelligence.
         
         Args:
             domain: Company domain
+            timed_out: List the names of timed-out sources are appended to (optional)
             
         Returns:
             TechnologyInvestment with collected data
         """
         self._logger.debug(f"🔧 Collecting technology intelligence for {domain}")
         
-        if not self.session:
-            self.session = aiohttp.ClientSession()
+        self.session = self.http_clients.get_session()
         
         try:
-            # Parallel collection from multiple sources
-            current_tech_task = self._analyze_current_tech_stack(domain)
-            website_changes_task = self._detect_website_changes(domain)
-            integration_task = self._detect_new_integrations(domain)
-            
-            current_tech, website_changes, integrations = await asyncio.gather(
-                current_tech_task, website_changes_task, integration_task,
-                return_exceptions=True
-            )
+            # Parallel collection from multiple sources, each under its own timeout
+            results = await gather_sources({
+                "current_tech": self._analyze_current_tech_stack(domain),
+                "website_changes": self._detect_website_changes(domain),
+                "integrations": self._detect_new_integrations(domain)
+            }, timeout=self.source_timeout)
+            if timed_out is not None:
+                timed_out.extend(timed_out_sources(results, prefix="technology."))
+            current_tech, website_changes, integrations = results.values()
             
             # Process and combine data
             investment = self._process_technology_data(
@@ -135,22 +155,18 @@ class TechnologyIntelligenceCollector:
         to identify technologies in use.
         """
         try:
-            if not self.session:
-                self.session = aiohttp.ClientSession()
+            self.session = self.http_clients.get_session()
             
             # Fetch website homepage
             url = f"https://{domain}"
-            async with self.session.get(url, timeout=15) as response:
-                if response.status == 200:
-                    content = await response.text()
-                    headers = dict(response.headers)
-                    
-                    return {
-                        'content': content,
-                        'headers': headers,
-                        'status': response.status,
-                        'url': str(response.url)
-                    }
+            response = await self.http_cache.fetch(self.session, url, timeout=15)
+            if response.status == 200:
+                return {
+                    'content': response.text(),
+                    'headers': response.headers,
+                    'status': response.status,
+                    'url': response.url
+                }
             
             return None
             
@@ -386,7 +402,6 @@ class TechnologyIntelligenceCollector:
             return []
     
     async def close(self):
-        """Close the HTTP session."""
-        if self.session:
-            await self.session.close()
-            self.session = None
\ No newline at end of file
+        """Release the shared HTTP session."""
+        # The session is owned by the shared HTTP client registry
+        self.session = None
\ No newline at end of file
@@ -7,28 +7,136 @@ It supports both the Python Wappalyzer library and the Wappalyzer CLI.
 
 import json
 import logging
+import os
+import pickle
 import subprocess
 import asyncio
+import threading
+import time
+from pathlib import Path
 from typing import Dict, List, Any, Optional
-import httpx
 
+from arco.config.config_manager import get_config
+from arco.core.http_clients import HTTPClientRegistry, get_http_clients
 from arco.integrations.base import APIClientInterface
+from arco.models.page_snapshot import PageSnapshot
 from arco.utils.retry import RetryConfig, with_retry, with_retry_async, FallbackChain
 
 logger = logging.getLogger(__name__)
 
+# Process-wide state shared by every WappalyzerIntegration instance
+_availability: Optional[Dict[str, bool]] = None
+_fingerprints = None
+_fingerprints_lock = threading.Lock()
+
+FINGERPRINT_CACHE_FILE = "wappalyzer_fingerprints.pkl"
+FINGERPRINT_CACHE_MAX_AGE = 7 * 24 * 3600  # seconds
+
+# Technologies reported by the HTTP fallback: signature vendor -> (name, category)
+HTTP_FALLBACK_TECHNOLOGIES = {
+    "wordpress": ("WordPress", "CMS"),
+    "shopify": ("Shopify", "E-commerce"),
+    "google_analytics": ("Google Analytics", "Analytics"),
+    "klaviyo": ("Klaviyo", "Email marketing"),
+    "hubspot": ("HubSpot", "CRM"),
+    "typeform": ("Typeform", "Forms"),
+}
+
+
+def _fingerprint_cache_path() -> Path:
+    """Get the on-disk fingerprint cache path under paths.cache."""
+    return Path(get_config().get("paths.cache", "cache")) / FINGERPRINT_CACHE_FILE
+
+
+def load_fingerprints(cache_path: Optional[str] = None, use_disk_cache: bool = True):
+    """
+    Load the compiled Wappalyzer fingerprint database once per process.
+    
+    The first call parses the fingerprint JSON (or unpickles a cached copy
+    from ``paths.cache`` when it is fresh); later calls return the same
+    in-memory instance.
+    
+    Args:
+        cache_path: Override for the pickled cache location
+        use_disk_cache: Whether to read/write the pickled cache
+        
+    Returns:
+        Wappalyzer instance with compiled fingerprints
+    """
+    global _fingerprints
+    
+    if _fingerprints is not None:
+        return _fingerprints
+    
+    with _fingerprints_lock:
+        if _fingerprints is not None:
+            return _fingerprints
+        
+        from Wappalyzer import Wappalyzer
+        
+        path = Path(cache_path) if cache_path else _fingerprint_cache_path()
+        
+        if use_disk_cache and path.exists() and time.time() - path.stat().st_mtime < FINGERPRINT_CACHE_MAX_AGE:
+            try:
+                with open(path, 'rb') as f:
+                    _fingerprints = pickle.load(f)
+                logger.info(f"Loaded Wappalyzer fingerprints from cache: {path}")
+                return _fingerprints
+            except Exception as e:
+                logger.warning(f"Ignoring unreadable Wappalyzer fingerprint cache {path}: {e}")
+        
+        start = time.time()
+        _fingerprints = Wappalyzer.latest()
+        logger.info(f"Compiled Wappalyzer fingerprints in {time.time() - start:.2f}s")
+        
+        if use_disk_cache:
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = path.with_suffix(".tmp")
+                with open(tmp_path, 'wb') as f:
+                    pickle.dump(_fingerprints, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_path, path)
+            except Exception as e:
+                logger.warning(f"Could not write Wappalyzer fingerprint cache {path}: {e}")
+        
+        return _fingerprints
+
+
 class WappalyzerIntegration(APIClientInterface):
     """Integration with Wappalyzer for technology stack detection."""
     
-    def __init__(self):
-        """Initialize the Wappalyzer integration."""
+    # Maximum URLs passed to a single Wappalyzer CLI invocation
+    CLI_BATCH_SIZE = 25
+    
+    def __init__(self, http_clients: Optional[HTTPClientRegistry] = None):
+        """
+        Initialize the Wappalyzer integration.
+        
+        Args:
+            http_clients: Shared HTTP client registry (defaults to the global registry)
+        """
         self.api_key = None
+        self.http_clients = http_clients or get_http_clients()
         self.wappalyzer_cli_available = False
         self.wappalyzer_py_available = False
         self._check_wappalyzer_availability()
     
     def _check_wappalyzer_availability(self) -> None:
-        """Check if Wappalyzer CLI or Python library is available."""
+        """Check if Wappalyzer CLI or Python library is available (once per process)."""
+        global _availability
+        
+        if _availability is None:
+            self._probe_wappalyzer_availability()
+            _availability = {
+                "cli": self.wappalyzer_cli_available,
+                "py": self.wappalyzer_py_available
+            }
+        else:
+            self.wappalyzer_cli_available = _availability["cli"]
+            self.wappalyzer_py_available = _availability["py"]
+    
+    def _probe_wappalyzer_availability(self) -> None:
+        """Probe the Wappalyzer CLI and Python library."""
         # Check CLI availability
         try:
             result = subprocess.run(
@@ -100,7 +208,8 @@ class WappalyzerIntegration(APIClientInterface):
             "reset": None
         }
     
-    async def analyze_url(self, url: str, timeout: int = 15, retry_config: Optional[RetryConfig] = None) -> Dict[str, Any]:
+    async def analyze_url(self, url: str, timeout: int = 15, retry_config: Optional[RetryConfig] = None,
+                          snapshot: Optional[PageSnapshot] = None) -> Dict[str, Any]:
         """
         Analyze a URL using Wappalyzer.
         
@@ -108,6 +217,8 @@ class WappalyzerIntegration(APIClientInterface):
             url: URL to analyze
             timeout: Timeout in seconds
             retry_config: Custom retry configuration
+            snapshot: Already fetched page; the Python library and HTTP fallback
+                reuse it instead of downloading the page again
             
         Returns:
             Dictionary with detected technologies
@@ -125,10 +236,10 @@ class WappalyzerIntegration(APIClientInterface):
         
         # Add Python library method if available
         if self.wappalyzer_py_available:
-            fallback_methods.append(lambda: self._analyze_with_py_lib(url, timeout))
+            fallback_methods.append(lambda: self._analyze_with_py_lib(url, timeout, snapshot))
         
         # Always add HTTP fallback as the last resort
-        fallback_methods.append(lambda: self._analyze_with_http_fallback(url, timeout))
+        fallback_methods.append(lambda: self._analyze_with_http_fallback(url, timeout, snapshot))
         
         # Create and execute the fallback chain
         fallback_chain = FallbackChain(fallback_methods)
@@ -140,6 +251,61 @@ class WappalyzerIntegration(APIClientInterface):
             # Return empty result as a last resort
             return {"technologies": []}
     
+    async def analyze_many(self, urls: List[str], timeout: int = 15, max_concurrent: int = 10,
+                           snapshots: Optional[Dict[str, PageSnapshot]] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Analyze many URLs with the same long-lived detector.
+        
+        The CLI is invoked once per ``CLI_BATCH_SIZE`` URLs; otherwise pages are
+        fetched concurrently and fed through the process-wide compiled
+        fingerprints. URLs that fail fall back to ``analyze_url``.
+        
+        Args:
+            urls: URLs or domains to analyze
+            timeout: Timeout in seconds per URL
+            max_concurrent: Maximum concurrent page fetches
+            snapshots: Already fetched pages keyed by the given URL (optional)
+            
+        Returns:
+            Mapping of each given URL to its detected technologies
+        """
+        snapshots = snapshots or {}
+        normalized = {
+            url: url if url.startswith(('http://', 'https://')) else f"https://{url}"
+            for url in urls
+        }
+        results: Dict[str, Dict[str, Any]] = {}
+        
+        if self.wappalyzer_cli_available:
+            targets = [url for url in urls if url not in snapshots]
+            for start in range(0, len(targets), self.CLI_BATCH_SIZE):
+                batch = targets[start:start + self.CLI_BATCH_SIZE]
+                batch_results = await self._analyze_many_with_cli(
+                    [normalized[url] for url in batch], timeout
+                )
+                if batch_results:
+                    for url in batch:
+                        if normalized[url] in batch_results:
+                            results[url] = batch_results[normalized[url]]
+        
+        semaphore = asyncio.Semaphore(max_concurrent)
+        
+        async def _analyze_remaining(url: str) -> None:
+            async with semaphore:
+                results[url] = await self.analyze_url(
+                    normalized[url], timeout=timeout, snapshot=snapshots.get(url)
+                )
+        
+        if self.wappalyzer_py_available:
+            # Compile fingerprints before fanning out
+            await asyncio.get_running_loop().run_in_executor(None, load_fingerprints)
+        
+        await asyncio.gather(*(
+            _analyze_remaining(url) for url in urls if url not in results
+        ))
+        
+        return {url: results.get(url, {"technologies": []}) for url in urls}
+    
     async def _analyze_with_cli(self, url: str, timeout: int) -> Optional[Dict[str, Any]]:
         """
         Analyze a URL using Wappalyzer CLI.
@@ -151,21 +317,44 @@ class WappalyzerIntegration(APIClientInterface):
         Returns:
             Dictionary with detected technologies or None if failed
         """
-        cmd = f"wappalyzer --urls {url} --format json"
+        results = await self._analyze_many_with_cli([url], timeout)
+        if results is None:
+            return None
+        return results.get(url)
+    
+    async def _analyze_many_with_cli(self, urls: List[str], timeout: int) -> Optional[Dict[str, Dict[str, Any]]]:
+        """
+        Analyze several URLs with a single Wappalyzer CLI invocation.
+        
+        Args:
+            urls: URLs to analyze (with protocol)
+            timeout: Timeout in seconds per URL
+            
+        Returns:
+            Mapping of URL to detected technologies, or None if the CLI failed
+        """
+        cmd = ["wappalyzer"]
+        for url in urls:
+            cmd.extend(["--urls", url])
+        cmd.extend(["--format", "json"])
         
         try:
             # Use asyncio to run subprocess with timeout
-            process = await asyncio.create_subprocess_shell(
-                cmd,
+            process = await asyncio.create_subprocess_exec(
+                *cmd,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE
             )
             
-            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=timeout)
+            try:
+                stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=timeout * len(urls))
+            except asyncio.TimeoutError:
+                process.kill()
+                raise
             
             if process.returncode == 0:
                 wapp_data = json.loads(stdout.decode())
-                return self._process_cli_output(wapp_data)
+                return self._map_cli_output(urls, wapp_data)
             else:
                 logger.warning(f"Wappalyzer CLI failed: {stderr.decode()}")
                 return None
@@ -173,6 +362,42 @@ class WappalyzerIntegration(APIClientInterface):
             logger.warning(f"Wappalyzer CLI analysis error: {e}")
             return None
     
+    def _map_cli_output(self, urls: List[str], wapp_data: Any) -> Dict[str, Dict[str, Any]]:
+        """
+        Split multi-URL CLI output into per-URL results.
+        
+        Sites are matched by their reported URL and fall back to output order.
+        
+        Args:
+            urls: URLs passed to the CLI
+            wapp_data: Parsed CLI output
+            
+        Returns:
+            Mapping of URL to processed technology data
+        """
+        if isinstance(wapp_data, dict):
+            wapp_data = [wapp_data]
+        if not isinstance(wapp_data, list):
+            return {url: {"technologies": []} for url in urls}
+        
+        def _normalize(value: str) -> str:
+            return value.rstrip('/').lower()
+        
+        by_url = {}
+        for site_data in wapp_data:
+            site_url = site_data.get("url") if isinstance(site_data, dict) else None
+            if site_url:
+                by_url[_normalize(site_url)] = site_data
+        
+        results = {}
+        for index, url in enumerate(urls):
+            site_data = by_url.get(_normalize(url))
+            if site_data is None and not by_url and index < len(wapp_data):
+                site_data = wapp_data[index]
+            results[url] = self._process_cli_output([site_data] if site_data else [])
+        
+        return results
+    
     def _process_cli_output(self, wapp_data: Dict) -> Dict[str, Any]:
         """
         Process Wappalyzer CLI output.
@@ -200,40 +425,64 @@ class WappalyzerIntegration(APIClientInterface):
         
         return result
     
-    async def _analyze_with_py_lib(self, url: str, timeout: int) -> Dict[str, Any]:
+    async def _fetch_snapshot(self, url: str, timeout: int) -> PageSnapshot:
+        """
+        Fetch a page for analysis (streamed and capped like every homepage fetch).
+        
+        Args:
+            url: URL to fetch
+            timeout: Timeout in seconds
+            
+        Returns:
+            Fetched PageSnapshot
+            
+        Raises:
+            ConnectionError: If the page could not be fetched
+        """
+        snapshot = await PageSnapshot.fetch(self.http_clients.get_session(), url, timeout=timeout, ssl=True)
+        if not snapshot.fetched:
+            raise ConnectionError(snapshot.error)
+        return snapshot
+    
+    async def _analyze_with_py_lib(self, url: str, timeout: int,
+                                   snapshot: Optional[PageSnapshot] = None) -> Dict[str, Any]:
         """
         Analyze a URL using Python Wappalyzer library.
         
         Args:
             url: URL to analyze
             timeout: Timeout in seconds
+            snapshot: Already fetched page to analyze (optional)
             
         Returns:
             Dictionary with detected technologies
         """
-        from Wappalyzer import Wappalyzer, WebPage
+        from Wappalyzer import WebPage
         
-        wappalyzer = Wappalyzer.latest()
+        # Loaded in an executor so a cold start (pickle or JSON parse) does not block the loop
+        wappalyzer = await asyncio.get_running_loop().run_in_executor(None, load_fingerprints)
         
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            response = await client.get(url)
-            webpage = WebPage.new_from_response(response)
-            technologies = wappalyzer.analyze(webpage)
-            
-            result = {"technologies": []}
-            
-            for tech_name in technologies:
-                tech_info = technologies[tech_name]
-                result["technologies"].append({
-                    "name": tech_name,
-                    "categories": tech_info.get("categories", []),
-                    "confidence": 100,  # Python library doesn't provide confidence
-                    "version": tech_info.get("version", "")
-                })
-            
-            return result
+        if snapshot is None or not snapshot.fetched:
+            snapshot = await self._fetch_snapshot(url, timeout)
+        webpage = WebPage(snapshot.final_url or url, snapshot.body, snapshot.headers)
+        
+        technologies = wappalyzer.analyze(webpage)
+        
+        result = {"technologies": []}
+        
+        for tech_name in technologies:
+            tech_info = technologies[tech_name]
+            result["technologies"].append({
+                "name": tech_name,
+                "categories": tech_info.get("categories", []),
+                "confidence": 100,  # Python library doesn't provide confidence
+                "version": tech_info.get("version", "")
+            })
+        
+        return result
     
-    async def _analyze_with_http_fallback(self, url: str, timeout: int) -> Dict[str, Any]:
+    async def _analyze_with_http_fallback(self, url: str, timeout: int,
+                                          snapshot: Optional[PageSnapshot] = None) -> Dict[str, Any]:
         """
         Analyze a URL using HTTP fallback method.
         
@@ -243,6 +492,7 @@ class WappalyzerIntegration(APIClientInterface):
         Args:
             url: URL to analyze
             timeout: Timeout in seconds
+            snapshot: Already fetched page to analyze (optional)
             
         Returns:
             Dictionary with detected technologies
@@ -250,77 +500,36 @@ class WappalyzerIntegration(APIClientInterface):
         result = {"technologies": []}
         
         try:
-            async with httpx.AsyncClient(timeout=timeout) as client:
-                response = await client.get(url)
-                html = response.text
-                headers = response.headers
-                
-                # Check for common technologies in headers
-                server = headers.get("Server", "")
-                if "nginx" in server.lower():
-                    result["technologies"].append({
-                        "name": "Nginx",
-                        "categories": ["Web servers"],
-                        "confidence": 100,
-                        "version": ""
-                    })
-                elif "apache" in server.lower():
-                    result["technologies"].append({
-                        "name": "Apache",
-                        "categories": ["Web servers"],
-                        "confidence": 100,
-                        "version": ""
-                    })
-                
-                # Check for common technologies in HTML
-                if "wp-content" in html:
-                    result["technologies"].append({
-                        "name": "WordPress",
-                        "categories": ["CMS"],
-                        "confidence": 80,
-                        "version": ""
-                    })
-                
-                if "shopify" in html.lower():
-                    result["technologies"].append({
-                        "name": "Shopify",
-                        "categories": ["E-commerce"],
-                        "confidence": 80,
-                        "version": ""
-                    })
-                
-                if "gtag" in html or "google-analytics" in html:
-                    result["technologies"].append({
-                        "name": "Google Analytics",
-                        "categories": ["Analytics"],
-                        "confidence": 80,
-                        "version": ""
-                    })
-                
-                if "klaviyo" in html.lower():
-                    result["technologies"].append({
-                        "name": "Klaviyo",
-                        "categories": ["Email marketing"],
-                        "confidence": 80,
-                        "version": ""
-                    })
-                
-                if "hubspot" in html.lower():
-                    result["technologies"].append({
-                        "name": "HubSpot",
-                        "categories": ["CRM"],
-                        "confidence": 80,
-                        "version": ""
-                    })
-                
-                if "typeform" in html.lower():
-                    result["technologies"].append({
-                        "name": "Typeform",
-                        "categories": ["Forms"],
-                        "confidence": 80,
-                        "version": ""
-                    })
-        
+            if snapshot is None or not snapshot.fetched:
+                snapshot = await self._fetch_snapshot(url, timeout)
+            
+            # Check for common technologies in headers
+            server = snapshot.get_header("server")
+            if "nginx" in server.lower():
+                result["technologies"].append({
+                    "name": "Nginx",
+                    "categories": ["Web servers"],
+                    "confidence": 100,
+                    "version": ""
+                })
+            elif "apache" in server.lower():
+                result["technologies"].append({
+                    "name": "Apache",
+                    "categories": ["Web servers"],
+                    "confidence": 100,
+                    "version": ""
+                })
+            
+            # Check for common technologies in HTML (one signature scan of the page)
+            for vendor in snapshot.signature_hits.vendors("wappalyzer_fallback"):
+                name, category = HTTP_FALLBACK_TECHNOLOGIES[vendor]
+                result["technologies"].append({
+                    "name": name,
+                    "categories": [category],
+                    "confidence": 80,
+                    "version": ""
+                })
+    
         except Exception as e:
             logger.warning(f"HTTP fallback analysis failed: {e}")
         
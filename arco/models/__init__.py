@@ -9,10 +9,12 @@ and ideal customer profile (ICP) models.
 from .prospect import Prospect, Contact, Technology
 from .qualified_prospect import QualifiedProspect, Leak
 from .leak_result import LeakResult
+from .page_snapshot import PageSnapshot
 from .icp import (
     ICP, ICPType, TechnologyRequirement, RevenueIndicator, SaaSWastePattern,
     ShopifyDTCPremiumICP, HealthSupplementsICP, FitnessEquipmentICP,
-    get_all_icps, get_icp_by_name, get_icp_by_type
+    CompiledICP, TechIndex,
+    get_all_icps, get_icp_by_name, get_icp_by_type, score_many
 )
 
 __all__ = [
@@ -22,6 +24,7 @@ __all__ = [
     'QualifiedProspect',
     'Leak',
     'LeakResult',
+    'PageSnapshot',
     'ICP',
     'ICPType',
     'TechnologyRequirement',
@@ -30,7 +33,10 @@ __all__ = [
     'ShopifyDTCPremiumICP',
     'HealthSupplementsICP',
     'FitnessEquipmentICP',
+    'CompiledICP',
+    'TechIndex',
     'get_all_icps',
     'get_icp_by_name',
-    'get_icp_by_type'
+    'get_icp_by_type',
+    'score_many'
 ]
\ No newline at end of file
@@ -10,6 +10,8 @@ from dataclasses import dataclass, field
 from typing import Dict, List, Any, Optional, Set, Tuple
 from enum import Enum
 import math
+import random
+import zlib
 from datetime import datetime
 
 
@@ -733,9 +735,14 @@ class FinancialLeakDetector:
         
         return results
     
+    @staticmethod
+    def _mock_random(prospect: Any, kind: str) -> random.Random:
+        """Random generator seeded by the prospect's domain, so mock data is reproducible."""
+        return random.Random(zlib.crc32(f"{prospect.domain}:{kind}".encode("utf-8")))
+    
     def _generate_mock_performance_data(self, prospect: Any) -> Dict[str, float]:
         """Generate mock performance data for demonstration purposes."""
-        import random
+        rng = self._mock_random(prospect, "performance")
         
         # Base performance metrics
         performance = {
@@ -775,13 +782,13 @@ class FinancialLeakDetector:
         for key in performance:
             if isinstance(performance[key], (int, float)):
                 # Add +/- 10% randomness
-                performance[key] *= random.uniform(0.9, 1.1)
+                performance[key] *= rng.uniform(0.9, 1.1)
         
         return performance
     
     def _generate_mock_conversion_data(self, prospect: Any) -> Dict[str, float]:
         """Generate mock conversion data for demonstration purposes."""
-        import random
+        rng = self._mock_random(prospect, "conversion")
         
         # Base conversion metrics
         conversion = {
@@ -817,6 +824,6 @@ class FinancialLeakDetector:
         for key in conversion:
             if isinstance(conversion[key], (int, float)):
                 # Add +/- 15% randomness
-                conversion[key] *= random.uniform(0.85, 1.15)
+                conversion[key] *= rng.uniform(0.85, 1.15)
         
         return conversion
\ No newline at end of file
@@ -5,8 +5,9 @@ This module contains the ICP model implementation for the ARCO system,
 which represents different ideal customer profiles for targeting.
 """
 
+from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Dict, List, Any, Optional, Set, Tuple
+from typing import AbstractSet, Dict, FrozenSet, List, Any, Optional, Sequence, Set, Tuple
 from enum import Enum
 import math
 from datetime import datetime
@@ -75,8 +76,96 @@ class RevenueIndicator:
         )
 
 
+class TechIndex:
+    """
+    Technology stack of a prospect indexed by category.
+    
+    Built once per prospect and shared by every ICP and waste pattern the
+    prospect is checked against.
+    """
+    
+    __slots__ = ("_technologies", "_tools_by_category", "_counts_by_category")
+    
+    def __init__(self, technologies: Sequence[Any]):
+        """
+        Index a technology stack (lazily, on first lookup).
+        
+        Args:
+            technologies: List of Technology objects
+        """
+        self._technologies = technologies
+        self._tools_by_category: Optional[Dict[str, Set[str]]] = None
+        self._counts_by_category: Optional[Dict[str, int]] = None
+    
+    def _build(self) -> None:
+        """Bucket the technologies by category."""
+        tools_by_category: Dict[str, Set[str]] = {}
+        counts_by_category: Dict[str, int] = {}
+        for tech in self._technologies:
+            tools_by_category.setdefault(tech.category, set()).add(tech.name)
+            counts_by_category[tech.category] = counts_by_category.get(tech.category, 0) + 1
+        self._tools_by_category, self._counts_by_category = tools_by_category, counts_by_category
+    
+    @property
+    def tools_by_category(self) -> Dict[str, Set[str]]:
+        """Tool names by category."""
+        if self._tools_by_category is None:
+            self._build()
+        return self._tools_by_category
+    
+    @property
+    def counts_by_category(self) -> Dict[str, int]:
+        """Number of technologies by category (duplicates included)."""
+        if self._counts_by_category is None:
+            self._build()
+        return self._counts_by_category
+    
+    @classmethod
+    def of(cls, prospect: Any) -> 'TechIndex':
+        """Index the technologies of a prospect."""
+        return cls(prospect.technologies or [])
+    
+    def tools(self, category: str) -> AbstractSet[str]:
+        """Get the tool names found in a category (empty if none)."""
+        return self.tools_by_category.get(category, _NO_TOOLS)
+    
+    def has(self, category: str, tool: str) -> bool:
+        """Check whether a tool was found in a category."""
+        return tool in self.tools(category)
+
+
+_NO_TOOLS: FrozenSet[str] = frozenset()
+
+
+class _CompiledMemo(ABC):
+    """
+    Memoizes the compiled form of a dataclass instance.
+    
+    Assigning a field drops the memo, and the memo is never pickled. Lists
+    or dicts changed in place are not noticed: call compile() again then.
+    """
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        self.__dict__.pop("_compiled", None)
+        super().__setattr__(name, value)
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        state.pop("_compiled", None)
+        return state
+    
+    @abstractmethod
+    def compile(self) -> Any:
+        """Compile the instance and memoize the result."""
+    
+    def compiled(self) -> Any:
+        """Get the memoized compiled form, compiling on first use."""
+        compiled = self.__dict__.get("_compiled")
+        return compiled if compiled is not None else self.compile()
+
+
 @dataclass
-class SaaSWastePattern:
+class SaaSWastePattern(_CompiledMemo):
     """Pattern for detecting SaaS waste specific to an ICP."""
     
     name: str
@@ -106,46 +195,32 @@ class SaaSWastePattern:
             priority=data.get("priority", 1)
         )
         
-    def matches(self, prospect_tech: List[Any]) -> bool:
+    def compile(self) -> 'CompiledWastePattern':
+        """
+        Freeze the detection rules into tuples (memoized for matches()).
+        
+        Returns:
+            CompiledWastePattern instance
+        """
+        compiled = self._compiled = CompiledWastePattern(self)
+        return compiled
+        
+    def matches(self, prospect_tech: List[Any], tech_index: Optional[TechIndex] = None) -> bool:
         """
         Check if this waste pattern matches the prospect's technology stack.
         
         Args:
             prospect_tech: List of Technology objects from the prospect
+            tech_index: Prebuilt index of prospect_tech (built here if omitted)
             
         Returns:
             bool: True if the pattern matches, False otherwise
         """
-        tech_by_category = {}
-        for tech in prospect_tech:
-            if tech.category not in tech_by_category:
-                tech_by_category[tech.category] = []
-            tech_by_category[tech.category].append(tech.name)
-        
-        # Check for redundant tools in the same category
-        if "redundant_categories" in self.detection_pattern:
-            for category in self.detection_pattern["redundant_categories"]:
-                if category in tech_by_category and len(tech_by_category[category]) > 1:
-                    return True
-        
-        # Check for specific tool combinations
-        if "tool_combinations" in self.detection_pattern:
-            for combo in self.detection_pattern["tool_combinations"]:
-                all_found = True
-                for tool_info in combo:
-                    category = tool_info["category"]
-                    tool = tool_info["tool"]
-                    if category not in tech_by_category or tool not in tech_by_category[category]:
-                        all_found = False
-                        break
-                if all_found:
-                    return True
-        
-        return False
+        return self.compiled().matches(tech_index or TechIndex(prospect_tech))
 
 
 @dataclass
-class ICP:
+class ICP(_CompiledMemo):
     """Ideal Customer Profile model for ARCO."""
     
     name: str
@@ -245,149 +320,54 @@ class ICP:
         
         return icp
     
-    def matches_prospect(self, prospect: Any) -> bool:
+    def compile(self) -> 'CompiledICP':
+        """
+        Freeze this ICP's criteria into sets for fast repeated matching.
+        
+        The compiled form is a snapshot, memoized for the matching methods
+        below. Assigning a field drops it; compile again after changing a
+        list field in place.
+        
+        Returns:
+            CompiledICP instance
+        """
+        compiled = self._compiled = CompiledICP(self)
+        return compiled
+    
+    def matches_prospect(self, prospect: Any, tech_index: Optional[TechIndex] = None) -> bool:
         """
         Check if a prospect matches this ICP.
         
         Args:
             prospect: A Prospect object to check against this ICP
+            tech_index: Prebuilt index of the prospect's technologies
             
         Returns:
             bool: True if the prospect matches this ICP, False otherwise
         """
-        # Check revenue range
-        if prospect.revenue:
-            if not (self.min_revenue <= prospect.revenue <= self.max_revenue):
-                return False
-        
-        # Check employee count if available
-        if prospect.employee_count and self.min_employees and self.max_employees:
-            if not (self.min_employees <= prospect.employee_count <= self.max_employees):
-                return False
-        
-        # Check industry if available
-        if prospect.industry and self.industries:
-            if prospect.industry not in self.industries:
-                return False
-        
-        # Check country if available
-        if prospect.country and self.target_countries:
-            if prospect.country not in self.target_countries:
-                return False
-        
-        # Check required technologies
-        if self.tech_requirements:
-            prospect_tech_categories = {tech.category for tech in prospect.technologies}
-            
-            for tech_req in self.tech_requirements:
-                if tech_req.required:
-                    # Check if the prospect has any of the required tools in this category
-                    if tech_req.category not in prospect_tech_categories:
-                        return False
-                    
-                    # Check if the prospect has any of the required tools
-                    prospect_tools = {
-                        tech.name for tech in prospect.technologies 
-                        if tech.category == tech_req.category
-                    }
-                    
-                    if not any(tool in prospect_tools for tool in tech_req.tools):
-                        return False
-        
-        return True
+        return self.compiled().matches(prospect, tech_index)
     
-    def calculate_match_score(self, prospect: Any) -> float:
+    def calculate_match_score(self, prospect: Any, tech_index: Optional[TechIndex] = None) -> float:
         """
         Calculate a match score between 0 and 100 for how well a prospect matches this ICP.
         
         Args:
             prospect: A Prospect object to score against this ICP
+            tech_index: Prebuilt index of the prospect's technologies
             
         Returns:
             float: A score between 0 and 100
         """
-        score = 0.0
-        total_points = 0
-        
-        # Revenue match (25 points)
-        if prospect.revenue:
-            total_points += 25
-            if self.min_revenue <= prospect.revenue <= self.max_revenue:
-                score += 25
-            else:
-                # Partial score based on how close to the range
-                if prospect.revenue < self.min_revenue:
-                    ratio = prospect.revenue / self.min_revenue
-                    score += 25 * min(ratio, 0.8)  # Max 80% of points if below range
-                else:  # prospect.revenue > self.max_revenue
-                    ratio = self.max_revenue / prospect.revenue
-                    score += 25 * min(ratio, 0.9)  # Max 90% of points if above range
-        
-        # Employee count match (15 points)
-        if prospect.employee_count and self.min_employees and self.max_employees:
-            total_points += 15
-            if self.min_employees <= prospect.employee_count <= self.max_employees:
-                score += 15
-            else:
-                # Partial score based on how close to the range
-                if prospect.employee_count < self.min_employees:
-                    ratio = prospect.employee_count / self.min_employees
-                    score += 15 * min(ratio, 0.8)
-                else:  # prospect.employee_count > self.max_employees
-                    ratio = self.max_employees / prospect.employee_count
-                    score += 15 * min(ratio, 0.9)
-        
-        # Industry match (20 points)
-        if prospect.industry and self.industries:
-            total_points += 20
-            if prospect.industry in self.industries:
-                score += 20
-        
-        # Country match (15 points)
-        if prospect.country and self.target_countries:
-            total_points += 15
-            if prospect.country in self.target_countries:
-                score += 15
+        return self.compiled().score(prospect, tech_index)
         
-        # Technology match (25 points)
-        if self.tech_requirements and prospect.technologies:
-            total_points += 25
-            tech_score = 0
-            
-            prospect_tech_map = {
-                tech.category: {t.name for t in prospect.technologies if t.category == tech.category}
-                for tech in prospect.technologies
-            }
-            
-            for tech_req in self.tech_requirements:
-                weight = tech_req.weight * (2 if tech_req.required else 1)
-                if tech_req.category in prospect_tech_map:
-                    # Check how many of the tools in this category match
-                    matching_tools = sum(1 for tool in tech_req.tools if tool in prospect_tech_map[tech_req.category])
-                    if matching_tools > 0:
-                        tech_score += weight * (matching_tools / len(tech_req.tools))
-            
-            # Normalize tech score to 25 points
-            total_weight = sum((req.weight * 2) if req.required else req.weight for req in self.tech_requirements)
-            if total_weight > 0:
-                tech_score = (tech_score / total_weight) * 25
-                score += tech_score
-        
-        # If we have no points to award, return 0
-        if total_points == 0:
-            return 0
-        
-        # Normalize score to 100 points
-        normalized_score = (score / total_points) * 100
-        
-        return normalized_score
-        
-    def calculate_technical_footprint_score(self, prospect: Any) -> Dict[str, Any]:
+    def calculate_technical_footprint_score(self, prospect: Any,
+                                            tech_index: Optional[TechIndex] = None) -> Dict[str, Any]:
         """
         Calculate a detailed technical footprint score for a prospect based on this ICP.
         
         Args:
             prospect: A Prospect object to score against this ICP
+            tech_index: Prebuilt index of the prospect's technologies
             
         Returns:
             Dict: A dictionary with detailed scoring information
@@ -403,10 +383,7 @@ class ICP:
             }
             
         # Map prospect technologies by category for easier lookup
-        prospect_tech_map = {
-            tech.category: {t.name for t in prospect.technologies if t.category == tech.category}
-            for tech in prospect.technologies
-        }
+        prospect_tech_map = (tech_index or TechIndex.of(prospect)).tools_by_category
         
         # Calculate scores for each technology requirement
         details = []
@@ -477,59 +454,28 @@ class ICP:
             "recommendations": recommendations
         }
         
-    def detect_saas_waste(self, prospect: Any) -> Dict[str, Any]:
+    def detect_saas_waste(self, prospect: Any, tech_index: Optional[TechIndex] = None) -> Dict[str, Any]:
         """
         Detect potential SaaS waste for a prospect based on this ICP's waste patterns.
         
         Args:
             prospect: A Prospect object to analyze for waste
+            tech_index: Prebuilt index of the prospect's technologies
             
         Returns:
             Dict: A dictionary with waste detection results
         """
-        if not prospect.technologies or not self.saas_waste_patterns:
-            return {
-                "total_monthly_waste": 0.0,
-                "total_annual_waste": 0.0,
-                "detected_patterns": [],
-                "recommendations": []
-            }
-        
-        # Check each waste pattern against the prospect's technology stack
-        detected_patterns = []
-        total_monthly_waste = 0.0
-        
-        for pattern in self.saas_waste_patterns:
-            if pattern.matches(prospect.technologies):
-                detected_patterns.append({
-                    "name": pattern.name,
-                    "description": pattern.description,
-                    "estimated_monthly_waste": pattern.estimated_monthly_waste,
-                    "priority": pattern.priority
-                })
-                total_monthly_waste += pattern.estimated_monthly_waste
-        
-        # Sort detected patterns by priority (highest first)
-        detected_patterns.sort(key=lambda x: x["priority"], reverse=True)
-        
-        # Generate recommendations
-        recommendations = []
-        for pattern in detected_patterns:
-            recommendations.append(f"Fix {pattern['name']}: {pattern['description']}")
+        return self.compiled().detect_saas_waste(prospect, tech_index)
         
-        return {
-            "total_monthly_waste": total_monthly_waste,
-            "total_annual_waste": total_monthly_waste * 12,
-            "detected_patterns": detected_patterns,
-            "recommendations": recommendations
-        }
-        
-    def calculate_roi(self, prospect: Any) -> Dict[str, Any]:
+    def calculate_roi(self, prospect: Any, tech_index: Optional[TechIndex] = None,
+                      waste_detection: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Calculate potential ROI for a prospect based on this ICP.
         
         Args:
             prospect: A Prospect object to calculate ROI for
+            tech_index: Prebuilt index of the prospect's technologies
+            waste_detection: Result of detect_saas_waste() if already computed
             
         Returns:
             Dict: A dictionary with ROI calculation results
@@ -554,7 +500,7 @@ class ICP:
         estimated_revenue = prospect.revenue if prospect.revenue else self.min_revenue
         
         # Calculate waste based on detected patterns or average
-        waste_detection = self.detect_saas_waste(prospect)
+        waste_detection = waste_detection or self.detect_saas_waste(prospect, tech_index)
         monthly_waste = waste_detection["total_monthly_waste"]
         
         # If no specific waste detected, use average percentage
@@ -584,6 +530,284 @@ class ICP:
         }
 
 
+class CompiledWastePattern:
+    """SaaS waste pattern with its detection rules frozen into tuples."""
+    
+    __slots__ = ("pattern", "redundant_categories", "tool_combinations")
+    
+    def __init__(self, pattern: SaaSWastePattern):
+        """
+        Compile a waste pattern.
+        
+        Args:
+            pattern: SaaSWastePattern to compile
+        """
+        self.pattern = pattern
+        self.redundant_categories: Tuple[str, ...] = tuple(
+            pattern.detection_pattern.get("redundant_categories", ()))
+        self.tool_combinations: Tuple[Tuple[Tuple[str, str], ...], ...] = tuple(
+            tuple((tool_info["category"], tool_info["tool"]) for tool_info in combo)
+            for combo in pattern.detection_pattern.get("tool_combinations", ())
+        )
+    
+    def matches(self, tech_index: TechIndex) -> bool:
+        """
+        Check if this waste pattern matches an indexed technology stack.
+        
+        Args:
+            tech_index: Index of the prospect's technologies
+            
+        Returns:
+            bool: True if the pattern matches, False otherwise
+        """
+        # Check for redundant tools in the same category
+        for category in self.redundant_categories:
+            if tech_index.counts_by_category.get(category, 0) > 1:
+                return True
+        
+        # Check for specific tool combinations
+        for combo in self.tool_combinations:
+            if all(tech_index.has(category, tool) for category, tool in combo):
+                return True
+        
+        return False
+
+
+class CompiledICP:
+    """
+    ICP with its criteria frozen into sets for fast repeated matching.
+    
+    Industries, countries and requirement tools become frozensets and the
+    requirement weights are totalled once, so matching a prospect only costs
+    set lookups against its TechIndex. Scores are identical to the ICP
+    methods, which delegate here.
+    """
+    
+    def __init__(self, icp: ICP):
+        """
+        Compile an ICP.
+        
+        Args:
+            icp: ICP to compile
+        """
+        self.icp = icp
+        self.name = icp.name
+        self.industries: FrozenSet[str] = frozenset(icp.industries)
+        self.target_countries: FrozenSet[str] = frozenset(icp.target_countries)
+        self.employee_range: Optional[Tuple[int, int]] = (
+            (icp.min_employees, icp.max_employees) if icp.min_employees and icp.max_employees else None
+        )
+        
+        # (category, tools, tool set, weight, required) per requirement, in ICP order
+        self.tech_requirements: Tuple[Tuple[str, Tuple[str, ...], FrozenSet[str], float, bool], ...] = tuple(
+            (req.category, tuple(req.tools), frozenset(req.tools),
+             req.weight * (2 if req.required else 1), req.required)
+            for req in icp.tech_requirements
+        )
+        self.required_tools: Tuple[Tuple[str, FrozenSet[str]], ...] = tuple(
+            (category, tool_set) for category, _, tool_set, _, required in self.tech_requirements if required
+        )
+        self.total_tech_weight = sum((req.weight * 2) if req.required else req.weight
+                                     for req in icp.tech_requirements)
+        self.waste_patterns: Tuple[CompiledWastePattern, ...] = tuple(
+            pattern.compiled() for pattern in icp.saas_waste_patterns
+        )
+    
+    def matches(self, prospect: Any, tech_index: Optional[TechIndex] = None) -> bool:
+        """
+        Check if a prospect matches the ICP.
+        
+        Args:
+            prospect: A Prospect object to check
+            tech_index: Prebuilt index of the prospect's technologies
+            
+        Returns:
+            bool: True if the prospect matches, False otherwise
+        """
+        icp = self.icp
+        revenue = getattr(prospect, 'revenue', None)
+        
+        # Check revenue range
+        if revenue:
+            if not (icp.min_revenue <= revenue <= icp.max_revenue):
+                return False
+        
+        # Check employee count if available
+        if prospect.employee_count and self.employee_range:
+            if not (self.employee_range[0] <= prospect.employee_count <= self.employee_range[1]):
+                return False
+        
+        # Check industry if available
+        if prospect.industry and self.industries:
+            if prospect.industry not in self.industries:
+                return False
+        
+        # Check country if available
+        if prospect.country and self.target_countries:
+            if prospect.country not in self.target_countries:
+                return False
+        
+        # Check required technologies: at least one of the required tools in each category
+        if self.required_tools:
+            tech_index = tech_index or TechIndex.of(prospect)
+            for category, tool_set in self.required_tools:
+                if tool_set.isdisjoint(tech_index.tools(category)):
+                    return False
+        
+        return True
+    
+    def score(self, prospect: Any, tech_index: Optional[TechIndex] = None) -> float:
+        """
+        Calculate a match score between 0 and 100 for a prospect.
+        
+        Args:
+            prospect: A Prospect object to score
+            tech_index: Prebuilt index of the prospect's technologies
+            
+        Returns:
+            float: A score between 0 and 100
+        """
+        icp = self.icp
+        revenue = getattr(prospect, 'revenue', None)
+        score = 0.0
+        total_points = 0
+        
+        # Revenue match (25 points)
+        if revenue:
+            total_points += 25
+            if icp.min_revenue <= revenue <= icp.max_revenue:
+                score += 25
+            else:
+                # Partial score based on how close to the range
+                if revenue < icp.min_revenue:
+                    ratio = revenue / icp.min_revenue
+                    score += 25 * min(ratio, 0.8)  # Max 80% of points if below range
+                else:  # revenue > icp.max_revenue
+                    ratio = icp.max_revenue / revenue
+                    score += 25 * min(ratio, 0.9)  # Max 90% of points if above range
+        
+        # Employee count match (15 points)
+        if prospect.employee_count and self.employee_range:
+            min_employees, max_employees = self.employee_range
+            total_points += 15
+            if min_employees <= prospect.employee_count <= max_employees:
+                score += 15
+            else:
+                # Partial score based on how close to the range
+                if prospect.employee_count < min_employees:
+                    ratio = prospect.employee_count / min_employees
+                    score += 15 * min(ratio, 0.8)
+                else:  # prospect.employee_count > max_employees
+                    ratio = max_employees / prospect.employee_count
+                    score += 15 * min(ratio, 0.9)
+        
+        # Industry match (20 points)
+        if prospect.industry and self.industries:
+            total_points += 20
+            if prospect.industry in self.industries:
+                score += 20
+        
+        # Country match (15 points)
+        if prospect.country and self.target_countries:
+            total_points += 15
+            if prospect.country in self.target_countries:
+                score += 15
+        
+        # Technology match (25 points)
+        if self.tech_requirements and prospect.technologies:
+            total_points += 25
+            tech_score = 0
+            tech_index = tech_index or TechIndex.of(prospect)
+            
+            for category, tools, _, weight, _ in self.tech_requirements:
+                prospect_tools = tech_index.tools_by_category.get(category)
+                if prospect_tools is not None:
+                    # Check how many of the tools in this category match
+                    matching_tools = sum(1 for tool in tools if tool in prospect_tools)
+                    if matching_tools > 0:
+                        tech_score += weight * (matching_tools / len(tools))
+            
+            # Normalize tech score to 25 points
+            if self.total_tech_weight > 0:
+                tech_score = (tech_score / self.total_tech_weight) * 25
+                score += tech_score
+        
+        # If we have no points to award, return 0
+        if total_points == 0:
+            return 0
+        
+        # Normalize score to 100 points
+        return (score / total_points) * 100
+    
+    def detect_saas_waste(self, prospect: Any, tech_index: Optional[TechIndex] = None) -> Dict[str, Any]:
+        """
+        Detect potential SaaS waste for a prospect.
+        
+        Args:
+            prospect: A Prospect object to analyze for waste
+            tech_index: Prebuilt index of the prospect's technologies
+            
+        Returns:
+            Dict: A dictionary with waste detection results
+        """
+        if not prospect.technologies or not self.waste_patterns:
+            return {
+                "total_monthly_waste": 0.0,
+                "total_annual_waste": 0.0,
+                "detected_patterns": [],
+                "recommendations": []
+            }
+        
+        # Check each waste pattern against the prospect's technology stack
+        tech_index = tech_index or TechIndex.of(prospect)
+        detected_patterns = []
+        total_monthly_waste = 0.0
+        
+        for compiled in self.waste_patterns:
+            if compiled.matches(tech_index):
+                pattern = compiled.pattern
+                detected_patterns.append({
+                    "name": pattern.name,
+                    "description": pattern.description,
+                    "estimated_monthly_waste": pattern.estimated_monthly_waste,
+                    "priority": pattern.priority
+                })
+                total_monthly_waste += pattern.estimated_monthly_waste
+        
+        # Sort detected patterns by priority (highest first)
+        detected_patterns.sort(key=lambda x: x["priority"], reverse=True)
+        
+        # Generate recommendations
+        recommendations = [f"Fix {pattern['name']}: {pattern['description']}" for pattern in detected_patterns]
+        
+        return {
+            "total_monthly_waste": total_monthly_waste,
+            "total_annual_waste": total_monthly_waste * 12,
+            "detected_patterns": detected_patterns,
+            "recommendations": recommendations
+        }
+    
+    def score_many(self, prospects: Sequence[Any], require_match: bool = False) -> List[Optional[float]]:
+        """
+        Score a batch of prospects against the ICP.
+        
+        Args:
+            prospects: Prospect objects to score
+            require_match: Return None for prospects that do not match the ICP
+            
+        Returns:
+            One match score (or None) per prospect, in input order
+        """
+        scores: List[Optional[float]] = []
+        for prospect in prospects:
+            tech_index = TechIndex.of(prospect)
+            if require_match and not self.matches(prospect, tech_index):
+                scores.append(None)
+            else:
+                scores.append(self.score(prospect, tech_index))
+        return scores
+
+
 @dataclass
 class ShopifyDTCPremiumICP(ICP):
     """Shopify DTC Premium ICP for beauty/skincare businesses."""
@@ -941,6 +1165,34 @@ def get_all_icps() -> List[ICP]:
     ]
 
 
+def score_many(prospects: Sequence[Any], icps: Optional[Sequence[ICP]] = None,
+               require_match: bool = False) -> List[Dict[str, Optional[float]]]:
+    """
+    Score a batch of prospects against several ICPs.
+    
+    Every ICP is compiled once and every prospect's technologies are indexed
+    once, then shared by all ICPs.
+    
+    Args:
+        prospects: Prospect objects to score
+        icps: ICPs to score against (defaults to get_all_icps())
+        require_match: Use None as the score of ICPs a prospect does not match
+        
+    Returns:
+        One dictionary of ICP name to match score per prospect, in input order
+    """
+    compiled = [icp.compiled() for icp in (icps if icps is not None else get_all_icps())]
+    results: List[Dict[str, Optional[float]]] = []
+    for prospect in prospects:
+        tech_index = TechIndex.of(prospect)
+        results.append({
+            icp.name: (None if require_match and not icp.matches(prospect, tech_index)
+                       else icp.score(prospect, tech_index))
+            for icp in compiled
+        })
+    return results
+
+
 def get_icp_by_name(name: str) -> Optional[ICP]:
     """Get an ICP by name."""
     for icp in get_all_icps():
@@ -0,0 +1,166 @@
+"""
+PageSnapshot Model for ARCO.
+
+This module contains the page snapshot model implementation for the ARCO system,
+which captures a single homepage fetch so that every detector in an analysis
+can share it instead of downloading the page again.
+"""
+
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Any, Optional
+
+from arco.utils.page_stream import PageBody, decode_page_body, page_stream_settings, read_page_body
+from arco.utils.signatures import SignatureHits, scan_signatures
+
+@dataclass
+class PageSnapshot:
+    """Result of a single HTTP fetch of a page."""
+
+    url: str
+    final_url: str = ""
+    status: int = 0
+    headers: Dict[str, str] = field(default_factory=dict)  # lowercased header names
+    body: str = ""
+    redirect_chain: List[str] = field(default_factory=list)
+    timings: Dict[str, float] = field(default_factory=dict)  # seconds: 'headers', 'total'
+    error: Optional[str] = None
+    bytes_read: int = 0  # body bytes received
+    truncated: Optional[str] = None  # why the body was cut short ("max_bytes" or "head")
+
+    def __post_init__(self):
+        self.headers = {k.lower(): v for k, v in self.headers.items()}
+        self._html_lower: Optional[str] = None
+        self._signature_hits: Optional[SignatureHits] = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the page was fetched successfully with a 200 response."""
+        return self.error is None and self.status == 200
+
+    @property
+    def fetched(self) -> bool:
+        """Whether any HTTP response was received."""
+        return self.error is None and self.status > 0
+
+    @property
+    def html_lower(self) -> str:
+        """Lowercased body, computed once and reused by all detectors."""
+        if self._html_lower is None:
+            self._html_lower = self.body.lower()
+        return self._html_lower
+
+    @property
+    def signature_hits(self) -> SignatureHits:
+        """Vendor/technology signature hits of the body, scanned once and reused by all detectors."""
+        if self._signature_hits is None:
+            self._signature_hits = scan_signatures(self.html_lower, lowered=True)
+        return self._signature_hits
+
+    @property
+    def load_time(self) -> float:
+        """Total time spent fetching the page in seconds."""
+        return self.timings.get("total", 0.0)
+
+    @property
+    def served_over_https(self) -> bool:
+        """Whether the page was served over HTTPS after following redirects."""
+        return self.final_url.startswith("https://")
+
+    def has_header(self, name: str) -> bool:
+        """Check whether a response header is present (case-insensitive)."""
+        return name.lower() in self.headers
+
+    def get_header(self, name: str, default: str = "") -> str:
+        """Get a response header value (case-insensitive)."""
+        return self.headers.get(name.lower(), default)
+
+    def _attach(self, page: PageBody) -> 'PageSnapshot':
+        """Take the body, its lowercased form and signature hits from a streamed read."""
+        self.body = page.text
+        self.bytes_read = page.bytes_read
+        self.truncated = page.truncated
+        self._html_lower = page.text_lower
+        self._signature_hits = page.signature_hits
+        return self
+
+    @classmethod
+    async def fetch(cls, session: Any, url: str, timeout: int = 10, ssl: bool = False,
+                    cache: Optional[Any] = None, max_bytes: Optional[int] = None,
+                    head_only: Optional[bool] = None) -> 'PageSnapshot':
+        """
+        Fetch a page once with an aiohttp-compatible session.
+
+        The body is streamed: it is decoded and scanned for signatures as it
+        arrives, and reading stops at the byte cap (or after </head> when
+        head_only is set). Errors are captured on the snapshot rather than
+        raised so that callers can hand the same object to every detector
+        unconditionally.
+
+        Args:
+            session: aiohttp ClientSession (or compatible)
+            url: URL to fetch
+            timeout: Timeout in seconds
+            ssl: Whether to verify SSL certificates
+            cache: HTTPResponseCache to read through (optional)
+            max_bytes: Maximum body bytes to read (defaults to page_stream.max_bytes, 0 disables the cap)
+            head_only: Stop after the closing </head> tag (defaults to page_stream.head_only)
+
+        Returns:
+            PageSnapshot for the URL
+        """
+        start = time.perf_counter()
+        try:
+            if cache is not None:
+                if max_bytes is None or head_only is None:
+                    settings = page_stream_settings()
+                    max_bytes = settings["max_bytes"] if max_bytes is None else max_bytes
+                    head_only = settings["head_only"] if head_only is None else head_only
+                # The cache stops downloading at the same limits and keys the entry on them
+                response = await cache.fetch(session, url, timeout=timeout, ssl=ssl, max_bytes=max_bytes,
+                                             head_only=head_only)
+                page = decode_page_body(response.body, response.encoding, max_bytes=max_bytes, head_only=head_only)
+                return cls(
+                    url=url,
+                    final_url=response.url,
+                    status=response.status,
+                    headers=response.headers,
+                    redirect_chain=list(response.history),
+                    timings={"total": time.perf_counter() - start}
+                )._attach(page)
+
+            async with session.get(url, timeout=timeout, ssl=ssl) as response:
+                headers_time = time.perf_counter() - start
+                page = await read_page_body(response, max_bytes=max_bytes, head_only=head_only)
+                return cls(
+                    url=url,
+                    final_url=str(response.url),
+                    status=response.status,
+                    headers=dict(response.headers),
+                    redirect_chain=[str(r.url) for r in response.history],
+                    timings={
+                        "headers": headers_time,
+                        "total": time.perf_counter() - start
+                    }
+                )._attach(page)
+        except Exception as e:
+            return cls(
+                url=url,
+                error=str(e) or type(e).__name__,
+                timings={"total": time.perf_counter() - start}
+            )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary (without the body)."""
+        return {
+            "url": self.url,
+            "final_url": self.final_url,
+            "status": self.status,
+            "headers": self.headers,
+            "body_length": len(self.body),
+            "bytes_read": self.bytes_read,
+            "truncated": self.truncated,
+            "redirect_chain": self.redirect_chain,
+            "timings": self.timings,
+            "error": self.error
+        }
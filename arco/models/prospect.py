@@ -315,6 +315,7 @@ class BusinessIntelligence:
     partnership_announcements: int = 0
     product_launches: int = 0
     data_quality_score: float = 0.0  # 0.0-1.0
+    timed_out_sources: List[str] = field(default_factory=list)  # collectors ("funding") or sources ("funding.crunchbase")
     last_updated: datetime = field(default_factory=datetime.now)
 
 
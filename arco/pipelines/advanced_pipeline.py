@@ -14,11 +14,13 @@ import os
 import time
 
 from arco.pipelines.standard_pipeline import StandardPipeline
+from arco.pipelines.checkpoint import RunCheckpoint, ENHANCED
 from arco.engines.leak_engine import LeakEngine
 from arco.engines.discovery_engine import DiscoveryEngine
 from arco.models.prospect import Prospect
 from arco.models.qualified_prospect import QualifiedProspect
 from arco.utils.logger import get_logger
+from arco.utils.result_writer import is_jsonl_path
 from arco.config.settings import load_config
 
 logger = get_logger(__name__)
@@ -31,6 +33,8 @@ class AdvancedPipeline(StandardPipeline):
     using more sophisticated engines for deeper analysis.
     """
     
+    pipeline_type = "advanced"
+    
     def __init__(self, config_path: str = "config/production.yml"):
         """
         Initialize the advanced pipeline.
@@ -42,7 +46,8 @@ class AdvancedPipeline(StandardPipeline):
         logger.info(f"Initializing AdvancedPipeline with config: {config_path}")
         
         # Initialize additional engines
-        self.leak_engine = LeakEngine(config_path=config_path)
+        self.leak_engine = LeakEngine(config_path=config_path, http_cache=self.http_cache,
+                                      http_clients=self.http_clients)
         self.discovery_engine = DiscoveryEngine(config_path=config_path)
         
         # Advanced pipeline statistics
@@ -53,13 +58,14 @@ class AdvancedPipeline(StandardPipeline):
             "discovery_time": 0.0
         })
     
-    def run(self, input_data: Any) -> List[QualifiedProspect]:
+    def run(self, input_data: Any, checkpoint: Optional[RunCheckpoint] = None) -> List[QualifiedProspect]:
         """
         Run the advanced pipeline with the given input data.
         
         Args:
             input_data: Can be a list of domains, a path to a file with domains,
                        or a search query string
+            checkpoint: Checkpoint to record results in and resume from (optional)
             
         Returns:
             List of qualified prospects
@@ -68,6 +74,8 @@ class AdvancedPipeline(StandardPipeline):
         
         # Reset statistics
         self._reset_stats()
+        if checkpoint is not None:
+            self.checkpoint = checkpoint
         start_time = time.time()
         
         # Handle different input types
@@ -76,11 +84,9 @@ class AdvancedPipeline(StandardPipeline):
             logger.info(f"Processing search query: {input_data}")
             qualified_prospects = self._process_search_query(input_data)
         else:
-            # Use standard pipeline processing for file or domain list
-            qualified_prospects = super().run(input_data)
-            
-            # Enhance prospects with additional data
-            qualified_prospects = self._enhance_prospects(qualified_prospects)
+            # Standard processing and enhancement share one event loop (and
+            # so one set of pooled HTTP clients)
+            qualified_prospects = self._run_sync(self._run_and_enhance_async(input_data, checkpoint))
         
         # Update processing time
         self.stats["processing_time"] = time.time() - start_time
@@ -88,7 +94,7 @@ class AdvancedPipeline(StandardPipeline):
         logger.info(f"Advanced pipeline completed: {len(qualified_prospects)} qualified prospects")
         return qualified_prospects
     
-    def process_prospect(self, prospect: Prospect) -> Optional[QualifiedProspect]:
+    async def process_prospect_async(self, prospect: Prospect) -> Optional[QualifiedProspect]:
         """
         Process a single prospect through the advanced pipeline.
         
@@ -107,7 +113,7 @@ class AdvancedPipeline(StandardPipeline):
             self.stats["enriched_count"] += 1
             
             # Then use the more advanced leak engine for analysis
-            leak_result = asyncio.run(self.leak_engine.analyze(enriched_prospect))
+            leak_result = await self.leak_engine.analyze(enriched_prospect)
             
             # Skip if no significant waste found
             if leak_result.total_monthly_waste < self.config.get("min_monthly_waste", 60):
@@ -115,7 +121,7 @@ class AdvancedPipeline(StandardPipeline):
                 return None
             
             # Qualify prospect using the advanced leak engine
-            qualified = asyncio.run(self.leak_engine.qualify(enriched_prospect, leak_result))
+            qualified = await self.leak_engine.qualify(enriched_prospect, leak_result)
             
             # Update statistics
             self.stats["qualified_count"] += 1
@@ -131,6 +137,7 @@ class AdvancedPipeline(StandardPipeline):
             
         except Exception as e:
             logger.error(f"Error processing {prospect.domain} with advanced pipeline: {e}")
+            self._record_failure(prospect, e)
             return None
     
     def save_results(self, qualified_prospects: List[QualifiedProspect], output_path: Optional[str] = None) -> str:
@@ -146,12 +153,7 @@ class AdvancedPipeline(StandardPipeline):
         """
         if not output_path:
             timestamp = asyncio.run(self._get_timestamp())
-            output_path = f"output/advanced_results_{timestamp}.json"
-        
-        logger.info(f"Saving advanced results to: {output_path}")
-        
-        # Ensure the output directory exists
-        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+            output_path = f"output/advanced_results_{timestamp}.{self.output_format}"
         
         # Calculate additional metrics
         if qualified_prospects:
@@ -159,6 +161,14 @@ class AdvancedPipeline(StandardPipeline):
                 getattr(p, "authority_score", 0) for p in qualified_prospects
             ) / len(qualified_prospects)
         
+        if is_jsonl_path(output_path):
+            return self._save_results_jsonl(qualified_prospects, output_path)
+        
+        logger.info(f"Saving advanced results to: {output_path}")
+        
+        # Ensure the output directory exists
+        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+        
         # Prepare export data
         export_data = {
             "pipeline_type": "advanced",
@@ -195,50 +205,80 @@ class AdvancedPipeline(StandardPipeline):
         
         logger.info(f"Discovered {len(discovered_prospects)} prospects from search query")
         
-        # Process each discovered prospect
-        qualified_prospects = []
-        for prospect in discovered_prospects:
-            qualified = self.process_prospect(prospect)
-            if qualified:
-                qualified_prospects.append(qualified)
+        # Process discovered prospects concurrently
+        results = self._run_sync(self.process_batch_async(discovered_prospects))
         
-        return qualified_prospects
+        return [qualified for qualified in results if qualified]
+    
+    async def _run_and_enhance_async(self, input_data: Any,
+                                     checkpoint: Optional[RunCheckpoint] = None) -> List[QualifiedProspect]:
+        """
+        Run standard processing for a file or domain list, then enhance the results.
+        
+        Results are only streamed once enhanced.
+        
+        Args:
+            input_data: A list of domains or a path to a file with domains
+            checkpoint: Checkpoint to record results in and resume from (optional)
+            
+        Returns:
+            Enhanced qualified prospects, in input order
+        """
+        writer, self.result_writer = self.result_writer, None
+        try:
+            qualified_prospects = await self.run_async(input_data, checkpoint)
+        finally:
+            self.result_writer = writer
+        
+        return await self._enhance_prospects_async(qualified_prospects)
     
-    def _enhance_prospects(self, prospects: List[QualifiedProspect]) -> List[QualifiedProspect]:
+    async def _enhance_prospects_async(self, prospects: List[QualifiedProspect]) -> List[QualifiedProspect]:
         """
-        Enhance prospects with additional data.
+        Enhance prospects with additional data, concurrently on the current event loop.
+        
+        At most ``parallel_processes`` prospects are enhanced at once.
+        Prospects the checkpoint already holds enhanced are kept as they are;
+        newly enhanced ones are written back to the checkpoint. Each prospect
+        goes to the result stream once it is final.
         
         Args:
             prospects: List of prospects to enhance
             
         Returns:
-            Enhanced prospects
+            Enhanced prospects, in input order
         """
         logger.info(f"Enhancing {len(prospects)} prospects with additional data")
+        semaphore = asyncio.Semaphore(self.parallel_processes)
         
-        enhanced_prospects = []
-        for prospect in prospects:
+        async def _enhance(prospect: QualifiedProspect) -> QualifiedProspect:
+            if self._restored.get(prospect.domain) == ENHANCED:
+                self._emit_result(prospect)
+                return prospect
+            
             try:
-                # Enrich with additional data
-                enriched = self.discovery_engine.enrich(prospect)
-                
-                # Re-analyze with the more advanced leak engine
-                leak_result = asyncio.run(self.leak_engine.analyze(enriched))
-                
-                # Re-qualify with the more advanced leak engine
-                requalified = asyncio.run(self.leak_engine.qualify(enriched, leak_result))
-                
-                enhanced_prospects.append(requalified)
-                self.stats["enriched_count"] += 1
-                
-                # Track high-value prospects (A tier)
-                if requalified.priority_tier == "A":
-                    self.stats["high_value_prospects"] += 1
-                
+                async with semaphore:
+                    # Enrich with additional data
+                    enriched = self.discovery_engine.enrich(prospect)
+                    
+                    # Re-analyze and re-qualify with the more advanced leak engine
+                    leak_result = await self.leak_engine.analyze(enriched)
+                    requalified = await self.leak_engine.qualify(enriched, leak_result)
             except Exception as e:
                 logger.error(f"Error enhancing prospect {prospect.domain}: {e}")
                 # Keep the original prospect if enhancement fails
-                enhanced_prospects.append(prospect)
+                self._emit_result(prospect)
+                return prospect
+            
+            self.stats["enriched_count"] += 1
+            await self._record_outcome(prospect, requalified, ENHANCED)
+            self._emit_result(requalified)
+            
+            # Track high-value prospects (A tier)
+            if requalified.priority_tier == "A":
+                self.stats["high_value_prospects"] += 1
+            return requalified
+        
+        enhanced_prospects = list(await asyncio.gather(*(_enhance(p) for p in prospects)))
         
         logger.info(f"Enhanced {self.stats['enriched_count']} prospects")
         return enhanced_prospects
@@ -0,0 +1,388 @@
+"""
+Pipeline Run Checkpoints for ARCO.
+
+This module records the outcome of every prospect of a pipeline run in
+SQLite as soon as it finishes, so a run that dies part-way can be resumed:
+completed domains are restored from the checkpoint instead of being
+analyzed again, and failed domains are retried with the error context of
+their earlier attempts.
+"""
+
+import dataclasses
+import json
+import sqlite3
+import threading
+import time
+import typing
+import uuid
+from datetime import datetime
+from enum import Enum
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from arco.config.config_manager import get_config
+from arco.models.qualified_prospect import Leak, MarketingLeak, QualifiedProspect
+from arco.utils.logger import get_logger
+from arco.utils.result_writer import json_default
+
+logger = get_logger(__name__)
+
+DEFAULT_MAX_ATTEMPTS = 3
+
+# Item statuses; everything except FAILED counts as done on resume
+QUALIFIED = "qualified"
+SKIPPED = "skipped"
+ENHANCED = "enhanced"
+FAILED = "failed"
+
+def new_run_id() -> str:
+    """Generate a sortable, unique run ID."""
+    return f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:6]}"
+
+
+def serialize_result(qualified: QualifiedProspect) -> str:
+    """
+    Serialize a qualified prospect for the checkpoint without ever raising.
+
+    Args:
+        qualified: Qualified prospect to serialize
+
+    Returns:
+        JSON string of the prospect's fields
+    """
+    try:
+        data = dataclasses.asdict(qualified)
+    except Exception as e:
+        logger.warning(f"Could not serialize {qualified.domain} fully: {e}")
+        data = {name: value for name, value in vars(qualified).items()
+                if isinstance(value, (str, int, float, bool, type(None)))}
+    return json.dumps(data, default=json_default)
+
+
+def _restore_enum(enum_type: Any, value: Any) -> Enum:
+    """Rebuild an enum from its value (or its ``Type.NAME`` string in older checkpoints)."""
+    try:
+        return enum_type(value)
+    except ValueError:
+        return enum_type[str(value).rsplit(".", 1)[-1]]
+
+
+def _restore_value(annotation: Any, value: Any) -> Any:
+    """
+    Rebuild a value of a dataclass field from its JSON form.
+
+    Args:
+        annotation: Resolved type annotation of the field
+        value: Decoded JSON value
+
+    Returns:
+        The value with nested dataclasses, enums and datetimes rebuilt
+    """
+    if value is None:
+        return None
+
+    origin, args = typing.get_origin(annotation), typing.get_args(annotation)
+    if origin is typing.Union:
+        # Optional[X]: rebuild as X
+        options = [arg for arg in args if arg is not type(None)]
+        return _restore_value(options[0], value) if len(options) == 1 else value
+    if origin is list:
+        return [_restore_value(args[0], item) for item in value] if args else list(value)
+    if dataclasses.is_dataclass(annotation):
+        return _restore_dataclass(annotation, value)
+    if isinstance(annotation, type) and issubclass(annotation, Enum):
+        return _restore_enum(annotation, value)
+    if annotation is datetime:
+        return datetime.fromisoformat(value)
+    return value
+
+
+def _restore_dataclass(cls: Any, data: Dict[str, Any]) -> Any:
+    """
+    Rebuild a dataclass from the dictionary dataclasses.asdict() produced.
+
+    Fields missing from the dictionary or that cannot be rebuilt keep their defaults.
+
+    Args:
+        cls: Dataclass to build
+        data: Decoded dictionary of its fields
+
+    Returns:
+        Instance of cls
+    """
+    hints = typing.get_type_hints(cls)
+    kwargs = {}
+    for f in dataclasses.fields(cls):
+        if not f.init or f.name not in data:
+            continue
+        try:
+            kwargs[f.name] = _restore_value(hints.get(f.name, Any), data[f.name])
+        except (KeyError, TypeError, ValueError) as e:
+            logger.debug(f"Could not restore {cls.__name__}.{f.name}: {e}")
+    return cls(**kwargs)
+
+
+def restore_result(data: Dict[str, Any]) -> QualifiedProspect:
+    """
+    Rebuild a qualified prospect from the dictionary of a serialized result.
+
+    Args:
+        data: Dictionary decoded from serialize_result()
+
+    Returns:
+        QualifiedProspect with every recorded field, including nested
+        technologies, contacts, scores and enums
+    """
+    qualified = _restore_dataclass(QualifiedProspect, data)
+    # asdict() drops the leak class; marketing leaks carry a data_source
+    qualified.top_leaks = [
+        (MarketingLeak if "data_source" in leak else Leak).from_dict(leak)
+        for leak in data.get("top_leaks") or []
+    ]
+    return qualified
+
+
+class RunCheckpoint:
+    """
+    Durable per-domain results of one pipeline run.
+
+    Every recorded outcome is committed in its own transaction, so at most
+    the prospects that were in flight when a run died are processed again.
+    """
+
+    def __init__(self, run_id: Optional[str] = None, path: Optional[str] = None,
+                 max_attempts: int = DEFAULT_MAX_ATTEMPTS):
+        """
+        Initialize the run checkpoint.
+
+        Args:
+            run_id: ID of the run to record or resume (a new one is generated if omitted)
+            path: SQLite database path (defaults to <paths.data>/checkpoints.sqlite3)
+            max_attempts: Attempts after which a failing domain is no longer retried
+        """
+        self.run_id = run_id or new_run_id()
+        self.path = Path(path) if path else Path(get_config().get("paths.data", "data")) / "checkpoints.sqlite3"
+        self.max_attempts = max(1, max_attempts)
+
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database lazily."""
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=FULL")
+            conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS runs (
+                    run_id TEXT PRIMARY KEY,
+                    pipeline_type TEXT NOT NULL,
+                    input TEXT NOT NULL,
+                    options TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    updated_at REAL NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS run_items (
+                    run_id TEXT NOT NULL,
+                    domain TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    result TEXT,
+                    errors TEXT NOT NULL,
+                    attempts INTEGER NOT NULL,
+                    updated_at REAL NOT NULL,
+                    PRIMARY KEY (run_id, domain)
+                );
+                """
+            )
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def start(self, pipeline_type: str, input_data: Any, options: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Register the run, or mark an existing run as running again.
+
+        Args:
+            pipeline_type: Pipeline type ('standard' or 'advanced')
+            input_data: Input file path, search query or list of domains
+            options: Other run options to keep for resuming (e.g. output path)
+        """
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute(
+                    "INSERT OR IGNORE INTO runs (run_id, pipeline_type, input, options, status, created_at, updated_at) "
+                    "VALUES (?, ?, ?, ?, 'running', ?, ?)",
+                    (self.run_id, pipeline_type, json.dumps(input_data), json.dumps(options or {}), now, now)
+                )
+                conn.execute("UPDATE runs SET status = 'running', updated_at = ? WHERE run_id = ?", (now, self.run_id))
+
+    def get_run(self) -> Optional[Dict[str, Any]]:
+        """
+        Get the recorded run.
+
+        Returns:
+            Dictionary with pipeline_type, input, options, status and item
+            counts by status, or None if the run does not exist
+        """
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT pipeline_type, input, options, status, created_at, updated_at FROM runs WHERE run_id = ?",
+                (self.run_id,)
+            ).fetchone()
+            if row is None:
+                return None
+            counts = dict(conn.execute(
+                "SELECT status, COUNT(*) FROM run_items WHERE run_id = ? GROUP BY status", (self.run_id,)
+            ).fetchall())
+
+        pipeline_type, input_data, options, status, created_at, updated_at = row
+        return {
+            "run_id": self.run_id,
+            "pipeline_type": pipeline_type,
+            "input": json.loads(input_data),
+            "options": json.loads(options),
+            "status": status,
+            "created_at": created_at,
+            "updated_at": updated_at,
+            "items": counts
+        }
+
+    def finish(self, status: str = "completed") -> None:
+        """
+        Mark the run as finished.
+
+        Args:
+            status: Final run status
+        """
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute("UPDATE runs SET status = ?, updated_at = ? WHERE run_id = ?",
+                             (status, time.time(), self.run_id))
+
+    def load_items(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Load the recorded outcome of every domain of the run.
+
+        Returns:
+            Dictionary of domain to item (status, result dictionary or None,
+            list of recorded errors and number of attempts)
+        """
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT domain, status, result, errors, attempts FROM run_items WHERE run_id = ?", (self.run_id,)
+            ).fetchall()
+
+        return {
+            domain: {
+                "status": status,
+                "result": json.loads(result) if result else None,
+                "errors": json.loads(errors),
+                "attempts": attempts
+            }
+            for domain, status, result, errors, attempts in rows
+        }
+
+    def restore(self, item: Dict[str, Any]) -> Optional[QualifiedProspect]:
+        """
+        Rebuild the qualified prospect of a recorded item.
+
+        Args:
+            item: Item returned by load_items()
+
+        Returns:
+            QualifiedProspect, or None if the domain was not qualified
+        """
+        return restore_result(item["result"]) if item["result"] else None
+
+    def should_retry(self, item: Dict[str, Any]) -> bool:
+        """
+        Check whether a recorded domain must be processed again.
+
+        Args:
+            item: Item returned by load_items()
+
+        Returns:
+            True for failed domains that have attempts left
+        """
+        return item["status"] == FAILED and item["attempts"] < self.max_attempts
+
+    def record_result(self, domain: str, qualified: Optional[QualifiedProspect],
+                      status: Optional[str] = None) -> None:
+        """
+        Record a processed domain.
+
+        Args:
+            domain: Prospect domain
+            qualified: Qualified prospect, or None if the domain was not qualified
+            status: Item status (defaults to 'qualified' or 'skipped')
+        """
+        result = serialize_result(qualified) if qualified else None
+        status = status or (QUALIFIED if qualified else SKIPPED)
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                # A success after failed attempts counts as one more attempt
+                conn.execute(
+                    "INSERT INTO run_items (run_id, domain, status, result, errors, attempts, updated_at) "
+                    "VALUES (?, ?, ?, ?, '[]', 1, ?) "
+                    "ON CONFLICT (run_id, domain) DO UPDATE SET status = excluded.status, "
+                    "result = excluded.result, attempts = attempts + (status = 'failed'), "
+                    "updated_at = excluded.updated_at",
+                    (self.run_id, domain, status, result, time.time())
+                )
+
+    def record_failure(self, domain: str, error: Dict[str, Any]) -> None:
+        """
+        Record a failed attempt, keeping the errors of earlier attempts.
+
+        Args:
+            domain: Prospect domain
+            error: JSON-serializable error context
+        """
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                row = conn.execute("SELECT errors, attempts FROM run_items WHERE run_id = ? AND domain = ?",
+                                   (self.run_id, domain)).fetchone()
+                errors: List[Dict[str, Any]] = json.loads(row[0]) if row else []
+                errors.append({**error, "recorded_at": time.time()})
+                conn.execute(
+                    "INSERT OR REPLACE INTO run_items (run_id, domain, status, result, errors, attempts, updated_at) "
+                    "VALUES (?, ?, ?, NULL, ?, ?, ?)",
+                    (self.run_id, domain, FAILED, json.dumps(errors, default=str),
+                     (row[1] if row else 0) + 1, time.time())
+                )
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+def open_checkpoint(run_id: Optional[str] = None) -> Optional[RunCheckpoint]:
+    """
+    Open the checkpoint of a run, configured from ``checkpoints``.
+
+    Args:
+        run_id: ID of the run to resume (a new run is started if omitted)
+
+    Returns:
+        RunCheckpoint, or None if checkpointing is disabled
+    """
+    config = get_config()
+    if not config.get("checkpoints.enabled", True):
+        return None
+    return RunCheckpoint(
+        run_id=run_id,
+        path=config.get("checkpoints.path") or None,
+        max_attempts=config.get("checkpoints.max_attempts", DEFAULT_MAX_ATTEMPTS)
+    )
@@ -7,6 +7,7 @@ integrando Google Analytics, web vitals e traffic source analysis.
 
 import asyncio
 import json
+import re
 import time
 from pathlib import Path
 from typing import Dict, List, Any, Optional
@@ -17,6 +18,7 @@ from arco.integrations.google_analytics import GoogleAnalyticsIntegration
 from arco.models.prospect import Prospect, MarketingData, WebVitals
 from arco.models.qualified_prospect import QualifiedProspect
 from arco.utils.logger import get_logger
+from arco.utils.result_writer import is_jsonl_path
 
 logger = get_logger(__name__)
 
@@ -28,6 +30,8 @@ class MarketingPipeline(AdvancedPipeline):
     para qualificação avançada de prospects.
     """
     
+    pipeline_type = "marketing"
+    
     def __init__(self, config_path: str = "config/production.yml", google_api_key: Optional[str] = None):
         """
         Initialize the marketing pipeline.
@@ -84,6 +88,7 @@ class MarketingPipeline(AdvancedPipeline):
             
         except Exception as e:
             logger.error(f"Error processing {prospect.domain} with marketing pipeline: {e}")
+            self._record_failure(prospect, e)
             return None
     
     def process_prospect(self, prospect: Prospect) -> Optional[QualifiedProspect]:
@@ -307,39 +312,46 @@ class MarketingPipeline(AdvancedPipeline):
         """
         if not output_path:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            output_path = f"output/marketing_results_{timestamp}.json"
-        
-        logger.info(f"Saving marketing pipeline results to: {output_path}")
-        
-        # Ensure the output directory exists
-        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-        
-        # Prepare export data with marketing statistics
-        export_data = {
-            "pipeline_type": "marketing",
-            "stats": self.stats,
-            "marketing_summary": {
-                "total_prospects_analyzed": self.stats["processed_count"],
-                "marketing_data_collected": self.stats["marketing_enriched"],
-                "web_vitals_success_rate": self.stats["web_vitals_collected"] / max(self.stats["processed_count"], 1),
-                "avg_lcp_seconds": round(self.stats["avg_lcp"], 2),
-                "avg_confidence_score": round(self.stats["avg_confidence_score"], 2),
-                "performance_issues_rate": self.stats["performance_issues_detected"] / max(self.stats["processed_count"], 1)
-            },
-            "prospects": [prospect.to_dict() for prospect in qualified_prospects]
+            output_path = f"output/marketing_results_{timestamp}.{self.output_format}"
+        
+        marketing_summary = {
+            "total_prospects_analyzed": self.stats["processed_count"],
+            "marketing_data_collected": self.stats["marketing_enriched"],
+            "web_vitals_success_rate": self.stats["web_vitals_collected"] / max(self.stats["processed_count"], 1),
+            "avg_lcp_seconds": round(self.stats["avg_lcp"], 2),
+            "avg_confidence_score": round(self.stats["avg_confidence_score"], 2),
+            "performance_issues_rate": self.stats["performance_issues_detected"] / max(self.stats["processed_count"], 1)
         }
         
-        # Save results as JSON
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(export_data, f, indent=2, default=str, ensure_ascii=False)
+        if is_jsonl_path(output_path):
+            output_path = self._save_results_jsonl(qualified_prospects, output_path,
+                                                   {"pipeline_type": "marketing",
+                                                    "marketing_summary": marketing_summary})
+        else:
+            logger.info(f"Saving marketing pipeline results to: {output_path}")
+            
+            # Ensure the output directory exists
+            Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+            
+            # Prepare export data with marketing statistics
+            export_data = {
+                "pipeline_type": "marketing",
+                "stats": self.stats,
+                "marketing_summary": marketing_summary,
+                "prospects": [prospect.to_dict() for prospect in qualified_prospects]
+            }
+            
+            # Save results as JSON
+            with open(output_path, 'w', encoding='utf-8') as f:
+                json.dump(export_data, f, indent=2, default=str, ensure_ascii=False)
         
         # Also save a summary file
-        summary_path = output_path.replace('.json', '_summary.json')
+        summary_path = re.sub(r"\.jsonl?(\.gz|\.zst)?$", "", output_path) + "_summary.json"
         summary_data = {
             "pipeline_type": "marketing",
             "execution_date": datetime.now().isoformat(),
             "stats": self.stats,
-            "marketing_summary": export_data["marketing_summary"],
+            "marketing_summary": marketing_summary,
             "top_prospects": [
                 {
                     "domain": p.domain,
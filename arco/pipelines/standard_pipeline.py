@@ -13,9 +13,14 @@ from typing import Dict, List, Any, Optional
 import os
 
 from arco.pipelines.base import PipelineInterface
+from arco.pipelines.checkpoint import RunCheckpoint, FAILED
 from arco.engines.simplified_engine import SimplifiedEngine
 from arco.models.prospect import Prospect
 from arco.models.qualified_prospect import QualifiedProspect
+from arco.core.http_clients import get_http_clients
+from arco.utils.http_cache import get_http_cache
+from arco.utils.page_stream import get_page_stream_stats
+from arco.utils.result_writer import JSONLResultWriter, is_jsonl_path, open_result_writer
 from arco.utils.logger import get_logger
 from arco.config.settings import load_config
 
@@ -27,8 +32,23 @@ class StandardPipeline(PipelineInterface):
     
     This pipeline uses the SimplifiedEngine for basic prospect analysis
     without requiring external API integrations.
+    
+    Prospects are processed on a single event loop with at most
+    ``pipeline.standard.parallel_processes`` in flight at once; a new one
+    starts as soon as any finishes. Progress is logged every
+    ``pipeline.standard.batch_size`` completions.
+    
+    When a RunCheckpoint is attached, every prospect's outcome is recorded
+    as soon as it finishes; domains the checkpoint already has are restored
+    instead of processed again, except failed ones with attempts left.
+    
+    Results saved as JSON Lines (``.jsonl``, ``.jsonl.gz``, ``.jsonl.zst``)
+    are streamed: each qualified prospect is written as soon as it is
+    produced, and save_results() only appends the trailer with the stats.
     """
     
+    pipeline_type = "standard"
+    
     def __init__(self, config_path: str = "config/production.yml"):
         """
         Initialize the standard pipeline.
@@ -40,8 +60,20 @@ class StandardPipeline(PipelineInterface):
         self.config = load_config(config_path)
         logger.info(f"Initializing StandardPipeline with config: {config_path}")
         
-        # Initialize engines
-        self.simplified_engine = SimplifiedEngine()
+        # Initialize engines (sharing one persistent HTTP response cache and
+        # the pooled HTTP clients)
+        self.http_cache = get_http_cache()
+        self.http_clients = get_http_clients()
+        self.simplified_engine = SimplifiedEngine(http_cache=self.http_cache, http_clients=self.http_clients)
+        
+        # Execution settings (pipeline.<type>.parallel_processes in flight,
+        # progress logged every batch_size completions)
+        pipeline_config = self.config.get("pipeline", {}).get(self.pipeline_type, {})
+        self.batch_size = max(1, int(pipeline_config.get("batch_size", 10)))
+        self.parallel_processes = max(1, int(pipeline_config.get("parallel_processes", 1)))
+        
+        # Extension of auto-generated output files ("json" or "jsonl[.gz|.zst]")
+        self.output_format = self.config.get("output", {}).get("format", "json")
         
         # Pipeline statistics
         self.stats = {
@@ -50,23 +82,68 @@ class StandardPipeline(PipelineInterface):
             "total_monthly_waste": 0.0,
             "total_annual_savings": 0.0,
             "average_qualification_score": 0.0,
-            "processing_time": 0.0
+            "processing_time": 0.0,
+            "resumed_count": 0,
+            "failed_count": 0
         }
+        
+        # Run checkpoint (set through run(..., checkpoint=...)) and per-run state
+        self.checkpoint: Optional[RunCheckpoint] = None
+        self._errors: Dict[str, Dict[str, Any]] = {}
+        self._restored: Dict[str, str] = {}
+        
+        # Streaming result writer (set by open_result_stream())
+        self.result_writer: Optional[JSONLResultWriter] = None
     
-    def run(self, input_data: Any) -> List[QualifiedProspect]:
+    def run(self, input_data: Any, checkpoint: Optional[RunCheckpoint] = None) -> List[QualifiedProspect]:
         """
         Run the pipeline with the given input data.
         
         Args:
             input_data: Can be a list of domains or a path to a file with domains
+            checkpoint: Checkpoint to record results in and resume from (optional)
             
         Returns:
             List of qualified prospects
         """
+        return self._run_sync(self.run_async(input_data, checkpoint))
+    
+    def _run_sync(self, coro: Any) -> Any:
+        """
+        Run a coroutine on a new event loop and close its pooled HTTP clients.
+        
+        Args:
+            coro: Coroutine to run
+            
+        Returns:
+            The coroutine's result
+        """
+        async def runner():
+            try:
+                return await coro
+            finally:
+                await self.http_clients.aclose()
+        
+        return asyncio.run(runner())
+    
+    async def run_async(self, input_data: Any,
+                        checkpoint: Optional[RunCheckpoint] = None) -> List[QualifiedProspect]:
+        """
+        Run the pipeline on the current event loop.
+        
+        Args:
+            input_data: Can be a list of domains or a path to a file with domains
+            checkpoint: Checkpoint to record results in and resume from (optional)
+            
+        Returns:
+            List of qualified prospects, in input order
+        """
         logger.info("Running standard pipeline")
         
         # Reset statistics
         self._reset_stats()
+        if checkpoint is not None:
+            self.checkpoint = checkpoint
         
         # Handle different input types
         domains = []
@@ -82,17 +159,17 @@ class StandardPipeline(PipelineInterface):
         
         logger.info(f"Processing {len(domains)} domains")
         
-        # Process domains
-        qualified_prospects = []
-        for domain in domains:
-            # Create prospect
-            prospect = Prospect(
+        prospects = [
+            Prospect(
                 domain=domain,
                 company_name=self._extract_company_name(domain)
             )
-            
-            # Process prospect
-            qualified = self.process_prospect(prospect)
+            for domain in domains
+        ]
+        
+        # Process domains
+        qualified_prospects = []
+        for qualified in await self.process_batch_async(prospects):
             if qualified:
                 qualified_prospects.append(qualified)
                 
@@ -110,10 +187,187 @@ class StandardPipeline(PipelineInterface):
         logger.info(f"Pipeline completed: {len(qualified_prospects)} qualified prospects")
         return qualified_prospects
     
+    async def process_batch_async(self, prospects: List[Prospect],
+                                  concurrency: Optional[int] = None) -> List[Optional[QualifiedProspect]]:
+        """
+        Process many prospects concurrently on the current event loop.
+        
+        Every prospect is scheduled at once under a single semaphore, so at
+        most ``concurrency`` are analyzed at the same time and a slow one
+        only holds its own slot. Each outcome is written to the checkpoint
+        (if any) as it finishes.
+        
+        Args:
+            prospects: Prospects to process
+            concurrency: Maximum prospects in flight (defaults to ``parallel_processes``)
+            
+        Returns:
+            One entry per input prospect, in input order (None when not qualified)
+        """
+        semaphore = asyncio.Semaphore(max(1, concurrency or self.parallel_processes))
+        items = self.checkpoint.load_items() if self.checkpoint else {}
+        completed = 0
+        
+        async def _bounded(prospect: Prospect) -> Optional[QualifiedProspect]:
+            item = items.get(prospect.domain)
+            if item is not None and not self._should_process(prospect, item):
+                qualified = self.checkpoint.restore(item)
+            else:
+                async with semaphore:
+                    qualified = await self.process_prospect_async(prospect)
+                await self._record_outcome(prospect, qualified)
+            
+            if qualified:
+                self._emit_result(qualified)
+            
+            nonlocal completed
+            completed += 1
+            if completed % self.batch_size == 0 or completed == len(prospects):
+                logger.debug(f"Processed {completed}/{len(prospects)} prospects")
+            return qualified
+        
+        return list(await asyncio.gather(*(_bounded(p) for p in prospects)))
+    
+    def _should_process(self, prospect: Prospect, item: Dict[str, Any]) -> bool:
+        """
+        Decide whether a domain recorded in the checkpoint is processed again.
+        
+        Args:
+            prospect: The prospect to process
+            item: Checkpoint item recorded for its domain
+            
+        Returns:
+            True if the prospect must be processed, False if its recorded outcome is reused
+        """
+        errors = item["errors"]
+        last_error = f"{errors[-1].get('type')}: {errors[-1].get('message')}" if errors else "unknown"
+        
+        if self.checkpoint.should_retry(item):
+            logger.info(f"Retrying {prospect.domain} (attempt {item['attempts'] + 1}/"
+                        f"{self.checkpoint.max_attempts}), last error: {last_error}")
+            return True
+        
+        if item["status"] == FAILED:
+            logger.warning(f"Not retrying {prospect.domain} after {item['attempts']} failed attempts, "
+                           f"last error: {last_error}")
+        self._restored[prospect.domain] = item["status"]
+        self.stats["resumed_count"] += 1
+        return False
+    
+    def _record_failure(self, prospect: Prospect, error: Exception) -> None:
+        """
+        Keep the error context of a failed prospect for the checkpoint.
+        
+        Args:
+            prospect: The prospect that failed
+            error: The exception raised while processing it
+        """
+        self.stats["failed_count"] += 1
+        self._errors[prospect.domain] = {
+            "type": type(error).__name__,
+            "message": str(error),
+            "pipeline": self.pipeline_type
+        }
+    
+    async def _record_outcome(self, prospect: Prospect, qualified: Optional[QualifiedProspect],
+                              status: Optional[str] = None) -> None:
+        """
+        Write a processed prospect to the checkpoint, if one is attached.
+        
+        The durable SQLite commit runs in a worker thread so it never blocks
+        the event loop.
+        
+        Args:
+            prospect: The processed prospect
+            qualified: Qualified prospect, or None if not qualified (or failed)
+            status: Checkpoint status overriding the default one
+        """
+        error = self._errors.pop(prospect.domain, None)
+        if self.checkpoint is None:
+            return
+        
+        try:
+            if error is not None:
+                await asyncio.to_thread(self.checkpoint.record_failure, prospect.domain, error)
+            else:
+                await asyncio.to_thread(self.checkpoint.record_result, prospect.domain, qualified, status)
+        except Exception as e:
+            # A checkpoint write must never abort the run
+            logger.warning(f"Could not checkpoint {prospect.domain}: {e}")
+    
+    def open_result_stream(self, output_path: str) -> JSONLResultWriter:
+        """
+        Stream qualified prospects to a JSON Lines file while the pipeline runs.
+        
+        Args:
+            output_path: Output file (finished by save_results())
+            
+        Returns:
+            The result writer
+        """
+        self.result_writer = open_result_writer(output_path)
+        logger.info(f"Streaming results to: {self.result_writer.path}")
+        return self.result_writer
+    
+    def _emit_result(self, qualified: QualifiedProspect) -> None:
+        """Write a qualified prospect to the result stream, if one is open."""
+        if self.result_writer is None:
+            return
+        
+        try:
+            self.result_writer.write(qualified)
+        except Exception as e:
+            # Result output must never abort the run
+            logger.warning(f"Could not stream result for {qualified.domain}: {e}")
+    
+    def _save_results_jsonl(self, qualified_prospects: List[QualifiedProspect], output_path: str,
+                            trailer: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Finish JSON Lines output with a trailer record holding the stats.
+        
+        If a result stream is open its prospects were already written while
+        the pipeline ran; otherwise the given prospects are written one by one.
+        
+        Args:
+            qualified_prospects: List of qualified prospects
+            output_path: Path to the output file
+            trailer: Extra trailer fields
+            
+        Returns:
+            Path to the saved file
+        """
+        writer, self.result_writer = self.result_writer, None
+        if writer is None:
+            writer = open_result_writer(output_path)
+            for prospect in qualified_prospects:
+                writer.write(prospect)
+        
+        path = writer.close({"pipeline_type": self.pipeline_type, "stats": self.stats, **(trailer or {})})
+        logger.info(f"Results saved: {path} ({writer.count} prospects)")
+        return path
+    
     def process_prospect(self, prospect: Prospect) -> Optional[QualifiedProspect]:
         """
         Process a single prospect through the pipeline.
         
+        Every call runs on its own event loop and closes the pooled HTTP
+        clients afterwards (they are bound to that loop), so calling this in
+        a loop opens a fresh connection pool per prospect. Use
+        process_batch_async() (or process_prospect_async() from a running
+        loop) to keep connections pooled across prospects.
+        
+        Args:
+            prospect: The prospect to process
+            
+        Returns:
+            Qualified prospect if successful, None otherwise
+        """
+        return self._run_sync(self.process_prospect_async(prospect))
+    
+    async def process_prospect_async(self, prospect: Prospect) -> Optional[QualifiedProspect]:
+        """
+        Process a single prospect on the current event loop.
+        
         Args:
             prospect: The prospect to process
             
@@ -125,7 +379,7 @@ class StandardPipeline(PipelineInterface):
         
         try:
             # Run leak analysis
-            leak_result = asyncio.run(self.simplified_engine.analyze(prospect))
+            leak_result = await self.simplified_engine.analyze(prospect)
             
             # Skip if no significant waste found
             if leak_result.total_monthly_waste < self.config.get("min_monthly_waste", 40):
@@ -133,13 +387,14 @@ class StandardPipeline(PipelineInterface):
                 return None
             
             # Qualify prospect
-            qualified = asyncio.run(self.simplified_engine.qualify(prospect, leak_result))
+            qualified = await self.simplified_engine.qualify(prospect, leak_result)
             
             logger.info(f"Qualified {prospect.domain}: Score {qualified.qualification_score}/100, Tier {qualified.priority_tier}")
             return qualified
             
         except Exception as e:
             logger.error(f"Error processing {prospect.domain}: {e}")
+            self._record_failure(prospect, e)
             return None
     
     def get_stats(self) -> Dict[str, Any]:
@@ -147,8 +402,11 @@ class StandardPipeline(PipelineInterface):
         Get pipeline execution statistics.
         
         Returns:
-            Dictionary with pipeline statistics
+            Dictionary with pipeline statistics, including HTTP cache, client and page read counters
         """
+        self.stats["http_cache"] = self.http_cache.get_stats()
+        self.stats["http_clients"] = self.http_clients.get_stats()
+        self.stats["page_stream"] = get_page_stream_stats()
         return self.stats
     
     def save_results(self, qualified_prospects: List[QualifiedProspect], output_path: Optional[str] = None) -> str:
@@ -164,7 +422,10 @@ class StandardPipeline(PipelineInterface):
         """
         if not output_path:
             timestamp = asyncio.run(self._get_timestamp())
-            output_path = f"output/standard_results_{timestamp}.json"
+            output_path = f"output/standard_results_{timestamp}.{self.output_format}"
+        
+        if is_jsonl_path(output_path):
+            return self._save_results_jsonl(qualified_prospects, output_path)
         
         logger.info(f"Saving results to: {output_path}")
         
@@ -185,21 +446,28 @@ class StandardPipeline(PipelineInterface):
         logger.info(f"Results saved: {output_path}")
         return output_path
     
-    def run_from_file(self, input_file: str, output_file: Optional[str] = None) -> List[QualifiedProspect]:
+    def run_from_file(self, input_file: str, output_file: Optional[str] = None,
+                      checkpoint: Optional[RunCheckpoint] = None) -> List[QualifiedProspect]:
         """
         Run the standard pipeline with domains from a file.
         
+        JSON Lines output files are streamed while the pipeline runs.
+        
         Args:
             input_file: Path to the input file with domains
             output_file: Path to the output file (optional)
+            checkpoint: Checkpoint to record results in and resume from (optional)
             
         Returns:
             List of qualified prospects
         """
         logger.info(f"Running standard pipeline with input file: {input_file}")
         
+        if is_jsonl_path(output_file) and self.result_writer is None:
+            self.open_result_stream(output_file)
+        
         # Run pipeline
-        qualified_prospects = self.run(input_file)
+        qualified_prospects = self.run(input_file, checkpoint=checkpoint)
         
         # Save results if output file specified
         if output_file:
@@ -244,12 +512,16 @@ class StandardPipeline(PipelineInterface):
         return datetime.now().strftime("%Y%m%d_%H%M%S")
     
     def _reset_stats(self) -> None:
-        """Reset pipeline statistics."""
+        """Reset pipeline statistics and per-run checkpoint state."""
         self.stats = {
             "processed_count": 0,
             "qualified_count": 0,
             "total_monthly_waste": 0.0,
             "total_annual_savings": 0.0,
             "average_qualification_score": 0.0,
-            "processing_time": 0.0
-        }
\ No newline at end of file
+            "processing_time": 0.0,
+            "resumed_count": 0,
+            "failed_count": 0
+        }
+        self._errors = {}
+        self._restored = {}
\ No newline at end of file
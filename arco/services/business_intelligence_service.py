@@ -7,15 +7,28 @@ collecting real data from multiple sources to replace fake calculations.
 
 import asyncio
 import logging
-from typing import Dict, List, Optional, Any
+from typing import Awaitable, Callable, Dict, List, Optional, Any, Sequence
 from datetime import datetime
 
+from arco.config.config_manager import get_config
 from arco.models.prospect import BusinessIntelligence, AdInvestmentProfile, FundingProfile, HiringActivity, TechnologyInvestment, Prospect
 from arco.integrations.ad_intelligence_collector import AdIntelligenceCollector
 from arco.integrations.funding_intelligence_collector import FundingIntelligenceCollector
 from arco.integrations.hiring_intelligence_collector import HiringIntelligenceCollector
 from arco.integrations.technology_intelligence_collector import TechnologyIntelligenceCollector
 from arco.core.error_handler import ProcessingErrorHandler, RetryConfig, CircuitBreakerConfig
+from arco.utils.fanout import gather_sources, timed_out_sources
+
+DEFAULT_COLLECTOR_TIMEOUT = 20.0
+
+# Data quality weight of each collector, and the sources each one gathers
+COLLECTOR_WEIGHTS = {"ad": 0.3, "funding": 0.25, "hiring": 0.25, "technology": 0.2}
+COLLECTOR_SOURCES = {
+    "ad": AdIntelligenceCollector.SOURCES,
+    "funding": FundingIntelligenceCollector.SOURCES,
+    "hiring": HiringIntelligenceCollector.SOURCES,
+    "technology": TechnologyIntelligenceCollector.SOURCES
+}
 
 
 class BusinessIntelligenceService:
@@ -32,7 +45,8 @@ class BusinessIntelligenceService:
                  funding_intelligence_collector: FundingIntelligenceCollector,
                  hiring_intelligence_collector: HiringIntelligenceCollector,
                  technology_intelligence_collector: TechnologyIntelligenceCollector,
-                 error_handler: Optional[ProcessingErrorHandler] = None):
+                 error_handler: Optional[ProcessingErrorHandler] = None,
+                 collector_timeout: Optional[float] = None):
         """
         Initialize the business intelligence service.
         
@@ -42,12 +56,16 @@ class BusinessIntelligenceService:
             hiring_intelligence_collector: Collector for hiring intelligence
             technology_intelligence_collector: Collector for technology intelligence
             error_handler: Error handler for robust API interactions
+            collector_timeout: Timeout in seconds per collector, retries included
+                (defaults to intelligence.collector_timeout)
         """
         self.ad_intelligence_collector = ad_intelligence_collector
         self.funding_intelligence_collector = funding_intelligence_collector
         self.hiring_intelligence_collector = hiring_intelligence_collector
         self.technology_intelligence_collector = technology_intelligence_collector
         self._logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+        self.collector_timeout = (collector_timeout if collector_timeout is not None
+                                  else get_config().get("intelligence.collector_timeout", DEFAULT_COLLECTOR_TIMEOUT))
         
         # Initialize error handler with business intelligence specific configuration
         self.error_handler = error_handler or ProcessingErrorHandler(
@@ -67,6 +85,11 @@ class BusinessIntelligenceService:
         """
         Collect comprehensive business intelligence from real sources with robust error handling.
         
+        The four collectors (and the independent sources inside each) run
+        concurrently, each under its own timeout. A collector or source that
+        times out contributes default values and is listed in
+        timed_out_sources, so the latency is that of the slowest source.
+        
         Args:
             prospect_domain: Domain of the prospect company
             company_name: Name of the prospect company
@@ -76,15 +99,32 @@ class BusinessIntelligenceService:
         """
         self._logger.info(f"🔍 Collecting business intelligence for {company_name}")
         
-        # Collect intelligence data with error handling for each collector
-        ad_investment = await self._collect_ad_intelligence_safely(prospect_domain, company_name)
-        funding_profile = await self._collect_funding_intelligence_safely(company_name)
-        hiring_activity = await self._collect_hiring_intelligence_safely(company_name)
-        technology_investment = await self._collect_technology_intelligence_safely(prospect_domain)
+        # Collect intelligence data concurrently with error handling for each collector
+        source_timeouts: List[str] = []
+        results = await gather_sources({
+            "ad": self._collect_ad_intelligence_safely(prospect_domain, company_name, source_timeouts),
+            "funding": self._collect_funding_intelligence_safely(company_name, source_timeouts),
+            "hiring": self._collect_hiring_intelligence_safely(company_name, source_timeouts),
+            "technology": self._collect_technology_intelligence_safely(prospect_domain, source_timeouts)
+        }, timeout=self.collector_timeout)
+        
+        collector_timeouts = timed_out_sources(results)
+        for collector in collector_timeouts:
+            self._logger.warning(f"⚠️ {collector.capitalize()} intelligence collection timed out for {company_name}")
+        
+        # A timed-out collector supersedes the sources it had already given up on
+        timed_out = list(dict.fromkeys(
+            [name for name in source_timeouts if name.split(".", 1)[0] not in collector_timeouts] + collector_timeouts
+        ))
+        
+        ad_investment = self._profile_or_default(results["ad"], AdInvestmentProfile)
+        funding_profile = self._profile_or_default(results["funding"], FundingProfile)
+        hiring_activity = self._profile_or_default(results["hiring"], HiringActivity)
+        technology_investment = self._profile_or_default(results["technology"], TechnologyInvestment)
         
         # Calculate data quality score
         data_quality_score = self._calculate_data_quality_score(
-            ad_investment, funding_profile, hiring_activity, technology_investment
+            ad_investment, funding_profile, hiring_activity, technology_investment, timed_out
         )
         
         business_intelligence = BusinessIntelligence(
@@ -93,6 +133,7 @@ class BusinessIntelligenceService:
             hiring_activity=hiring_activity,
             technology_investment=technology_investment,
             data_quality_score=data_quality_score,
+            timed_out_sources=timed_out,
             last_updated=datetime.now()
         )
         
@@ -102,58 +143,105 @@ class BusinessIntelligenceService:
             f"Ad Active: {'✓' if ad_investment.facebook_active or ad_investment.google_active else '✗'}, "
             f"Recent Funding: {'✓' if funding_profile.recent_funding_months else '✗'}, "
             f"Tech Hiring: {hiring_activity.tech_job_postings}"
+            + (f", Timed Out: {', '.join(timed_out)}" if timed_out else "")
         )
         
         return business_intelligence
     
-    async def _collect_ad_intelligence_safely(self, prospect_domain: str, company_name: str) -> AdInvestmentProfile:
+    @staticmethod
+    def _profile_or_default(result: Any, profile_type: type) -> Any:
+        """Get a collector's profile, or an empty profile if the collector timed out."""
+        return profile_type() if isinstance(result, BaseException) else result
+    
+    async def _collect_with_retry(self, collect: Callable[..., Awaitable[Any]], operation_name: str,
+                                  service_name: str, *args: Any,
+                                  timed_out: Optional[List[str]] = None) -> Any:
+        """
+        Run a collector with retries, reporting the source timeouts of the returned attempt only.
+        
+        Every attempt collects its timed-out sources in its own list, so the
+        sources that timed out in a failed attempt are not reported.
+        
+        Args:
+            collect: Collector coroutine function taking a timed_out list
+            operation_name: Operation name for error handling
+            service_name: Service name for error handling
+            *args: Collector arguments
+            timed_out: List extended with the returned attempt's timed-out sources
+            
+        Returns:
+            The collector's profile
+        """
+        returned_timeouts: List[str] = []
+        
+        async def attempt(*attempt_args: Any) -> Any:
+            nonlocal returned_timeouts
+            attempt_timeouts: List[str] = []
+            profile = await collect(*attempt_args, timed_out=attempt_timeouts)
+            returned_timeouts = attempt_timeouts
+            return profile
+        
+        profile = await self.error_handler.process_with_retry(attempt, operation_name, service_name, *args)
+        if timed_out is not None:
+            timed_out.extend(returned_timeouts)
+        return profile
+    
+    async def _collect_ad_intelligence_safely(self, prospect_domain: str, company_name: str,
+                                              timed_out: Optional[List[str]] = None) -> AdInvestmentProfile:
         """Collect ad intelligence with comprehensive error handling."""
         try:
-            return await self.error_handler.process_with_retry(
+            return await self._collect_with_retry(
                 self.ad_intelligence_collector.collect,
                 "collect_ad_intelligence",
                 "ad_intelligence_service",
                 prospect_domain,
-                company_name
+                company_name,
+                timed_out=timed_out
             )
         except Exception as e:
             self._logger.warning(f"⚠️ Ad intelligence collection failed for {company_name}: {e}")
             return AdInvestmentProfile()
     
-    async def _collect_funding_intelligence_safely(self, company_name: str) -> FundingProfile:
+    async def _collect_funding_intelligence_safely(self, company_name: str,
+                                                   timed_out: Optional[List[str]] = None) -> FundingProfile:
         """Collect funding intelligence with comprehensive error handling."""
         try:
-            return await self.error_handler.process_with_retry(
+            return await self._collect_with_retry(
                 self.funding_intelligence_collector.collect,
                 "collect_funding_intelligence",
                 "funding_intelligence_service",
-                company_name
+                company_name,
+                timed_out=timed_out
             )
         except Exception as e:
             self._logger.warning(f"⚠️ Funding intelligence collection failed for {company_name}: {e}")
             return FundingProfile()
     
-    async def _collect_hiring_intelligence_safely(self, company_name: str) -> HiringActivity:
+    async def _collect_hiring_intelligence_safely(self, company_name: str,
+                                                  timed_out: Optional[List[str]] = None) -> HiringActivity:
         """Collect hiring intelligence with comprehensive error handling."""
         try:
-            return await self.error_handler.process_with_retry(
+            return await self._collect_with_retry(
                 self.hiring_intelligence_collector.collect,
                 "collect_hiring_intelligence",
                 "hiring_intelligence_service",
-                company_name
+                company_name,
+                timed_out=timed_out
             )
         except Exception as e:
             self._logger.warning(f"⚠️ Hiring intelligence collection failed for {company_name}: {e}")
             return HiringActivity()
     
-    async def _collect_technology_intelligence_safely(self, prospect_domain: str) -> TechnologyInvestment:
+    async def _collect_technology_intelligence_safely(self, prospect_domain: str,
+                                                      timed_out: Optional[List[str]] = None) -> TechnologyInvestment:
         """Collect technology intelligence with comprehensive error handling."""
         try:
-            return await self.error_handler.process_with_retry(
+            return await self._collect_with_retry(
                 self.technology_intelligence_collector.collect,
                 "collect_technology_intelligence",
                 "technology_intelligence_service",
-                prospect_domain
+                prospect_domain,
+                timed_out=timed_out
             )
         except Exception as e:
             self._logger.warning(f"⚠️ Technology intelligence collection failed for {prospect_domain}: {e}")
@@ -163,7 +251,8 @@ class BusinessIntelligenceService:
                                     ad_investment: AdInvestmentProfile,
                                     funding_profile: FundingProfile,
                                     hiring_activity: HiringActivity,
-                                    technology_investment: TechnologyInvestment) -> float:
+                                    technology_investment: TechnologyInvestment,
+                                    timed_out: Sequence[str] = ()) -> float:
         """
         Calculate data quality score based on available intelligence.
         
@@ -172,6 +261,7 @@ class BusinessIntelligenceService:
             funding_profile: Funding profile
             hiring_activity: Hiring activity
             technology_investment: Technology investment
+            timed_out: Collectors ("funding") or sources ("funding.crunchbase") that timed out
             
         Returns:
             Data quality score (0.0-1.0)
@@ -202,7 +292,15 @@ class BusinessIntelligenceService:
         elif len(technology_investment.new_integrations_detected) > 0:
             score += 0.1
         
-        return min(score, 1.0)
+        # Timed-out sources are unknown rather than empty: keep only the share of
+        # the weights whose sources answered (a source carries an equal part of its collector's weight)
+        unanswered = 0.0
+        for name in timed_out:
+            collector, _, source = name.partition(".")
+            weight = COLLECTOR_WEIGHTS.get(collector, 0.0)
+            unanswered += weight / len(COLLECTOR_SOURCES[collector]) if source and weight else weight
+        
+        return min(score, 1.0) * max(0.0, 1.0 - unanswered)
     
     async def get_budget_verification_signals(self, business_intelligence: BusinessIntelligence) -> List[str]:
         """
@@ -7,12 +7,14 @@ coordinating multiple specialized services to analyze prospects with real data.
 
 import asyncio
 import logging
-from typing import List, Optional, Dict, Any
+import time
+from typing import AsyncIterator, List, Optional, Dict, Any
 from datetime import datetime
 
 from arco.models.prospect import Prospect, BusinessModel, CompanyScale, LeadScore, ActionableInsight, BusinessRecommendation, CRMProfile
 from arco.services.business_intelligence_service import BusinessIntelligenceService
 from arco.services.lead_scoring_service import LeadScoringService
+from arco.utils.concurrency_limit import AIMDConcurrencyLimit
 
 
 class ProspectOrchestrator:
@@ -25,20 +27,24 @@ class ProspectOrchestrator:
     
     def __init__(self,
                  business_intelligence_service: BusinessIntelligenceService,
-                 lead_scoring_service: LeadScoringService):
+                 lead_scoring_service: LeadScoringService,
+                 concurrency_limit: Optional[AIMDConcurrencyLimit] = None):
         """
         Initialize orchestrator with injected services.
         
         Args:
             business_intelligence_service: Service for collecting business intelligence
             lead_scoring_service: Service for calculating lead scores
+            concurrency_limit: Adaptive limit of prospects analyzed at once
+                (defaults to the ``orchestrator.concurrency`` config section)
         """
         self.business_intelligence_service = business_intelligence_service
         self.lead_scoring_service = lead_scoring_service
+        self.concurrency_limit = concurrency_limit or AIMDConcurrencyLimit.from_config()
         self._logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
     
     async def analyze_prospect_comprehensively(self, 
-                                             prospect_data: Dict[str, Any]) -> ComprehensiveProspect:
+                                             prospect_data: Dict[str, Any]) -> Prospect:
         """
         Complete prospect analysis with all business intelligence.
         
@@ -46,7 +52,7 @@ class ProspectOrchestrator:
             prospect_data: Basic prospect data (domain, company_name, etc.)
             
         Returns:
-            ComprehensiveProspect with complete analysis
+            Prospect with complete analysis
         """
         company_name = prospect_data.get('company_name', '')
         domain = prospect_data.get('domain', '')
@@ -72,7 +78,7 @@ class ProspectOrchestrator:
             )
             
             # 4. Create comprehensive prospect
-            comprehensive_prospect = ComprehensiveProspect(
+            comprehensive_prospect = Prospect(
                 id=prospect_data.get('id', f"{domain}_{company_name}"),
                 company_name=company_name,
                 domain=domain,
@@ -87,12 +93,15 @@ class ProspectOrchestrator:
                 confidence_level=business_intel.data_quality_score
             )
             
-            self._logger.info(
-                f"✅ Analyzed {company_name}: "
-                f"Score: {lead_score.total_score}/100 ({lead_score.temperature.value}), "
-                f"Budget Signals: {len(await self.business_intelligence_service.get_budget_verification_signals(business_intel))}, "
-                f"Data Quality: {business_intel.data_quality_score:.2f}"
-            )
+            if self._logger.isEnabledFor(logging.INFO):
+                # Budget signals are only counted for the log line, so skip them when it is not emitted
+                budget_signals = await self.business_intelligence_service.get_budget_verification_signals(business_intel)
+                self._logger.info(
+                    f"✅ Analyzed {company_name}: "
+                    f"Score: {lead_score.total_score}/100 ({lead_score.temperature.value}), "
+                    f"Budget Signals: {len(budget_signals)}, "
+                    f"Data Quality: {business_intel.data_quality_score:.2f}"
+                )
             
             return comprehensive_prospect
             
@@ -100,57 +109,99 @@ class ProspectOrchestrator:
             self._logger.error(f"❌ Failed to analyze {company_name}: {e}")
             raise
     
-    async def process_prospects_batch(self, 
-                                    prospects_data: List[Dict[str, Any]]) -> List[ComprehensiveProspect]:
+    async def stream_prospects(self,
+                               prospects_data: List[Dict[str, Any]]) -> AsyncIterator[Prospect]:
         """
-        Process multiple prospects with comprehensive analysis.
-        
+        Analyze prospects through a worker pool, yielding each as it completes.
+
+        Workers pull prospects from a queue and keep up to the concurrency
+        limit in flight, so a slow prospect only holds its own slot. The
+        limit adapts (AIMD) to the latency and errors of every analysis.
+        Prospects that fail are logged and skipped.
+
         Args:
             prospects_data: List of basic prospect data
-            
-        Returns:
-            List of comprehensive prospects with analysis
+
+        Yields:
+            Prospects with complete analysis, in completion order
         """
-        self._logger.info(f"🚀 Processing {len(prospects_data)} prospects with comprehensive analysis")
-        
-        comprehensive_prospects = []
-        
-        # Process in batches to respect API rate limits
-        batch_size = 5
-        for i in range(0, len(prospects_data), batch_size):
-            batch = prospects_data[i:i + batch_size]
-            
-            self._logger.info(f"📊 Processing batch {i//batch_size + 1}/{(len(prospects_data)-1)//batch_size + 1}")
-            
-            # Process batch concurrently
-            batch_tasks = [
-                self.analyze_prospect_comprehensively(prospect_data)
-                for prospect_data in batch
-            ]
-            
-            batch_results = await asyncio.gather(*batch_tasks, return_exceptions=True)
-            
-            # Handle results and exceptions
-            for j, result in enumerate(batch_results):
+        if not prospects_data:
+            return
+
+        pending: asyncio.Queue = asyncio.Queue()
+        for prospect_data in prospects_data:
+            pending.put_nowait(prospect_data)
+        results: asyncio.Queue = asyncio.Queue()
+        slots = asyncio.Condition()
+        in_flight = 0
+
+        async def worker() -> None:
+            nonlocal in_flight
+            while True:
+                async with slots:
+                    await slots.wait_for(lambda: in_flight < self.concurrency_limit.limit)
+                    if pending.empty():
+                        return
+                    prospect_data = pending.get_nowait()
+                    in_flight += 1
+
+                start = time.perf_counter()
+                try:
+                    result = await self.analyze_prospect_comprehensively(prospect_data)
+                except Exception as e:
+                    result = e
+                self.concurrency_limit.record(time.perf_counter() - start, error=isinstance(result, Exception))
+
+                async with slots:
+                    in_flight -= 1
+                    slots.notify_all()
+                results.put_nowait((prospect_data, result))
+
+        workers = [
+            asyncio.create_task(worker())
+            for _ in range(min(self.concurrency_limit.max_limit, len(prospects_data)))
+        ]
+        try:
+            for _ in range(len(prospects_data)):
+                prospect_data, result = await results.get()
                 if isinstance(result, Exception):
-                    self._logger.error(f"❌ Failed to process {batch[j].get('company_name', 'Unknown')}: {result}")
+                    self._logger.error(f"❌ Failed to process {prospect_data.get('company_name', 'Unknown')}: {result}")
                 else:
-                    comprehensive_prospects.append(result)
-            
-            # Rate limiting between batches
-            if i + batch_size < len(prospects_data):
-                await asyncio.sleep(2.0)
-        
+                    yield result
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+    async def process_prospects_batch(self,
+                                    prospects_data: List[Dict[str, Any]]) -> List[Prospect]:
+        """
+        Process multiple prospects with comprehensive analysis.
+
+        Args:
+            prospects_data: List of basic prospect data
+
+        Returns:
+            List of comprehensive prospects with analysis, best lead score first
+        """
+        self._logger.info(
+            f"🚀 Processing {len(prospects_data)} prospects with comprehensive analysis "
+            f"(concurrency {self.concurrency_limit.limit})"
+        )
+
+        comprehensive_prospects = [prospect async for prospect in self.stream_prospects(prospects_data)]
+
         # Sort by lead score
         comprehensive_prospects.sort(key=lambda p: p.lead_score.total_score, reverse=True)
-        
+
         self._logger.info(
             f"🎯 Completed processing: {len(comprehensive_prospects)} prospects analyzed, "
-            f"{len([p for p in comprehensive_prospects if p.is_hot_lead()])} hot leads identified"
+            f"{len([p for p in comprehensive_prospects if p.is_hot_lead()])} hot leads identified, "
+            f"concurrency now {self.concurrency_limit.limit}"
         )
-        
+
         return comprehensive_prospects
-    
+
     def _classify_business_model(self, prospect_data: Dict[str, Any]) -> BusinessModel:
         """
         Classify business model based on prospect data.
@@ -191,7 +242,7 @@ class ProspectOrchestrator:
             return CompanyScale.STARTUP
     
     async def generate_executive_report(self, 
-                                      prospects: List[ComprehensiveProspect]) -> Dict[str, Any]:
+                                      prospects: List[Prospect]) -> Dict[str, Any]:
         """
         Generate executive summary report with key insights and ROI projections.
         
@@ -242,7 +293,7 @@ class ProspectOrchestrator:
         
         return report
     
-    def _analyze_business_model_distribution(self, prospects: List[ComprehensiveProspect]) -> Dict[str, int]:
+    def _analyze_business_model_distribution(self, prospects: List[Prospect]) -> Dict[str, int]:
         """Analyze distribution of business models."""
         distribution = {}
         for prospect in prospects:
@@ -250,7 +301,7 @@ class ProspectOrchestrator:
             distribution[model] = distribution.get(model, 0) + 1
         return distribution
     
-    def _analyze_company_scale_distribution(self, prospects: List[ComprehensiveProspect]) -> Dict[str, int]:
+    def _analyze_company_scale_distribution(self, prospects: List[Prospect]) -> Dict[str, int]:
         """Analyze distribution of company scales."""
         distribution = {}
         for prospect in prospects:
@@ -258,7 +309,7 @@ class ProspectOrchestrator:
             distribution[scale] = distribution.get(scale, 0) + 1
         return distribution
     
-    def _analyze_geographic_distribution(self, prospects: List[ComprehensiveProspect]) -> Dict[str, int]:
+    def _analyze_geographic_distribution(self, prospects: List[Prospect]) -> Dict[str, int]:
         """Analyze geographic distribution."""
         distribution = {}
         for prospect in prospects:
@@ -267,8 +318,8 @@ class ProspectOrchestrator:
         return distribution
     
     def _generate_strategic_recommendations(self, 
-                                         prospects: List[ComprehensiveProspect],
-                                         hot_leads: List[ComprehensiveProspect]) -> List[str]:
+                                         prospects: List[Prospect],
+                                         hot_leads: List[Prospect]) -> List[str]:
         """Generate strategic recommendations based on analysis."""
         recommendations = []
         
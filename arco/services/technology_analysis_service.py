@@ -18,8 +18,13 @@ from datetime import datetime, timedelta
 import aiohttp
 from urllib.parse import urljoin, urlparse
 
+from arco.utils.page_stream import read_page_body
+from arco.utils.signatures import SIGNATURES, SignatureHits, scan_signatures
+
 logger = logging.getLogger(__name__)
 
+JQUERY_SIGNATURE = SIGNATURES['technology']['jquery'][0]
+
 
 @dataclass
 class TechnologyDetection:
@@ -208,11 +213,11 @@ class TechnologyAnalysisService:
                 if response.status != 200:
                     return technologies
                 
-                html_content = await response.text()
+                page = await read_page_body(response)
                 headers = dict(response.headers)
             
             # Detect technologies from HTML content
-            technologies.extend(self._detect_from_html(html_content))
+            technologies.extend(self._detect_from_html(page.text, page.signature_hits))
             
             # Detect technologies from HTTP headers
             technologies.extend(self._detect_from_headers(headers))
@@ -229,12 +234,14 @@ class TechnologyAnalysisService:
         
         return technologies
     
-    def _detect_from_html(self, html_content: str) -> List[TechnologyDetection]:
-        """Detect technologies from HTML content."""
+    def _detect_from_html(self, html_content: str, hits: Optional[SignatureHits] = None) -> List[TechnologyDetection]:
+        """Detect technologies from HTML content (reusing its signature hits when already scanned)."""
         technologies = []
+        hits = hits if hits is not None else scan_signatures(html_content)
+        detected = set(hits.vendors('technology'))
         
         # WordPress detection
-        if 'wp-content' in html_content or 'wordpress' in html_content.lower():
+        if 'wordpress' in detected:
             version_match = re.search(r'wp-includes/js/wp-embed\.min\.js\?ver=(\d+\.\d+(?:\.\d+)?)', html_content)
             version = version_match.group(1) if version_match else None
             technologies.append(TechnologyDetection(
@@ -245,7 +252,7 @@ class TechnologyAnalysisService:
             ))
         
         # React detection
-        if 'react' in html_content.lower():
+        if 'react' in detected:
             version_match = re.search(r'react@(\d+\.\d+\.\d+)', html_content)
             version = version_match.group(1) if version_match else None
             technologies.append(TechnologyDetection(
@@ -256,7 +263,7 @@ class TechnologyAnalysisService:
             ))
         
         # Angular detection
-        if 'angular' in html_content.lower() or 'ng-' in html_content:
+        if 'angular' in detected:
             version_match = re.search(r'angular/(\d+\.\d+\.\d+)', html_content)
             version = version_match.group(1) if version_match else None
             technologies.append(TechnologyDetection(
@@ -266,8 +273,8 @@ class TechnologyAnalysisService:
                 confidence=0.8
             ))
         
-        # jQuery detection
-        jquery_match = re.search(r'jquery[/-](\d+\.\d+\.\d+)', html_content, re.IGNORECASE)
+        # jQuery detection (the version is captured by the signature's own match)
+        jquery_match = 'jquery' in detected and hits.first_match(JQUERY_SIGNATURE)
         if jquery_match:
             technologies.append(TechnologyDetection(
                 name='jQuery',
@@ -277,7 +284,7 @@ class TechnologyAnalysisService:
             ))
         
         # Bootstrap detection
-        if 'bootstrap' in html_content.lower():
+        if 'bootstrap' in detected:
             version_match = re.search(r'bootstrap[/-](\d+\.\d+\.\d+)', html_content)
             version = version_match.group(1) if version_match else None
             technologies.append(TechnologyDetection(
@@ -289,11 +296,11 @@ class TechnologyAnalysisService:
         
         # Deprecated technology detection
         deprecated_found = []
-        if 'flash' in html_content.lower() or '.swf' in html_content:
+        if 'flash' in detected:
             deprecated_found.append('Flash')
-        if 'silverlight' in html_content.lower():
+        if 'silverlight' in detected:
             deprecated_found.append('Silverlight')
-        if 'java-applet' in html_content.lower() or '<applet' in html_content:
+        if 'java_applet' in detected:
             deprecated_found.append('Java Applet')
         
         for dep_tech in deprecated_found:
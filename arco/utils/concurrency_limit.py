@@ -0,0 +1,162 @@
+"""
+Adaptive Concurrency Limit for ARCO.
+
+This module provides an AIMD (additive increase, multiplicative decrease)
+concurrency limit. Callers report the latency and outcome of every
+completed unit of work; the limit grows by one for each window of healthy
+completions and is cut multiplicatively when work fails or the smoothed
+latency rises well above the best recent latency, so the amount of work
+kept in flight follows what the downstream services can absorb. The best
+latency decays toward the current one, so a single fast outlier (a cache
+hit, a fast failure) does not mark all later traffic as slow.
+"""
+
+from typing import Any, Dict, Optional
+
+from arco.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_CONCURRENCY = {
+    "initial": 5,
+    "min": 1,
+    "max": 20,
+    "backoff": 0.5,
+    "latency_tolerance": 2.0,
+    "smoothing": 0.2,
+    "baseline_decay": 0.05,
+}
+
+
+class AIMDConcurrencyLimit:
+    """
+    AIMD concurrency limit driven by observed errors and latency.
+
+    The limit is not enforced here: schedulers read ``limit`` before
+    starting more work and call ``record()`` when work completes.
+    """
+
+    def __init__(self, initial: int = 5, min_limit: int = 1, max_limit: int = 20, backoff: float = 0.5,
+                 latency_tolerance: float = 2.0, smoothing: float = 0.2, baseline_decay: float = 0.05):
+        """
+        Initialize the limit.
+
+        Args:
+            initial: Starting concurrency
+            min_limit: Lowest concurrency the limit can be cut to
+            max_limit: Highest concurrency the limit can grow to
+            backoff: Factor the limit is multiplied by on overload
+            latency_tolerance: Overload when the smoothed latency exceeds this
+                multiple of the best recent smoothed latency (0 ignores latency)
+            smoothing: Weight of a new sample in the smoothed latency
+            baseline_decay: Fraction of the gap to the smoothed latency the
+                best latency moves up by on every healthy sample
+        """
+        if not 1 <= min_limit <= max_limit:
+            raise ValueError(f"Invalid concurrency bounds: min {min_limit}, max {max_limit}")
+        if not 0 < backoff < 1:
+            raise ValueError(f"Backoff must be between 0 and 1, got {backoff}")
+
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff = backoff
+        self.latency_tolerance = latency_tolerance
+        self.smoothing = smoothing
+        self.baseline_decay = baseline_decay
+
+        self.limit = min(max(initial, min_limit), max_limit)  # current concurrency limit
+        self._healthy = 0  # healthy completions since the last increase
+        self._since_decrease = 0
+        self.latency: Optional[float] = None  # smoothed latency in seconds
+        self.best_latency: Optional[float] = None
+
+        self.stats = {"samples": 0, "errors": 0, "slow": 0, "increases": 0, "decreases": 0}
+
+    @classmethod
+    def from_config(cls, section: str = "orchestrator.concurrency") -> 'AIMDConcurrencyLimit':
+        """
+        Create a limit configured from a config section.
+
+        Args:
+            section: Dotted path of the config section
+
+        Returns:
+            AIMDConcurrencyLimit instance
+        """
+        from arco.config.config_manager import get_config
+
+        config = get_config()
+        settings = {key: config.get(f"{section}.{key}", default) for key, default in DEFAULT_CONCURRENCY.items()}
+        return cls(
+            initial=settings["initial"],
+            min_limit=settings["min"],
+            max_limit=settings["max"],
+            backoff=settings["backoff"],
+            latency_tolerance=settings["latency_tolerance"],
+            smoothing=settings["smoothing"],
+            baseline_decay=settings["baseline_decay"]
+        )
+
+    def record(self, latency: float, error: bool = False) -> int:
+        """
+        Record a completed unit of work and adapt the limit.
+
+        Args:
+            latency: Time the work took in seconds
+            error: Whether the work failed
+
+        Returns:
+            The new concurrency limit
+        """
+        self.stats["samples"] += 1
+        self._since_decrease += 1
+
+        if not error:
+            self.latency = latency if self.latency is None else self.latency + self.smoothing * (latency - self.latency)
+            if self.best_latency is None or self.latency < self.best_latency:
+                self.best_latency = self.latency
+            else:
+                # Drift toward the current latency so the baseline follows steady traffic
+                self.best_latency += self.baseline_decay * (self.latency - self.best_latency)
+
+        slow = (not error and self.latency_tolerance > 0 and
+                self.latency > self.best_latency * self.latency_tolerance)
+        if error:
+            self.stats["errors"] += 1
+        elif slow:
+            self.stats["slow"] += 1
+
+        if error or (slow and self.limit > self.min_limit):
+            # Cut at most once per window so one burst of failures does not collapse the limit
+            if self.limit > self.min_limit and self._since_decrease >= self.limit:
+                previous = self.limit
+                self.limit = max(self.min_limit, int(self.limit * self.backoff))
+                self._healthy = 0
+                self._since_decrease = 0
+                self.stats["decreases"] += 1
+                logger.debug(f"Concurrency limit {previous} -> {self.limit} ({'errors' if error else 'latency'})")
+        elif self.limit < self.max_limit:
+            # One more slot per window of completions (slow ones too once
+            # nothing is left to cut, so the limit can probe back up)
+            self._healthy += 1
+            if self._healthy >= self.limit:
+                self.limit += 1
+                self._healthy = 0
+                self.stats["increases"] += 1
+
+        return self.limit
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get limit statistics.
+
+        Returns:
+            Dictionary with the current limit, smoothed latencies and
+            sample, error and adjustment counts
+        """
+        return {
+            **self.stats,
+            "limit": self.limit,
+            "latency": self.latency,
+            "best_latency": self.best_latency
+        }
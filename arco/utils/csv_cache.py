@@ -0,0 +1,157 @@
+"""
+Columnar CSV Cache for ARCO.
+
+This module converts large CSV exports (e.g. Apollo) into uncompressed
+Arrow IPC files the first time they are read. Later runs memory-map the
+Arrow file instead of re-parsing the CSV. Cache files are keyed by the CSV
+path, modification time and size, so only changed files are re-parsed.
+"""
+
+import hashlib
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from arco.config.config_manager import get_config
+from arco.utils.logger import get_logger
+
+try:
+    import polars as pl
+    POLARS_AVAILABLE = True
+except ImportError:
+    pl = None
+    POLARS_AVAILABLE = False
+
+logger = get_logger(__name__)
+
+
+class CSVColumnarCache:
+    """
+    Cache of CSV files as memory-mapped Arrow IPC tables.
+
+    All columns are stored as strings, exactly as they appear in the CSV,
+    so non-empty cells match what csv.DictReader gives. Empty cells differ:
+    they come back as None, where csv.DictReader gives "", so callers should
+    treat both as missing.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, enabled: bool = True):
+        """
+        Initialize the CSV cache.
+
+        Args:
+            cache_dir: Directory for Arrow files (defaults to <paths.cache>/csv)
+            enabled: When False (or polars is missing) load() always returns None
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else Path(get_config().get("paths.cache", "cache")) / "csv"
+        self.enabled = enabled and POLARS_AVAILABLE
+        self.stats = {"hits": 0, "misses": 0, "errors": 0}
+
+        if enabled and not POLARS_AVAILABLE:
+            logger.warning("polars is not installed, CSV files will be parsed on every run")
+
+    def _cache_path(self, csv_path: Path) -> Path:
+        """Get the Arrow file for the current version of a CSV file."""
+        stat = csv_path.stat()
+        path_key = hashlib.sha1(str(csv_path.resolve()).encode("utf-8")).hexdigest()[:12]
+        version_key = hashlib.sha1(f"{stat.st_mtime_ns}:{stat.st_size}".encode("utf-8")).hexdigest()[:12]
+        return self.cache_dir / f"{csv_path.stem}-{path_key}-{version_key}.arrow"
+
+    def load(self, csv_path: str) -> Optional["pl.DataFrame"]:
+        """
+        Load a CSV file as a table, converting and caching it on first use.
+
+        Args:
+            csv_path: Path to the CSV file
+
+        Returns:
+            Memory-mapped DataFrame with string columns, or None if the cache is
+            disabled or the file could not be converted (callers should then
+            fall back to csv.DictReader)
+        """
+        if not self.enabled:
+            return None
+
+        csv_path = Path(csv_path)
+        try:
+            cache_path = self._cache_path(csv_path)
+            if cache_path.exists():
+                self.stats["hits"] += 1
+                # polars memory-maps uncompressed IPC files by default
+                return pl.read_ipc(cache_path)
+
+            self.stats["misses"] += 1
+            frame = pl.read_csv(
+                csv_path,
+                infer_schema_length=0,
+                encoding="utf8-lossy",
+                truncate_ragged_lines=True
+            )
+            self._write(csv_path, cache_path, frame)
+            return pl.read_ipc(cache_path)
+
+        except Exception as e:
+            self.stats["errors"] += 1
+            logger.warning(f"Could not load {csv_path} through the columnar cache: {e}")
+            return None
+
+    def _write(self, csv_path: Path, cache_path: Path, frame: "pl.DataFrame") -> None:
+        """Write the Arrow file atomically and drop older versions of the same CSV."""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        tmp_path = cache_path.with_suffix(f".tmp{os.getpid()}")
+        frame.write_ipc(tmp_path, compression="uncompressed")
+        os.replace(tmp_path, cache_path)
+
+        prefix = cache_path.name.rsplit("-", 1)[0]
+        for old in self.cache_dir.glob(f"{prefix}-*.arrow"):
+            if old != cache_path:
+                old.unlink(missing_ok=True)
+
+        logger.info(f"Cached {frame.height} rows of {csv_path.name} as {cache_path.name}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with hit/miss counters
+        """
+        return {**self.stats, "enabled": self.enabled}
+
+
+def iter_rows(frame: "pl.DataFrame", batch_size: int = 1000) -> Iterator[List[Dict[str, Optional[str]]]]:
+    """
+    Iterate over a table in batches of row dictionaries.
+
+    Rows are only materialized one batch at a time.
+
+    Args:
+        frame: Table returned by CSVColumnarCache.load()
+        batch_size: Rows per batch
+
+    Yields:
+        Lists of row dictionaries (column name to value)
+    """
+    for offset in range(0, frame.height, max(1, batch_size)):
+        yield frame.slice(offset, batch_size).to_dicts()
+
+
+# Global cache instance
+_csv_cache_instance = None
+
+def get_csv_cache() -> CSVColumnarCache:
+    """
+    Get the global CSV cache configured from ``csv_cache``.
+
+    Returns:
+        CSVColumnarCache instance
+    """
+    global _csv_cache_instance
+    if _csv_cache_instance is None:
+        config = get_config()
+        _csv_cache_instance = CSVColumnarCache(
+            cache_dir=config.get("csv_cache.path") or None,
+            enabled=config.get("csv_cache.enabled", True)
+        )
+    return _csv_cache_instance
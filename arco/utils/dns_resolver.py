@@ -0,0 +1,310 @@
+"""
+DNS Resolver for ARCO.
+
+This module provides a non-blocking DNS resolver with an in-process cache.
+Lookups use aiodns when it is installed (so record TTLs are honored) and
+fall back to the event loop's resolver otherwise. NXDOMAIN answers are
+cached too, so dead domains from large imports are only looked up once.
+"""
+
+import asyncio
+import socket
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional
+
+from arco.config.config_manager import get_config
+from arco.utils.logger import get_logger
+
+try:
+    import aiodns
+    AIODNS_AVAILABLE = True
+except ImportError:
+    aiodns = None
+    AIODNS_AVAILABLE = False
+
+logger = get_logger(__name__)
+
+DEFAULT_TTL = 300  # used when the resolver does not report a TTL
+DEFAULT_NEGATIVE_TTL = 3600  # how long NXDOMAIN answers are cached
+DEFAULT_CONCURRENCY = 50  # parallel lookups in resolve_many()
+
+# getaddrinfo errors meaning the name does not exist (as opposed to a timeout)
+_NOT_FOUND_ERRORS = {socket.EAI_NONAME, getattr(socket, "EAI_NODATA", socket.EAI_NONAME)}
+
+
+@dataclass
+class DNSEntry:
+    """Cached DNS answer for a host."""
+
+    host: str
+    addresses: List[str] = field(default_factory=list)  # empty for NXDOMAIN
+    expires_at: float = 0.0
+
+    @property
+    def resolves(self) -> bool:
+        """Whether the host has at least one address."""
+        return bool(self.addresses)
+
+    @property
+    def expired(self) -> bool:
+        """Whether the entry must be looked up again."""
+        return time.monotonic() >= self.expires_at
+
+
+class DNSResolver:
+    """
+    Non-blocking DNS resolver with positive and negative caching.
+
+    Only definitive "name does not exist" answers are cached negatively;
+    timeouts and server failures are retried on the next lookup.
+    Concurrent lookups of the same host share one query.
+    """
+
+    def __init__(self, default_ttl: int = DEFAULT_TTL, negative_ttl: int = DEFAULT_NEGATIVE_TTL,
+                 min_ttl: int = 30, max_ttl: int = 86400, timeout: float = 5.0,
+                 use_aiodns: bool = True):
+        """
+        Initialize the DNS resolver.
+
+        Args:
+            default_ttl: Seconds to cache answers without a reported TTL
+            negative_ttl: Seconds to cache NXDOMAIN answers
+            min_ttl: Lower bound for record TTLs
+            max_ttl: Upper bound for record TTLs
+            timeout: Seconds before a lookup is abandoned
+            use_aiodns: Use aiodns when it is installed
+        """
+        self.default_ttl = default_ttl
+        self.negative_ttl = negative_ttl
+        self.min_ttl = min_ttl
+        self.max_ttl = max(max_ttl, min_ttl)
+        self.timeout = timeout
+        self.use_aiodns = use_aiodns and AIODNS_AVAILABLE
+
+        self._cache: Dict[str, DNSEntry] = {}
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._resolvers: Dict[int, Any] = {}
+
+        self.stats = {
+            "hits": 0,
+            "negative_hits": 0,
+            "lookups": 0,
+            "not_found": 0,
+            "errors": 0,
+            "coalesced": 0
+        }
+
+    @staticmethod
+    def normalize_host(host: str) -> str:
+        """Normalize a domain or URL to a bare host name."""
+        host = host.strip().lower()
+        for prefix in ("https://", "http://"):
+            if host.startswith(prefix):
+                host = host[len(prefix):]
+        return host.split("/", 1)[0].split(":", 1)[0].rstrip(".")
+
+    def get_cached(self, host: str) -> Optional[DNSEntry]:
+        """
+        Get the cached answer for a host, if it has not expired.
+
+        Args:
+            host: Domain or URL
+
+        Returns:
+            DNSEntry or None
+        """
+        entry = self._cache.get(self.normalize_host(host))
+        if entry is None or entry.expired:
+            return None
+        return entry
+
+    async def resolve(self, host: str) -> List[str]:
+        """
+        Resolve a host to its IP addresses.
+
+        Args:
+            host: Domain or URL
+
+        Returns:
+            List of addresses (empty if the name does not exist or the lookup failed)
+        """
+        host = self.normalize_host(host)
+        if not host:
+            return []
+
+        entry = self._cache.get(host)
+        if entry is not None and not entry.expired:
+            self.stats["hits" if entry.resolves else "negative_hits"] += 1
+            return list(entry.addresses)
+
+        loop = asyncio.get_running_loop()
+        future = self._inflight.get(host)
+        if future is not None and not future.done() and future.get_loop() is loop:
+            self.stats["coalesced"] += 1
+            return list(await asyncio.shield(future))
+
+        future = loop.create_future()
+        self._inflight[host] = future
+        addresses: List[str] = []
+        try:
+            addresses = await self._lookup(host)
+        finally:
+            future.set_result(addresses)
+            if self._inflight.get(host) is future:
+                del self._inflight[host]
+        return list(addresses)
+
+    async def resolves(self, host: str) -> bool:
+        """
+        Check whether a host resolves to at least one address.
+
+        Args:
+            host: Domain or URL
+
+        Returns:
+            True if the host resolves
+        """
+        return bool(await self.resolve(host))
+
+    async def resolve_many(self, hosts: Iterable[str],
+                           concurrency: int = DEFAULT_CONCURRENCY) -> Dict[str, bool]:
+        """
+        Resolve many hosts concurrently (e.g. to pre-filter a large import).
+
+        Args:
+            hosts: Domains or URLs
+            concurrency: Maximum number of lookups in flight
+
+        Returns:
+            Mapping of each input host to whether it resolves
+        """
+        hosts = list(dict.fromkeys(hosts))
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def check(host: str) -> bool:
+            async with semaphore:
+                return await self.resolves(host)
+
+        results = await asyncio.gather(*(check(host) for host in hosts))
+        return dict(zip(hosts, results))
+
+    async def _lookup(self, host: str) -> List[str]:
+        """Query DNS for a host and cache the answer."""
+        self.stats["lookups"] += 1
+        try:
+            if self.use_aiodns:
+                addresses, ttl = await asyncio.wait_for(self._query_aiodns(host), self.timeout)
+            else:
+                addresses, ttl = await asyncio.wait_for(self._query_loop(host), self.timeout)
+        except LookupError:
+            self.stats["not_found"] += 1
+            self._store(host, [], self.negative_ttl)
+            return []
+        except Exception as e:
+            self.stats["errors"] += 1
+            logger.debug(f"DNS lookup failed for {host}: {e}")
+            return []
+
+        self._store(host, addresses, min(self.max_ttl, max(self.min_ttl, ttl)))
+        return addresses
+
+    def _store(self, host: str, addresses: List[str], ttl: float) -> None:
+        """Cache an answer for ttl seconds."""
+        self._cache[host] = DNSEntry(host=host, addresses=addresses,
+                                     expires_at=time.monotonic() + ttl)
+
+    def _aiodns_resolver(self) -> Any:
+        """Get the aiodns resolver bound to the running loop."""
+        loop = asyncio.get_running_loop()
+        resolver = self._resolvers.get(id(loop))
+        if resolver is None or resolver.loop is not loop:
+            self._resolvers = {k: r for k, r in self._resolvers.items() if not r.loop.is_closed()}
+            resolver = aiodns.DNSResolver(loop=loop, timeout=self.timeout)
+            self._resolvers[id(loop)] = resolver
+        return resolver
+
+    async def _query_aiodns(self, host: str):
+        """
+        Look up A (then AAAA) records with aiodns.
+
+        Raises:
+            LookupError: If the name does not exist
+        """
+        resolver = self._aiodns_resolver()
+        not_found = (aiodns.error.ARES_ENOTFOUND, aiodns.error.ARES_ENODATA)
+
+        for record_type in ("A", "AAAA"):
+            try:
+                records = await resolver.query(host, record_type)
+            except aiodns.error.DNSError as e:
+                if e.args and e.args[0] in not_found:
+                    continue
+                raise OSError(str(e)) from e
+            if records:
+                ttl = min(getattr(r, "ttl", self.default_ttl) for r in records)
+                return [r.host for r in records], ttl
+
+        raise LookupError(host)
+
+    async def _query_loop(self, host: str):
+        """
+        Look up a host with the event loop's resolver (no TTL available).
+
+        Raises:
+            LookupError: If the name does not exist
+        """
+        try:
+            infos = await asyncio.get_running_loop().getaddrinfo(
+                host, None, proto=socket.IPPROTO_TCP
+            )
+        except socket.gaierror as e:
+            if e.errno in _NOT_FOUND_ERRORS:
+                raise LookupError(host) from e
+            raise
+
+        addresses = list(dict.fromkeys(info[4][0] for info in infos))
+        if not addresses:
+            raise LookupError(host)
+        return addresses, self.default_ttl
+
+    def clear(self) -> None:
+        """Drop every cached answer."""
+        self._cache.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get resolver statistics.
+
+        Returns:
+            Dictionary with cache and lookup counters
+        """
+        return {
+            **self.stats,
+            "cached": len(self._cache),
+            "backend": "aiodns" if self.use_aiodns else "loop"
+        }
+
+
+# Global resolver instance
+_dns_resolver_instance = None
+
+def get_dns_resolver() -> DNSResolver:
+    """
+    Get the global DNS resolver configured from ``dns``.
+
+    Returns:
+        DNSResolver instance
+    """
+    global _dns_resolver_instance
+    if _dns_resolver_instance is None:
+        config = get_config()
+        _dns_resolver_instance = DNSResolver(
+            default_ttl=config.get("dns.default_ttl", DEFAULT_TTL),
+            negative_ttl=config.get("dns.negative_ttl", DEFAULT_NEGATIVE_TTL),
+            min_ttl=config.get("dns.min_ttl", 30),
+            max_ttl=config.get("dns.max_ttl", 86400),
+            timeout=config.get("dns.timeout", 5.0),
+            use_aiodns=config.get("dns.use_aiodns", True)
+        )
+    return _dns_resolver_instance
@@ -0,0 +1,73 @@
+"""
+Concurrent Source Fan-out for ARCO.
+
+This module awaits independent data sources concurrently, each under its own
+timeout, with partial-result semantics: a source that fails or times out
+yields its exception in place of a result instead of cancelling the others,
+so callers can build what they can from the sources that answered and
+report which ones timed out.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Dict, List, Optional
+
+DEFAULT_SOURCE_TIMEOUT = 10.0
+
+
+class SourceTimeoutError(asyncio.TimeoutError):
+    """A source did not answer within its timeout."""
+
+    def __init__(self, source: str, timeout: float):
+        """
+        Initialize the error.
+
+        Args:
+            source: Name of the source
+            timeout: Timeout in seconds that expired
+        """
+        super().__init__(f"{source} timed out after {timeout:g}s")
+        self.source = source
+        self.timeout = timeout
+
+
+async def _await_source(name: str, awaitable: Awaitable[Any], timeout: Optional[float]) -> Any:
+    """Await one source, raising SourceTimeoutError when its timeout expires."""
+    if not timeout:
+        return await awaitable
+    try:
+        return await asyncio.wait_for(awaitable, timeout)
+    except asyncio.TimeoutError as e:
+        raise SourceTimeoutError(name, timeout) from e
+
+
+async def gather_sources(sources: Dict[str, Awaitable[Any]], timeout: Optional[float] = None) -> Dict[str, Any]:
+    """
+    Await independent sources concurrently, each under its own timeout.
+
+    Args:
+        sources: Mapping of source name to awaitable
+        timeout: Timeout in seconds per source (None or 0 waits indefinitely)
+
+    Returns:
+        Mapping of source name to its result, or to the exception it raised
+        (SourceTimeoutError if it timed out)
+    """
+    results = await asyncio.gather(
+        *(_await_source(name, awaitable, timeout) for name, awaitable in sources.items()),
+        return_exceptions=True
+    )
+    return dict(zip(sources, results))
+
+
+def timed_out_sources(results: Dict[str, Any], prefix: str = "") -> List[str]:
+    """
+    Get the names of the sources that timed out.
+
+    Args:
+        results: Results returned by gather_sources
+        prefix: Prefix added to every name (e.g. "funding.")
+
+    Returns:
+        Names of the timed-out sources, in source order
+    """
+    return [f"{prefix}{name}" for name, result in results.items() if isinstance(result, SourceTimeoutError)]
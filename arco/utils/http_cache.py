@@ -0,0 +1,559 @@
+"""
+HTTP Response Cache for ARCO.
+
+This module provides a persistent, SQLite-backed HTTP response cache shared by
+the engines and integrations. Responses are keyed on method + URL + params
+(plus the request headers that change the response, whether redirects are
+followed, since httpx and aiohttp differ there, and the body read limits),
+expire according to per-endpoint TTLs, are revalidated with ETag /
+Last-Modified when stale, and are stored zlib-compressed under
+``paths.cache``. A body cut short by the read limits is stored under the
+key of those limits, so it only answers requests made with the same ones.
+SQLite reads and writes made by fetch() run in a worker thread so they never
+block the event loop.
+"""
+
+import asyncio
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from arco.config.config_manager import get_config
+from arco.utils.logger import get_logger
+from arco.utils.rate_limiter import get_rate_limiter
+
+logger = get_logger(__name__)
+
+# Default TTLs (seconds) by URL substring, checked in order
+DEFAULT_TTL_RULES = {
+    "robots.txt": 86400,
+    "sitemap.xml": 86400,
+    "/cart.js": 21600,
+    "rdap.org": 604800,
+}
+DEFAULT_TTL = 3600
+
+# Statuses worth caching (404/410 matter for robots.txt / sitemap.xml checks)
+CACHEABLE_STATUSES = {200, 203, 301, 308, 404, 410}
+
+# Params that never take part in the cache key (credentials)
+IGNORED_KEY_PARAMS = {"key", "api_key", "apikey", "access_token", "token"}
+
+# Request headers that change the response and so take part in the cache key
+KEY_HEADERS = ("accept", "accept-language", "authorization")
+
+HEAD_END = b"</head>"
+
+
+@dataclass
+class CachedResponse:
+    """HTTP response served from the network or from the cache."""
+
+    url: str
+    status: int
+    headers: Dict[str, str] = field(default_factory=dict)  # lowercased header names
+    body: bytes = b""
+    history: List[str] = field(default_factory=list)
+    from_cache: bool = False
+    revalidated: bool = False
+    truncated: bool = False  # body cut at the max_bytes (or </head>) of the request
+
+    @property
+    def encoding(self) -> str:
+        """Charset from the Content-Type header (defaults to utf-8)."""
+        content_type = self.headers.get("content-type", "")
+        for part in content_type.split(";"):
+            part = part.strip()
+            if part.lower().startswith("charset="):
+                return part.split("=", 1)[1].strip('"\' ') or "utf-8"
+        return "utf-8"
+
+    def text(self, errors: str = "replace") -> str:
+        """Decode the body as text."""
+        try:
+            return self.body.decode(self.encoding, errors=errors)
+        except LookupError:
+            return self.body.decode("utf-8", errors=errors)
+
+    def json(self) -> Any:
+        """Decode the body as JSON."""
+        return json.loads(self.text())
+
+
+class HTTPResponseCache:
+    """
+    Persistent HTTP response cache backed by SQLite.
+
+    The cache is safe to share between coroutines and threads of one process;
+    SQLite's own locking keeps separate processes from corrupting the file.
+    """
+
+    def __init__(self, path: Optional[str] = None, default_ttl: int = DEFAULT_TTL,
+                 ttl_rules: Optional[Dict[str, int]] = None, enabled: bool = True):
+        """
+        Initialize the HTTP response cache.
+
+        Args:
+            path: SQLite database path (defaults to <paths.cache>/http_cache.sqlite3)
+            default_ttl: TTL in seconds for URLs without a matching rule
+            ttl_rules: Mapping of URL substring to TTL in seconds
+            enabled: When False every lookup misses and nothing is stored
+        """
+        self.path = Path(path) if path else Path(get_config().get("paths.cache", "cache")) / "http_cache.sqlite3"
+        self.default_ttl = default_ttl
+        self.ttl_rules = dict(DEFAULT_TTL_RULES if ttl_rules is None else ttl_rules)
+        self.enabled = enabled
+
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+        self.stats = {
+            "hits": 0,
+            "misses": 0,
+            "revalidations": 0,
+            "stores": 0,
+            "errors": 0
+        }
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database lazily."""
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    url TEXT NOT NULL,
+                    status INTEGER NOT NULL,
+                    headers TEXT NOT NULL,
+                    body BLOB NOT NULL,
+                    history TEXT NOT NULL,
+                    etag TEXT,
+                    last_modified TEXT,
+                    stored_at REAL NOT NULL,
+                    expires_at REAL NOT NULL,
+                    truncated INTEGER NOT NULL DEFAULT 0
+                )
+                """
+            )
+            # Databases created before bodies could be stored truncated lack the column
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(responses)")}
+            if "truncated" not in columns:
+                conn.execute("ALTER TABLE responses ADD COLUMN truncated INTEGER NOT NULL DEFAULT 0")
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    @staticmethod
+    def make_key(method: str, url: str, params: Optional[Dict[str, Any]] = None,
+                 headers: Optional[Dict[str, str]] = None, follow_redirects: bool = True,
+                 max_bytes: Optional[int] = None, head_only: bool = False) -> str:
+        """
+        Build the cache key for a request.
+
+        Args:
+            method: HTTP method
+            url: Request URL
+            params: Query parameters (credential params are ignored)
+            headers: Request headers (only KEY_HEADERS take part in the key)
+            follow_redirects: Whether the client follows redirects (a 301
+                stored without following must not answer a following client)
+            max_bytes: Body byte cap of the request (0 or None for no cap)
+            head_only: Whether the body is read only up to </head>
+
+        Returns:
+            Hex digest identifying the request
+        """
+        key_params = sorted(
+            (str(k), str(v)) for k, v in (params or {}).items()
+            if str(k).lower() not in IGNORED_KEY_PARAMS
+        )
+        key = [method.upper(), url, key_params, "follow" if follow_redirects else "no-follow"]
+        key_headers = sorted(
+            (str(k).lower(), str(v)) for k, v in (headers or {}).items()
+            if str(k).lower() in KEY_HEADERS
+        )
+        if key_headers:
+            key.append(key_headers)
+        if max_bytes or head_only:
+            key.append({"max_bytes": max_bytes or 0, "head_only": bool(head_only)})
+        raw = json.dumps(key, separators=(",", ":"))
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def ttl_for(self, url: str) -> int:
+        """Get the TTL for a URL from the per-endpoint rules."""
+        for pattern, ttl in self.ttl_rules.items():
+            if pattern in url:
+                return int(ttl)
+        return self.default_ttl
+
+    def lookup(self, method: str, url: str, params: Optional[Dict[str, Any]] = None,
+               allow_stale: bool = False, headers: Optional[Dict[str, str]] = None,
+               follow_redirects: bool = True, max_bytes: Optional[int] = None,
+               head_only: bool = False) -> Optional[Tuple[CachedResponse, Dict[str, str], float]]:
+        """
+        Look up a stored response.
+
+        Args:
+            method: HTTP method
+            url: Request URL
+            params: Query parameters
+            allow_stale: Also return expired entries (for revalidation)
+            headers: Request headers
+            follow_redirects: Whether the client follows redirects
+            max_bytes: Body byte cap of the request
+            head_only: Whether the body is read only up to </head>
+
+        Returns:
+            Tuple of (response, validator headers, expires_at) or None
+        """
+        if not self.enabled:
+            return None
+
+        key = self.make_key(method, url, params, headers, follow_redirects, max_bytes, head_only)
+        try:
+            with self._lock:
+                row = self._connect().execute(
+                    "SELECT url, status, headers, body, history, etag, last_modified, expires_at, truncated "
+                    "FROM responses WHERE key = ?",
+                    (key,)
+                ).fetchone()
+        except sqlite3.Error as e:
+            self.stats["errors"] += 1
+            logger.warning(f"HTTP cache lookup failed for {url}: {e}")
+            return None
+
+        if row is None:
+            return None
+
+        cached_url, status, headers, body, history, etag, last_modified, expires_at, truncated = row
+        if not allow_stale and expires_at <= time.time():
+            return None
+
+        validators = {}
+        if etag:
+            validators["If-None-Match"] = etag
+        if last_modified:
+            validators["If-Modified-Since"] = last_modified
+
+        response = CachedResponse(
+            url=cached_url,
+            status=status,
+            headers=json.loads(headers),
+            body=zlib.decompress(body),
+            history=json.loads(history),
+            from_cache=True,
+            truncated=bool(truncated)
+        )
+        return response, validators, expires_at
+
+    def get(self, method: str, url: str, params: Optional[Dict[str, Any]] = None,
+            headers: Optional[Dict[str, str]] = None, follow_redirects: bool = True) -> Optional[CachedResponse]:
+        """
+        Get a fresh cached response, counting the hit or miss.
+
+        Args:
+            method: HTTP method
+            url: Request URL
+            params: Query parameters
+            headers: Request headers
+            follow_redirects: Whether the client follows redirects
+
+        Returns:
+            Cached response or None when missing or expired
+        """
+        entry = self.lookup(method, url, params, headers=headers, follow_redirects=follow_redirects)
+        if entry is None:
+            self.stats["misses"] += 1
+            return None
+        self.stats["hits"] += 1
+        return entry[0]
+
+    def put(self, method: str, url: str, params: Optional[Dict[str, Any]], response: CachedResponse,
+            ttl: Optional[int] = None, headers: Optional[Dict[str, str]] = None,
+            follow_redirects: bool = True, max_bytes: Optional[int] = None, head_only: bool = False) -> bool:
+        """
+        Store a response if it is cacheable.
+
+        Args:
+            method: HTTP method
+            url: Request URL
+            params: Query parameters
+            response: Response to store
+            ttl: TTL in seconds (defaults to the per-endpoint rule)
+            headers: Request headers
+            follow_redirects: Whether the client followed redirects
+            max_bytes: Body byte cap the response was read with
+            head_only: Whether the body was read only up to </head>
+
+        Returns:
+            True if the response was stored
+        """
+        if not self.enabled or not self._is_cacheable(method, response):
+            return False
+
+        now = time.time()
+        ttl = self.ttl_for(url) if ttl is None else ttl
+        response_headers = {k.lower(): v for k, v in response.headers.items()}
+
+        try:
+            with self._lock:
+                conn = self._connect()
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses "
+                    "(key, url, status, headers, body, history, etag, last_modified, stored_at, expires_at, truncated) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        self.make_key(method, url, params, headers, follow_redirects, max_bytes, head_only),
+                        response.url or url,
+                        response.status,
+                        json.dumps(response_headers),
+                        zlib.compress(response.body, 6),
+                        json.dumps(response.history),
+                        response_headers.get("etag"),
+                        response_headers.get("last-modified"),
+                        now,
+                        now + ttl,
+                        int(response.truncated)
+                    )
+                )
+                conn.commit()
+        except sqlite3.Error as e:
+            self.stats["errors"] += 1
+            logger.warning(f"HTTP cache store failed for {url}: {e}")
+            return False
+
+        self.stats["stores"] += 1
+        return True
+
+    def _touch(self, method: str, url: str, params: Optional[Dict[str, Any]], ttl: int,
+               headers: Optional[Dict[str, str]] = None, follow_redirects: bool = True,
+               max_bytes: Optional[int] = None, head_only: bool = False) -> None:
+        """Extend the expiry of an entry after a 304 revalidation."""
+        try:
+            with self._lock:
+                conn = self._connect()
+                conn.execute(
+                    "UPDATE responses SET expires_at = ? WHERE key = ?",
+                    (time.time() + ttl,
+                     self.make_key(method, url, params, headers, follow_redirects, max_bytes, head_only))
+                )
+                conn.commit()
+        except sqlite3.Error as e:
+            self.stats["errors"] += 1
+            logger.warning(f"HTTP cache refresh failed for {url}: {e}")
+
+    def _is_cacheable(self, method: str, response: CachedResponse) -> bool:
+        """Check whether a response may be stored."""
+        if method.upper() not in ("GET", "HEAD"):
+            return False
+        if response.status not in CACHEABLE_STATUSES:
+            return False
+        cache_control = {k.lower(): v for k, v in response.headers.items()}.get("cache-control", "").lower()
+        return "no-store" not in cache_control
+
+    async def fetch(self, client: Any, url: str, method: str = "GET",
+                    params: Optional[Dict[str, Any]] = None, headers: Optional[Dict[str, str]] = None,
+                    ttl: Optional[int] = None, provider: Optional[str] = None, max_bytes: Optional[int] = None,
+                    head_only: bool = False, **kwargs) -> CachedResponse:
+        """
+        Fetch a URL through the cache.
+
+        Fresh entries are served without touching the network. Stale entries
+        with an ETag or Last-Modified are revalidated with a conditional
+        request; a 304 refreshes the entry and serves the stored body. The
+        SQLite work runs in a worker thread. Entries are kept apart by
+        whether the client follows redirects (aiohttp does by default,
+        httpx does not), so a stored 301 only answers non-following clients,
+        and by the body read limits, so a body cut at max_bytes or </head>
+        only answers requests with the same limits.
+
+        Args:
+            client: aiohttp.ClientSession or httpx.AsyncClient
+            url: URL to fetch
+            method: HTTP method
+            params: Query parameters
+            headers: Extra request headers (Accept, Accept-Language and
+                Authorization take part in the cache key)
+            ttl: TTL in seconds (defaults to the per-endpoint rule)
+            provider: Rate limiter provider to take a slot from on network requests
+            max_bytes: Stop downloading the body after this many bytes
+            head_only: Stop downloading the body right after </head>
+            **kwargs: Passed through to the client (e.g. timeout, ssl)
+
+        Returns:
+            CachedResponse (network errors propagate to the caller)
+        """
+        ttl = self.ttl_for(url) if ttl is None else ttl
+        follow_redirects = self._follows_redirects(client, kwargs)
+        limits = {"max_bytes": max_bytes, "head_only": head_only}
+        entry = await asyncio.to_thread(self.lookup, method, url, params, allow_stale=True, headers=headers,
+                                        follow_redirects=follow_redirects, **limits)
+
+        if entry is not None:
+            cached, validators, expires_at = entry
+            if expires_at > time.time():
+                self.stats["hits"] += 1
+                return cached
+        else:
+            cached, validators = None, {}
+
+        request_headers = dict(headers or {})
+        request_headers.update(validators)
+
+        if provider:
+            await get_rate_limiter().acquire(provider)
+
+        response = await self._send(client, method, url, params, request_headers, **limits, **kwargs)
+
+        if provider:
+            get_rate_limiter().record_response(provider, response.status, response.headers)
+
+        if response.status == 304 and cached is not None:
+            self.stats["revalidations"] += 1
+            await asyncio.to_thread(self._touch, method, url, params, ttl, headers, follow_redirects, **limits)
+            cached.revalidated = True
+            return cached
+
+        self.stats["misses"] += 1
+        await asyncio.to_thread(self.put, method, url, params, response, ttl=ttl, headers=headers,
+                                follow_redirects=follow_redirects, **limits)
+        return response
+
+    @staticmethod
+    def _follows_redirects(client: Any, kwargs: Dict[str, Any]) -> bool:
+        """Check whether a request made with these client kwargs follows redirects."""
+        if type(client).__module__.startswith("httpx"):
+            return bool(kwargs.get("follow_redirects", getattr(client, "follow_redirects", False)))
+        return bool(kwargs.get("allow_redirects", True))
+
+    async def _send(self, client: Any, method: str, url: str, params: Optional[Dict[str, Any]],
+                    headers: Dict[str, str], max_bytes: Optional[int] = None, head_only: bool = False,
+                    **kwargs) -> CachedResponse:
+        """Send a request with an aiohttp or httpx client."""
+        if type(client).__module__.startswith("httpx"):
+            if max_bytes or head_only:
+                async with client.stream(method, url, params=params, headers=headers, **kwargs) as response:
+                    body, truncated = await self._read_capped(response.aiter_bytes(), max_bytes, head_only)
+            else:
+                response = await client.request(method, url, params=params, headers=headers, **kwargs)
+                body, truncated = response.content, False
+            return CachedResponse(
+                url=str(response.url),
+                status=response.status_code,
+                headers={k.lower(): v for k, v in response.headers.items()},
+                body=body,
+                history=[str(r.url) for r in response.history],
+                truncated=truncated
+            )
+
+        async with client.request(method, url, params=params, headers=headers, **kwargs) as response:
+            if max_bytes or head_only:
+                body, truncated = await self._read_capped(response.content.iter_chunked(64 * 1024),
+                                                          max_bytes, head_only)
+            else:
+                body, truncated = await response.read(), False
+            return CachedResponse(
+                url=str(response.url),
+                status=response.status,
+                headers={k.lower(): v for k, v in response.headers.items()},
+                body=body,
+                history=[str(r.url) for r in response.history],
+                truncated=truncated
+            )
+
+    @staticmethod
+    async def _read_capped(chunks: Any, max_bytes: Optional[int],
+                           head_only: bool = False) -> Tuple[bytes, bool]:
+        """Read body chunks until max_bytes (or </head>), returning the body and whether it was cut."""
+        body = bytearray()
+        async for chunk in chunks:
+            searched = max(0, len(body) - len(HEAD_END) + 1)
+            body += chunk
+            if head_only:
+                head_end = body.lower().find(HEAD_END, searched)
+                if head_end != -1 and (not max_bytes or head_end + len(HEAD_END) <= max_bytes):
+                    return bytes(body[:head_end + len(HEAD_END)]), True
+            if max_bytes and len(body) > max_bytes:
+                return bytes(body[:max_bytes]), True
+        return bytes(body), False
+
+    def purge_expired(self) -> int:
+        """
+        Delete expired entries that cannot be revalidated.
+
+        Returns:
+            Number of deleted entries
+        """
+        try:
+            with self._lock:
+                conn = self._connect()
+                cursor = conn.execute(
+                    "DELETE FROM responses WHERE expires_at <= ? AND etag IS NULL AND last_modified IS NULL",
+                    (time.time(),)
+                )
+                conn.commit()
+                return cursor.rowcount
+        except sqlite3.Error as e:
+            logger.warning(f"HTTP cache purge failed: {e}")
+            return 0
+
+    def clear(self) -> None:
+        """Delete all cached responses."""
+        with self._lock:
+            conn = self._connect()
+            conn.execute("DELETE FROM responses")
+            conn.commit()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with hit/miss counters and hit rate
+        """
+        lookups = self.stats["hits"] + self.stats["revalidations"] + self.stats["misses"]
+        served = self.stats["hits"] + self.stats["revalidations"]
+        return {
+            **self.stats,
+            "hit_rate": served / lookups if lookups else 0.0,
+            "enabled": self.enabled
+        }
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+# Global cache instance
+_http_cache_instance = None
+
+def get_http_cache() -> HTTPResponseCache:
+    """
+    Get the global HTTP response cache configured from ``http_cache``.
+
+    Returns:
+        HTTPResponseCache instance
+    """
+    global _http_cache_instance
+    if _http_cache_instance is None:
+        config = get_config()
+        _http_cache_instance = HTTPResponseCache(
+            path=config.get("http_cache.path"),
+            default_ttl=config.get("http_cache.default_ttl", DEFAULT_TTL),
+            ttl_rules=config.get("http_cache.ttl", None),
+            enabled=config.get("http_cache.enabled", True)
+        )
+    return _http_cache_instance
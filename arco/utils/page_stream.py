@@ -0,0 +1,276 @@
+"""
+Streaming Page Reader for ARCO.
+
+This module reads HTML response bodies incrementally instead of buffering
+them whole. Chunks are decoded as they arrive, lowercased once and fed to
+the signature matcher, and reading stops at a configurable byte cap (or
+right after the closing </head> tag when only head content is needed).
+Byte counters are kept so the cap can be tuned from real traffic.
+"""
+
+import codecs
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from arco.utils.logger import get_logger
+from arco.utils.signatures import SignatureHits, SignatureMatcher, get_signature_matcher
+
+logger = get_logger(__name__)
+
+DEFAULT_MAX_BYTES = 2 * 1024 * 1024
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+HEAD_END = b"</head>"
+
+# Why a read stopped before the end of the body
+TRUNCATED_MAX_BYTES = "max_bytes"
+TRUNCATED_HEAD = "head"
+
+
+@dataclass
+class PageBody:
+    """Decoded, signature-scanned body of a page."""
+
+    text: str
+    text_lower: str
+    signature_hits: SignatureHits
+    bytes_read: int  # body bytes received from the server (or cache)
+    truncated: Optional[str] = None  # TRUNCATED_MAX_BYTES / TRUNCATED_HEAD when the read stopped early
+
+
+class PageStreamStats:
+    """Counters of streamed page reads, shared by every reader of the process."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Reset every counter."""
+        with self._lock:
+            self.pages = 0
+            self.bytes_read = 0
+            self.bytes_kept = 0
+            self.largest_page = 0
+            self.truncated = {TRUNCATED_MAX_BYTES: 0, TRUNCATED_HEAD: 0}
+
+    def record(self, bytes_read: int, bytes_kept: int, truncated: Optional[str]) -> None:
+        """Record one finished read."""
+        with self._lock:
+            self.pages += 1
+            self.bytes_read += bytes_read
+            self.bytes_kept += bytes_kept
+            self.largest_page = max(self.largest_page, bytes_read)
+            if truncated:
+                self.truncated[truncated] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get read statistics.
+
+        Returns:
+            Dictionary with page and byte counts, how often each limit
+            stopped a read and the average bytes read per page
+        """
+        with self._lock:
+            return {
+                "pages": self.pages,
+                "bytes_read": self.bytes_read,
+                "bytes_kept": self.bytes_kept,
+                "largest_page": self.largest_page,
+                "avg_bytes_per_page": self.bytes_read / self.pages if self.pages else 0.0,
+                "stopped_at_max_bytes": self.truncated[TRUNCATED_MAX_BYTES],
+                "stopped_at_head": self.truncated[TRUNCATED_HEAD]
+            }
+
+
+_stats = PageStreamStats()
+
+
+def get_page_stream_stats() -> Dict[str, Any]:
+    """
+    Get the process-wide page read statistics.
+
+    Returns:
+        Dictionary of read counters (see PageStreamStats.get_stats)
+    """
+    return _stats.get_stats()
+
+
+class PageBodyReader:
+    """
+    Incremental reader of one page body.
+
+    Bytes are fed as they arrive; each chunk is decoded, lowercased and
+    scanned for signatures right away. feed() returns False once the byte
+    cap or the end of the head is reached so the caller can stop reading.
+    """
+
+    def __init__(self, encoding: str = "utf-8", max_bytes: int = DEFAULT_MAX_BYTES, head_only: bool = False,
+                 matcher: Optional[SignatureMatcher] = None):
+        """
+        Initialize the reader.
+
+        Args:
+            encoding: Charset of the body (unknown charsets fall back to utf-8)
+            max_bytes: Maximum body bytes to keep (0 disables the cap)
+            head_only: Stop right after the closing </head> tag
+            matcher: Signature matcher (defaults to the shared registry matcher)
+        """
+        try:
+            self._decoder = codecs.getincrementaldecoder(encoding or "utf-8")(errors="replace")
+        except LookupError:
+            self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+        self.max_bytes = max_bytes
+        self.head_only = head_only
+        self.bytes_read = 0
+        self.bytes_kept = 0
+        self.truncated: Optional[str] = None
+
+        self._parts: List[str] = []
+        self._signatures = (matcher or get_signature_matcher()).stream()
+        self._head_tail = b""
+        self._body: Optional[PageBody] = None
+
+    @property
+    def done(self) -> bool:
+        """Whether the reader has stopped accepting bytes."""
+        return self.truncated is not None or self._body is not None
+
+    def feed(self, data: bytes) -> bool:
+        """
+        Feed the next bytes of the body.
+
+        Args:
+            data: Next chunk of raw body bytes
+
+        Returns:
+            Whether more bytes should be read
+        """
+        if self.done:
+            return False
+        self.bytes_read += len(data)
+
+        if self.max_bytes and self.bytes_kept + len(data) > self.max_bytes:
+            data = data[:self.max_bytes - self.bytes_kept]
+            self.truncated = TRUNCATED_MAX_BYTES
+
+        if self.head_only:
+            window = self._head_tail + data
+            head_end = window.lower().find(HEAD_END)
+            if head_end != -1:
+                data = data[:head_end + len(HEAD_END) - len(self._head_tail)]
+                self.truncated = TRUNCATED_HEAD
+            else:
+                self._head_tail = window[-(len(HEAD_END) - 1):]
+
+        self.bytes_kept += len(data)
+        self._decode(data, final=self.truncated is not None)
+        return not self.done
+
+    def _decode(self, data: bytes, final: bool) -> None:
+        """Decode bytes and scan the text."""
+        text = self._decoder.decode(data, final=final)
+        if text:
+            self._parts.append(text)
+            self._signatures.feed(text)
+
+    def close(self) -> PageBody:
+        """
+        Finish reading.
+
+        Returns:
+            PageBody with the decoded text, its lowercased form and signature hits
+        """
+        if self._body is None:
+            if self.truncated is None:
+                self._decode(b"", final=True)
+            hits = self._signatures.close()
+            self._body = PageBody(
+                text="".join(self._parts),
+                text_lower=self._signatures.text,
+                signature_hits=hits,
+                bytes_read=self.bytes_read,
+                truncated=self.truncated
+            )
+            self._parts = []
+            _stats.record(self.bytes_read, self.bytes_kept, self.truncated)
+        return self._body
+
+
+def page_stream_settings() -> Dict[str, Any]:
+    """
+    Get the read limits from the ``page_stream`` config section.
+
+    Returns:
+        Dictionary with max_bytes, head_only and chunk_size
+    """
+    from arco.config.config_manager import get_config
+
+    config = get_config()
+    return {
+        "max_bytes": config.get("page_stream.max_bytes", DEFAULT_MAX_BYTES),
+        "head_only": config.get("page_stream.head_only", False),
+        "chunk_size": config.get("page_stream.chunk_size", DEFAULT_CHUNK_SIZE)
+    }
+
+
+def _with_defaults(**limits: Any) -> Dict[str, Any]:
+    """Fill the limits left as None from the config."""
+    if any(value is None for value in limits.values()):
+        settings = page_stream_settings()
+        limits = {name: settings[name] if value is None else value for name, value in limits.items()}
+    return limits
+
+
+async def read_page_body(response: Any, max_bytes: Optional[int] = None, head_only: Optional[bool] = None,
+                         chunk_size: Optional[int] = None) -> PageBody:
+    """
+    Stream the body of an aiohttp response through a PageBodyReader.
+
+    Reading stops (and the rest of the body is never downloaded) once the
+    byte cap or the end of the head is reached. Limits left as None come
+    from the ``page_stream`` config section.
+
+    Args:
+        response: aiohttp ClientResponse
+        max_bytes: Maximum body bytes to keep (0 disables the cap)
+        head_only: Stop right after the closing </head> tag
+        chunk_size: Bytes per network read
+
+    Returns:
+        PageBody of the response
+    """
+    limits = _with_defaults(max_bytes=max_bytes, head_only=head_only, chunk_size=chunk_size)
+    reader = PageBodyReader(getattr(response, "charset", None) or "utf-8",
+                            max_bytes=limits["max_bytes"], head_only=limits["head_only"])
+    async for chunk in response.content.iter_chunked(limits["chunk_size"]):
+        if not reader.feed(chunk):
+            break
+    page = reader.close()
+
+    if page.truncated:
+        logger.debug(f"Stopped reading {response.url} at {page.truncated} after {page.bytes_read} bytes")
+    return page
+
+
+def decode_page_body(body: bytes, encoding: str = "utf-8", max_bytes: Optional[int] = None,
+                     head_only: Optional[bool] = None) -> PageBody:
+    """
+    Decode an already downloaded body (e.g. from the HTTP cache) with the same limits.
+
+    Args:
+        body: Raw body bytes
+        encoding: Charset of the body
+        max_bytes: Maximum body bytes to keep (0 disables the cap)
+        head_only: Stop right after the closing </head> tag
+
+    Returns:
+        PageBody of the body
+    """
+    limits = _with_defaults(max_bytes=max_bytes, head_only=head_only)
+    reader = PageBodyReader(encoding, max_bytes=limits["max_bytes"], head_only=limits["head_only"])
+    reader.feed(body)
+    return reader.close()
@@ -0,0 +1,380 @@
+"""
+PageSpeed Insights Result Store for ARCO.
+
+This module provides a durable, SQLite-backed store of PageSpeed Insights
+results keyed by domain + strategy. Fresh results are served directly, stale
+results are served immediately while a background refresh runs, and
+concurrent requests for the same domain share a single in-flight PSI call.
+Only valid results (with an LCP measurement) are stored, so a transient PSI
+failure is never cached as the site's data. SQLite reads and writes made by
+get() run in a worker thread so they never block the event loop.
+"""
+
+import asyncio
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from arco.config.config_manager import get_config
+from arco.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_FRESH_TTL = 86400  # serve without refreshing for 1 day
+DEFAULT_MAX_STALE = 604800  # serve while refreshing for up to 7 days
+
+PageSpeedFetcher = Callable[[], Awaitable[Optional[Dict[str, Any]]]]
+
+
+def _numeric(audits: Dict[str, Any], name: str, scale: float = 1.0) -> Optional[float]:
+    """Get an audit's numericValue, scaled, or None when missing."""
+    value = audits.get(name, {}).get("numericValue")
+    return value / scale if value is not None else None
+
+
+@dataclass
+class PageSpeedRecord:
+    """Stored PageSpeed Insights result for a domain and strategy."""
+
+    domain: str
+    strategy: str
+    score: Optional[float] = None  # performance score (0-100)
+    lcp: Optional[float] = None  # seconds
+    fid: Optional[float] = None  # milliseconds (max-potential-fid)
+    cls: Optional[float] = None
+    ttfb: Optional[float] = None  # milliseconds
+    fcp: Optional[float] = None  # seconds
+    lighthouse: Dict[str, Any] = field(default_factory=dict)  # raw PSI response
+    fetched_at: float = field(default_factory=time.time)
+
+    @property
+    def age(self) -> float:
+        """Seconds since the result was fetched."""
+        return time.time() - self.fetched_at
+
+    @property
+    def is_valid(self) -> bool:
+        """Whether PSI returned a usable measurement (an LCP value)."""
+        return self.lcp is not None
+
+    @classmethod
+    def from_response(cls, domain: str, strategy: str, data: Dict[str, Any]) -> 'PageSpeedRecord':
+        """
+        Build a record from a raw PageSpeed Insights API response.
+
+        Args:
+            domain: Normalized domain
+            strategy: Analysis strategy ("mobile" or "desktop")
+            data: Raw PSI JSON response
+
+        Returns:
+            PageSpeedRecord with the Core Web Vitals extracted
+        """
+        lighthouse_result = data.get("lighthouseResult", {})
+        audits = lighthouse_result.get("audits", {})
+        score = lighthouse_result.get("categories", {}).get("performance", {}).get("score")
+
+        return cls(
+            domain=domain,
+            strategy=strategy,
+            score=score * 100 if score is not None else None,
+            lcp=_numeric(audits, "largest-contentful-paint", 1000),
+            fid=_numeric(audits, "max-potential-fid"),
+            cls=_numeric(audits, "cumulative-layout-shift"),
+            ttfb=_numeric(audits, "server-response-time"),
+            fcp=_numeric(audits, "first-contentful-paint", 1000),
+            lighthouse=data
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary (without the raw Lighthouse JSON)."""
+        return {
+            "domain": self.domain,
+            "strategy": self.strategy,
+            "score": self.score,
+            "lcp": self.lcp,
+            "fid": self.fid,
+            "cls": self.cls,
+            "ttfb": self.ttfb,
+            "fcp": self.fcp,
+            "fetched_at": self.fetched_at
+        }
+
+
+class PageSpeedStore:
+    """
+    Durable PageSpeed Insights result store with stale-while-revalidate.
+
+    Results younger than ``fresh_ttl`` are served as-is. Results younger than
+    ``max_stale`` are served immediately and refreshed in the background.
+    Anything older (or missing) is fetched before returning.
+    """
+
+    def __init__(self, path: Optional[str] = None, fresh_ttl: int = DEFAULT_FRESH_TTL,
+                 max_stale: int = DEFAULT_MAX_STALE, enabled: bool = True):
+        """
+        Initialize the PageSpeed store.
+
+        Args:
+            path: SQLite database path (defaults to <paths.cache>/pagespeed.sqlite3)
+            fresh_ttl: Age in seconds below which results are served without refreshing
+            max_stale: Age in seconds below which stale results are still served
+            enabled: When False every request goes straight to the fetcher
+        """
+        self.path = Path(path) if path else Path(get_config().get("paths.cache", "cache")) / "pagespeed.sqlite3"
+        self.fresh_ttl = fresh_ttl
+        self.max_stale = max(max_stale, fresh_ttl)
+        self.enabled = enabled
+
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._inflight: Dict[Tuple[str, str], asyncio.Task] = {}
+
+        self.stats = {
+            "hits": 0,
+            "stale_hits": 0,
+            "misses": 0,
+            "coalesced": 0,
+            "refreshes": 0,
+            "invalid": 0,
+            "errors": 0
+        }
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database lazily."""
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS pagespeed_results (
+                    domain TEXT NOT NULL,
+                    strategy TEXT NOT NULL,
+                    score REAL,
+                    lcp REAL,
+                    fid REAL,
+                    cls REAL,
+                    ttfb REAL,
+                    fcp REAL,
+                    lighthouse BLOB NOT NULL,
+                    fetched_at REAL NOT NULL,
+                    PRIMARY KEY (domain, strategy)
+                )
+                """
+            )
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    @staticmethod
+    def normalize_domain(domain: str) -> str:
+        """Normalize a domain or URL to the store key (no scheme or trailing slash)."""
+        domain = domain.strip().lower()
+        for prefix in ("https://", "http://"):
+            if domain.startswith(prefix):
+                domain = domain[len(prefix):]
+        return domain.rstrip("/")
+
+    def load(self, domain: str, strategy: str = "mobile") -> Optional[PageSpeedRecord]:
+        """
+        Load the stored result for a domain regardless of its age.
+
+        Args:
+            domain: Domain or URL
+            strategy: Analysis strategy ("mobile" or "desktop")
+
+        Returns:
+            PageSpeedRecord or None
+        """
+        domain = self.normalize_domain(domain)
+        try:
+            with self._lock:
+                row = self._connect().execute(
+                    "SELECT score, lcp, fid, cls, ttfb, fcp, lighthouse, fetched_at "
+                    "FROM pagespeed_results WHERE domain = ? AND strategy = ?",
+                    (domain, strategy)
+                ).fetchone()
+        except sqlite3.Error as e:
+            self.stats["errors"] += 1
+            logger.warning(f"PageSpeed store lookup failed for {domain}: {e}")
+            return None
+
+        if row is None:
+            return None
+
+        score, lcp, fid, cls, ttfb, fcp, lighthouse, fetched_at = row
+        return PageSpeedRecord(
+            domain=domain,
+            strategy=strategy,
+            score=score,
+            lcp=lcp,
+            fid=fid,
+            cls=cls,
+            ttfb=ttfb,
+            fcp=fcp,
+            lighthouse=json.loads(zlib.decompress(lighthouse)),
+            fetched_at=fetched_at
+        )
+
+    def save(self, record: PageSpeedRecord) -> bool:
+        """
+        Store a result, replacing any previous one for the domain and strategy.
+
+        Args:
+            record: Result to store
+
+        Returns:
+            True if the result was stored
+        """
+        try:
+            with self._lock:
+                conn = self._connect()
+                conn.execute(
+                    "INSERT OR REPLACE INTO pagespeed_results "
+                    "(domain, strategy, score, lcp, fid, cls, ttfb, fcp, lighthouse, fetched_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        record.domain,
+                        record.strategy,
+                        record.score,
+                        record.lcp,
+                        record.fid,
+                        record.cls,
+                        record.ttfb,
+                        record.fcp,
+                        zlib.compress(json.dumps(record.lighthouse).encode("utf-8"), 6),
+                        record.fetched_at
+                    )
+                )
+                conn.commit()
+        except sqlite3.Error as e:
+            self.stats["errors"] += 1
+            logger.warning(f"PageSpeed store save failed for {record.domain}: {e}")
+            return False
+        return True
+
+    async def get(self, domain: str, strategy: str, fetcher: PageSpeedFetcher) -> Optional[PageSpeedRecord]:
+        """
+        Get the PageSpeed result for a domain, fetching or refreshing as needed.
+
+        Args:
+            domain: Domain or URL
+            strategy: Analysis strategy ("mobile" or "desktop")
+            fetcher: Coroutine function returning the raw PSI response (or None)
+
+        Returns:
+            PageSpeedRecord or None if no result could be obtained
+            (fetcher exceptions propagate when there is nothing to serve)
+        """
+        domain = self.normalize_domain(domain)
+
+        if self.enabled:
+            record = await asyncio.to_thread(self.load, domain, strategy)
+            if record is not None:
+                if record.age < self.fresh_ttl:
+                    self.stats["hits"] += 1
+                    return record
+                if record.age < self.max_stale:
+                    self.stats["stale_hits"] += 1
+                    self._refresh(domain, strategy, fetcher)
+                    return record
+
+        self.stats["misses"] += 1
+        return await asyncio.shield(self._refresh(domain, strategy, fetcher))
+
+    def _refresh(self, domain: str, strategy: str, fetcher: PageSpeedFetcher) -> asyncio.Task:
+        """Start a fetch for the domain, or join the one already in flight."""
+        key = (domain, strategy)
+        loop = asyncio.get_running_loop()
+
+        task = self._inflight.get(key)
+        if task is not None and not task.done() and task.get_loop() is loop:
+            self.stats["coalesced"] += 1
+            return task
+
+        task = loop.create_task(self._fetch_and_save(domain, strategy, fetcher))
+        self._inflight[key] = task
+        task.add_done_callback(lambda t: self._finish_refresh(key, t))
+        return task
+
+    def _finish_refresh(self, key: Tuple[str, str], task: asyncio.Task) -> None:
+        """Drop a finished fetch from the in-flight table."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(f"PageSpeed refresh failed for {key[0]} ({key[1]}): {task.exception()}")
+
+    async def _fetch_and_save(self, domain: str, strategy: str, fetcher: PageSpeedFetcher) -> Optional[PageSpeedRecord]:
+        """Run the fetcher and store its result if it is valid."""
+        try:
+            data = await fetcher()
+        except Exception:
+            self.stats["errors"] += 1
+            raise
+
+        if not data:
+            return None
+
+        record = PageSpeedRecord.from_response(domain, strategy, data)
+        if not record.is_valid:
+            # Returned to this caller only: storing it would serve the failure for the whole TTL
+            self.stats["invalid"] += 1
+            logger.warning(f"Not storing PageSpeed result without LCP for {domain} ({strategy})")
+            return record
+
+        self.stats["refreshes"] += 1
+        if self.enabled:
+            await asyncio.to_thread(self.save, record)
+        return record
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get store statistics.
+
+        Returns:
+            Dictionary with hit/miss counters and hit rate
+        """
+        lookups = self.stats["hits"] + self.stats["stale_hits"] + self.stats["misses"]
+        served = self.stats["hits"] + self.stats["stale_hits"]
+        return {
+            **self.stats,
+            "in_flight": len(self._inflight),
+            "hit_rate": served / lookups if lookups else 0.0,
+            "enabled": self.enabled
+        }
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+# Global store instance
+_pagespeed_store_instance = None
+
+def get_pagespeed_store() -> PageSpeedStore:
+    """
+    Get the global PageSpeed store configured from ``pagespeed_store``.
+
+    Returns:
+        PageSpeedStore instance
+    """
+    global _pagespeed_store_instance
+    if _pagespeed_store_instance is None:
+        config = get_config()
+        _pagespeed_store_instance = PageSpeedStore(
+            path=config.get("pagespeed_store.path"),
+            fresh_ttl=config.get("pagespeed_store.fresh_ttl", DEFAULT_FRESH_TTL),
+            max_stale=config.get("pagespeed_store.max_stale", DEFAULT_MAX_STALE),
+            enabled=config.get("pagespeed_store.enabled", True)
+        )
+    return _pagespeed_store_instance
@@ -0,0 +1,309 @@
+"""
+Progress Journal for ARCO.
+
+This module provides durable storage for lead progress: an append-only
+journal of lead events plus compacted lead snapshots, both kept in SQLite
+(WAL mode). Recording a stage change is a single row insert, and
+compaction folds the journal into the snapshots atomically, so a crash at
+any point leaves a consistent store.
+
+Several processes may share one journal. Each appends its own events and
+catches up on the others' with events_since(); leads are registered per
+domain atomically, and a process that finds the journal compacted past
+the events it has seen reloads everything with load().
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from arco.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# (seq, lead_id, event, payload)
+JournalEvent = Tuple[int, str, str, Dict[str, Any]]
+
+
+class ProgressJournal:
+    """
+    Append-only event journal with compacted snapshots.
+
+    Events are stored in insertion order with an increasing sequence
+    number that is never reused. compact() replaces the snapshots of the
+    given leads and drops every event up to a sequence number in one
+    transaction, and records that sequence number as ``compacted_seq``.
+    """
+
+    def __init__(self, path: str):
+        """
+        Initialize the progress journal.
+
+        Args:
+            path: SQLite database path
+        """
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._data_version: Optional[int] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database lazily."""
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS lead_snapshots (
+                    lead_id TEXT PRIMARY KEY,
+                    data TEXT NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS lead_events (
+                    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                    lead_id TEXT NOT NULL,
+                    event TEXT NOT NULL,
+                    payload TEXT NOT NULL,
+                    created_at REAL NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS lead_domains (
+                    domain TEXT PRIMARY KEY,
+                    lead_id TEXT NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS journal_meta (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL
+                );
+                """
+            )
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    @staticmethod
+    def _get_meta(conn: sqlite3.Connection, key: str) -> Optional[str]:
+        """Read a metadata value on an open connection."""
+        row = conn.execute("SELECT value FROM journal_meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    @staticmethod
+    def _set_meta(conn: sqlite3.Connection, key: str, value: str) -> None:
+        """Write a metadata value on an open connection."""
+        conn.execute("INSERT OR REPLACE INTO journal_meta (key, value) VALUES (?, ?)", (key, value))
+
+    @staticmethod
+    def _insert_event(conn: sqlite3.Connection, lead_id: str, event: str, payload: Dict[str, Any]) -> int:
+        """Insert an event on an open connection and return its sequence number."""
+        cursor = conn.execute(
+            "INSERT INTO lead_events (lead_id, event, payload, created_at) VALUES (?, ?, ?, ?)",
+            (lead_id, event, json.dumps(payload, default=str), time.time())
+        )
+        return cursor.lastrowid
+
+    def append(self, lead_id: str, event: str, payload: Dict[str, Any]) -> int:
+        """
+        Append an event to the journal.
+
+        Args:
+            lead_id: Lead the event belongs to
+            event: Event type
+            payload: JSON-serializable event data
+
+        Returns:
+            Sequence number of the event
+        """
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                return self._insert_event(conn, lead_id, event, payload)
+
+    def add_lead(self, lead_id: str, domain: str, payload: Dict[str, Any]) -> Tuple[str, Optional[int]]:
+        """
+        Register a lead for a domain and journal its "add" event, unless the
+        domain already has a lead (possibly registered by another process).
+
+        Args:
+            lead_id: ID for the new lead
+            domain: Lead domain
+            payload: Data of the "add" event
+
+        Returns:
+            Tuple of (lead ID registered for the domain, sequence number of the
+            "add" event or None if the domain already had a lead)
+        """
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                inserted = conn.execute(
+                    "INSERT OR IGNORE INTO lead_domains (domain, lead_id) VALUES (?, ?)", (domain, lead_id)
+                ).rowcount
+                if not inserted:
+                    row = conn.execute("SELECT lead_id FROM lead_domains WHERE domain = ?", (domain,)).fetchone()
+                    return row[0], None
+                return lead_id, self._insert_event(conn, lead_id, "add", payload)
+
+    def has_changed(self) -> bool:
+        """
+        Check whether another connection (or process) has written since the last check.
+
+        Returns:
+            True if the database changed (always True on the first call)
+        """
+        with self._lock:
+            version = self._connect().execute("PRAGMA data_version").fetchone()[0]
+            changed = version != self._data_version
+            self._data_version = version
+        return changed
+
+    def load(self) -> Tuple[List[Dict[str, Any]], List[JournalEvent], int]:
+        """
+        Load the stored snapshots and the events recorded since the last compaction.
+
+        Returns:
+            Tuple of (lead snapshot dictionaries, events in sequence order,
+            sequence number the snapshots include events up to)
+        """
+        with self._lock:
+            conn = self._connect()
+            conn.execute("BEGIN")
+            try:
+                snapshots = [json.loads(data) for data, in conn.execute("SELECT data FROM lead_snapshots")]
+                events = self._select_events(conn, 0)
+                compacted_seq = int(self._get_meta(conn, "compacted_seq") or 0)
+            finally:
+                conn.commit()
+        return snapshots, events, compacted_seq
+
+    @staticmethod
+    def _select_events(conn: sqlite3.Connection, after_seq: int) -> List[JournalEvent]:
+        """Read events after a sequence number on an open connection."""
+        return [
+            (seq, lead_id, event, json.loads(payload))
+            for seq, lead_id, event, payload in conn.execute(
+                "SELECT seq, lead_id, event, payload FROM lead_events WHERE seq > ? ORDER BY seq", (after_seq,)
+            )
+        ]
+
+    def events_since(self, after_seq: int) -> Optional[List[JournalEvent]]:
+        """
+        Get the events recorded after a sequence number.
+
+        Args:
+            after_seq: Last sequence number already applied
+
+        Returns:
+            Events in sequence order, or None if some of them were already
+            compacted away (the caller must then reload with load())
+        """
+        with self._lock:
+            conn = self._connect()
+            conn.execute("BEGIN")
+            try:
+                if int(self._get_meta(conn, "compacted_seq") or 0) > after_seq:
+                    return None
+                return self._select_events(conn, after_seq)
+            finally:
+                conn.commit()
+
+    def compact(self, after_seq: int,
+                snapshot: Callable[[List[JournalEvent]], Iterable[Dict[str, Any]]]) -> Optional[int]:
+        """
+        Fold the journal into the lead snapshots.
+
+        Runs under the database write lock: the events after ``after_seq``
+        are passed to ``snapshot``, which must apply them and return the
+        snapshots of every lead changed since the caller last compacted.
+
+        Args:
+            after_seq: Last sequence number the caller has applied
+            snapshot: Callback returning lead dictionaries (with a "lead_id") to store
+
+        Returns:
+            Sequence number the snapshots now include, or None if another
+            process compacted past ``after_seq`` first
+        """
+        with self._lock:
+            conn = self._connect()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                compacted_seq = int(self._get_meta(conn, "compacted_seq") or 0)
+                if compacted_seq > after_seq:
+                    conn.rollback()
+                    return None
+
+                events = self._select_events(conn, after_seq)
+                upto_seq = events[-1][0] if events else after_seq
+                conn.executemany(
+                    "INSERT OR REPLACE INTO lead_snapshots (lead_id, data) VALUES (?, ?)",
+                    ((data["lead_id"], json.dumps(data, default=str)) for data in snapshot(events))
+                )
+                conn.execute("DELETE FROM lead_events WHERE seq <= ?", (upto_seq,))
+                self._set_meta(conn, "compacted_seq", str(max(upto_seq, compacted_seq)))
+                conn.commit()
+                return upto_seq
+            except BaseException:
+                conn.rollback()
+                raise
+
+    def import_once(self, key: str, loader: Callable[[], Iterable[Dict[str, Any]]]) -> int:
+        """
+        Import lead snapshots unless an import with the same key already ran.
+
+        Args:
+            key: Import identifier (stored in the journal metadata)
+            loader: Callback returning lead dictionaries to import
+
+        Returns:
+            Number of leads imported
+        """
+        with self._lock:
+            conn = self._connect()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                if self._get_meta(conn, key):
+                    conn.rollback()
+                    return 0
+
+                imported = 0
+                for data in loader():
+                    if conn.execute("INSERT OR IGNORE INTO lead_domains (domain, lead_id) VALUES (?, ?)",
+                                    (data.get("domain", ""), data["lead_id"])).rowcount:
+                        conn.execute("INSERT OR REPLACE INTO lead_snapshots (lead_id, data) VALUES (?, ?)",
+                                     (data["lead_id"], json.dumps(data, default=str)))
+                        imported += 1
+                self._set_meta(conn, key, str(time.time()))
+                conn.commit()
+                return imported
+            except BaseException:
+                conn.rollback()
+                raise
+
+    def clear(self) -> int:
+        """
+        Delete every snapshot and event, leaving a single "clear" event so
+        that other processes drop their state on their next refresh.
+
+        Returns:
+            Sequence number of the "clear" event
+        """
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute("DELETE FROM lead_snapshots")
+                conn.execute("DELETE FROM lead_events")
+                conn.execute("DELETE FROM lead_domains")
+                seq = self._insert_event(conn, "", "clear", {})
+                self._set_meta(conn, "compacted_seq", str(seq - 1))
+            return seq
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+                self._data_version = None
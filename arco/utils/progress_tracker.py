@@ -16,9 +16,17 @@ import threading
 import uuid
 
 from arco.utils.logger import get_logger
+from arco.utils.progress_journal import ProgressJournal
 
 logger = get_logger(__name__)
 
+# Journaled events after which the journal is compacted into lead snapshots
+DEFAULT_COMPACT_THRESHOLD = 10000
+
+# Stage activity is counted in buckets of this many seconds, kept for one day
+ACTIVITY_BUCKET_SECONDS = 60
+ACTIVITY_RETENTION_SECONDS = 86400
+
 class ProgressStage:
     """Enum-like class for progress stages."""
     
@@ -81,7 +89,7 @@ class ProgressStage:
 class LeadProgress:
     """Class to track the progress of a lead."""
     
-    def __init__(self, lead_id: str, domain: str, company_name: str = None):
+    def __init__(self, lead_id: str, domain: str, company_name: str = None, timestamp: str = None):
         """
         Initialize the lead progress.
         
@@ -89,6 +97,7 @@ class LeadProgress:
             lead_id: Unique identifier for the lead
             domain: Domain of the lead
             company_name: Company name of the lead
+            timestamp: ISO timestamp of the import (defaults to now)
         """
         self.lead_id = lead_id
         self.domain = domain
@@ -96,20 +105,25 @@ class LeadProgress:
         self.current_stage = ProgressStage.IMPORTED
         self.stage_history = {
             ProgressStage.IMPORTED: {
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": timestamp or datetime.now().isoformat(),
                 "duration": 0
             }
         }
+        # Every stage entry in journal order (stage_history keeps only the last entry per stage)
+        self.stage_events = [
+            {"stage": ProgressStage.IMPORTED, "timestamp": self.stage_history[ProgressStage.IMPORTED]["timestamp"]}
+        ]
         self.metadata = {}
         self.errors = []
     
-    def update_stage(self, stage: str, metadata: Dict[str, Any] = None) -> bool:
+    def update_stage(self, stage: str, metadata: Dict[str, Any] = None, timestamp: str = None) -> bool:
         """
         Update the stage of the lead.
         
         Args:
             stage: New stage
             metadata: Additional metadata for the stage
+            timestamp: ISO timestamp of the change (defaults to now)
             
         Returns:
             True if the stage was updated, False otherwise
@@ -118,10 +132,24 @@ class LeadProgress:
             logger.warning(f"Invalid stage: {stage}")
             return False
         
+        self.apply_stage(stage, metadata, timestamp or datetime.now().isoformat())
+        
+        logger.info(f"Lead {self.lead_id} ({self.domain}) updated to stage: {stage}")
+        return True
+    
+    def apply_stage(self, stage: str, metadata: Optional[Dict[str, Any]], timestamp: str) -> None:
+        """
+        Apply a validated stage change without logging (used when replaying the journal).
+        
+        Args:
+            stage: New stage
+            metadata: Additional metadata for the stage
+            timestamp: ISO timestamp of the change
+        """
         # Calculate duration in previous stage
         if self.current_stage in self.stage_history:
             prev_timestamp = datetime.fromisoformat(self.stage_history[self.current_stage]["timestamp"])
-            duration = (datetime.now() - prev_timestamp).total_seconds()
+            duration = (datetime.fromisoformat(timestamp) - prev_timestamp).total_seconds()
             self.stage_history[self.current_stage]["duration"] = duration
         
         # Update current stage
@@ -129,20 +157,18 @@ class LeadProgress:
         
         # Add to stage history
         self.stage_history[stage] = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": timestamp,
             "duration": 0
         }
+        self.stage_events.append({"stage": stage, "timestamp": timestamp})
         
         # Update metadata
         if metadata:
             if stage not in self.metadata:
                 self.metadata[stage] = {}
             self.metadata[stage].update(metadata)
-        
-        logger.info(f"Lead {self.lead_id} ({self.domain}) updated to stage: {stage}")
-        return True
     
-    def add_error(self, stage: str, error_message: str, error_details: Dict[str, Any] = None) -> None:
+    def add_error(self, stage: str, error_message: str, error_details: Dict[str, Any] = None) -> Dict[str, Any]:
         """
         Add an error to the lead.
         
@@ -150,6 +176,9 @@ class LeadProgress:
             stage: Stage where the error occurred
             error_message: Error message
             error_details: Additional error details
+            
+        Returns:
+            The recorded error
         """
         error = {
             "stage": stage,
@@ -159,6 +188,7 @@ class LeadProgress:
         }
         self.errors.append(error)
         logger.error(f"Lead {self.lead_id} ({self.domain}) error in stage {stage}: {error_message}")
+        return error
     
     def get_stage_duration(self, stage: str) -> float:
         """
@@ -206,6 +236,7 @@ class LeadProgress:
             "company_name": self.company_name,
             "current_stage": self.current_stage,
             "stage_history": self.stage_history,
+            "stage_events": self.stage_events,
             "metadata": self.metadata,
             "errors": self.errors,
             "total_duration": self.get_total_duration()
@@ -229,13 +260,133 @@ class LeadProgress:
         )
         lead.current_stage = data.get("current_stage", ProgressStage.IMPORTED)
         lead.stage_history = data.get("stage_history", {})
+        lead.stage_events = data.get("stage_events") or [
+            # Written before stage events were kept: one entry per stage is all that is known
+            {"stage": stage, "timestamp": entry.get("timestamp", "")}
+            for stage, entry in sorted(lead.stage_history.items(), key=lambda item: item[1].get("timestamp", ""))
+        ]
         lead.metadata = data.get("metadata", {})
         lead.errors = data.get("errors", [])
         return lead
 
 
+class StageAnalytics:
+    """
+    Running aggregates of lead progress.
+    
+    Keeps the number of leads per current stage, the sum and count of the
+    durations of completed stages, a stage transition matrix and per-stage
+    activity in time buckets, so that reports cost O(stages) instead of a
+    walk over every lead and its history.
+    """
+    
+    def __init__(self, bucket_seconds: int = ACTIVITY_BUCKET_SECONDS,
+                 retention_seconds: int = ACTIVITY_RETENTION_SECONDS):
+        """
+        Initialize the aggregates.
+        
+        Args:
+            bucket_seconds: Width of an activity bucket
+            retention_seconds: Age after which activity buckets are dropped
+        """
+        self.bucket_seconds = bucket_seconds
+        self.retention_seconds = retention_seconds
+        self.reset()
+    
+    def reset(self) -> None:
+        """Clear every aggregate."""
+        self.stage_counts: Dict[str, int] = {}
+        self.duration_sums: Dict[str, float] = {}
+        self.duration_counts: Dict[str, int] = {}
+        self.transitions: Dict[Tuple[str, str], int] = {}
+        self._buckets: Dict[int, Dict[str, int]] = {}  # bucket -> stage -> stage entries
+    
+    def count_lead(self, lead: LeadProgress, sign: int = 1) -> None:
+        """
+        Add (or, with sign=-1, remove) a lead's current stage and completed stage durations.
+        
+        Args:
+            lead: Lead to count
+            sign: 1 to add the lead, -1 to remove it
+        """
+        self.stage_counts[lead.current_stage] = self.stage_counts.get(lead.current_stage, 0) + sign
+        for stage, entry in lead.stage_history.items():
+            if stage != lead.current_stage:  # Only include completed stages
+                self.duration_sums[stage] = self.duration_sums.get(stage, 0) + sign * entry.get("duration", 0)
+                self.duration_counts[stage] = self.duration_counts.get(stage, 0) + sign
+    
+    def record_history(self, lead: LeadProgress) -> None:
+        """
+        Record the stage entries and transitions of a lead's ordered stage events
+        (used for leads loaded from snapshots, whose journal events are gone).
+        
+        Args:
+            lead: Lead to record
+        """
+        previous = None
+        for event in lead.stage_events:
+            self.record_entry(event["stage"], event.get("timestamp"), previous)
+            previous = event["stage"]
+    
+    def record_entry(self, stage: str, timestamp: Optional[str], previous_stage: Optional[str] = None) -> None:
+        """
+        Record a lead entering a stage.
+        
+        Args:
+            stage: Stage entered
+            timestamp: ISO timestamp of the change
+            previous_stage: Stage the lead left, if any
+        """
+        if previous_stage is not None:
+            key = (previous_stage, stage)
+            self.transitions[key] = self.transitions.get(key, 0) + 1
+        
+        try:
+            moment = datetime.fromisoformat(timestamp).timestamp()
+        except (TypeError, ValueError):
+            return
+        if moment < time.time() - self.retention_seconds:
+            return
+        
+        bucket = self._buckets.setdefault(int(moment // self.bucket_seconds), {})
+        bucket[stage] = bucket.get(stage, 0) + 1
+        self._prune()
+    
+    def _prune(self) -> None:
+        """Drop activity buckets older than the retention period."""
+        oldest = int((time.time() - self.retention_seconds) // self.bucket_seconds)
+        if len(self._buckets) > self.retention_seconds // self.bucket_seconds + 1:
+            for key in [key for key in self._buckets if key < oldest]:
+                del self._buckets[key]
+    
+    def get_activity(self, window_seconds: int) -> Dict[str, int]:
+        """
+        Count stage entries within a recent time window.
+        
+        Args:
+            window_seconds: Window length (at most the retention period)
+            
+        Returns:
+            Dictionary of stage to number of leads that entered it in the window
+        """
+        first = int((time.time() - window_seconds) // self.bucket_seconds)
+        counts = {stage: 0 for stage in ProgressStage.get_all_stages()}
+        for key, bucket in self._buckets.items():
+            if key >= first:
+                for stage, count in bucket.items():
+                    counts[stage] = counts.get(stage, 0) + count
+        return counts
+
+
 class ProgressTracker:
-    """Class to track the progress of multiple leads."""
+    """
+    Class to track the progress of multiple leads.
+    
+    The tracker is safe to use from several threads, and several processes
+    may share one storage directory: every change is journaled first and
+    each tracker applies the journal (its own and other processes' events)
+    in order, picking up foreign changes before reads and writes.
+    """
     
     _instance = None
     _lock = threading.Lock()
@@ -248,31 +399,40 @@ class ProgressTracker:
                 cls._instance._initialized = False
         return cls._instance
     
-    def __init__(self, storage_dir: str = None):
+    def __init__(self, storage_dir: str = None, compact_threshold: int = DEFAULT_COMPACT_THRESHOLD):
         """
         Initialize the progress tracker.
         
         Args:
             storage_dir: Directory to store progress data
+            compact_threshold: Number of journaled events after which the journal
+                               is folded into the lead snapshots
         """
-        if self._initialized:
-            return
-        
-        self.storage_dir = storage_dir or os.path.join("data", "progress")
-        os.makedirs(self.storage_dir, exist_ok=True)
-        
-        self.leads = {}
-        self.last_save_time = 0
-        self.auto_save_interval = 60  # seconds
-        
-        # Load existing progress data
-        self._load_progress()
-        
-        self._initialized = True
+        with self._lock:
+            if self._initialized:
+                return
+            
+            self.storage_dir = storage_dir or os.path.join("data", "progress")
+            os.makedirs(self.storage_dir, exist_ok=True)
+            
+            self.leads = {}
+            self.compact_threshold = compact_threshold
+            self.journal = ProgressJournal(os.path.join(self.storage_dir, "lead_progress.sqlite3"))
+            self._state_lock = threading.RLock()  # guards the in-memory state below
+            self._domain_index: Dict[str, str] = {}  # domain -> lead_id
+            self._dirty: Set[str] = set()  # leads changed since the last compaction
+            self._last_seq = 0  # last journal event applied
+            self._pending_events = 0
+            self.analytics = StageAnalytics()
+            
+            # Load existing progress data
+            self._load_progress()
+            
+            self._initialized = True
     
     def _get_progress_file_path(self) -> str:
         """
-        Get the path to the progress file.
+        Get the path to the legacy JSON progress file.
         
         Returns:
             Path to the progress file
@@ -280,38 +440,146 @@ class ProgressTracker:
         return os.path.join(self.storage_dir, "lead_progress.json")
     
     def _load_progress(self) -> None:
-        """Load progress data from file."""
+        """Import the legacy JSON file once, then load the snapshots and replay the journal."""
+        try:
+            imported = self.journal.import_once("legacy_imported", self._read_legacy_progress)
+            if imported:
+                logger.info(f"Imported {imported} leads from {self._get_progress_file_path()}")
+        except Exception as e:
+            logger.error(f"Error importing legacy progress data: {e}")
+        
+        self._reload()
+        logger.info(f"Loaded progress data for {len(self.leads)} leads ({self._pending_events} journaled events)")
+    
+    def _read_legacy_progress(self) -> List[Dict[str, Any]]:
+        """Read the leads of the JSON file written by earlier versions."""
         file_path = self._get_progress_file_path()
-        if os.path.exists(file_path):
+        if not os.path.exists(file_path):
+            return []
+        
+        with open(file_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return [LeadProgress.from_dict(lead_data).to_dict() for lead_data in data.get("leads", [])]
+    
+    def _reload(self) -> None:
+        """Rebuild the in-memory state from the snapshots and the journal."""
+        try:
+            snapshots, events, compacted_seq = self.journal.load()
+        except Exception as e:
+            logger.error(f"Error loading progress data: {e}")
+            return
+        
+        self.leads = {}
+        self._domain_index = {}
+        self._dirty = set()
+        self._pending_events = 0
+        self._last_seq = compacted_seq
+        self.analytics.reset()
+        
+        for lead_data in snapshots:
+            self._index_lead(LeadProgress.from_dict(lead_data))
+        self._apply_events(events)
+    
+    def _index_lead(self, lead: LeadProgress) -> None:
+        """Add a lead to the in-memory state, the domain index and the analytics."""
+        if lead.lead_id in self.leads:
+            self.analytics.count_lead(self.leads[lead.lead_id], sign=-1)
+        self.leads[lead.lead_id] = lead
+        self._domain_index.setdefault(lead.domain, lead.lead_id)
+        self.analytics.count_lead(lead)
+        self.analytics.record_history(lead)
+    
+    def _apply_events(self, events: List[Tuple[int, str, str, Dict[str, Any]]]) -> None:
+        """Apply journaled events (from any process) to the in-memory state."""
+        for seq, lead_id, event, payload in events:
+            if event == "clear":
+                self.leads = {}
+                self._domain_index = {}
+                self._dirty = set()
+                self.analytics.reset()
+            elif event == "add":
+                self._index_lead(LeadProgress(lead_id, payload["domain"], payload.get("company_name"),
+                                              timestamp=payload["timestamp"]))
+            elif lead_id in self.leads:
+                lead = self.leads[lead_id]
+                if event == "stage":
+                    previous_stage = lead.current_stage
+                    self.analytics.count_lead(lead, sign=-1)
+                    lead.apply_stage(payload["stage"], payload.get("metadata"), payload["timestamp"])
+                    self.analytics.count_lead(lead)
+                    self.analytics.record_entry(payload["stage"], payload["timestamp"], previous_stage)
+                elif event == "error":
+                    lead.errors.append(payload)
+            
+            if lead_id:
+                self._dirty.add(lead_id)
+            self._pending_events += 1
+            self._last_seq = seq
+    
+    def _catch_up(self, own_event: Optional[Tuple[int, str, str, Dict[str, Any]]] = None) -> None:
+        """
+        Apply the events journaled since the last one applied (reloading if they were compacted).
+        
+        Args:
+            own_event: Event just journaled by this tracker; when it directly follows
+                       the last applied event it is applied without reading the journal
+        """
+        if own_event is not None and own_event[0] == self._last_seq + 1:
+            self._apply_events([own_event])
+            return
+        
+        events = self.journal.events_since(self._last_seq)
+        if events is None:
+            self._reload()
+        else:
+            self._apply_events(events)
+    
+    def refresh(self) -> None:
+        """Pick up changes journaled by other processes sharing the storage directory."""
+        with self._state_lock:
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    for lead_data in data.get("leads", []):
-                        lead = LeadProgress.from_dict(lead_data)
-                        self.leads[lead.lead_id] = lead
-                logger.info(f"Loaded progress data for {len(self.leads)} leads")
+                if self.journal.has_changed():
+                    self._catch_up()
             except Exception as e:
-                logger.error(f"Error loading progress data: {e}")
+                logger.error(f"Error refreshing progress data: {e}")
     
-    def _save_progress(self) -> None:
-        """Save progress data to file."""
-        file_path = self._get_progress_file_path()
+    def _record(self, lead_id: str, event: str, payload: Dict[str, Any]) -> bool:
+        """
+        Journal an event, then apply it together with any event journaled
+        concurrently by other processes, in sequence order.
+        """
         try:
-            data = {
-                "timestamp": datetime.now().isoformat(),
-                "leads": [lead.to_dict() for lead in self.leads.values()]
-            }
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2)
-            self.last_save_time = time.time()
-            logger.info(f"Saved progress data for {len(self.leads)} leads")
+            seq = self.journal.append(lead_id, event, payload)
+            self._catch_up((seq, lead_id, event, payload))
         except Exception as e:
-            logger.error(f"Error saving progress data: {e}")
+            logger.error(f"Error journaling progress event: {e}")
+            return False
+        
+        self._maybe_compact()
+        return True
+    
+    def _maybe_compact(self) -> None:
+        """Compact the journal when it has grown past the threshold."""
+        if self._pending_events >= self.compact_threshold:
+            self._compact()
     
-    def _auto_save(self) -> None:
-        """Auto-save progress data if interval has elapsed."""
-        if time.time() - self.last_save_time > self.auto_save_interval:
-            self._save_progress()
+    def _compact(self) -> None:
+        """Fold the journal into the snapshots of the leads it changed."""
+        def snapshot(events):
+            self._apply_events(events)
+            return [self.leads[lead_id].to_dict() for lead_id in self._dirty if lead_id in self.leads]
+        
+        try:
+            pending_events = self._pending_events
+            if self.journal.compact(self._last_seq, snapshot) is None:
+                # Another process compacted first; its snapshots include our events
+                self._reload()
+                return
+            logger.info(f"Compacted {pending_events} progress events into {len(self._dirty)} lead snapshots")
+            self._dirty.clear()
+            self._pending_events = 0
+        except Exception as e:
+            logger.error(f"Error compacting progress data: {e}")
     
     def add_lead(self, domain: str, company_name: str = None, lead_id: str = None) -> str:
         """
@@ -325,21 +593,24 @@ class ProgressTracker:
         Returns:
             Lead ID
         """
-        lead_id = lead_id or str(uuid.uuid4())
-        
-        # Check if lead already exists
-        for existing_lead in self.leads.values():
-            if existing_lead.domain == domain:
-                return existing_lead.lead_id
-        
-        # Create new lead
-        lead = LeadProgress(lead_id, domain, company_name)
-        self.leads[lead_id] = lead
-        
-        # Auto-save
-        self._auto_save()
-        
-        return lead_id
+        with self._state_lock:
+            # Check if lead already exists
+            self.refresh()
+            existing_lead_id = self._domain_index.get(domain)
+            if existing_lead_id is not None:
+                return existing_lead_id
+            
+            # Register the domain atomically (another process may have just added it)
+            try:
+                payload = {"domain": domain, "company_name": company_name, "timestamp": datetime.now().isoformat()}
+                lead_id, seq = self.journal.add_lead(lead_id or str(uuid.uuid4()), domain, payload)
+                self._catch_up((seq, lead_id, "add", payload) if seq is not None else None)
+            except Exception as e:
+                logger.error(f"Error journaling new lead {domain}: {e}")
+                raise
+            
+            self._maybe_compact()
+            return lead_id
     
     def update_stage(self, lead_id: str, stage: str, metadata: Dict[str, Any] = None) -> bool:
         """
@@ -353,16 +624,23 @@ class ProgressTracker:
         Returns:
             True if the stage was updated, False otherwise
         """
-        if lead_id not in self.leads:
-            logger.warning(f"Lead not found: {lead_id}")
-            return False
-        
-        result = self.leads[lead_id].update_stage(stage, metadata)
-        
-        # Auto-save
-        self._auto_save()
+        with self._state_lock:
+            self.refresh()
+            if lead_id not in self.leads:
+                logger.warning(f"Lead not found: {lead_id}")
+                return False
+            
+            if stage not in ProgressStage.get_all_stages():
+                logger.warning(f"Invalid stage: {stage}")
+                return False
+            
+            payload = {"stage": stage, "metadata": metadata, "timestamp": datetime.now().isoformat()}
+            if not self._record(lead_id, "stage", payload):
+                return False
         
-        return result
+        lead = self.leads.get(lead_id)
+        logger.info(f"Lead {lead_id} ({lead.domain if lead else ''}) updated to stage: {stage}")
+        return True
     
     def add_error(self, lead_id: str, stage: str, error_message: str, error_details: Dict[str, Any] = None) -> bool:
         """
@@ -377,15 +655,23 @@ class ProgressTracker:
         Returns:
             True if the error was added, False otherwise
         """
-        if lead_id not in self.leads:
-            logger.warning(f"Lead not found: {lead_id}")
-            return False
-        
-        self.leads[lead_id].add_error(stage, error_message, error_details)
-        
-        # Auto-save
-        self._auto_save()
+        with self._state_lock:
+            self.refresh()
+            if lead_id not in self.leads:
+                logger.warning(f"Lead not found: {lead_id}")
+                return False
+            
+            error = {
+                "stage": stage,
+                "timestamp": datetime.now().isoformat(),
+                "message": error_message,
+                "details": error_details or {}
+            }
+            if not self._record(lead_id, "error", error):
+                return False
         
+        lead = self.leads.get(lead_id)
+        logger.error(f"Lead {lead_id} ({lead.domain if lead else ''}) error in stage {stage}: {error_message}")
         return True
     
     def get_lead(self, lead_id: str) -> Optional[LeadProgress]:
@@ -398,6 +684,7 @@ class ProgressTracker:
         Returns:
             LeadProgress object or None if not found
         """
+        self.refresh()
         return self.leads.get(lead_id)
     
     def get_lead_by_domain(self, domain: str) -> Optional[LeadProgress]:
@@ -410,10 +697,10 @@ class ProgressTracker:
         Returns:
             LeadProgress object or None if not found
         """
-        for lead in self.leads.values():
-            if lead.domain == domain:
-                return lead
-        return None
+        with self._state_lock:
+            self.refresh()
+            lead_id = self._domain_index.get(domain)
+            return self.leads.get(lead_id) if lead_id is not None else None
     
     def get_leads_by_stage(self, stage: str) -> List[LeadProgress]:
         """
@@ -425,7 +712,9 @@ class ProgressTracker:
         Returns:
             List of LeadProgress objects
         """
-        return [lead for lead in self.leads.values() if lead.current_stage == stage]
+        with self._state_lock:
+            self.refresh()
+            return [lead for lead in self.leads.values() if lead.current_stage == stage]
     
     def get_stage_counts(self) -> Dict[str, int]:
         """
@@ -435,8 +724,11 @@ class ProgressTracker:
             Dictionary with stage counts
         """
         counts = {stage: 0 for stage in ProgressStage.get_all_stages()}
-        for lead in self.leads.values():
-            counts[lead.current_stage] = counts.get(lead.current_stage, 0) + 1
+        with self._state_lock:
+            self.refresh()
+            for stage, count in self.analytics.stage_counts.items():
+                if count:
+                    counts[stage] = count
         return counts
     
     def get_average_durations(self) -> Dict[str, float]:
@@ -446,22 +738,49 @@ class ProgressTracker:
         Returns:
             Dictionary with average durations
         """
-        durations = {stage: [] for stage in ProgressStage.get_all_stages()}
-        for lead in self.leads.values():
-            for stage in lead.stage_history:
-                if stage != lead.current_stage:  # Only include completed stages
-                    durations[stage].append(lead.stage_history[stage]["duration"])
+        with self._state_lock:
+            self.refresh()
+            sums = dict(self.analytics.duration_sums)
+            counts = dict(self.analytics.duration_counts)
         
         # Calculate averages
         averages = {}
-        for stage, values in durations.items():
-            if values:
-                averages[stage] = sum(values) / len(values)
+        for stage in ProgressStage.get_all_stages():
+            if counts.get(stage):
+                averages[stage] = sums[stage] / counts[stage]
             else:
                 averages[stage] = 0
         
         return averages
     
+    def get_transition_counts(self) -> Dict[str, Dict[str, int]]:
+        """
+        Get the number of stage transitions between each pair of stages.
+        
+        Returns:
+            Dictionary of from-stage to a dictionary of to-stage and count
+        """
+        matrix: Dict[str, Dict[str, int]] = {}
+        with self._state_lock:
+            self.refresh()
+            for (from_stage, to_stage), count in self.analytics.transitions.items():
+                matrix.setdefault(from_stage, {})[to_stage] = count
+        return matrix
+    
+    def get_recent_activity(self, window_seconds: int = 3600) -> Dict[str, int]:
+        """
+        Get the number of leads that entered each stage within a recent window.
+        
+        Args:
+            window_seconds: Window length in seconds (up to one day)
+            
+        Returns:
+            Dictionary with stage entry counts
+        """
+        with self._state_lock:
+            self.refresh()
+            return self.analytics.get_activity(window_seconds)
+    
     def get_conversion_rates(self) -> Dict[str, float]:
         """
         Get conversion rates between stages.
@@ -494,22 +813,31 @@ class ProgressTracker:
         Returns:
             Dictionary with summary information
         """
-        return {
-            "total_leads": len(self.leads),
-            "stage_counts": self.get_stage_counts(),
-            "average_durations": self.get_average_durations(),
-            "conversion_rates": self.get_conversion_rates(),
-            "timestamp": datetime.now().isoformat()
-        }
+        with self._state_lock:
+            self.refresh()
+            return {
+                "total_leads": len(self.leads),
+                "stage_counts": self.get_stage_counts(),
+                "average_durations": self.get_average_durations(),
+                "conversion_rates": self.get_conversion_rates(),
+                "transitions": self.get_transition_counts(),
+                "activity": {
+                    "last_hour": self.get_recent_activity(3600),
+                    "last_day": self.get_recent_activity(86400)
+                },
+                "timestamp": datetime.now().isoformat()
+            }
     
     def save(self) -> None:
-        """Save progress data to file."""
-        self._save_progress()
+        """Compact the journal into the lead snapshots."""
+        with self._state_lock:
+            self._compact()
     
     def clear(self) -> None:
-        """Clear all progress data."""
-        self.leads = {}
-        self._save_progress()
+        """Clear all progress data (for every process sharing the storage directory)."""
+        with self._state_lock:
+            self.journal.clear()
+            self._catch_up()
         logger.info("Cleared all progress data")
 
 
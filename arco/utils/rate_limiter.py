@@ -0,0 +1,286 @@
+"""
+Rate Limiter for ARCO.
+
+This module provides a process-wide request scheduler with one token bucket
+per external provider (PageSpeed Insights, Custom Search, Meta Ads, HubSpot,
+RDAP, ...). Quotas come from the ``rate_limits`` config section. Callers
+await a slot instead of sleeping blindly, and 429 / Retry-After responses
+pause the provider for every caller at once.
+"""
+
+import asyncio
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Mapping, Optional
+
+from arco.config.config_manager import get_config
+from arco.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Default quotas: requests per period (seconds) and burst size
+DEFAULT_RATE_LIMITS = {
+    "pagespeed": {"requests": 400, "period": 100, "burst": 20},
+    "google_search": {"requests": 100, "period": 60, "burst": 10},
+    "google_ads": {"requests": 60, "period": 60, "burst": 10},
+    "meta_ads": {"requests": 200, "period": 3600, "burst": 20},
+    "meta_graph": {"requests": 200, "period": 3600, "burst": 20},
+    "instagram": {"requests": 200, "period": 3600, "burst": 10},
+    "hubspot": {"requests": 100, "period": 10, "burst": 100},
+    "rdap": {"requests": 10, "period": 10, "burst": 5},
+}
+
+# Longest pause applied after repeated 429s without a Retry-After header
+MAX_BACKOFF = 60.0
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header value.
+
+    Args:
+        value: Delay in seconds or an HTTP date
+
+    Returns:
+        Delay in seconds, or None if the value cannot be parsed
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class TokenBucket:
+    """
+    Token bucket for a single provider.
+
+    Slots are reserved ahead of time: a caller takes a token immediately and
+    is told how long to wait for it, so concurrent callers queue up in order
+    without polling.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        """
+        Initialize the token bucket.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum number of tokens (burst size)
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated_at = time.monotonic()
+        self.paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens: float = 1.0, max_wait: Optional[float] = None) -> Optional[float]:
+        """
+        Reserve tokens and return how long the caller must wait for them.
+
+        Args:
+            tokens: Number of tokens to take
+            max_wait: Give up (without reserving) if the wait would be longer
+
+        Returns:
+            Wait time in seconds, or None if it would exceed max_wait
+        """
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+            self.updated_at = now
+
+            deficit = tokens - self.tokens
+            wait = max(deficit / self.rate if deficit > 0 else 0.0, self.paused_until - now)
+            if max_wait is not None and wait > max_wait:
+                return None
+
+            self.tokens -= tokens
+            return wait
+
+    def pause(self, seconds: float) -> None:
+        """Stop handing out slots for the given number of seconds."""
+        with self._lock:
+            self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+
+
+class RateLimiter:
+    """
+    Process-wide request scheduler with per-provider token buckets.
+
+    Providers without a configured quota are not limited.
+    """
+
+    def __init__(self, limits: Optional[Dict[str, Dict[str, float]]] = None):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            limits: Mapping of provider to {"requests", "period", "burst"}
+        """
+        self.buckets: Dict[str, TokenBucket] = {}
+        self.stats: Dict[str, Dict[str, Any]] = {}
+        self._throttle_streak: Dict[str, int] = {}
+
+        for provider, limit in (DEFAULT_RATE_LIMITS if limits is None else limits).items():
+            self.configure(provider, **limit)
+
+    def configure(self, provider: str, requests: float, period: float = 1.0,
+                  burst: Optional[float] = None) -> None:
+        """
+        Set the quota for a provider.
+
+        Args:
+            provider: Provider name
+            requests: Requests allowed per period
+            period: Period in seconds
+            burst: Maximum requests sent back-to-back (defaults to requests)
+        """
+        self.buckets[provider] = TokenBucket(
+            rate=requests / period,
+            capacity=max(1.0, burst if burst is not None else requests)
+        )
+        self.stats.setdefault(provider, {
+            "acquired": 0,
+            "rejected": 0,
+            "throttled": 0,
+            "wait_time": 0.0
+        })
+
+    def _reserve(self, provider: str, tokens: float, max_wait: Optional[float]) -> Optional[float]:
+        """Reserve a slot and update the provider statistics."""
+        bucket = self.buckets.get(provider)
+        if bucket is None:
+            return 0.0
+
+        wait = bucket.reserve(tokens, max_wait)
+        stats = self.stats[provider]
+        if wait is None:
+            stats["rejected"] += 1
+            logger.warning(f"Rate limit for {provider} would need more than {max_wait:.1f}s, skipping request")
+            return None
+
+        stats["acquired"] += 1
+        stats["wait_time"] += wait
+        return wait
+
+    async def acquire(self, provider: str, tokens: float = 1.0, max_wait: Optional[float] = None) -> bool:
+        """
+        Wait for a request slot.
+
+        Args:
+            provider: Provider name
+            tokens: Number of slots to take
+            max_wait: Return False instead of waiting longer than this
+
+        Returns:
+            True once the request may be sent, False if max_wait was exceeded
+        """
+        wait = self._reserve(provider, tokens, max_wait)
+        if wait is None:
+            return False
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return True
+
+    def acquire_sync(self, provider: str, tokens: float = 1.0, max_wait: Optional[float] = None) -> bool:
+        """
+        Blocking variant of acquire() for synchronous clients.
+
+        Args:
+            provider: Provider name
+            tokens: Number of slots to take
+            max_wait: Return False instead of waiting longer than this
+
+        Returns:
+            True once the request may be sent, False if max_wait was exceeded
+        """
+        wait = self._reserve(provider, tokens, max_wait)
+        if wait is None:
+            return False
+        if wait > 0:
+            time.sleep(wait)
+        return True
+
+    def pause(self, provider: str, seconds: float) -> None:
+        """
+        Pause a provider for every caller.
+
+        Args:
+            provider: Provider name
+            seconds: Pause length in seconds
+        """
+        bucket = self.buckets.get(provider)
+        if bucket is not None and seconds > 0:
+            bucket.pause(seconds)
+
+    def record_response(self, provider: str, status: int, headers: Optional[Mapping[str, str]] = None) -> None:
+        """
+        Feed a response back into the scheduler.
+
+        A 429 or 503 pauses the provider for the Retry-After delay, or for an
+        exponential backoff when the header is missing.
+
+        Args:
+            provider: Provider name
+            status: HTTP status code
+            headers: Response headers
+        """
+        if provider not in self.buckets:
+            return
+
+        if status not in (429, 503):
+            self._throttle_streak[provider] = 0
+            return
+
+        retry_after = None
+        for name, value in (headers or {}).items():
+            if name.lower() == "retry-after":
+                retry_after = parse_retry_after(value)
+                break
+
+        if retry_after is None:
+            if status == 503:
+                return
+            streak = self._throttle_streak.get(provider, 0)
+            self._throttle_streak[provider] = streak + 1
+            retry_after = min(MAX_BACKOFF, 2.0 ** streak)
+
+        self.stats[provider]["throttled"] += 1
+        logger.warning(f"{provider} throttled with {status}, pausing for {retry_after:.1f}s")
+        self.pause(provider, retry_after)
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get per-provider statistics.
+
+        Returns:
+            Dictionary of provider to acquired/rejected/throttled counters
+        """
+        return {provider: dict(stats) for provider, stats in self.stats.items()}
+
+
+# Global rate limiter instance
+_rate_limiter_instance = None
+
+def get_rate_limiter() -> RateLimiter:
+    """
+    Get the global rate limiter configured from ``rate_limits``.
+
+    Returns:
+        RateLimiter instance
+    """
+    global _rate_limiter_instance
+    if _rate_limiter_instance is None:
+        limits = dict(DEFAULT_RATE_LIMITS)
+        limits.update(get_config().get("rate_limits", None) or {})
+        _rate_limiter_instance = RateLimiter(limits)
+    return _rate_limiter_instance
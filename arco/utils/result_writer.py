@@ -0,0 +1,196 @@
+"""
+Streaming Result Writer for ARCO.
+
+This module writes pipeline results as JSON Lines: one qualified prospect
+per line, written (and flushed) as soon as it is produced, followed by a
+single trailer record with the run statistics. Files ending in ``.gz`` are
+gzip-compressed and files ending in ``.zst`` are zstd-compressed (requires
+zstandard). Records are serialized with orjson when it is installed.
+"""
+
+import dataclasses
+import gzip
+import json
+import time
+from datetime import datetime
+from enum import Enum
+from pathlib import Path
+from typing import Any, Callable, Dict, IO, Optional
+
+from arco.config.config_manager import get_config
+from arco.utils.logger import get_logger
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    zstandard = None
+    ZSTD_AVAILABLE = False
+
+logger = get_logger(__name__)
+
+JSONL_SUFFIXES = (".jsonl", ".jsonl.gz", ".jsonl.zst")
+TRAILER_TYPE = "trailer"
+
+
+def is_jsonl_path(path: Optional[str]) -> bool:
+    """Check whether an output path asks for JSON Lines output."""
+    return bool(path) and str(path).lower().endswith(JSONL_SUFFIXES)
+
+
+def json_default(value: Any) -> Any:
+    """Encode enums by value and datetimes in ISO format; anything else as a string (also used by checkpoints)."""
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+def _json_dumps(record: Dict[str, Any]) -> bytes:
+    """Serialize a record with the standard library."""
+    return json.dumps(record, default=json_default, ensure_ascii=False).encode("utf-8")
+
+
+def _orjson_dumps(record: Dict[str, Any]) -> bytes:
+    """Serialize a record with orjson."""
+    return orjson.dumps(record, default=str, option=orjson.OPT_NON_STR_KEYS)
+
+
+class JSONLResultWriter:
+    """
+    Append-only JSON Lines writer for qualified prospects.
+
+    Every record is flushed after ``flush_every`` writes, so results are
+    visible (and survive a crash) while the run is still going. The trailer
+    record carries ``"_type": "trailer"`` and is always the last line.
+    """
+
+    def __init__(self, path: str, serializer: str = "auto", flush_every: int = 1):
+        """
+        Initialize the result writer (the file is opened on the first write).
+
+        Args:
+            path: Output file; a ``.gz`` or ``.zst`` suffix selects compression
+            serializer: "orjson", "json" or "auto" (orjson when installed)
+            flush_every: Records written between flushes
+        """
+        self.path = Path(path)
+        if self.path.suffix == ".zst" and not ZSTD_AVAILABLE:
+            logger.warning("zstandard is not installed, writing gzip-compressed results instead")
+            self.path = self.path.with_suffix(".gz")
+
+        use_orjson = serializer == "orjson" or (serializer == "auto" and ORJSON_AVAILABLE)
+        if use_orjson and not ORJSON_AVAILABLE:
+            logger.warning("orjson is not installed, serializing results with json")
+            use_orjson = False
+        self._dumps: Callable[[Dict[str, Any]], bytes] = _orjson_dumps if use_orjson else _json_dumps
+
+        self.flush_every = max(1, flush_every)
+        self.count = 0
+        self.closed = False
+        self._file: Optional[IO[bytes]] = None
+        self._raw: Optional[IO[bytes]] = None
+        self._unflushed = 0
+
+    def _open(self) -> IO[bytes]:
+        """Open the output file lazily."""
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            if self.path.suffix == ".gz":
+                self._file = gzip.open(self.path, "wb", compresslevel=6)
+            elif self.path.suffix == ".zst":
+                self._raw = open(self.path, "wb")
+                self._file = zstandard.ZstdCompressor(level=3).stream_writer(self._raw)
+            else:
+                self._file = open(self.path, "wb")
+        return self._file
+
+    def _write_record(self, record: Dict[str, Any]) -> None:
+        """Write one record as a line."""
+        if self.closed:
+            raise ValueError(f"Result writer for {self.path} is closed")
+        self._open().write(self._dumps(record) + b"\n")
+
+    def write(self, prospect: Any) -> None:
+        """
+        Write one prospect.
+
+        Args:
+            prospect: QualifiedProspect (or any dataclass) or dictionary
+        """
+        # asdict() rather than to_dict(): the nested analysis objects of a
+        # Prospect do not all implement to_dict()
+        if isinstance(prospect, dict):
+            record = prospect
+        elif dataclasses.is_dataclass(prospect):
+            record = dataclasses.asdict(prospect)
+        else:
+            record = prospect.to_dict()
+        self._write_record(record)
+        self.count += 1
+        self._unflushed += 1
+        if self._unflushed >= self.flush_every:
+            self.flush()
+
+    def flush(self) -> None:
+        """Flush buffered records to disk."""
+        if self._file is not None and not self.closed:
+            self._file.flush()
+            self._unflushed = 0
+
+    def close(self, trailer: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Write the trailer record and close the file.
+
+        Args:
+            trailer: Extra trailer fields (e.g. pipeline_type and stats)
+
+        Returns:
+            Path of the written file
+        """
+        if self.closed:
+            return str(self.path)
+
+        self._write_record({
+            "_type": TRAILER_TYPE,
+            **(trailer or {}),
+            "prospect_count": self.count,
+            "written_at": time.time()
+        })
+        self._file.close()
+        if self._raw is not None:
+            self._raw.close()
+        self.closed = True
+        return str(self.path)
+
+    def __enter__(self) -> "JSONLResultWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close({"complete": exc_type is None})
+
+
+def open_result_writer(path: str) -> JSONLResultWriter:
+    """
+    Open a result writer configured from ``output``.
+
+    Args:
+        path: Output file
+
+    Returns:
+        JSONLResultWriter instance
+    """
+    config = get_config()
+    return JSONLResultWriter(
+        path,
+        serializer=config.get("output.serializer", "auto"),
+        flush_every=config.get("output.flush_every", 1)
+    )
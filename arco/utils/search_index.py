@@ -0,0 +1,230 @@
+"""
+Search Index for ARCO.
+
+This module provides a small in-memory inverted index for full-text search
+over tabular records (e.g. Apollo CSV exports). Queries are answered from
+the postings lists instead of scanning every record, support prefix
+matching, quoted phrases and field-scoped terms (``site:``, ``inurl:``,
+``industry:`` ...), and results are ranked.
+"""
+
+import math
+import re
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import Dict, Hashable, List, Optional, Set, Tuple
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_CLAUSE_RE = re.compile(r'(?:([A-Za-z_]+):)?(?:"([^"]*)"|(\S+))')
+
+# Score multiplier for a query token that only matches as a prefix
+PREFIX_MATCH_WEIGHT = 0.5
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split text into lowercase alphanumeric tokens.
+
+    Args:
+        text: Text to tokenize
+
+    Returns:
+        List of tokens in order
+    """
+    return _TOKEN_RE.findall(text.lower()) if text else []
+
+
+@dataclass
+class QueryClause:
+    """One term or quoted phrase of a parsed query."""
+
+    tokens: List[str]
+    fields: Optional[List[str]] = None  # None means every field
+    phrase: bool = False
+
+
+class SearchIndex:
+    """
+    Inverted index with prefix, phrase and field-scoped search.
+
+    Every clause of a query must match (AND). A clause matches a document
+    when all of its tokens occur in one of the clause's fields; unquoted
+    tokens may also match as a prefix of an indexed token, quoted phrases
+    must match exactly and in order. Documents are ranked by the sum of
+    field weight x IDF of the matched tokens.
+    """
+
+    def __init__(self, field_weights: Dict[str, float], aliases: Optional[Dict[str, str]] = None):
+        """
+        Initialize the search index.
+
+        Args:
+            field_weights: Mapping of indexed field name to ranking weight
+            aliases: Mapping of query field names to indexed field names
+                     (e.g. {"site": "website"}); unknown query fields search every field
+        """
+        self.field_weights = dict(field_weights)
+        self.aliases = {name.lower(): field for name, field in (aliases or {}).items()}
+        self.aliases.update({field.lower(): field for field in self.field_weights})
+
+        self._postings: Dict[str, Dict[str, Set[Hashable]]] = {}
+        self._doc_freq: Dict[str, int] = {}
+        self._texts: Dict[Hashable, Dict[str, str]] = {}
+        self._order: Dict[Hashable, int] = {}
+        self._sorted_terms: Optional[List[str]] = None
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def add(self, doc_id: Hashable, fields: Dict[str, str]) -> None:
+        """
+        Index a document.
+
+        Args:
+            doc_id: Unique document identifier
+            fields: Mapping of field name to text (fields without a weight are ignored)
+        """
+        if doc_id in self._order:
+            return
+
+        self._order[doc_id] = len(self._order)
+        texts = {}
+        doc_terms: Set[str] = set()
+        for field in self.field_weights:
+            tokens = tokenize(fields.get(field) or "")
+            if not tokens:
+                continue
+            texts[field] = " ".join(tokens)
+            doc_terms.update(tokens)
+            for token in tokens:
+                self._postings.setdefault(token, {}).setdefault(field, set()).add(doc_id)
+
+        for token in doc_terms:
+            self._doc_freq[token] = self._doc_freq.get(token, 0) + 1
+        self._texts[doc_id] = texts
+        self._sorted_terms = None
+
+    def parse_query(self, query: str) -> List[QueryClause]:
+        """
+        Parse a query into clauses.
+
+        Args:
+            query: Query such as '"add to cart" site:myshopify.com serum'
+
+        Returns:
+            List of clauses (clauses without tokens are dropped)
+        """
+        clauses = []
+        for field_name, phrase, term in _CLAUSE_RE.findall(query or ""):
+            tokens = tokenize(phrase if phrase else term)
+            if not tokens:
+                continue
+
+            fields = None
+            if field_name:
+                field = self.aliases.get(field_name.lower())
+                fields = [field] if field else None
+
+            clauses.append(QueryClause(tokens=tokens, fields=fields, phrase=bool(phrase)))
+        return clauses
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[Tuple[Hashable, float]]:
+        """
+        Search the index.
+
+        Args:
+            query: Query string (see parse_query)
+            limit: Maximum number of results
+
+        Returns:
+            List of (doc_id, score), best first; an empty query returns every
+            document in insertion order
+        """
+        clauses = self.parse_query(query)
+        if not clauses:
+            docs = sorted(self._order, key=self._order.get)
+            return [(doc_id, 0.0) for doc_id in docs[:limit]]
+
+        scores: Optional[Dict[Hashable, float]] = None
+        for clause in clauses:
+            clause_scores = self._match_clause(clause)
+            if scores is None:
+                scores = clause_scores
+            else:
+                scores = {doc_id: score + clause_scores[doc_id]
+                          for doc_id, score in scores.items() if doc_id in clause_scores}
+            if not scores:
+                return []
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], self._order[item[0]]))
+        return ranked[:limit] if limit is not None else ranked
+
+    def _match_clause(self, clause: QueryClause) -> Dict[Hashable, float]:
+        """Score every document matching a clause in at least one of its fields."""
+        best: Dict[Hashable, float] = {}
+
+        for field in clause.fields or list(self.field_weights):
+            field_scores: Optional[Dict[Hashable, float]] = None
+
+            for token in clause.tokens:
+                token_scores = self._match_token(token, field, prefix=not clause.phrase)
+                if field_scores is None:
+                    field_scores = token_scores
+                else:
+                    field_scores = {doc_id: score + token_scores[doc_id]
+                                    for doc_id, score in field_scores.items() if doc_id in token_scores}
+                if not field_scores:
+                    break
+
+            if not field_scores:
+                continue
+
+            if clause.phrase and len(clause.tokens) > 1:
+                phrase = f" {' '.join(clause.tokens)} "
+                field_scores = {doc_id: score for doc_id, score in field_scores.items()
+                                if phrase in f" {self._texts[doc_id].get(field, '')} "}
+
+            weight = self.field_weights[field]
+            for doc_id, score in field_scores.items():
+                best[doc_id] = max(best.get(doc_id, 0.0), score * weight)
+
+        return best
+
+    def _match_token(self, token: str, field: str, prefix: bool) -> Dict[Hashable, float]:
+        """Score documents containing a token (or, optionally, a token it prefixes) in a field."""
+        scores: Dict[Hashable, float] = {}
+
+        exact = self._postings.get(token, {}).get(field)
+        if exact:
+            idf = self._idf(token)
+            for doc_id in exact:
+                scores[doc_id] = idf
+
+        if prefix:
+            for term in self._expand_prefix(token):
+                docs = self._postings[term].get(field)
+                if not docs:
+                    continue
+                idf = self._idf(term) * PREFIX_MATCH_WEIGHT
+                for doc_id in docs:
+                    if scores.get(doc_id, 0.0) < idf:
+                        scores[doc_id] = idf
+
+        return scores
+
+    def _expand_prefix(self, prefix: str) -> List[str]:
+        """Get the indexed terms that start with (but are not equal to) a prefix."""
+        if self._sorted_terms is None:
+            self._sorted_terms = sorted(self._postings)
+
+        terms = []
+        index = bisect_left(self._sorted_terms, prefix)
+        while index < len(self._sorted_terms) and self._sorted_terms[index].startswith(prefix):
+            if self._sorted_terms[index] != prefix:
+                terms.append(self._sorted_terms[index])
+            index += 1
+        return terms
+
+    def _idf(self, term: str) -> float:
+        """Inverse document frequency of a term."""
+        return math.log(1 + len(self._order) / self._doc_freq[term])
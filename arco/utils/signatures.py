@@ -0,0 +1,406 @@
+"""
+SaaS and Technology Signatures for ARCO.
+
+This module holds the HTML signatures every vendor/technology detector
+uses, in one registry, and scans a page for all of them at once. The
+literal signatures of every detector are compiled into a single
+Aho-Corasick automaton (pyahocorasick) so a page is scanned once in linear
+time, whatever the number of signatures; without pyahocorasick each
+distinct literal is searched for with str.find, once per page. Every hit
+comes back with its match offsets.
+
+Signatures are matched against the lowercased page. Literal signatures
+are lowercase strings; the few signatures that need a regular expression
+declare literal anchors that must all be present before the expression is
+run.
+"""
+
+import logging
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, List, Match, Optional, Pattern, Tuple, Union
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    ahocorasick = None
+    AHOCORASICK_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class RegexSignature:
+    """Signature that needs a regular expression."""
+
+    pattern: str
+    anchors: Tuple[str, ...]  # literals the expression cannot match without
+    compiled: Pattern = field(init=False, compare=False, repr=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "compiled", re.compile(self.pattern))
+
+
+Signature = Union[str, RegexSignature]
+
+# Signature groups: group -> vendor/technology -> signatures, in detection order
+SIGNATURES: Dict[str, Dict[str, Tuple[Signature, ...]]] = {
+    # FootprintCollector._detect_saas_apps
+    "footprint": {
+        "klaviyo": ("klaviyo.com", "klaviyo-media.com", "klviyo.com", "static.klaviyo.com"),
+        "mailchimp": ("mailchimp.com", "mctk.com", "chimpstatic.com", "list-manage.com"),
+        "sendgrid": ("sendgrid.net", "sendgrid.com", "sgwidgets.com"),
+        "hotjar": ("hotjar.com", "hjdebug.com", "static.hotjar.com"),
+        "mixpanel": ("mixpanel.com", "mxpnl.com", "api.mixpanel.com"),
+        "fullstory": ("fullstory.com", "fs.com"),
+        "zendesk": ("zendesk.com", "zdassets.com", "zdchat.com"),
+        "intercom": ("intercom.io", "intercom.com", "intercomcdn.com"),
+        "drift": ("drift.com", "driftt.com"),
+        "typeform": ("typeform.com", "tfstatic.com"),
+        "jotform": ("jotform.com", "jotfor.ms"),
+        "recharge": ("rechargeapps.com", "rechargepayments.com"),
+        "loop": ("loop.com", "getloop.com"),
+        "yotpo": ("yotpo.com", "yotpoassets.com"),
+        "optimizely": ("optimizely.com", "optimcdn.com"),
+        "vwo": ("vwo.com", "visualwebsiteoptimizer.com"),
+        "shopify": ("shopify.com", "myshopify.com", "shopifycdn.com"),
+        "google_analytics": ("google-analytics.com", "googletagmanager.com"),
+    },
+    # LeakEngine._detect_saas_via_http
+    "leak_engine": {
+        "klaviyo": ("klaviyo.com", "klaviyo-media", "kla.js"),
+        "gorgias": ("gorgias.com", "gorgias-chat", "helpdesk.gorgias"),
+        "recharge": ("rechargepayments.com", "recharge-api"),
+        "typeform": ("typeform.com", "typeform.js", "embed.typeform"),
+        "shopify": ("shopify.com", "shopify-analytics", "shopify_stats"),
+        "hotjar": ("hotjar.com", "hjar"),
+        "intercom": ("intercom.io", "intercom.js"),
+        "zendesk": ("zendesk.com", "zopim.com"),
+    },
+    # LeakScanner.scan_domain_for_leaks
+    "leak_scanner": {
+        "typeform": ("cdn.typeform.com", "scripts.typeform.com"),
+        "klaviyo": ("js.klaviyo.com", "a.klaviyo.com"),
+        "hubspot": ("js.hs-scripts.com", "js.hsforms.com"),
+        "mailchimp": ("js.mailchimp.com", RegexSignature(r"us\d+\.api\.mailchimp\.com", (".api.mailchimp.com",))),
+        "recharge": ("rechargepayments.com", "rechargeapps.com"),
+        "loop": ("loopreturns.com", "getloop.com"),
+        "yotpo_subscriptions": (RegexSignature(r"yotpo\.com.*subscription", ("yotpo.com", "subscription")),
+                                "yotpo-subscriptions"),
+    },
+    # TechnologyAnalysisService._detect_from_html
+    "technology": {
+        "wordpress": ("wp-content", "wordpress"),
+        "react": ("react",),
+        "angular": ("angular", "ng-"),
+        "jquery": (RegexSignature(r"jquery[/-](\d+\.\d+\.\d+)", ("jquery",)),),
+        "bootstrap": ("bootstrap",),
+        "flash": ("flash", ".swf"),
+        "silverlight": ("silverlight",),
+        "java_applet": ("java-applet", "<applet"),
+    },
+    # WappalyzerIntegration._analyze_with_http_fallback
+    "wappalyzer_fallback": {
+        "wordpress": ("wp-content",),
+        "shopify": ("shopify",),
+        "google_analytics": ("gtag", "google-analytics"),
+        "klaviyo": ("klaviyo",),
+        "hubspot": ("hubspot",),
+        "typeform": ("typeform",),
+    },
+}
+
+
+class SignatureHits:
+    """
+    Signature hits of one page, with the offsets of every match.
+
+    With the automaton every offset is known after the scan. Without it,
+    presence is checked per signature on first use (so detectors that only
+    ask which vendors matched stop at the first occurrence) and offsets
+    are located when asked for.
+    """
+
+    def __init__(self, text: str, matcher: 'SignatureMatcher',
+                 offsets: Optional[Dict[Signature, List[int]]] = None):
+        """
+        Initialize the hits.
+
+        Args:
+            text: Lowercased page
+            matcher: Matcher that scanned the page
+            offsets: Offsets of every matched signature, if already scanned
+        """
+        self._text = text
+        self._matcher = matcher
+        self._complete = offsets is not None
+        self._offsets: Dict[Signature, List[int]] = offsets if offsets is not None else {}
+        self._present: Dict[Signature, bool] = {}
+
+    def __contains__(self, signature: Signature) -> bool:
+        if self._complete:
+            return signature in self._offsets
+        present = self._present.get(signature)
+        if present is None:
+            if isinstance(signature, RegexSignature):
+                present = (all(anchor in self for anchor in signature.anchors) and
+                           signature.compiled.search(self._text) is not None)
+            else:
+                present = signature in self._text
+            self._present[signature] = present
+        return present
+
+    def get(self, signature: Signature) -> List[int]:
+        """
+        Get the match offsets of a signature.
+
+        Args:
+            signature: Literal or regex signature
+
+        Returns:
+            Start offsets in the lowercased page (empty if it did not match)
+        """
+        if self._complete or signature in self._offsets:
+            return self._offsets.get(signature, [])
+        if signature not in self:
+            return []
+        if isinstance(signature, RegexSignature):
+            offsets = [match.start() for match in signature.compiled.finditer(self._text)]
+        else:
+            offsets = _find_all(self._text, signature)
+        self._offsets[signature] = offsets
+        return offsets
+
+    def first_match(self, signature: RegexSignature) -> Optional[Match]:
+        """
+        Get the first match of a regex signature, for reading its groups.
+
+        The expression is re-run at the recorded offset only, not over the page.
+
+        Args:
+            signature: Regex signature
+
+        Returns:
+            Match object on the lowercased page, or None if it did not match
+        """
+        offsets = self.get(signature)
+        return signature.compiled.match(self._text, offsets[0]) if offsets else None
+
+    @property
+    def offsets(self) -> Dict[Signature, List[int]]:
+        """Offsets of every matched signature."""
+        if not self._complete:
+            for signature in self._matcher.literals + self._matcher.regexes:
+                self.get(signature)
+            self._complete = True
+            self._offsets = {signature: offsets for signature, offsets in self._offsets.items() if offsets}
+        return self._offsets
+
+    def group(self, name: str) -> Dict[str, Dict[Signature, List[int]]]:
+        """
+        Get the matched vendors of a signature group.
+
+        Args:
+            name: Signature group name
+
+        Returns:
+            Dictionary of vendor to {signature: offsets} for its matched
+            signatures, in the group's detection order
+        """
+        matched = {}
+        for vendor, signatures in self._matcher.groups[name].items():
+            vendor_hits = {signature: self.get(signature) for signature in signatures if signature in self}
+            if vendor_hits:
+                matched[vendor] = vendor_hits
+        return matched
+
+    def vendors(self, name: str) -> List[str]:
+        """Get the names of the matched vendors of a signature group, in detection order."""
+        return [vendor for vendor, signatures in self._matcher.groups[name].items()
+                if any(signature in self for signature in signatures)]
+
+
+def _find_all(text: str, literal: str) -> List[int]:
+    """Find the start offsets of every (possibly overlapping) occurrence of a literal."""
+    offsets = []
+    start = text.find(literal)
+    while start != -1:
+        offsets.append(start)
+        start = text.find(literal, start + 1)
+    return offsets
+
+
+class SignatureMatcher:
+    """
+    Signature groups compiled for single-pass scanning.
+
+    Literal signatures (and regex anchors) of all groups are deduplicated
+    and compiled into one automaton; regex signatures only run when all of
+    their anchors were found.
+    """
+
+    def __init__(self, groups: Optional[Dict[str, Dict[str, Tuple[Signature, ...]]]] = None):
+        """
+        Compile signature groups.
+
+        Args:
+            groups: Signature groups (defaults to SIGNATURES)
+        """
+        self.groups = groups if groups is not None else SIGNATURES
+
+        literals = set()
+        regexes = {}
+        for vendors in self.groups.values():
+            for signatures in vendors.values():
+                for signature in signatures:
+                    if isinstance(signature, RegexSignature):
+                        regexes[signature] = None
+                        literals.update(signature.anchors)
+                    else:
+                        literals.add(signature)
+        self.literals: Tuple[str, ...] = tuple(sorted(literals))
+        self.regexes: Tuple[RegexSignature, ...] = tuple(regexes)
+        self.max_literal_length = max(map(len, self.literals), default=0)
+
+        self._automaton = None
+        if AHOCORASICK_AVAILABLE and self.literals:
+            self._automaton = ahocorasick.Automaton()
+            for literal in self.literals:
+                self._automaton.add_word(literal, (len(literal) - 1, literal))
+            self._automaton.make_automaton()
+
+    def stream(self) -> 'SignatureStream':
+        """
+        Start an incremental scan of a page that arrives in chunks.
+
+        Returns:
+            SignatureStream to feed the page to
+        """
+        return SignatureStream(self)
+
+    def scan(self, text: str, lowered: bool = False) -> SignatureHits:
+        """
+        Scan a page for every signature.
+
+        Args:
+            text: Page content
+            lowered: Whether the text is already lowercased
+
+        Returns:
+            SignatureHits for the page
+        """
+        stream = self.stream()
+        stream.feed(text, lowered=lowered)
+        return stream.close()
+
+
+class SignatureStream:
+    """
+    Incremental signature scan of a page that arrives in chunks.
+
+    Each chunk is lowercased and, with the automaton, scanned as soon as it
+    is fed; the end of the previous chunk is rescanned with it so that
+    signatures spanning a chunk boundary are found once. Regex signatures
+    run on the whole page when the stream is closed.
+    """
+
+    def __init__(self, matcher: SignatureMatcher):
+        """
+        Initialize the stream.
+
+        Args:
+            matcher: Matcher to scan with
+        """
+        self._matcher = matcher
+        self._parts: List[str] = []
+        self._length = 0
+        self._tail = ""
+        self._offsets: Dict[Signature, List[int]] = {}
+        self._hits: Optional[SignatureHits] = None
+
+    def feed(self, chunk: str, lowered: bool = False) -> None:
+        """
+        Scan the next chunk of the page.
+
+        Args:
+            chunk: Next chunk of page content
+            lowered: Whether the chunk is already lowercased
+        """
+        if self._hits is not None:
+            raise ValueError("Signature stream is closed")
+        if not chunk:
+            return
+        if not lowered:
+            chunk = chunk.lower()
+
+        automaton = self._matcher._automaton
+        if automaton is not None:
+            window = self._tail + chunk
+            base = self._length - len(self._tail)
+            for end, (length, literal) in automaton.iter(window):
+                # Matches ending in the tail were reported with the previous chunk
+                if end >= len(self._tail):
+                    self._offsets.setdefault(literal, []).append(base + end - length)
+            keep = self._matcher.max_literal_length - 1
+            self._tail = window[-keep:] if keep > 0 else ""
+
+        self._parts.append(chunk)
+        self._length += len(chunk)
+
+    @property
+    def text(self) -> str:
+        """Lowercased page fed so far."""
+        if len(self._parts) > 1:
+            self._parts = ["".join(self._parts)]
+        return self._parts[0] if self._parts else ""
+
+    def close(self) -> SignatureHits:
+        """
+        Finish the scan.
+
+        Returns:
+            SignatureHits for the whole page
+        """
+        if self._hits is None:
+            text = self.text
+            if self._matcher._automaton is None:
+                self._hits = SignatureHits(text, self._matcher)
+            else:
+                offsets = self._offsets
+                for signature in self._matcher.regexes:
+                    if all(anchor in offsets for anchor in signature.anchors):
+                        regex_offsets = [match.start() for match in signature.compiled.finditer(text)]
+                        if regex_offsets:
+                            offsets[signature] = regex_offsets
+                self._hits = SignatureHits(text, self._matcher, offsets)
+        return self._hits
+
+
+@lru_cache(maxsize=1)
+def get_signature_matcher() -> SignatureMatcher:
+    """
+    Get the shared matcher compiled from the signature registry.
+
+    Returns:
+        SignatureMatcher instance
+    """
+    matcher = SignatureMatcher()
+    logger.debug(f"Compiled {len(matcher.literals)} literal and {len(matcher.regexes)} regex signatures "
+                 f"({'aho-corasick' if AHOCORASICK_AVAILABLE else 'str.find'})")
+    return matcher
+
+
+def scan_signatures(text: str, lowered: bool = False) -> SignatureHits:
+    """
+    Scan a page for every registered signature in one pass.
+
+    Args:
+        text: Page content
+        lowered: Whether the text is already lowercased
+
+    Returns:
+        SignatureHits for the page
+    """
+    return get_signature_matcher().scan(text, lowered=lowered)
@@ -25,7 +25,9 @@ import socket
 import sys
 import os
 sys.path.append(os.path.join(os.path.dirname(__file__)))
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from icp_kernel import ICPKernel
+from arco.utils.signatures import SIGNATURES, scan_signatures
 
 @dataclass
 class FootprintResult:
@@ -79,104 +81,8 @@ class FootprintCollector:
             'Connection': 'keep-alive',
         }
         
-        # SaaS Detection Patterns (otimizado)
-        self.saas_patterns = {
-            # Email Marketing
-            'klaviyo': [
-                r'klaviyo\.com',
-                r'klaviyo-media\.com',
-                r'klviyo\.com',
-                r'static\.klaviyo\.com'
-            ],
-            'mailchimp': [
-                r'mailchimp\.com',
-                r'mctk\.com',
-                r'chimpstatic\.com',
-                r'list-manage\.com'
-            ],
-            'sendgrid': [
-                r'sendgrid\.net',
-                r'sendgrid\.com',
-                r'sgwidgets\.com'
-            ],
-            
-            # Analytics
-            'hotjar': [
-                r'hotjar\.com',
-                r'hjdebug\.com',
-                r'static\.hotjar\.com'
-            ],
-            'mixpanel': [
-                r'mixpanel\.com',
-                r'mxpnl\.com',
-                r'api\.mixpanel\.com'
-            ],
-            'fullstory': [
-                r'fullstory\.com',
-                r'fs\.com'
-            ],
-            
-            # Customer Support
-            'zendesk': [
-                r'zendesk\.com',
-                r'zdassets\.com',
-                r'zdchat\.com'
-            ],
-            'intercom': [
-                r'intercom\.io',
-                r'intercom\.com',
-                r'intercomcdn\.com'
-            ],
-            'drift': [
-                r'drift\.com',
-                r'driftt\.com'
-            ],
-            
-            # Forms
-            'typeform': [
-                r'typeform\.com',
-                r'tfstatic\.com'
-            ],
-            'jotform': [
-                r'jotform\.com',
-                r'jotfor\.ms'
-            ],
-            
-            # Subscriptions  
-            'recharge': [
-                r'rechargeapps\.com',
-                r'rechargepayments\.com'
-            ],
-            'loop': [
-                r'loop\.com',
-                r'getloop\.com'
-            ],
-            'yotpo': [
-                r'yotpo\.com',
-                r'yotpoassets\.com'
-            ],
-            
-            # Optimization
-            'optimizely': [
-                r'optimizely\.com',
-                r'optimcdn\.com'
-            ],
-            'vwo': [
-                r'vwo\.com',
-                r'visualwebsiteoptimizer\.com'
-            ],
-            
-            # Others
-            'shopify': [
-                r'shopify\.com',
-                r'myshopify\.com',
-                r'shopifycdn\.com'
-            ],
-            'google_analytics': [
-                r'google-analytics\.com',
-                r'googletagmanager\.com'
-            ]
-        }
+        # SaaS Detection Patterns (registry compartilhado em arco.utils.signatures)
+        self.saas_patterns = SIGNATURES['footprint']
         
         print("🔍 FOOTPRINT COLLECTOR INITIALIZED")
         print("=" * 45)
@@ -305,16 +211,8 @@ class FootprintCollector:
     async def _detect_saas_apps(self, content: str) -> List[str]:
         """Detecta SaaS apps no conteúdo"""
         
-        detected = []
-        content_lower = content.lower()
-        
-        for app_name, patterns in self.saas_patterns.items():
-            for pattern in patterns:
-                if re.search(pattern, content_lower):
-                    detected.append(app_name)
-                    break  # Stop after first match for this app
-        
-        return list(set(detected))  # Remove duplicates
+        # Single pass over the page for every signature
+        return scan_signatures(content).vendors('footprint')
 
     async def _extract_metadata(self, content: str) -> Dict[str, str]:
         """Extrai metadados básicos"""
@@ -7,7 +7,6 @@ Main entry point for the ARCO system.
 import argparse
 import logging
 import sys
-import asyncio
 from pathlib import Path
 from typing import List, Optional
 
@@ -50,7 +49,8 @@ def parse_arguments():
         "--output", 
         type=str, 
         default=None,
-        help="Output file for results (default: auto-generated in output/ directory)"
+        help="Output file for results (default: auto-generated in output/ directory); "
+             ".jsonl, .jsonl.gz and .jsonl.zst files are written as results are produced"
     )
     parser.add_argument(
         "--limit",
@@ -58,6 +58,13 @@ def parse_arguments():
         default=20,
         help="Limit the number of results (for search queries in advanced pipeline)"
     )
+    parser.add_argument(
+        "--resume",
+        type=str,
+        default=None,
+        metavar="RUN_ID",
+        help="Resume a checkpointed run, skipping domains it already completed"
+    )
     parser.add_argument(
         "--debug", 
         action="store_true", 
@@ -68,19 +75,58 @@ def parse_arguments():
 
 from arco.core.container import get_container
 from arco.core.service_configuration import get_configured_container
+from arco.pipelines import StandardPipeline, AdvancedPipeline
+from arco.pipelines.checkpoint import RunCheckpoint, open_checkpoint
+from arco.utils.result_writer import is_jsonl_path
 
-async def run_pipeline(pipeline_type: str, config_path: str, input_data: Optional[str], 
-                      output_path: Optional[str], limit: int = 20):
+def run_pipeline(pipeline_type: str, config_path: str, input_data: Optional[str], 
+                 output_path: Optional[str], limit: int = 20, resume: Optional[str] = None):
     """
     Run the specified pipeline with the given parameters.
     
+    Synchronous on purpose: the pipelines' run methods start (and close)
+    their own event loop, so they must not be called from a running one.
+    
     Args:
         pipeline_type: Type of pipeline to run ('standard' or 'advanced')
         config_path: Path to the configuration file
         input_data: Input file path or search query
         output_path: Output file path
         limit: Maximum number of results for search queries
+        resume: ID of a checkpointed run to resume (its pipeline type, input
+            and output are reused unless given explicitly)
     """
+    # Open the run checkpoint (a new run unless resuming)
+    checkpoint = open_checkpoint(resume)
+    if resume:
+        run = checkpoint.get_run() if checkpoint else None
+        if run is None:
+            logger.error(f"No checkpointed run found with ID: {resume}")
+            return None
+        pipeline_type = run["pipeline_type"]
+        input_data = input_data or run["input"]
+        output_path = output_path or run["options"].get("output")
+        logger.info(f"Resuming run {resume} ({run['status']}), recorded results: {run['items']}")
+    elif checkpoint:
+        logger.info(f"Checkpointing run {checkpoint.run_id} (resume with --resume {checkpoint.run_id})")
+    if checkpoint:
+        checkpoint.start(pipeline_type, input_data, {"output": output_path, "limit": limit})
+    
+    try:
+        results = _run_checkpointed(pipeline_type, input_data, output_path, limit, checkpoint)
+    except BaseException:
+        if checkpoint:
+            checkpoint.finish("failed")
+            logger.error(f"Run {checkpoint.run_id} failed, resume with --resume {checkpoint.run_id}")
+        raise
+    
+    if checkpoint:
+        checkpoint.finish()
+    return results
+
+def _run_checkpointed(pipeline_type: str, input_data: Optional[str], output_path: Optional[str],
+                      limit: int, checkpoint: Optional[RunCheckpoint]):
+    """Resolve the pipeline and run it, recording results in the checkpoint."""
     logger.info(f"Running {pipeline_type} pipeline")
     
     container = get_configured_container()
@@ -91,27 +137,34 @@ async def run_pipeline(pipeline_type: str, config_path: str, input_data: Optiona
     else:
         pipeline = container.resolve(AdvancedPipeline)
     
+    # Stream JSON Lines output while the pipeline runs
+    if is_jsonl_path(output_path):
+        pipeline.open_result_stream(output_path)
+    
     # Run the pipeline
+    saved = False
     if input_data:
         # Check if input is a file or a search query
         if Path(input_data).exists():
             logger.info(f"Using input file: {input_data}")
-            results = pipeline.run_from_file(input_data, output_path)
+            results = pipeline.run_from_file(input_data, output_path, checkpoint=checkpoint)
+            saved = bool(output_path)
         else:
             # For advanced pipeline, treat as search query
             if pipeline_type == "advanced":
                 logger.info(f"Using search query: {input_data} (limit: {limit})")
-                results = pipeline.run(input_data)
+                results = pipeline.run(input_data, checkpoint=checkpoint)
             else:
                 logger.error(f"Input file not found: {input_data}")
                 return None
     else:
         # Run with default settings
         logger.info("Running with default settings")
-        results = pipeline.run([])
+        results = pipeline.run([], checkpoint=checkpoint)
     
-    # Save results if not already saved by run_from_file
-    if results and output_path:
+    # Save results if not already saved by run_from_file (a result stream
+    # always gets its trailer)
+    if output_path and not saved and (results or is_jsonl_path(output_path)):
         pipeline.save_results(results, output_path)
     
     # Display statistics
@@ -140,13 +193,14 @@ def main():
     
     try:
         # Run the pipeline
-        results = asyncio.run(run_pipeline(
+        results = run_pipeline(
             pipeline_type=args.pipeline,
             config_path=args.config,
             input_data=args.input,
             output_path=args.output,
-            limit=args.limit
-        ))
+            limit=args.limit,
+            resume=args.resume
+        )
         
         if results:
             logger.info(f"Pipeline execution completed successfully")
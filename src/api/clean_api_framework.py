@@ -14,8 +14,14 @@ from datetime import datetime, timedelta
 from dataclasses import dataclass
 import time
 
+from arco.utils.http_cache import CachedResponse, HTTPResponseCache, get_http_cache
+from arco.utils.rate_limiter import get_rate_limiter
+
 logger = logging.getLogger(__name__)
 
+# Longest a call may block waiting for a rate limit slot before giving up
+RATE_LIMIT_MAX_WAIT = 30
+
 
 @dataclass
 class APICredentials:
@@ -48,43 +54,13 @@ class APIResponse:
     from_cache: bool = False
 
 
-class APIRateLimiter:
-    """Simple rate limiting to respect API limits"""
-    
-    def __init__(self):
-        self.last_calls = {}
-        self.call_counts = {}
-    
-    def can_make_call(self, api_name: str, calls_per_minute: int = 60) -> bool:
-        """Check if we can make an API call within rate limits"""
-        now = datetime.now()
-        minute_ago = now - timedelta(minutes=1)
-        
-        # Clean old calls
-        if api_name in self.last_calls:
-            self.last_calls[api_name] = [
-                call_time for call_time in self.last_calls[api_name]
-                if call_time > minute_ago
-            ]
-        else:
-            self.last_calls[api_name] = []
-        
-        return len(self.last_calls[api_name]) < calls_per_minute
-    
-    def record_call(self, api_name: str):
-        """Record an API call"""
-        if api_name not in self.last_calls:
-            self.last_calls[api_name] = []
-        self.last_calls[api_name].append(datetime.now())
-
-
 class MetaAdsAPIClient:
     """Clean Meta Ads API client with proper error handling"""
     
     def __init__(self, credentials: APICredentials):
         self.credentials = credentials
         self.base_url = "https://graph.facebook.com/v18.0"
-        self.rate_limiter = APIRateLimiter()
+        self.rate_limiter = get_rate_limiter()
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'ArcoFind/1.0 Lead Intelligence Platform'
@@ -99,7 +75,7 @@ class MetaAdsAPIClient:
             )
         
         try:
-            if not self.rate_limiter.can_make_call('meta_test'):
+            if not self.rate_limiter.acquire_sync('meta_graph', max_wait=RATE_LIMIT_MAX_WAIT):
                 return APIResponse(
                     success=False,
                     error="Rate limit exceeded",
@@ -113,7 +89,7 @@ class MetaAdsAPIClient:
             }
             
             response = self.session.get(url, params=params, timeout=15)
-            self.rate_limiter.record_call('meta_test')
+            self.rate_limiter.record_response('meta_graph', response.status_code, response.headers)
             
             if response.status_code == 200:
                 data = response.json()
@@ -161,7 +137,7 @@ class MetaAdsAPIClient:
             )
         
         try:
-            if not self.rate_limiter.can_make_call('meta_ads_library', 200):  # Higher limit for ads library
+            if not self.rate_limiter.acquire_sync('meta_ads', max_wait=RATE_LIMIT_MAX_WAIT):
                 return APIResponse(
                     success=False,
                     error="Rate limit exceeded for ads library",
@@ -179,7 +155,7 @@ class MetaAdsAPIClient:
             }
             
             response = self.session.get(url, params=params, timeout=30)
-            self.rate_limiter.record_call('meta_ads_library')
+            self.rate_limiter.record_response('meta_ads', response.status_code, response.headers)
             
             if response.status_code == 200:
                 data = response.json()
@@ -232,7 +208,7 @@ class MetaAdsAPIClient:
             )
         
         try:
-            if not self.rate_limiter.can_make_call('meta_page_info'):
+            if not self.rate_limiter.acquire_sync('meta_graph', max_wait=RATE_LIMIT_MAX_WAIT):
                 return APIResponse(
                     success=False,
                     error="Rate limit exceeded",
@@ -246,7 +222,7 @@ class MetaAdsAPIClient:
             }
             
             response = self.session.get(url, params=params, timeout=15)
-            self.rate_limiter.record_call('meta_page_info')
+            self.rate_limiter.record_response('meta_graph', response.status_code, response.headers)
             
             if response.status_code == 200:
                 data = response.json()
@@ -275,7 +251,7 @@ class GoogleAdsAPIClient:
     
     def __init__(self, credentials: APICredentials):
         self.credentials = credentials
-        self.rate_limiter = APIRateLimiter()
+        self.rate_limiter = get_rate_limiter()
         self.session = requests.Session()
     
     def test_connection(self) -> APIResponse:
@@ -304,7 +280,7 @@ class GoogleAdsAPIClient:
 class UnifiedAPIClient:
     """Unified client for both Meta and Google APIs"""
     
-    def __init__(self, credentials: APICredentials = None):
+    def __init__(self, credentials: APICredentials = None, http_cache: HTTPResponseCache = None):
         if credentials is None:
             credentials = APICredentials()
         
@@ -312,8 +288,8 @@ class UnifiedAPIClient:
         self.meta_client = MetaAdsAPIClient(credentials)
         self.google_client = GoogleAdsAPIClient(credentials)
         
-        # Simple in-memory cache
-        self.cache = {}
+        # Persistent response cache shared with the arco engines
+        self.cache = http_cache or get_http_cache()
         self.cache_ttl = timedelta(minutes=30)
     
     def test_all_connections(self) -> Dict[str, APIResponse]:
@@ -342,19 +318,24 @@ class UnifiedAPIClient:
         results = {}
         
         # Try Meta first
+        cache_url = f"{self.meta_client.base_url}/ads_archive"
+        
         for keyword in industry_keywords:
-            cache_key = f"meta_ads_{keyword}_{'_'.join(countries)}"
+            cache_params = {
+                'search_terms': keyword,
+                'ad_reached_countries': ','.join(countries),
+                'limit': limit
+            }
             
             # Check cache first
-            if cache_key in self.cache:
-                cached_data, cached_time = self.cache[cache_key]
-                if datetime.now() - cached_time < self.cache_ttl:
-                    results[f"meta_{keyword}"] = APIResponse(
-                        success=True,
-                        data=cached_data,
-                        from_cache=True
-                    )
-                    continue
+            cached = self.cache.get("GET", cache_url, cache_params)
+            if cached is not None:
+                results[f"meta_{keyword}"] = APIResponse(
+                    success=True,
+                    data=cached.json(),
+                    from_cache=True
+                )
+                continue
             
             # Make API call
             response = self.meta_client.search_ads_library(keyword, countries, limit)
@@ -362,13 +343,26 @@ class UnifiedAPIClient:
             
             # Cache successful responses
             if response.success and response.data:
-                self.cache[cache_key] = (response.data, datetime.now())
+                self.cache.put(
+                    "GET", cache_url, cache_params,
+                    CachedResponse(
+                        url=cache_url,
+                        status=200,
+                        headers={'content-type': 'application/json'},
+                        body=json.dumps(response.data).encode('utf-8')
+                    ),
+                    ttl=int(self.cache_ttl.total_seconds())
+                )
         
         # Google Ads would go here when implemented
         # results['google'] = self.google_client.search_ads(...)
         
         return results
     
+    def get_stats(self) -> Dict:
+        """Get response cache statistics"""
+        return {'cache': self.cache.get_stats()}
+    
     def get_comprehensive_company_data(self, company_identifiers: Dict) -> Dict:
         """Get comprehensive company data from multiple sources"""
         data = {
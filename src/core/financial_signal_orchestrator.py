@@ -22,12 +22,14 @@ import subprocess
 import time
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass, asdict
-from datetime import datetime, timedelta
+from datetime import datetime
 import yaml
 from google.cloud import bigquery
 import numpy as np
 from dotenv import load_dotenv
 
+from arco.utils.rate_limiter import get_rate_limiter
+
 load_dotenv()
 
 @dataclass
@@ -94,12 +96,8 @@ class FinancialSignalOrchestrator:
             'api_errors': 0
         }
         
-        # Rate limiting
-        self.api_calls = {
-            'meta_ads': {'count': 0, 'reset_time': datetime.now() + timedelta(hours=1)},
-            'instagram': {'count': 0, 'reset_time': datetime.now() + timedelta(hours=1)},
-            'bigquery': {'bytes_processed': 0, 'reset_time': datetime.now() + timedelta(days=1)}
-        }
+        # Rate limiting (shared per-provider token buckets)
+        self.rate_limiter = get_rate_limiter()
         
         print("🎯 FINANCIAL SIGNAL ORCHESTRATOR")
         print("=" * 50)
@@ -531,7 +529,7 @@ class FinancialSignalOrchestrator:
     async def _detect_ad_spend(self, domain: str) -> Dict:
         """Detect active ad spend via Meta Ad Library"""
         
-        if not self.meta_token or not self._check_rate_limit('meta_ads'):
+        if not self.meta_token or not await self.rate_limiter.acquire('meta_ads', max_wait=30):
             return {'active_ads': False, 'estimated_ad_spend': 0, 'ad_platforms': []}
         
         try:
@@ -548,12 +546,11 @@ class FinancialSignalOrchestrator:
             
             async with aiohttp.ClientSession() as session:
                 async with session.get(url, params=params) as response:
+                    self.rate_limiter.record_response('meta_ads', response.status, response.headers)
                     if response.status == 200:
                         data = await response.json()
                         ads = data.get('data', [])
                         
-                        self.api_calls['meta_ads']['count'] += 1
-                        
                         if ads:
                             # Estimate spend based on ad count and recency
                             estimated_spend = len(ads) * 300  # $300 per active ad (conservative)
@@ -585,8 +582,10 @@ class FinancialSignalOrchestrator:
         
         try:
             rdap_url = f"https://rdap.org/domain/{domain}"
+            await self.rate_limiter.acquire('rdap')
             async with aiohttp.ClientSession() as session:
                 async with session.get(rdap_url) as response:
+                    self.rate_limiter.record_response('rdap', response.status, response.headers)
                     if response.status == 200:
                         data = await response.json()
                         
@@ -625,7 +624,7 @@ class FinancialSignalOrchestrator:
                         instagram_pattern = r'instagram\.com/([a-zA-Z0-9_.]+)'
                         match = re.search(instagram_pattern, content)
                         
-                        if match and self._check_rate_limit('instagram'):
+                        if match and await self.rate_limiter.acquire('instagram', max_wait=30):
                             handle = match.group(1)
                             follower_count = await self._get_instagram_followers(handle)
                             return {'follower_count': follower_count}
@@ -644,9 +643,9 @@ class FinancialSignalOrchestrator:
             
             async with aiohttp.ClientSession() as session:
                 async with session.get(url, params=params) as response:
+                    self.rate_limiter.record_response('instagram', response.status, response.headers)
                     if response.status == 200:
                         data = await response.json()
-                        self.api_calls['instagram']['count'] += 1
                         return data.get('author_followers_count', 0)
         
         except Exception as e:
@@ -654,27 +653,6 @@ class FinancialSignalOrchestrator:
         
         return 0
 
-    def _check_rate_limit(self, api_name: str) -> bool:
-        """Check if API rate limit allows request"""
-        
-        limits = {
-            'meta_ads': 100,     # 100 requests per hour
-            'instagram': 200,    # 200 requests per hour
-            'bigquery': 1000     # 1TB per day (1000 GB)
-        }
-        
-        api_info = self.api_calls.get(api_name, {})
-        
-        if datetime.now() > api_info.get('reset_time', datetime.now()):
-            # Reset counter
-            self.api_calls[api_name] = {
-                'count': 0,
-                'reset_time': datetime.now() + timedelta(hours=1)
-            }
-            return True
-        
-        return api_info.get('count', 0) < limits.get(api_name, 100)
-
     def _calculate_leak_score(self, signals: FinancialSignals) -> int:
         """Calculate comprehensive leak score (0-100)"""
         
@@ -18,6 +18,8 @@ import yaml
 import httpx
 from urllib.parse import urlparse, urljoin
 
+from arco.utils.signatures import SIGNATURES, RegexSignature, scan_signatures
+
 
 @dataclass
 class LeakFootprint:
@@ -91,6 +93,11 @@ class VendorCostDatabase:
         return 0
 
 
+def _footprint(signature) -> str:
+    """Printable form of a signature."""
+    return signature.pattern if isinstance(signature, RegexSignature) else signature
+
+
 class LeakScanner:
     """Main leak detection engine using public footprints"""
     
@@ -98,40 +105,33 @@ class LeakScanner:
         self.vendor_db = VendorCostDatabase()
         self.session = None
         
-        # Leak detection patterns
+        # Leak categories; the footprints are the 'leak_scanner' signatures in arco.utils.signatures
         self.leak_patterns = {
             'typeform': {
-                'patterns': [r'cdn\.typeform\.com', r'scripts\.typeform\.com'],
                 'category': 'Formulários caros',
                 'replacement': 'React hook + SES = $0'
             },
             'klaviyo': {
-                'patterns': [r'js\.klaviyo\.com', r'a\.klaviyo\.com'],
                 'category': 'E-mail pricing escalado',
                 'replacement': 'Postmark / custom'
             },
             'hubspot': {
-                'patterns': [r'js\.hs-scripts\.com', r'js\.hsforms\.com'],
                 'category': 'Suite all-in sem uso',
                 'replacement': 'CRM light'
             },
             'mailchimp': {
-                'patterns': [r'js\.mailchimp\.com', r'us\d+\.api\.mailchimp\.com'],
                 'category': 'E-mail pricing escalado',
                 'replacement': 'Postmark / custom'
             },
             'recharge': {
-                'patterns': [r'rechargepayments\.com', r'rechargeapps\.com'],
                 'category': 'Apps duplicados subscrição',
                 'replacement': '1 só app ou código'
             },
             'loop': {
-                'patterns': [r'loopreturns\.com', r'getloop\.com'],
                 'category': 'Apps duplicados subscrição',
                 'replacement': '1 só app ou código'
             },
             'yotpo_subscriptions': {
-                'patterns': [r'yotpo\.com.*subscription', r'yotpo-subscriptions'],
                 'category': 'Apps duplicados subscrição',
                 'replacement': '1 só app ou código'
             }
@@ -158,17 +158,15 @@ class LeakScanner:
             # Get homepage content
             url = f"https://{domain}" if not domain.startswith('http') else domain
             response = await self.session.get(url, follow_redirects=True)
-            content = response.text.lower()
+            hits = scan_signatures(response.text).group('leak_scanner')
             
             # Check each leak pattern
             for vendor, config in self.leak_patterns.items():
-                detected = False
+                detected = vendor in hits
                 confidence = 0.0
                 
-                for pattern in config['patterns']:
-                    if re.search(pattern, content, re.IGNORECASE):
-                        detected = True
-                        confidence = min(confidence + 0.3, 1.0)
+                for _ in hits.get(vendor, ()):
+                    confidence = min(confidence + 0.3, 1.0)
                 
                 if detected:
                     # Estimate cost based on vendor
@@ -178,7 +176,7 @@ class LeakScanner:
                         category=config['category'],
                         detected=True,
                         monthly_cost=monthly_cost,
-                        footprint=config['patterns'][0],
+                        footprint=_footprint(SIGNATURES['leak_scanner'][vendor][0]),
                         replacement=config['replacement'],
                         confidence=confidence
                     )
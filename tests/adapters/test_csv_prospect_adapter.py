@@ -0,0 +1,109 @@
+"""
+Test module for the CSV prospect adapter.
+
+This module contains tests for sequential and process pool Apollo CSV ingestion
+and for dropping unresolvable domains at import.
+"""
+
+import asyncio
+import csv
+import pytest
+from unittest.mock import MagicMock
+
+from arco.adapters import csv_prospect_adapter
+from arco.adapters.csv_prospect_adapter import (
+    ApolloRowParser, BatchProcessingConfig, load_all_apollo_csvs_async
+)
+from arco.engines.validator_engine import ValidatorEngine
+from arco.utils.csv_cache import CSVColumnarCache
+from arco.utils.dns_resolver import DNSResolver
+
+
+def _write_csv(path, rows):
+    """Write rows to a CSV file."""
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=["Company", "Website", "# Employees", "Annual Revenue", "Technologies"])
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+@pytest.fixture
+def apollo_dir(tmp_path, monkeypatch):
+    """Create two Apollo exports that share a domain."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(csv_prospect_adapter, "get_csv_cache",
+                        lambda: CSVColumnarCache(cache_dir=str(tmp_path / "cache")))
+
+    _write_csv(tmp_path / "apollo-a.csv", [
+        {"Company": f"Store {i}", "Website": f"https://www.store{i}.com/", "# Employees": "12",
+         "Annual Revenue": "$2.5M", "Technologies": "Shopify, Klaviyo"}
+        for i in range(7)
+    ] + [{"Company": "Store 3", "Website": "store3.com"}, {"Company": "", "Website": ""}])
+    _write_csv(tmp_path / "apollo-b.csv", [
+        {"Company": "Store 0 EU", "Website": "store0.com"},
+        {"Company": "Iron Gym", "Website": "irongym.com", "# Employees": "40"}
+    ])
+    return tmp_path
+
+
+def _load(directory, **overrides):
+    """Load every export with progress tracking and rate limiting disabled."""
+    config = BatchProcessingConfig(batch_size=3, rate_limit_delay=0, enable_progress_tracking=False, **overrides)
+    return asyncio.run(load_all_apollo_csvs_async(str(directory), config))
+
+
+def test_apollo_row_parser():
+    """Test that rows are parsed without adapter state."""
+    prospect = ApolloRowParser().parse_row({
+        "Company": "Glow", "Website": "https://www.Glow.com/shop", "# Employees": "1,200",
+        "Annual Revenue": "$1.5M", "Technologies": "Shopify, Google Analytics"
+    })
+
+    assert prospect.domain == "glow.com"
+    assert prospect.company_name == "Glow"
+    assert prospect.employee_count == 1200
+    assert [tech.category for tech in prospect.technologies] == ["E-commerce", "Analytics"]
+    assert ApolloRowParser().parse_row({"Company": "", "Website": ""}) is None
+    assert ApolloRowParser().parse_row({"Company": "", "Website": "www.bare.com"}).domain == "bare.com"
+
+
+def test_process_pool_matches_sequential_ingestion(apollo_dir):
+    """Test that chunked process pool parsing merges like sequential parsing."""
+    sequential, sequential_report = _load(apollo_dir)
+    parallel, parallel_report = _load(apollo_dir, process_workers=2, process_chunk_size=2)
+
+    assert len(sequential) == len(parallel) == 8
+    assert [p.domain for p in parallel] == [p.domain for p in sequential]
+    assert parallel[0].company_name == "Store 0"
+
+    for report in (sequential_report, parallel_report):
+        stats = report["aggregated_statistics"]
+        assert stats["total_rows"] == 11
+        assert stats["successful_parses"] == 9
+        assert stats["duplicates_found"] == 1
+        assert report["session_summary"]["global_duplicates_removed"] == 1
+    assert parallel_report["file_reports"][0]["statistics"]["batches_processed"] == 3
+
+
+def test_import_drops_unresolvable_domains(apollo_dir):
+    """Test that resolve_domains pre-resolves every domain once and drops the dead ones."""
+    queried = []
+
+    async def lookup(host):
+        queried.append(host)
+        if host == "irongym.com":
+            raise LookupError(host)
+        return ["93.184.216.34"], 120
+
+    resolver = DNSResolver(use_aiodns=False)
+    resolver._query_loop = lookup
+    validator = ValidatorEngine(http_cache=MagicMock(), http_clients=MagicMock(), dns_resolver=resolver)
+    config = BatchProcessingConfig(batch_size=3, rate_limit_delay=0, enable_progress_tracking=False,
+                                   resolve_domains=True)
+
+    prospects, report = asyncio.run(load_all_apollo_csvs_async(str(apollo_dir), config, validator=validator))
+
+    assert len(prospects) == 7
+    assert "irongym.com" not in [p.domain for p in prospects]
+    assert sorted(queried) == sorted(set(queried)) and len(queried) == 8
+    assert report["session_summary"]["unresolvable_domains_removed"] == 1
@@ -0,0 +1,73 @@
+"""
+Test module for the batch executor.
+
+This module contains tests for chunked inline, thread and process execution.
+"""
+
+import asyncio
+import pytest
+
+from arco.core.executor import BatchExecutor, attribute_view
+
+
+def _describe_chunk(numbers, scale):
+    """Scale every number of a chunk and tag it with the chunk's first item."""
+    return [(n * scale, numbers[0]) for n in numbers]
+
+
+class _Item:
+    """Item with one attribute the chunk function reads and one it does not."""
+
+    def __init__(self, n):
+        self.n = n
+        self.payload = bytes(10_000)
+
+
+def _view_chunk(items, scale):
+    """Scale the number of every item and report whether the item still has its payload."""
+    return [(item.n * scale, hasattr(item, "payload"), hasattr(item, "missing")) for item in items]
+
+
+@pytest.mark.parametrize("mode", ["inline", "thread", "process"])
+def test_executor_keeps_input_order(mode):
+    """Test that every mode returns the same results, in input order."""
+    executor = BatchExecutor(mode=mode, max_workers=2, chunk_size=4)
+    try:
+        results = executor.map(_describe_chunk, list(range(10)), 3)
+        async_results = asyncio.run(executor.map_async(_describe_chunk, list(range(10)), 3))
+    finally:
+        executor.shutdown()
+
+    assert [value for value, _ in results] == [n * 3 for n in range(10)]
+    assert async_results == results
+    if mode == "inline":
+        assert {first for _, first in results} == {0}
+    else:
+        assert [first for _, first in results] == [0] * 4 + [4] * 4 + [8] * 2
+        assert executor.get_stats()["chunks"] == 6
+
+
+def test_executor_runs_small_batches_inline():
+    """Test that single-chunk batches never start a pool."""
+    executor = BatchExecutor(mode="process", chunk_size=50)
+    assert executor.map(_describe_chunk, [1, 2], 2) == [(2, 1), (4, 1)]
+    assert executor.map(_describe_chunk, [], 2) == []
+    assert executor._pool is None
+
+    with pytest.raises(ValueError):
+        BatchExecutor(mode="cluster")
+
+
+@pytest.mark.parametrize("mode", ["inline", "thread", "process"])
+def test_executor_sends_views_to_process_workers(mode):
+    """Test that process workers get the item views and other modes the items themselves."""
+    executor = BatchExecutor(mode=mode, max_workers=2, chunk_size=2)
+    items = [_Item(n) for n in range(5)]
+    try:
+        results = executor.map(_view_chunk, items, 2, view=lambda item: attribute_view(item, ("n", "missing")))
+    finally:
+        executor.shutdown()
+
+    assert [value for value, _, _ in results] == [0, 2, 4, 6, 8]
+    assert {has_payload for _, has_payload, _ in results} == {mode != "process"}
+    assert not any(has_missing for _, _, has_missing in results)
@@ -1,2 +1,60 @@
-# tests/core/test_http_client.py
-# Placeholder for tests related to the HTTP client.
+"""
+Test module for the shared HTTP client registry.
+
+This module contains tests for the pooled aiohttp sessions and httpx clients.
+"""
+
+import asyncio
+from arco.core.http_clients import HTTPClientRegistry
+
+
+def test_registry_reuses_sessions_within_a_loop():
+    """Test that sessions are shared per loop and share one connector."""
+    registry = HTTPClientRegistry(limit=20, limit_per_host=5)
+
+    async def run():
+        first = registry.get_session()
+        second = registry.get_session()
+        with_headers = registry.get_session(headers={"Accept": "application/json"})
+        result = (first is second, first.connector is with_headers.connector,
+                  first is with_headers, registry.get_stats()["sessions"])
+        await registry.aclose()
+        return result, first.closed
+
+    (same, shared_connector, same_with_headers, sessions), closed = asyncio.run(run())
+
+    assert same
+    assert shared_connector
+    assert not same_with_headers
+    assert sessions == 2
+    assert closed
+    assert registry.get_stats()["pools"] == 0
+
+
+def test_registry_keeps_one_pool_per_loop():
+    """Test that a new event loop gets fresh clients instead of closed ones."""
+    registry = HTTPClientRegistry()
+
+    async def borrow():
+        return registry.get_session(), registry.get_httpx_client()
+
+    first_session, first_client = asyncio.run(borrow())
+    second_session, second_client = asyncio.run(borrow())
+
+    assert first_session is not second_session
+    assert first_client is not second_client
+    assert registry.get_stats()["pools"] == 1
+
+
+def test_registry_separates_ssl_verification():
+    """Test that sessions without SSL verification use their own connector."""
+    registry = HTTPClientRegistry()
+
+    async def run():
+        verified = registry.get_session()
+        unverified = registry.get_session(verify_ssl=False)
+        result = verified.connector is unverified.connector
+        await registry.aclose()
+        return result
+
+    assert asyncio.run(run()) is False
@@ -9,6 +9,7 @@ import asyncio
 from arco.engines.leak_engine import LeakEngine
 from arco.models.prospect import Prospect
 from arco.models.leak_result import LeakResult
+from arco.models.page_snapshot import PageSnapshot
 from arco.models.qualified_prospect import QualifiedProspect
 
 @pytest.mark.asyncio
@@ -94,9 +95,30 @@ async def test_leak_engine_with_real_domain():
     # Clean up
     await engine.close()
 
+@pytest.mark.asyncio
+async def test_leak_engine_https_redirect_from_snapshot():
+    """Test that the HTTPS redirect check reads the shared snapshot instead of fetching again."""
+    engine = LeakEngine()
+    headers = {
+        "Strict-Transport-Security": "max-age=1",
+        "X-Content-Type-Options": "nosniff",
+        "X-Frame-Options": "DENY"
+    }
+    
+    redirected = PageSnapshot(url="http://example.com", final_url="https://example.com/", status=200, headers=headers)
+    not_redirected = PageSnapshot(url="http://example.com", final_url="http://example.com/", status=200, headers=headers)
+    https_only = PageSnapshot(url="https://example.com", final_url="https://example.com/", status=200, headers=headers)
+    
+    assert await engine._detect_security_issues("example.com", redirected) == []
+    assert [issue.type for issue in await engine._detect_security_issues("example.com", not_redirected)] == [
+        "missing_https_redirect"
+    ]
+    # Plain HTTP could not be fetched, so the redirect is not judged
+    assert await engine._detect_security_issues("example.com", https_only) == []
+
 if __name__ == "__main__":
     # Run the tests
     asyncio.run(test_leak_engine_analyze())
     asyncio.run(test_leak_engine_qualify())
     asyncio.run(test_leak_engine_with_real_domain())
-    print("All tests passed!")
\ No newline at end of file
+    print("All tests passed!")
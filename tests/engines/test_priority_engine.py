@@ -0,0 +1,133 @@
+"""
+Test module for the priority engine.
+
+This module contains tests for the vectorized batch scoring path, which must
+produce exactly the scores of the scalar path.
+"""
+
+import asyncio
+import random
+from dataclasses import asdict
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from arco.core.executor import BatchExecutor
+from arco.engines import priority_engine
+from arco.engines.priority_engine import PriorityEngine
+
+pytest.importorskip("numpy")
+
+INDUSTRIES = ["SaaS", "Software", "fintech", "AI", "E-commerce", "ecommerce", "Healthcare",
+              "Manufacturing", "Retail", "Consulting", "Non-Profit", "Government", "Mining", ""]
+FUNDING_STAGES = ["Series A", "series b", "Growth", "Seed", "Angel", "Bootstrapped", ""]
+TECHNOLOGIES = (priority_engine.ENTERPRISE_TECH + priority_engine.MODERN_STACK +
+                priority_engine.MARTECH_STACK + priority_engine.LEGACY_TECH + ["Shopify", "Klaviyo"])
+
+
+def _synthetic_prospects(count, seed=7):
+    """Create prospects covering every scoring branch."""
+    rng = random.Random(seed)
+    now = datetime.now()
+    prospects = []
+    for i in range(count):
+        attributes = {
+            "domain": f"store{i}.com",
+            "company_name": f"Store {i}",
+            "industry": rng.choice(INDUSTRIES),
+            "funding_stage": rng.choice(FUNDING_STAGES),
+            "technologies": [tech.upper() if rng.random() < 0.2 else tech
+                             for tech in rng.sample(TECHNOLOGIES, rng.choice([0, 2, 6, 12, 22]))],
+            "employee_count": rng.choice([0, 5, 10, 35, 50, 120, 200, 800]),
+            "revenue": rng.choice([0, 250000, 500000, 2500000, 7500000, 25000000, 90000000]),
+            "job_postings_count": rng.choice([0, 2, 5, 12, 15, 30]),
+            "traffic_growth_rate": rng.choice([0, 0.1, 0.3, 0.8]),
+            "website": rng.choice(["", f"https://store{i}.com"]),
+            "contact_email": rng.choice([None, f"hello@store{i}.com"]),
+            "linkedin_profiles": rng.choice([[], ["ceo"]]),
+        }
+        # Days are kept away from the 180/365/730 boundaries so a clock tick cannot change a branch
+        if rng.random() < 0.6:
+            attributes["last_funding_date"] = now - timedelta(days=rng.choice([30, 250, 500, 1000]))
+        if rng.random() < 0.3:
+            attributes["decision_maker_emails"] = [f"ceo@store{i}.com"]
+        if rng.random() < 0.3:
+            attributes["phone_numbers"] = ["+1 555 0100"]
+        prospects.append(SimpleNamespace(**attributes))
+    return prospects
+
+
+def _comparable(score):
+    """Score fields that must match exactly (calculation time excluded)."""
+    fields = asdict(score)
+    fields.pop("calculated_at")
+    return fields
+
+
+def _assert_matches_scalar(engine, prospects):
+    """Check the vectorized ranking against score_prospect() and a stable sort."""
+    expected = [(prospect, engine.score_prospect(prospect)) for prospect in prospects]
+    expected.sort(key=lambda x: x[1].total_score, reverse=True)
+
+    scored = engine.score_batch_vectorized(prospects)
+
+    assert [prospect.domain for prospect, _ in scored] == [prospect.domain for prospect, _ in expected]
+    assert [_comparable(score) for _, score in scored] == [_comparable(score) for _, score in expected]
+    return scored
+
+
+def test_vectorized_scores_match_scalar_path():
+    """Test that vectorized scoring matches the scalar path field by field."""
+    engine = PriorityEngine()
+    prospects = _synthetic_prospects(2000)
+    # Attributes the columns cannot hold fall back to (or fail in) the scalar path
+    prospects[3].industry = None
+    prospects[5].employee_count = "50"
+
+    scored = _assert_matches_scalar(engine, prospects[:3] + [prospects[4]] + prospects[6:])
+    assert {score.priority_tier for _, score in scored} == {"HIGH", "MEDIUM", "LOW"}
+
+    scores = {prospect.domain: score for prospect, score in asyncio.run(engine.score_batch(prospects))}
+    assert scores["store3.com"].total_score == 0.0
+    assert _comparable(scores["store5.com"]) == _comparable(priority_engine._score_chunk([prospects[5]], engine.scoring_weights)[0])
+
+
+@pytest.mark.parametrize("mode", ["thread", "process"])
+def test_score_batch_fans_vectorized_chunks_out_on_the_executor(mode, monkeypatch):
+    """Test that score_batch scores NumPy chunks on the batch executor and ranks like the vectorized path."""
+    engine = PriorityEngine()
+    prospects = _synthetic_prospects(300)
+    executor = BatchExecutor(mode=mode, max_workers=2, chunk_size=100)
+    monkeypatch.setattr(priority_engine, "get_executor", lambda: executor)
+
+    try:
+        scored = asyncio.run(engine.score_batch(prospects))
+    finally:
+        executor.shutdown()
+
+    expected = engine.score_batch_vectorized(prospects)
+    assert executor.get_stats()["chunks"] == 3
+    assert [prospect.domain for prospect, _ in scored] == [prospect.domain for prospect, _ in expected]
+    assert [_comparable(score) for _, score in scored] == [_comparable(score) for _, score in expected]
+
+
+def test_top_percentage_uses_partial_sort():
+    """Test that the top percentage equals a stable sorted slice, sorted input or not."""
+    engine = PriorityEngine()
+    scored = engine.score_batch_vectorized(_synthetic_prospects(500))
+    shuffled = scored[:]
+    random.Random(3).shuffle(shuffled)
+
+    for percentage in (0.1, 0.25, 0.001):
+        expected = scored[:max(1, int(len(scored) * percentage))]
+        assert engine.get_top_percentage(scored, percentage) == expected
+        top = engine.get_top_percentage(shuffled, percentage)
+        assert [score.total_score for _, score in top] == [score.total_score for _, score in expected]
+        assert top == sorted(shuffled, key=lambda x: x[1].total_score, reverse=True)[:len(expected)]
+
+
+@pytest.mark.slow
+def test_vectorized_scores_match_scalar_path_at_scale():
+    """Test vectorized scoring against the scalar path on 100k prospects."""
+    _assert_matches_scalar(PriorityEngine(), _synthetic_prospects(100_000, seed=11))
@@ -127,10 +127,72 @@ def test_validator_engine_validation_scoring():
     assert validated_minimal.validation_score < validated_partial.validation_score
     assert validated_partial.validation_score < validated_complete.validation_score
 
+def test_validator_engine_stream_bounds_concurrency():
+    """Test that streamed validation caps in-flight prospects and per-host requests."""
+    engine = ValidatorEngine()
+    engine.per_host_concurrency = 1
+    in_flight = {"total": 0, "max": 0, "shop.com": 0, "max_shop": 0}
+    
+    async def fake_validate(prospect):
+        in_flight["total"] += 1
+        in_flight["max"] = max(in_flight["max"], in_flight["total"])
+        if prospect.domain == "shop.com":
+            in_flight["shop.com"] += 1
+            in_flight["max_shop"] = max(in_flight["max_shop"], in_flight["shop.com"])
+        await asyncio.sleep(0.01 if prospect.domain == "slow.com" else 0.001)
+        if prospect.domain == "shop.com":
+            in_flight["shop.com"] -= 1
+        in_flight["total"] -= 1
+        prospect.validation_score = 1.0
+        return prospect
+    
+    engine._validate_async = fake_validate
+    prospects = [Prospect(domain="slow.com", company_name="Slow")]
+    prospects += [Prospect(domain=f"site{i}.com", company_name=f"Site {i}") for i in range(20)]
+    prospects += [Prospect(domain="shop.com", company_name="Shop") for _ in range(3)]
+    
+    async def run():
+        return [p.domain async for p in engine.validate_stream(iter(prospects), concurrency=4)]
+    
+    domains = asyncio.run(run())
+    
+    assert sorted(domains) == sorted(p.domain for p in prospects)
+    assert domains[0] != "slow.com"
+    assert in_flight["max"] <= 4
+    assert in_flight["max_shop"] == 1
+
+def test_validator_engine_stream_stops_when_abandoned():
+    """Test that abandoning the stream leaves no validation task pending."""
+    engine = ValidatorEngine()
+    
+    async def fake_validate(prospect):
+        await asyncio.sleep(0.001)
+        return prospect
+    
+    engine._validate_async = fake_validate
+    prospects = [Prospect(domain=f"site{i}.com", company_name=f"Site {i}") for i in range(20)]
+    
+    async def run():
+        stream = engine.validate_stream(iter(prospects), concurrency=2)
+        first = await stream.__anext__()
+        # Let the workers fill the bounded queue before walking away
+        await asyncio.sleep(0.05)
+        await stream.aclose()
+        await asyncio.sleep(0.01)
+        pending = [task for task in asyncio.all_tasks() if not task.done() and task is not asyncio.current_task()]
+        return first, pending
+    
+    first, pending = asyncio.run(run())
+    
+    assert first.domain.startswith("site")
+    assert pending == []
+
 if __name__ == "__main__":
     # Run the tests
     test_validator_engine_init()
     test_validator_engine_validate()
     test_validator_engine_batch_validate()
     test_validator_engine_validation_scoring()
+    test_validator_engine_stream_bounds_concurrency()
+    test_validator_engine_stream_stops_when_abandoned()
     print("All tests passed!")
\ No newline at end of file
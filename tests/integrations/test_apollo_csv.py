@@ -185,6 +185,80 @@ class TestApolloCSVParser(unittest.TestCase):
         self.assertEqual(self.parser._determine_tech_category("ReCharge"), "subscriptions")
         self.assertEqual(self.parser._determine_tech_category("Unknown Technology"), "other")
 
+    def test_get_record_by_domain_normalizes(self):
+        """Test that domain lookups ignore scheme, www, case and path."""
+        for query in ["TestCompany.com", "https://www.testcompany.com/about", "www.testcompany.com"]:
+            record = self.parser.get_record_by_domain(query)
+            self.assertIsNotNone(record)
+            self.assertEqual(record["Company"], "Test Company")
+    
+    def test_get_records_by_company(self):
+        """Test getting records by company name."""
+        records = self.parser.get_records_by_company("another  company")
+        self.assertEqual(len(records), 1)
+        self.assertEqual(records[0]["Website"], "http://anothercompany.com")
+        self.assertEqual(self.parser.get_records_by_company("Nonexistent"), [])
+
+
+class TestApolloCSVIntegrationIndex(unittest.TestCase):
+    """Test cases for the merged domain index of ApolloCSVIntegration."""
+    
+    def setUp(self):
+        """Write two Apollo exports that share a domain."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        fieldnames = ["Company", "Website", "Industry", "Technologies", "Account Owner"]
+        files = {
+            "apollo-a.csv": [
+                {"Company": "Shared Co", "Website": "https://www.shared.com", "Industry": "",
+                 "Technologies": "Shopify, Klaviyo", "Account Owner": "a@shared.com"},
+                {"Company": "Solo Inc.", "Website": "solo.com", "Industry": "Retail",
+                 "Technologies": "", "Account Owner": ""}
+            ],
+            "apollo-b.csv": [
+                {"Company": "Shared Company", "Website": "http://shared.com/", "Industry": "Fashion",
+                 "Technologies": "Klaviyo, Yotpo", "Account Owner": "b@shared.com"}
+            ]
+        }
+        for name, rows in files.items():
+            with open(os.path.join(self.temp_dir.name, name), 'w', newline='', encoding='utf-8') as f:
+                writer = csv.DictWriter(f, fieldnames=fieldnames)
+                writer.writeheader()
+                writer.writerows(rows)
+        
+        self.integration = ApolloCSVIntegration(csv_dir=self.temp_dir.name)
+    
+    def tearDown(self):
+        """Clean up after tests."""
+        self.temp_dir.cleanup()
+    
+    def test_duplicate_domains_are_merged_in_file_order(self):
+        """Test that the first file wins and empty fields are filled from later files."""
+        company_info = self.integration.get_company_info("SHARED.com")
+        self.assertEqual(company_info["name"], "Shared Co")
+        self.assertEqual(company_info["industry"], "Fashion")
+        
+        tech_names = [tech["name"] for tech in self.integration.get_technologies("shared.com")]
+        self.assertEqual(tech_names, ["Shopify", "Klaviyo", "Yotpo"])
+        
+        emails = [contact["email"] for contact in self.integration.get_contacts("shared.com")]
+        self.assertEqual(emails, ["a@shared.com", "b@shared.com"])
+    
+    def test_search_companies_is_ranked_and_field_scoped(self):
+        """Test that search returns one result per merged domain and honors field scopes."""
+        companies = self.integration.search_companies("shared")
+        self.assertEqual([c["domain"] for c in companies], ["shared.com"])
+        
+        companies = self.integration.search_companies("industry:retail")
+        self.assertEqual([c["domain"] for c in companies], ["solo.com"])
+        self.assertEqual(self.integration.search_companies("site:solo industry:fashion"), [])
+    
+    def test_get_company_info_by_name(self):
+        """Test looking up companies through the company-name index."""
+        results = self.integration.get_company_info_by_name("solo inc")
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0]["website"], "solo.com")
+        self.assertEqual(self.integration.get_company_info_by_name("Unknown"), [])
+
 
 class TestApolloCSVIntegration(unittest.TestCase):
     """Test cases for the ApolloCSVIntegration class."""
@@ -10,6 +10,7 @@ import unittest
 from unittest.mock import patch
 
 from arco.integrations import WappalyzerIntegration
+from arco.integrations import wappalyzer as wappalyzer_module
 
 
 class TestWappalyzerIntegration(unittest.TestCase):
@@ -37,9 +38,47 @@ class TestWappalyzerIntegration(unittest.TestCase):
         # Mock subprocess.run to simulate CLI availability
         mock_run.return_value.returncode = 0
         
-        wappalyzer = WappalyzerIntegration()
+        # Availability is probed once per process; force a fresh probe
+        with patch.object(wappalyzer_module, '_availability', None):
+            wappalyzer = WappalyzerIntegration()
         self.assertTrue(wappalyzer.wappalyzer_cli_available)
     
+    def test_availability_cached_per_process(self):
+        """Test that later instances reuse the first availability probe."""
+        with patch('subprocess.run') as mock_run:
+            WappalyzerIntegration()
+            mock_run.assert_not_called()
+    
+    def test_map_cli_output(self):
+        """Test splitting multi-URL CLI output per URL."""
+        urls = ["https://a.com", "https://b.com"]
+        wapp_data = [
+            {"url": "https://b.com/", "technologies": [{"name": "Shopify", "categories": [{"name": "Ecommerce"}]}]},
+            {"url": "https://a.com/", "technologies": []}
+        ]
+        
+        results = self.wappalyzer._map_cli_output(urls, wapp_data)
+        
+        self.assertEqual(results["https://a.com"]["technologies"], [])
+        self.assertEqual(results["https://b.com"]["technologies"][0]["name"], "Shopify")
+    
+    def test_analyze_many_batches_cli_calls(self):
+        """Test that analyze_many passes many URLs to one CLI invocation."""
+        domains = [f"site{i}.com" for i in range(30)]
+        calls = []
+        
+        async def fake_cli(urls, timeout):
+            calls.append(urls)
+            return {url: {"technologies": [{"name": url}]} for url in urls}
+        
+        self.wappalyzer.wappalyzer_cli_available = True
+        with patch.object(self.wappalyzer, '_analyze_many_with_cli', side_effect=fake_cli):
+            results = asyncio.run(self.wappalyzer.analyze_many(domains))
+        
+        self.assertEqual([len(batch) for batch in calls], [25, 5])
+        self.assertEqual(list(results), domains)
+        self.assertEqual(results["site3.com"]["technologies"][0]["name"], "https://site3.com")
+    
     @unittest.skipIf(not os.environ.get('RUN_LIVE_TESTS'), "Skipping live test")
     def test_analyze_url(self):
         """Test analyzing a URL with Wappalyzer."""
@@ -11,6 +11,160 @@ from arco.models import (
 )
 
 
+# Frozen copies of the per-prospect algorithms the compiled ICPs replaced,
+# kept so the compiled and batch paths are checked against an independent
+# reference rather than against themselves.
+
+def _reference_pattern_matches(pattern, prospect_tech):
+    """Reference SaaSWastePattern.matches()."""
+    tech_by_category = {}
+    for tech in prospect_tech:
+        if tech.category not in tech_by_category:
+            tech_by_category[tech.category] = []
+        tech_by_category[tech.category].append(tech.name)
+    
+    if "redundant_categories" in pattern.detection_pattern:
+        for category in pattern.detection_pattern["redundant_categories"]:
+            if category in tech_by_category and len(tech_by_category[category]) > 1:
+                return True
+    
+    if "tool_combinations" in pattern.detection_pattern:
+        for combo in pattern.detection_pattern["tool_combinations"]:
+            all_found = True
+            for tool_info in combo:
+                category = tool_info["category"]
+                tool = tool_info["tool"]
+                if category not in tech_by_category or tool not in tech_by_category[category]:
+                    all_found = False
+                    break
+            if all_found:
+                return True
+    
+    return False
+
+
+def _reference_matches_prospect(icp, prospect):
+    """Reference ICP.matches_prospect()."""
+    revenue = getattr(prospect, "revenue", None)
+    if revenue:
+        if not (icp.min_revenue <= revenue <= icp.max_revenue):
+            return False
+    
+    if prospect.employee_count and icp.min_employees and icp.max_employees:
+        if not (icp.min_employees <= prospect.employee_count <= icp.max_employees):
+            return False
+    
+    if prospect.industry and icp.industries:
+        if prospect.industry not in icp.industries:
+            return False
+    
+    if prospect.country and icp.target_countries:
+        if prospect.country not in icp.target_countries:
+            return False
+    
+    if icp.tech_requirements:
+        prospect_tech_categories = {tech.category for tech in prospect.technologies}
+        for tech_req in icp.tech_requirements:
+            if tech_req.required:
+                if tech_req.category not in prospect_tech_categories:
+                    return False
+                prospect_tools = {
+                    tech.name for tech in prospect.technologies
+                    if tech.category == tech_req.category
+                }
+                if not any(tool in prospect_tools for tool in tech_req.tools):
+                    return False
+    
+    return True
+
+
+def _reference_match_score(icp, prospect):
+    """Reference ICP.calculate_match_score()."""
+    score = 0.0
+    total_points = 0
+    
+    revenue = getattr(prospect, "revenue", None)
+    if revenue:
+        total_points += 25
+        if icp.min_revenue <= revenue <= icp.max_revenue:
+            score += 25
+        elif revenue < icp.min_revenue:
+            score += 25 * min(revenue / icp.min_revenue, 0.8)
+        else:
+            score += 25 * min(icp.max_revenue / revenue, 0.9)
+    
+    if prospect.employee_count and icp.min_employees and icp.max_employees:
+        total_points += 15
+        if icp.min_employees <= prospect.employee_count <= icp.max_employees:
+            score += 15
+        elif prospect.employee_count < icp.min_employees:
+            score += 15 * min(prospect.employee_count / icp.min_employees, 0.8)
+        else:
+            score += 15 * min(icp.max_employees / prospect.employee_count, 0.9)
+    
+    if prospect.industry and icp.industries:
+        total_points += 20
+        if prospect.industry in icp.industries:
+            score += 20
+    
+    if prospect.country and icp.target_countries:
+        total_points += 15
+        if prospect.country in icp.target_countries:
+            score += 15
+    
+    if icp.tech_requirements and prospect.technologies:
+        total_points += 25
+        tech_score = 0
+        prospect_tech_map = {
+            tech.category: {t.name for t in prospect.technologies if t.category == tech.category}
+            for tech in prospect.technologies
+        }
+        for tech_req in icp.tech_requirements:
+            weight = tech_req.weight * (2 if tech_req.required else 1)
+            if tech_req.category in prospect_tech_map:
+                matching_tools = sum(1 for tool in tech_req.tools if tool in prospect_tech_map[tech_req.category])
+                if matching_tools > 0:
+                    tech_score += weight * (matching_tools / len(tech_req.tools))
+        total_weight = sum((req.weight * 2) if req.required else req.weight for req in icp.tech_requirements)
+        if total_weight > 0:
+            score += (tech_score / total_weight) * 25
+    
+    if total_points == 0:
+        return 0
+    return (score / total_points) * 100
+
+
+def _reference_detect_saas_waste(icp, prospect):
+    """Reference ICP.detect_saas_waste()."""
+    if not prospect.technologies or not icp.saas_waste_patterns:
+        return {
+            "total_monthly_waste": 0.0,
+            "total_annual_waste": 0.0,
+            "detected_patterns": [],
+            "recommendations": []
+        }
+    
+    detected_patterns = []
+    total_monthly_waste = 0.0
+    for pattern in icp.saas_waste_patterns:
+        if _reference_pattern_matches(pattern, prospect.technologies):
+            detected_patterns.append({
+                "name": pattern.name,
+                "description": pattern.description,
+                "estimated_monthly_waste": pattern.estimated_monthly_waste,
+                "priority": pattern.priority
+            })
+            total_monthly_waste += pattern.estimated_monthly_waste
+    
+    detected_patterns.sort(key=lambda x: x["priority"], reverse=True)
+    return {
+        "total_monthly_waste": total_monthly_waste,
+        "total_annual_waste": total_monthly_waste * 12,
+        "detected_patterns": detected_patterns,
+        "recommendations": [f"Fix {pattern['name']}: {pattern['description']}" for pattern in detected_patterns]
+    }
+
+
 class TestICPModels(unittest.TestCase):
     """Test cases for ICP models."""
     
@@ -353,5 +507,130 @@ class TestICPModels(unittest.TestCase):
         self.assertTrue(large_roi["estimated_monthly_saas_spend"] > roi_result["estimated_monthly_saas_spend"])
 
 
+class TestCompiledICP(unittest.TestCase):
+    """Test cases for compiled ICPs and batch scoring."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.prospect = Prospect(
+            domain="example-beauty.com",
+            company_name="Example Beauty Co",
+            industry="Beauty",
+            employee_count=15,
+            country="United States"
+        )
+        self.prospect.technologies = [
+            Technology(name="shopify", category="ecommerce_platform", version="2.0"),
+            Technology(name="klaviyo", category="email_marketing"),
+            Technology(name="recharge", category="subscriptions"),
+            Technology(name="yotpo", category="reviews")
+        ]
+    
+    def test_compiled_icp(self):
+        """Test that a compiled ICP reuses one technology index across checks."""
+        from arco.models import TechIndex
+        
+        icp = ShopifyDTCPremiumICP()
+        compiled = icp.compile()
+        self.prospect.technologies.append(Technology(name="okendo", category="reviews"))
+        tech_index = TechIndex.of(self.prospect)
+        
+        self.assertEqual(tech_index.counts_by_category["reviews"], 2)
+        self.assertTrue(compiled.matches(self.prospect, tech_index))
+        self.assertEqual(compiled.score(self.prospect, tech_index), _reference_match_score(icp, self.prospect))
+        self.assertEqual(compiled.score(self.prospect, tech_index), icp.calculate_match_score(self.prospect))
+        self.assertEqual(compiled.detect_saas_waste(self.prospect, tech_index),
+                         _reference_detect_saas_waste(icp, self.prospect))
+        self.assertEqual(icp.detect_saas_waste(self.prospect), _reference_detect_saas_waste(icp, self.prospect))
+        self.assertTrue(compiled.detect_saas_waste(self.prospect, tech_index)["detected_patterns"])
+        
+        # Industry, country and required tools are all checked against the frozen sets
+        other_industry = Prospect(domain="example-tech.com", company_name="Example Tech", industry="Technology")
+        other_industry.technologies = list(self.prospect.technologies)
+        self.assertFalse(compiled.matches(other_industry))
+        no_platform = Prospect(domain="no-platform.com", company_name="No Platform", industry="Beauty")
+        no_platform.technologies = [Technology(name="woocommerce", category="ecommerce_platform")]
+        self.assertEqual(compiled.matches(no_platform), _reference_matches_prospect(icp, no_platform))
+    
+    def test_compiled_icp_is_memoized(self):
+        """Test that the legacy methods reuse one compiled form until the ICP changes."""
+        import pickle
+        
+        icp = ShopifyDTCPremiumICP()
+        compiled = icp.compiled()
+        icp.calculate_match_score(self.prospect)
+        self.assertIs(icp.compiled(), compiled)
+        self.assertIs(icp.saas_waste_patterns[0].compiled(), icp.saas_waste_patterns[0].compiled())
+        self.assertTrue(icp.matches_prospect(self.prospect))
+        
+        icp.industries = ["Technology"]
+        self.assertIsNot(icp.compiled(), compiled)
+        self.assertFalse(icp.matches_prospect(self.prospect))
+        
+        restored = pickle.loads(pickle.dumps(icp))
+        self.assertNotIn("_compiled", restored.__dict__)
+        self.assertEqual(restored, icp)
+        self.assertFalse(restored.matches_prospect(self.prospect))
+    
+    def test_score_many(self):
+        """Test batch scoring against several ICPs."""
+        from arco.models import get_all_icps, score_many
+        
+        icps = get_all_icps()
+        other = Prospect(domain="example-tech.com", company_name="Example Tech", industry="Technology")
+        results = score_many([self.prospect, other], icps)
+        
+        self.assertEqual(len(results), 2)
+        for prospect, scores in zip([self.prospect, other], results):
+            self.assertEqual(scores, {icp.name: _reference_match_score(icp, prospect) for icp in icps})
+        
+        matched = score_many([self.prospect, other], icps, require_match=True)
+        self.assertIsNone(matched[1][icps[0].name])
+        self.assertEqual(matched[0][icps[0].name], results[0][icps[0].name])
+        self.assertEqual(icps[0].compile().score_many([self.prospect, other], require_match=True),
+                         [results[0][icps[0].name], None])
+    
+    def test_score_many_matches_per_prospect_scoring(self):
+        """Test that batch and per-prospect scoring equal the reference algorithm on random prospects."""
+        import random
+        from arco.models import get_all_icps, score_many
+        
+        rng = random.Random(1234)
+        icps = get_all_icps()
+        tools = sorted({(req.category, tool) for icp in icps for req in icp.tech_requirements for tool in req.tools})
+        tools += [("reviews", "judge_me"), ("reviews", "yotpo"), ("analytics", "hotjar")]
+        industries = sorted({industry for icp in icps for industry in icp.industries}) + ["Technology", ""]
+        countries = ["United States", "Canada", "Germany", "Brazil", ""]
+        
+        prospects = []
+        for i in range(200):
+            prospect = Prospect(
+                domain=f"store{i}.com",
+                company_name=f"Store {i}",
+                industry=rng.choice(industries),
+                employee_count=rng.choice([0, 3, 12, 40, 120, 900]),
+                country=rng.choice(countries)
+            )
+            prospect.revenue = rng.choice([None, 200000.0, 1500000.0, 8000000.0, 50000000.0])
+            prospect.technologies = [Technology(name=tool, category=category)
+                                     for category, tool in rng.sample(tools, rng.randint(0, 8))]
+            prospects.append(prospect)
+        
+        scores = score_many(prospects, icps)
+        matched = score_many(prospects, icps, require_match=True)
+        for prospect, prospect_scores, prospect_matched in zip(prospects, scores, matched):
+            for icp in icps:
+                expected = _reference_match_score(icp, prospect)
+                self.assertEqual(prospect_scores[icp.name], expected)
+                self.assertEqual(icp.calculate_match_score(prospect), expected)
+                self.assertEqual(icp.matches_prospect(prospect), _reference_matches_prospect(icp, prospect))
+                self.assertEqual(icp.detect_saas_waste(prospect), _reference_detect_saas_waste(icp, prospect))
+                self.assertEqual(prospect_matched[icp.name],
+                                 expected if _reference_matches_prospect(icp, prospect) else None)
+        self.assertTrue(any(score for prospect_scores in scores for score in prospect_scores.values()))
+        self.assertTrue(any(score is not None for prospect_matched in matched
+                            for score in prospect_matched.values()))
+
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
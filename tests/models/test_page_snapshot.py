@@ -0,0 +1,114 @@
+"""
+Test module for the PageSnapshot model.
+
+This module contains tests for the PageSnapshot model implementation.
+"""
+
+import asyncio
+from arco.models.page_snapshot import PageSnapshot
+from arco.utils.http_cache import CachedResponse
+
+
+class _FakeContent:
+    """Minimal stand-in for an aiohttp response stream."""
+
+    def __init__(self, body):
+        self._body = body
+
+    async def iter_chunked(self, size):
+        for start in range(0, len(self._body), size):
+            yield self._body[start:start + size]
+
+
+class _FakeResponse:
+    """Minimal stand-in for an aiohttp response."""
+
+    def __init__(self, status=200, headers=None, body="", url="https://example.com/", history=()):
+        self.status = status
+        self.headers = headers or {}
+        self.charset = "utf-8"
+        self.content = _FakeContent(body.encode("utf-8"))
+        self.url = url
+        self.history = list(history)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class _FakeSession:
+    """Session that counts GET requests."""
+
+    def __init__(self, response=None, error=None):
+        self.response = response
+        self.error = error
+        self.calls = 0
+
+    def get(self, url, **kwargs):
+        self.calls += 1
+        if self.error:
+            raise self.error
+        return self.response
+
+
+def test_page_snapshot_fetch():
+    """Test fetching a snapshot captures status, headers, body and redirects."""
+    redirect = _FakeResponse(status=301, url="http://example.com/")
+    session = _FakeSession(_FakeResponse(
+        headers={"Strict-Transport-Security": "max-age=1", "Server": "nginx"},
+        body="<HTML><Title>Example</Title></HTML>",
+        history=[redirect]
+    ))
+
+    snapshot = asyncio.run(PageSnapshot.fetch(session, "https://example.com"))
+
+    assert session.calls == 1
+    assert snapshot.ok
+    assert snapshot.fetched
+    assert snapshot.has_header("strict-transport-security")
+    assert snapshot.get_header("SERVER") == "nginx"
+    assert snapshot.html_lower == "<html><title>example</title></html>"
+    assert snapshot.redirect_chain == ["http://example.com/"]
+    assert "total" in snapshot.timings
+    assert snapshot.to_dict()["body_length"] == len(snapshot.body)
+
+
+class _FakeCache:
+    """Cache that records the read limits it is asked to fetch with."""
+
+    def __init__(self, response):
+        self.response = response
+        self.kwargs = None
+
+    async def fetch(self, session, url, **kwargs):
+        self.kwargs = kwargs
+        return self.response
+
+
+def test_page_snapshot_fetch_passes_head_only_to_the_cache():
+    """Test that cached fetches stop at the same read limits as streamed ones."""
+    cache = _FakeCache(CachedResponse(url="https://example.com/", status=200,
+                                      body=b"<html><head><title>Example</title></head>", truncated=True))
+
+    snapshot = asyncio.run(PageSnapshot.fetch(None, "https://example.com", cache=cache, max_bytes=1024,
+                                              head_only=True))
+
+    assert cache.kwargs["max_bytes"] == 1024
+    assert cache.kwargs["head_only"] is True
+    assert snapshot.ok
+    assert snapshot.truncated == "head"
+    assert snapshot.body == "<html><head><title>Example</title></head>"
+
+
+def test_page_snapshot_fetch_error():
+    """Test that fetch errors are recorded instead of raised."""
+    session = _FakeSession(error=ConnectionError("refused"))
+
+    snapshot = asyncio.run(PageSnapshot.fetch(session, "https://example.com"))
+
+    assert not snapshot.ok
+    assert not snapshot.fetched
+    assert snapshot.error == "refused"
+    assert snapshot.body == ""
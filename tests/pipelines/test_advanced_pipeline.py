@@ -4,8 +4,9 @@ Test module for the AdvancedPipeline.
 This module contains tests for the AdvancedPipeline implementation.
 """
 
+import asyncio
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 from arco.pipelines.advanced_pipeline import AdvancedPipeline
 from arco.models.prospect import Prospect, Technology
 from arco.models.qualified_prospect import QualifiedProspect, Leak
@@ -278,6 +279,40 @@ def test_advanced_pipeline_analyze_performance(mock_engines_and_integrations):
     assert leak_result.leaks[0].annual_savings == 1800.0
     assert leak_result.total_monthly_waste == 650.0  # 500 + 150
 
+def test_advanced_pipeline_enhances_on_one_event_loop():
+    """Enhancement runs concurrently on the run's single event loop and closes the pooled clients once."""
+    domains = ["alpha.com", "beta.com", "gamma.com", "delta.com"]
+    in_flight = {"now": 0, "max": 0}
+    loops = set()
+    
+    async def analyze(prospect):
+        loops.add(asyncio.get_running_loop())
+        in_flight["now"] += 1
+        in_flight["max"] = max(in_flight["max"], in_flight["now"])
+        await asyncio.sleep(0.01)
+        in_flight["now"] -= 1
+        return LeakResult(domain=prospect.domain, total_monthly_waste=500.0)
+    
+    async def qualify(prospect, leak_result):
+        loops.add(asyncio.get_running_loop())
+        return QualifiedProspect(domain=prospect.domain, company_name=prospect.company_name,
+                                 monthly_waste=leak_result.total_monthly_waste, priority_tier="A")
+    
+    pipeline = AdvancedPipeline()
+    pipeline.parallel_processes = 2
+    pipeline.http_clients = MagicMock(aclose=AsyncMock())
+    pipeline.simplified_engine = MagicMock(analyze=AsyncMock(side_effect=analyze),
+                                           qualify=AsyncMock(side_effect=qualify))
+    pipeline.leak_engine = MagicMock(analyze=AsyncMock(side_effect=analyze), qualify=AsyncMock(side_effect=qualify))
+    pipeline.discovery_engine = MagicMock(enrich=lambda prospect: prospect)
+    
+    results = pipeline.run(domains)
+    
+    assert [r.domain for r in results] == domains
+    assert len(loops) == 1
+    assert in_flight["max"] == 2
+    assert pipeline.http_clients.aclose.await_count == 1
+
 if __name__ == "__main__":
     # Run the tests
     pytest.main(["-v", __file__])
\ No newline at end of file
@@ -0,0 +1,163 @@
+"""
+Test module for pipeline run checkpoints.
+
+This module contains tests for recording prospect results as they finish
+and resuming interrupted runs.
+"""
+
+import asyncio
+import json
+import threading
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from arco.pipelines import standard_pipeline
+from arco.pipelines.checkpoint import RunCheckpoint, restore_result, serialize_result
+from arco.pipelines.standard_pipeline import StandardPipeline
+from arco.models.leak_result import LeakResult
+from arco.models.prospect import (
+    BusinessModel, Contact, LeadScore, LeadTemperature, MarketingData, PriorityClassification,
+    Technology, WebVitals
+)
+from arco.models.qualified_prospect import Leak, MarketingLeak, QualifiedProspect
+
+
+def _qualified(domain):
+    """Create a qualified prospect for a domain."""
+    return QualifiedProspect(domain=domain, company_name=domain.split(".")[0],
+                             monthly_waste=500.0, annual_savings=6000.0, qualification_score=80)
+
+
+@pytest.fixture
+def open_checkpoint(tmp_path):
+    """Open (or reopen) the checkpoint of one run on a temporary database."""
+    return lambda **kwargs: RunCheckpoint(run_id="run-1", path=str(tmp_path / "checkpoints.sqlite3"), **kwargs)
+
+
+@pytest.fixture
+def pipeline(monkeypatch):
+    """Create a StandardPipeline whose engine fails on down.com and skips quiet.com."""
+    monkeypatch.setattr(standard_pipeline, "load_config", lambda path: {"min_monthly_waste": 40})
+    monkeypatch.setattr(standard_pipeline, "get_http_cache", MagicMock)
+    monkeypatch.setattr(standard_pipeline, "get_http_clients", MagicMock)
+    monkeypatch.setattr(standard_pipeline, "SimplifiedEngine", MagicMock)
+
+    async def analyze(prospect):
+        if prospect.domain == "down.com":
+            raise TimeoutError("analysis timed out")
+        waste = 0.0 if prospect.domain == "quiet.com" else 500.0
+        return LeakResult(domain=prospect.domain, total_monthly_waste=waste)
+
+    pipeline = StandardPipeline()
+    pipeline.simplified_engine.analyze = AsyncMock(side_effect=analyze)
+    pipeline.simplified_engine.qualify = AsyncMock(side_effect=lambda prospect, leaks: _qualified(prospect.domain))
+    return pipeline
+
+
+def test_checkpoint_records_items(open_checkpoint):
+    """Test that results and failed attempts survive reopening the checkpoint."""
+    checkpoint = open_checkpoint(max_attempts=2)
+    checkpoint.start("standard", "domains.txt", {"output": "out.json"})
+    checkpoint.record_result("glow.com", _qualified("glow.com"))
+    checkpoint.record_result("quiet.com", None)
+    checkpoint.record_failure("down.com", {"type": "TimeoutError", "message": "timed out"})
+    checkpoint.close()
+
+    reopened = open_checkpoint(max_attempts=2)
+    run = reopened.get_run()
+    assert run["input"] == "domains.txt"
+    assert run["options"] == {"output": "out.json"}
+    assert run["items"] == {"qualified": 1, "skipped": 1, "failed": 1}
+
+    items = reopened.load_items()
+    assert reopened.restore(items["glow.com"]).qualification_score == 80
+    assert reopened.restore(items["quiet.com"]) is None
+    assert reopened.should_retry(items["down.com"])
+
+    reopened.record_failure("down.com", {"type": "ConnectionError", "message": "reset"})
+    down = reopened.load_items()["down.com"]
+    assert [error["type"] for error in down["errors"]] == ["TimeoutError", "ConnectionError"]
+    assert not reopened.should_retry(down)
+
+    reopened.record_result("down.com", _qualified("down.com"))
+    assert reopened.load_items()["down.com"]["attempts"] == 3
+
+
+def test_checkpoint_restores_nested_fields():
+    """Test that a restored result equals the prospect that was recorded."""
+    qualified = _qualified("glow.com")
+    qualified.business_model = BusinessModel.ECOMMERCE
+    qualified.priority_classification = PriorityClassification.P1
+    qualified.technologies = [Technology(name="Shopify", category="E-commerce", monthly_cost=79.0)]
+    qualified.contacts = [Contact(name="Ana", email="ana@glow.com", position="CEO")]
+    qualified.lead_score = LeadScore(total_score=82, temperature=LeadTemperature.HOT, risk_factors=["churn"])
+    qualified.marketing_data = MarketingData(web_vitals=WebVitals(lcp=3.1), bounce_rate=0.4)
+    qualified.business_intelligence.hiring_activity.tech_job_postings = 3
+    qualified.technical_profile.core_web_vitals = {"lcp": 3.1}
+    qualified.top_leaks = [
+        Leak(type="saas", monthly_waste=300.0, annual_savings=3600.0, description="Overlap", severity="high"),
+        MarketingLeak(type="speed", monthly_waste=200.0, annual_savings=2400.0, description="Slow LCP",
+                      severity="medium", current_metric=3.1, data_source="pagespeed")
+    ]
+
+    restored = restore_result(json.loads(serialize_result(qualified)))
+
+    assert restored == qualified
+    assert isinstance(restored.top_leaks[1], MarketingLeak)
+
+
+def test_pipeline_resumes_from_checkpoint(pipeline, open_checkpoint):
+    """Test that a resumed run only reprocesses failed domains."""
+    domains = ["glow.com", "quiet.com", "down.com"]
+
+    first = asyncio.run(pipeline.run_async(domains, checkpoint=open_checkpoint()))
+    assert [p.domain for p in first] == ["glow.com"]
+    assert pipeline.stats["failed_count"] == 1
+
+    items = open_checkpoint().load_items()
+    assert {domain: item["status"] for domain, item in items.items()} == {
+        "glow.com": "qualified", "quiet.com": "skipped", "down.com": "failed"
+    }
+    assert items["down.com"]["errors"][0]["message"] == "analysis timed out"
+
+    # The outage is over: only down.com is analyzed again
+    pipeline.simplified_engine.analyze.reset_mock(side_effect=True)
+    pipeline.simplified_engine.analyze.return_value = LeakResult(domain="down.com", total_monthly_waste=500.0)
+    resumed = asyncio.run(pipeline.run_async(domains, checkpoint=open_checkpoint()))
+
+    assert [call.args[0].domain for call in pipeline.simplified_engine.analyze.call_args_list] == ["down.com"]
+    assert [p.domain for p in resumed] == ["glow.com", "down.com"]
+    assert pipeline.stats["resumed_count"] == 2
+    assert open_checkpoint().load_items()["down.com"]["status"] == "qualified"
+
+
+def test_pipeline_survives_checkpoint_errors(pipeline, open_checkpoint):
+    """Test that a checkpoint that cannot record outcomes does not abort the run."""
+    checkpoint = open_checkpoint()
+    checkpoint.record_result = MagicMock(side_effect=TypeError("not serializable"))
+
+    qualified = asyncio.run(pipeline.run_async(["glow.com", "quiet.com"], checkpoint=checkpoint))
+
+    assert [p.domain for p in qualified] == ["glow.com"]
+    assert checkpoint.record_result.call_count == 2
+
+
+def test_pipeline_checkpoints_off_the_event_loop(pipeline, open_checkpoint):
+    """Test that outcomes are committed to the checkpoint from a worker thread."""
+    checkpoint = open_checkpoint()
+    on_main_thread = []
+    record_result, record_failure = checkpoint.record_result, checkpoint.record_failure
+
+    def record(method):
+        def wrapper(*args, **kwargs):
+            on_main_thread.append(threading.current_thread() is threading.main_thread())
+            return method(*args, **kwargs)
+        return wrapper
+
+    checkpoint.record_result = record(record_result)
+    checkpoint.record_failure = record(record_failure)
+
+    asyncio.run(pipeline.run_async(["glow.com", "quiet.com", "down.com"], checkpoint=checkpoint))
+
+    assert on_main_thread == [False, False, False]
+    assert len(open_checkpoint().load_items()) == 3
@@ -4,10 +4,12 @@ Test module for the StandardPipeline.
 This module contains tests for the StandardPipeline implementation.
 """
 
+import asyncio
+import json
 import pytest
 from unittest.mock import MagicMock, patch
 from arco.pipelines.standard_pipeline import StandardPipeline
-from arco.models.prospect import Prospect
+from arco.models.prospect import BusinessModel, Prospect, Technology
 from arco.models.qualified_prospect import QualifiedProspect
 from arco.models.leak_result import LeakResult
 from arco.engines.discovery_engine import DiscoveryEngine
@@ -180,6 +182,98 @@ def test_standard_pipeline_process_prospect(mock_engines):
     assert stats["total_monthly_waste"] > 0
     assert stats["total_annual_savings"] > 0
 
+def test_standard_pipeline_batch_matches_sequential():
+    """Concurrent batch mode returns the same prospects and stats as sequential mode."""
+    domains = ["alpha.com", "beta.com", "gamma.com", "delta.com"]
+    
+    async def analyze(prospect):
+        waste = 0.0 if prospect.domain == "beta.com" else 100.0 * len(prospect.domain)
+        return LeakResult(domain=prospect.domain, total_monthly_waste=waste)
+    
+    async def qualify(prospect, leak_result):
+        return QualifiedProspect(
+            domain=prospect.domain,
+            company_name=prospect.company_name,
+            monthly_waste=leak_result.total_monthly_waste,
+            annual_savings=leak_result.total_monthly_waste * 12,
+            qualification_score=70,
+            priority_tier="B"
+        )
+    
+    runs = []
+    for parallel_processes in (1, 3):
+        pipeline = StandardPipeline()
+        pipeline.parallel_processes = parallel_processes
+        pipeline.batch_size = 3
+        pipeline.simplified_engine = MagicMock()
+        pipeline.simplified_engine.analyze.side_effect = analyze
+        pipeline.simplified_engine.qualify.side_effect = qualify
+        
+        results = pipeline.run(domains)
+        runs.append(([r.domain for r in results], dict(pipeline.get_stats())))
+    
+    assert runs[0] == runs[1]
+    assert runs[0][0] == ["alpha.com", "gamma.com", "delta.com"]
+    assert runs[0][1]["processed_count"] == 4
+    assert runs[0][1]["qualified_count"] == 3
+
+def test_standard_pipeline_slow_prospect_does_not_stall_others():
+    """A slow prospect only holds its own slot; later prospects keep flowing through the others."""
+    domains = ["slow.com", "a.com", "b.com", "c.com", "d.com"]
+    finished = []
+    
+    async def analyze(prospect):
+        await asyncio.sleep(0.3 if prospect.domain == "slow.com" else 0.01)
+        finished.append(prospect.domain)
+        return LeakResult(domain=prospect.domain, total_monthly_waste=0.0)
+    
+    pipeline = StandardPipeline()
+    pipeline.parallel_processes = 2
+    pipeline.batch_size = 2
+    pipeline.simplified_engine = MagicMock()
+    pipeline.simplified_engine.analyze.side_effect = analyze
+    
+    pipeline.run(domains)
+    
+    # With per-batch gathering, c.com and d.com would wait for slow.com's batch
+    assert finished == ["a.com", "b.com", "c.com", "d.com", "slow.com"]
+    assert pipeline.get_stats()["processed_count"] == 5
+
+def test_standard_pipeline_streams_qualified_prospects(tmp_path):
+    """Qualified prospects (with nested analysis objects) are streamed to JSON Lines without aborting the run."""
+    domains = ["alpha.com", "beta.com"]
+    
+    async def analyze(prospect):
+        return LeakResult(domain=prospect.domain, total_monthly_waste=500.0)
+    
+    async def qualify(prospect, leak_result):
+        qualified = QualifiedProspect(domain=prospect.domain, company_name=prospect.company_name,
+                                      monthly_waste=leak_result.total_monthly_waste, qualification_score=80)
+        qualified.technologies.append(Technology(name="Shopify", category="E-commerce"))
+        qualified.business_model = BusinessModel.ECOMMERCE
+        return qualified
+    
+    pipeline = StandardPipeline()
+    pipeline.simplified_engine = MagicMock()
+    pipeline.simplified_engine.analyze.side_effect = analyze
+    pipeline.simplified_engine.qualify.side_effect = qualify
+    
+    pipeline.open_result_stream(str(tmp_path / "results.jsonl"))
+    results = pipeline.run(domains)
+    path = pipeline.save_results(results, str(tmp_path / "results.jsonl"))
+    
+    with open(path, encoding="utf-8") as f:
+        records = [json.loads(line) for line in f]
+    assert sorted(r["domain"] for r in records[:-1]) == domains
+    assert records[0]["technologies"][0]["name"] == "Shopify"
+    assert records[0]["business_model"] == "E-commerce"
+    assert records[-1]["prospect_count"] == 2
+    
+    # A writer that cannot serialize a prospect is logged, not raised
+    pipeline.open_result_stream(str(tmp_path / "broken.jsonl"))
+    pipeline.result_writer.write = MagicMock(side_effect=TypeError("not serializable"))
+    assert [r.domain for r in pipeline.run(domains)] == domains
+
 if __name__ == "__main__":
     # Run the tests
     pytest.main(["-v", __file__])
\ No newline at end of file
@@ -0,0 +1,122 @@
+"""
+Test module for the business intelligence service.
+
+This module contains tests for collecting intelligence from the four
+collectors concurrently with per-collector and per-source timeouts.
+"""
+
+import asyncio
+import time
+from unittest.mock import Mock
+
+from arco.core.error_handler import ProcessingErrorHandler, RetryConfig
+from arco.integrations.funding_intelligence_collector import FundingIntelligenceCollector
+from arco.models.prospect import AdInvestmentProfile, FundingProfile, HiringActivity, TechnologyInvestment
+from arco.services.business_intelligence_service import BusinessIntelligenceService
+
+
+class _SlowCollector:
+    """Collector that answers after a delay, reporting timed-out sources."""
+
+    def __init__(self, profile, delay, timed_out=()):
+        self.profile = profile
+        self.delay = delay
+        self.timed_out = list(timed_out)
+
+    async def collect(self, *args, timed_out=None):
+        if timed_out is not None:
+            timed_out.extend(self.timed_out)
+        await asyncio.sleep(self.delay)
+        return self.profile
+
+
+class _FlakyCollector(_SlowCollector):
+    """Collector whose first attempt reports timed-out sources, then fails."""
+
+    def __init__(self, profile, timed_out):
+        super().__init__(profile, 0.0, timed_out)
+        self.attempts = 0
+
+    async def collect(self, *args, timed_out=None):
+        self.attempts += 1
+        if self.attempts == 1:
+            timed_out.extend(self.timed_out)
+            raise ConnectionError("connection reset")
+        return self.profile
+
+
+def _service(ad, funding, hiring, technology, collector_timeout=1.0):
+    """Create a service without retries around the given collectors."""
+    return BusinessIntelligenceService(
+        ad_intelligence_collector=ad,
+        funding_intelligence_collector=funding,
+        hiring_intelligence_collector=hiring,
+        technology_intelligence_collector=technology,
+        error_handler=ProcessingErrorHandler(retry_config=RetryConfig(max_retries=0)),
+        collector_timeout=collector_timeout
+    )
+
+
+def test_collectors_run_concurrently_with_timeouts():
+    """Test that latency is the slowest collector's and timeouts lower the quality score."""
+    profiles = {
+        "ad": AdInvestmentProfile(facebook_active=True),
+        "funding": FundingProfile(recent_funding_months=3),
+        "hiring": HiringActivity(tech_job_postings=5),
+        "technology": TechnologyInvestment(recent_website_redesign=True)
+    }
+
+    service = _service(*(_SlowCollector(profile, 0.2) for profile in profiles.values()))
+    start = time.perf_counter()
+    complete = asyncio.run(service.collect_intelligence("example.com", "Example"))
+    assert time.perf_counter() - start < 0.6
+    assert complete.timed_out_sources == []
+    assert complete.data_quality_score == 1.0
+
+    service = _service(
+        _SlowCollector(profiles["ad"], 0.01),
+        _SlowCollector(profiles["funding"], 5.0, timed_out=["funding.crunchbase"]),
+        _SlowCollector(profiles["hiring"], 0.01, timed_out=["hiring.linkedin"]),
+        _SlowCollector(profiles["technology"], 0.01),
+        collector_timeout=0.2
+    )
+    start = time.perf_counter()
+    partial = asyncio.run(service.collect_intelligence("example.com", "Example"))
+    assert time.perf_counter() - start < 1.0
+
+    assert partial.ad_investment.facebook_active
+    assert partial.funding_profile == FundingProfile()
+    assert partial.timed_out_sources == ["hiring.linkedin", "funding"]
+    # 0.75 of evidence, keeping the weights that answered: 1 - 0.25 (funding) - 0.25 / 3 (one hiring source)
+    assert abs(partial.data_quality_score - 0.75 * (1 - 0.25 - 0.25 / 3)) < 1e-9
+
+
+def test_retried_collector_reports_only_the_returned_attempts_timeouts():
+    """Test that sources that timed out in a failed attempt are not reported."""
+    hiring = _FlakyCollector(HiringActivity(tech_job_postings=5), timed_out=["hiring.linkedin"])
+    service = BusinessIntelligenceService(
+        ad_intelligence_collector=_SlowCollector(AdInvestmentProfile(), 0.0),
+        funding_intelligence_collector=_SlowCollector(FundingProfile(), 0.0, timed_out=["funding.crunchbase"]),
+        hiring_intelligence_collector=hiring,
+        technology_intelligence_collector=_SlowCollector(TechnologyInvestment(), 0.0),
+        error_handler=ProcessingErrorHandler(retry_config=RetryConfig(max_retries=1, initial_delay=0.0,
+                                                                      jitter=False))
+    )
+
+    intelligence = asyncio.run(service.collect_intelligence("example.com", "Example"))
+
+    assert hiring.attempts == 2
+    assert intelligence.hiring_activity.tech_job_postings == 5
+    assert intelligence.timed_out_sources == ["funding.crunchbase"]
+
+
+def test_collector_reports_timed_out_sources():
+    """Test that a collector keeps the sources that answered and names the ones that timed out."""
+    collector = FundingIntelligenceCollector(http_clients=Mock(), source_timeout=0.25)
+    # The placeholder Crunchbase source takes 0.3s, the other two 0.2s
+    timed_out = []
+
+    profile = asyncio.run(collector.collect("Example", timed_out=timed_out))
+
+    assert isinstance(profile, FundingProfile)
+    assert timed_out == ["funding.crunchbase"]
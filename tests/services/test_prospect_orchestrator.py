@@ -0,0 +1,71 @@
+"""
+Test module for the prospect orchestrator.
+
+This module contains tests for analyzing prospects through the adaptive
+worker pool and streaming results as they complete.
+"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+from arco.services.prospect_orchestrator import ProspectOrchestrator
+from arco.utils.concurrency_limit import AIMDConcurrencyLimit
+
+
+def _orchestrator(delays, failing=(), **limits):
+    """Create an orchestrator whose analysis sleeps for each prospect's delay."""
+    orchestrator = ProspectOrchestrator(Mock(), Mock(), concurrency_limit=AIMDConcurrencyLimit(**limits))
+    orchestrator.in_flight = orchestrator.max_in_flight = 0
+
+    async def analyze(prospect_data):
+        name = prospect_data["company_name"]
+        orchestrator.in_flight += 1
+        orchestrator.max_in_flight = max(orchestrator.max_in_flight, orchestrator.in_flight)
+        try:
+            await asyncio.sleep(delays[name])
+            if name in failing:
+                raise ConnectionError(f"{name} unreachable")
+            return SimpleNamespace(company_name=name, lead_score=SimpleNamespace(total_score=len(name)),
+                                   is_hot_lead=lambda: False)
+        finally:
+            orchestrator.in_flight -= 1
+
+    orchestrator.analyze_prospect_comprehensively = analyze
+    return orchestrator
+
+
+async def _stream(orchestrator, names):
+    """Collect streamed prospects with the time each arrived."""
+    start = time.perf_counter()
+    return [
+        (prospect.company_name, time.perf_counter() - start)
+        async for prospect in orchestrator.stream_prospects([{"company_name": name} for name in names])
+    ]
+
+
+def test_slow_prospect_does_not_stall_the_pool():
+    """Test that other prospects keep flowing through the free slots while one is slow."""
+    delays = {"slow": 0.6, **{f"p{i}": 0.03 for i in range(8)}}
+    orchestrator = _orchestrator(delays, initial=2, max_limit=2)
+
+    streamed = asyncio.run(_stream(orchestrator, delays))
+
+    # With fixed batches of 2 the slow prospect would hold back every later batch (~0.6s)
+    assert [name for name, _ in streamed[:-1]] == [f"p{i}" for i in range(8)]
+    assert streamed[-2][1] < 0.45
+    assert streamed[-1][0] == "slow"
+    assert orchestrator.max_in_flight == 2
+
+
+def test_failures_shrink_concurrency_and_are_skipped():
+    """Test that failed prospects are dropped from results and cut the limit."""
+    delays = {name: 0.01 for name in ("a", "bb", "ccc", "dddd", "fail1", "fail2")}
+    orchestrator = _orchestrator(delays, failing={"fail1", "fail2"}, initial=4, max_limit=4)
+
+    prospects = asyncio.run(orchestrator.process_prospects_batch([{"company_name": name} for name in delays]))
+
+    assert [p.company_name for p in prospects] == ["dddd", "ccc", "bb", "a"]
+    assert orchestrator.concurrency_limit.limit == 2
+    assert orchestrator.max_in_flight <= 4
@@ -218,19 +218,16 @@ class TestCleanAPIFramework:
     
     def test_rate_limiting(self):
         """Test rate limiting functionality"""
-        from api.clean_api_framework import APIRateLimiter
+        from arco.utils.rate_limiter import RateLimiter
         
-        limiter = APIRateLimiter()
+        limiter = RateLimiter({'test_api': {'requests': 5, 'period': 60}})
         
-        # Should allow initial calls
-        assert limiter.can_make_call('test_api', 5) is True
-        
-        # Record calls up to limit
+        # Should allow calls up to limit
         for i in range(5):
-            limiter.record_call('test_api')
+            assert limiter.acquire_sync('test_api', max_wait=0) is True
         
         # Should block after limit
-        assert limiter.can_make_call('test_api', 5) is False
+        assert limiter.acquire_sync('test_api', max_wait=0) is False
 
 
 class TestUnifiedLeadSystem:
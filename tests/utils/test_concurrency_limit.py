@@ -0,0 +1,65 @@
+"""
+Test module for the adaptive concurrency limit.
+
+This module contains tests for growing the limit additively on healthy
+completions and cutting it multiplicatively on errors or slow ones.
+"""
+
+from arco.utils.concurrency_limit import AIMDConcurrencyLimit
+
+
+def test_limit_grows_additively_and_backs_off_on_errors():
+    """Test that the limit grows by one per window and halves once per window of errors."""
+    limit = AIMDConcurrencyLimit(initial=4, min_limit=1, max_limit=6)
+
+    # A window of `limit` healthy completions adds one slot
+    for _ in range(4):
+        limit.record(0.1)
+    assert limit.limit == 5
+    for _ in range(5 + 6):
+        limit.record(0.1)
+    assert limit.limit == 6
+
+    # A burst of errors cuts the limit once per window instead of collapsing it
+    for _ in range(3):
+        limit.record(0.1, error=True)
+    assert limit.limit == 3
+    for _ in range(10):
+        limit.record(0.1, error=True)
+    assert limit.limit == 1
+
+    stats = limit.get_stats()
+    assert stats["errors"] == 13
+    assert stats["increases"] == 2
+    assert stats["decreases"] == 2
+
+
+def test_limit_backs_off_when_latency_degrades():
+    """Test that the limit is cut when smoothed latency exceeds the tolerance over the best seen."""
+    limit = AIMDConcurrencyLimit(initial=2, max_limit=10, latency_tolerance=2.0, smoothing=0.5)
+    for _ in range(2 + 3):
+        limit.record(0.1)
+    assert limit.limit == 4
+
+    while limit.latency <= 2.0 * limit.best_latency:
+        limit.record(1.0)
+    assert limit.limit == 2
+    assert limit.get_stats()["slow"] >= 1
+
+    ignoring = AIMDConcurrencyLimit(initial=2, latency_tolerance=0)
+    for latency in (0.1, 5.0, 5.0, 5.0, 5.0):
+        ignoring.record(latency)
+    assert ignoring.limit == 4
+
+
+def test_limit_recovers_after_a_fast_outlier():
+    """Test that one fast sample before steady slower traffic does not pin the limit down."""
+    limit = AIMDConcurrencyLimit(initial=5, max_limit=20)
+    limit.record(0.1)
+    for _ in range(500):
+        limit.record(1.0)
+
+    stats = limit.get_stats()
+    assert limit.limit == 20
+    assert stats["increases"] > 0
+    assert stats["best_latency"] > 0.5
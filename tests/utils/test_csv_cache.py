@@ -0,0 +1,64 @@
+"""
+Test module for the columnar CSV cache.
+
+This module contains tests for caching CSV imports as Arrow files.
+"""
+
+import csv
+import os
+import pytest
+
+pytest.importorskip("polars")
+
+from arco.utils.csv_cache import CSVColumnarCache, iter_rows
+
+
+def _write_csv(path, rows):
+    """Write rows to a CSV file."""
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    """Create a small Apollo-style export."""
+    path = tmp_path / "apollo-test.csv"
+    _write_csv(path, [
+        {"Company": "Glow", "Website": "glow.com", "# Employees": "25", "Industry": ""},
+        {"Company": "Iron Gym", "Website": "irongym.com", "# Employees": "007", "Industry": "Fitness"}
+    ])
+    return path
+
+
+def test_csv_cache_converts_once_and_keeps_strings(tmp_path, csv_path):
+    """Test that the CSV is parsed once and values stay as raw strings."""
+    cache = CSVColumnarCache(cache_dir=str(tmp_path / "cache"))
+
+    first = cache.load(str(csv_path))
+    second = cache.load(str(csv_path))
+
+    assert first.height == second.height == 2
+    rows = [row for batch in iter_rows(second, batch_size=1) for row in batch]
+    assert rows[1]["# Employees"] == "007"
+    assert not rows[0]["Industry"]
+    assert cache.get_stats()["misses"] == 1
+    assert cache.get_stats()["hits"] == 1
+
+
+def test_csv_cache_reparses_changed_files(tmp_path, csv_path):
+    """Test that a modified CSV replaces its cached version."""
+    cache = CSVColumnarCache(cache_dir=str(tmp_path / "cache"))
+    cache.load(str(csv_path))
+
+    _write_csv(csv_path, [{"Company": "New", "Website": "new.com", "# Employees": "1", "Industry": "Retail"}])
+    stat = os.stat(csv_path)
+    os.utime(csv_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    frame = cache.load(str(csv_path))
+
+    assert frame.height == 1
+    assert frame.to_dicts()[0]["Company"] == "New"
+    assert cache.get_stats()["misses"] == 2
+    assert len(list((tmp_path / "cache").glob("*.arrow"))) == 1
@@ -0,0 +1,76 @@
+"""
+Test module for the DNS resolver.
+
+This module contains tests for the cached, non-blocking DNS resolver.
+"""
+
+import asyncio
+import pytest
+from arco.utils.dns_resolver import DNSResolver
+
+
+class _FakeDNS:
+    """Fake lookup backend that counts queries per host."""
+
+    def __init__(self, records, failing=()):
+        self.records = records
+        self.failing = set(failing)
+        self.calls = {}
+
+    async def __call__(self, host):
+        self.calls[host] = self.calls.get(host, 0) + 1
+        await asyncio.sleep(0.01)
+        if host in self.failing:
+            raise OSError("temporary failure")
+        if host not in self.records:
+            raise LookupError(host)
+        return self.records[host], 120
+
+
+@pytest.fixture
+def resolver():
+    """Create a resolver backed by the fake lookup."""
+    resolver = DNSResolver(use_aiodns=False)
+    resolver._query_loop = _FakeDNS({"example.com": ["93.184.216.34"]}, failing={"flaky.com"})
+    return resolver
+
+
+def test_dns_resolver_caches_answers(resolver):
+    """Test that answers are cached and URLs are normalized."""
+    async def run():
+        first = await resolver.resolve("https://Example.com/path")
+        second = await resolver.resolve("example.com")
+        return first, second
+
+    first, second = asyncio.run(run())
+
+    assert first == second == ["93.184.216.34"]
+    assert resolver._query_loop.calls == {"example.com": 1}
+    assert resolver.get_stats()["hits"] == 1
+
+
+def test_dns_resolver_caches_nxdomain_but_not_failures(resolver):
+    """Test that NXDOMAIN is cached negatively while transient errors are retried."""
+    async def run():
+        for _ in range(2):
+            assert await resolver.resolves("dead.example") is False
+            assert await resolver.resolves("flaky.com") is False
+
+    asyncio.run(run())
+
+    assert resolver._query_loop.calls == {"dead.example": 1, "flaky.com": 2}
+    assert resolver.get_stats()["negative_hits"] == 1
+    assert resolver.get_cached("dead.example").resolves is False
+
+
+def test_dns_resolver_coalesces_and_bulk_resolves(resolver):
+    """Test that concurrent lookups share a query and resolve_many maps every host."""
+    async def run():
+        return await resolver.resolve_many(
+            ["example.com", "example.com", "dead.example", "example.com"], concurrency=2
+        )
+
+    results = asyncio.run(run())
+
+    assert results == {"example.com": True, "dead.example": False}
+    assert resolver._query_loop.calls["example.com"] == 1
@@ -0,0 +1,212 @@
+"""
+Test module for the HTTP response cache.
+
+This module contains tests for the persistent HTTP response cache.
+"""
+
+import asyncio
+import threading
+import pytest
+from arco.utils.http_cache import CachedResponse, HTTPResponseCache
+
+
+class _FakeResponse:
+    """Minimal stand-in for an aiohttp response."""
+
+    def __init__(self, status=200, headers=None, body=b"", url="https://example.com/"):
+        self.status = status
+        self.headers = headers or {}
+        self._body = body
+        self.url = url
+        self.history = []
+
+    async def read(self):
+        return self._body
+
+    @property
+    def content(self):
+        return self
+
+    async def iter_chunked(self, size):
+        for start in range(0, len(self._body), size):
+            yield self._body[start:start + size]
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class _FakeSession:
+    """Session that returns queued responses and records request headers."""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.requests = []
+
+    def request(self, method, url, headers=None, **kwargs):
+        self.requests.append(dict(headers or {}))
+        return self.responses.pop(0)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Create a cache backed by a temporary database."""
+    cache = HTTPResponseCache(path=str(tmp_path / "http_cache.sqlite"), default_ttl=60)
+    yield cache
+    cache.close()
+
+
+def test_http_cache_serves_fresh_entries(cache):
+    """Test that a fresh entry is served without a second request."""
+    session = _FakeSession(_FakeResponse(body=b"User-agent: *"))
+
+    first = asyncio.run(cache.fetch(session, "https://example.com/robots.txt"))
+    second = asyncio.run(cache.fetch(session, "https://example.com/robots.txt"))
+
+    assert len(session.requests) == 1
+    assert not first.from_cache
+    assert second.from_cache
+    assert second.text() == "User-agent: *"
+    assert cache.get_stats()["hits"] == 1
+
+
+def test_http_cache_revalidates_stale_entries(cache):
+    """Test that stale entries are revalidated with the stored ETag."""
+    session = _FakeSession(
+        _FakeResponse(headers={"ETag": '"v1"'}, body=b"{}"),
+        _FakeResponse(status=304)
+    )
+
+    asyncio.run(cache.fetch(session, "https://example.com/cart.js", ttl=0))
+    response = asyncio.run(cache.fetch(session, "https://example.com/cart.js", ttl=0))
+
+    assert session.requests[1]["If-None-Match"] == '"v1"'
+    assert response.revalidated
+    assert response.json() == {}
+    assert cache.get_stats()["revalidations"] == 1
+
+
+def test_http_cache_key_ignores_credentials(cache):
+    """Test that API keys do not take part in the cache key."""
+    url = "https://www.googleapis.com/pagespeedonline/v5/runPagespeed"
+    response = CachedResponse(url=url, status=200, body=b'{"ok": true}')
+
+    assert cache.put("GET", url, {"url": "example.com", "key": "secret-1"}, response)
+    assert cache.get("GET", url, {"url": "example.com", "key": "secret-2"}) is not None
+    assert cache.get("GET", url, {"url": "example.org", "key": "secret-1"}) is None
+
+
+def test_http_cache_key_includes_response_headers(cache):
+    """Test that requests differing in Accept or Authorization get separate entries."""
+    url = "https://api.example.com/company"
+    session = _FakeSession(
+        _FakeResponse(body=b'{"format": "json"}', url=url),
+        _FakeResponse(body=b"<company/>", url=url),
+        _FakeResponse(body=b'{"user": "a"}', url=url)
+    )
+
+    as_json = asyncio.run(cache.fetch(session, url, headers={"Accept": "application/json"}))
+    as_xml = asyncio.run(cache.fetch(session, url, headers={"Accept": "application/xml"}))
+    other_user = asyncio.run(cache.fetch(session, url, headers={"Accept": "application/json",
+                                                                "Authorization": "Bearer a"}))
+    again = asyncio.run(cache.fetch(session, url, headers={"accept": "application/json", "User-Agent": "x"}))
+
+    assert len(session.requests) == 3
+    assert (as_json.body, as_xml.body, other_user.body) == (b'{"format": "json"}', b"<company/>", b'{"user": "a"}')
+    assert again.from_cache and again.body == b'{"format": "json"}'
+
+
+def test_http_cache_fetch_keeps_sqlite_off_the_event_loop(cache, monkeypatch):
+    """Test that fetch() reads and writes the database from a worker thread."""
+    loop_threads = set()
+    lookup, put = cache.lookup, cache.put
+
+    def record(method):
+        def wrapper(*args, **kwargs):
+            loop_threads.add(threading.current_thread() is threading.main_thread())
+            return method(*args, **kwargs)
+        return wrapper
+
+    monkeypatch.setattr(cache, "lookup", record(lookup))
+    monkeypatch.setattr(cache, "put", record(put))
+    session = _FakeSession(_FakeResponse(body=b"ok"))
+
+    asyncio.run(cache.fetch(session, "https://example.com/"))
+    asyncio.run(cache.fetch(session, "https://example.com/"))
+
+    assert loop_threads == {False}
+    assert cache.get_stats()["hits"] == 1
+
+
+def test_http_cache_skips_uncacheable_responses(cache):
+    """Test that errors and no-store responses are not stored."""
+    url = "https://example.com/"
+
+    assert not cache.put("GET", url, None, CachedResponse(url=url, status=500))
+    assert not cache.put("GET", url, None, CachedResponse(url=url, status=200, headers={"Cache-Control": "no-store"}))
+    assert not cache.put("POST", url, None, CachedResponse(url=url, status=200))
+    assert cache.get("GET", url) is None
+
+
+def test_http_cache_keys_truncated_bodies_on_the_read_limits(cache):
+    """Test that a body cut at max_bytes is stored for requests with the same cap only."""
+    url = "https://example.com/"
+    session = _FakeSession(_FakeResponse(body=b"x" * 100), _FakeResponse(body=b"y" * 50))
+
+    truncated = asyncio.run(cache.fetch(session, url, max_bytes=80))
+    truncated_again = asyncio.run(cache.fetch(session, url, max_bytes=80))
+    uncapped = asyncio.run(cache.fetch(session, url))
+
+    assert truncated.truncated and truncated.body == b"x" * 80
+    assert truncated_again.from_cache and truncated_again.truncated and truncated_again.body == b"x" * 80
+    assert not uncapped.truncated and uncapped.body == b"y" * 50
+    assert len(session.requests) == 2
+    assert cache.get("GET", url).body == b"y" * 50
+
+
+def test_http_cache_stops_reading_after_head(cache):
+    """Test that a head_only fetch stops downloading after </head> and is cached for head_only reads."""
+    url = "https://example.com/"
+    body = b"<html><HEAD><title>x</title></HEAD>" + b"<body>" + b"z" * 1000 + b"</body></html>"
+    response = _FakeResponse(body=body)
+    chunks_read = []
+
+    async def iter_chunked(size):
+        for start in range(0, len(body), 8):
+            chunks_read.append(start)
+            yield body[start:start + 8]
+
+    response.iter_chunked = iter_chunked
+    session = _FakeSession(response)
+
+    head = asyncio.run(cache.fetch(session, url, max_bytes=4096, head_only=True))
+    head_again = asyncio.run(cache.fetch(session, url, max_bytes=4096, head_only=True))
+
+    assert head.truncated and head.body == b"<html><HEAD><title>x</title></HEAD>"
+    assert len(chunks_read) == 5
+    assert head_again.from_cache and head_again.body == head.body
+    assert len(session.requests) == 1
+    assert cache.get("GET", url) is None
+
+
+def test_http_cache_keys_redirect_policy_per_client(cache):
+    """Test that a 301 stored by a non-following httpx client is not served to aiohttp."""
+    httpx = pytest.importorskip("httpx")
+    url = "https://example.com/"
+    transport = httpx.MockTransport(lambda request: httpx.Response(301, headers={"Location": "https://www.example.com/"}))
+    session = _FakeSession(_FakeResponse(body=b"<html></html>", url="https://www.example.com/"))
+
+    async def fetch_both():
+        async with httpx.AsyncClient(transport=transport) as client:
+            redirect = await cache.fetch(client, url)
+            redirect_again = await cache.fetch(client, url)
+        followed = await cache.fetch(session, url)
+        return redirect, redirect_again, followed
+
+    redirect, redirect_again, followed = asyncio.run(fetch_both())
+
+    assert redirect.status == 301 and redirect_again.from_cache
+    assert followed.status == 200 and not followed.from_cache
+    assert len(session.requests) == 1
@@ -0,0 +1,106 @@
+"""
+Test module for the streaming page reader.
+
+This module contains tests for decoding and signature-scanning page bodies
+chunk by chunk under a byte cap.
+"""
+
+import asyncio
+import random
+
+from arco.utils import page_stream
+from arco.utils.page_stream import PageBodyReader, read_page_body
+from arco.utils.signatures import scan_signatures
+
+PAGE = (
+    "<html><head><title>Café Ünïcode – Store</title>"
+    '<script src="https://static.klaviyo.com/onsite/js/klaviyo.js"></script>'
+    '<script src="https://us12.api.mailchimp.com/x.js"></script>'
+    "</HEAD><body>"
+    '<div data-yotpo="yotpo.com/v1/subscription-widget">€€€</div>'
+    '<link href="//cdn.shopify.com/s/files/theme.css">'
+    "</body></html>"
+)
+
+
+class _FakeContent:
+    """Minimal stand-in for an aiohttp response stream that counts reads."""
+
+    def __init__(self, body):
+        self._body = body
+        self.reads = 0
+
+    async def iter_chunked(self, size):
+        for start in range(0, len(self._body), size):
+            self.reads += 1
+            yield self._body[start:start + size]
+
+
+class _FakeResponse:
+    """Minimal stand-in for an aiohttp response."""
+
+    def __init__(self, body, charset="utf-8"):
+        self.charset = charset
+        self.content = _FakeContent(body)
+        self.url = "https://example.com/"
+
+
+def _read_in_chunks(data, sizes, **kwargs):
+    """Feed bytes to a reader in chunks of the given sizes."""
+    reader = PageBodyReader(**kwargs)
+    rng = random.Random(sizes)
+    start = 0
+    while start < len(data):
+        size = rng.randint(1, sizes)
+        if not reader.feed(data[start:start + size]):
+            break
+        start += size
+    return reader.close()
+
+
+def test_chunked_read_matches_whole_page():
+    """Test that any chunking decodes and scans the page like a one-shot read."""
+    data = PAGE.encode("utf-8")
+    expected = scan_signatures(PAGE)
+
+    for sizes in (1, 3, 7, 64, len(data)):
+        page = _read_in_chunks(data, sizes, max_bytes=0)
+        assert page.text == PAGE
+        assert page.text_lower == PAGE.lower()
+        assert page.bytes_read == len(data)
+        assert page.truncated is None
+        assert page.signature_hits.offsets == expected.offsets
+        assert page.signature_hits.vendors("leak_scanner") == ["mailchimp", "yotpo_subscriptions"]
+
+
+def test_read_stops_at_byte_cap_and_head():
+    """Test that reading stops at the byte cap or right after </head>."""
+    page_stream._stats.reset()
+    data = PAGE.encode("utf-8")
+
+    capped = _read_in_chunks(data, 5, max_bytes=40)
+    assert capped.truncated == page_stream.TRUNCATED_MAX_BYTES
+    assert capped.text == data[:40].decode("utf-8", errors="replace")
+
+    head = _read_in_chunks(data, 5, max_bytes=0, head_only=True)
+    assert head.truncated == page_stream.TRUNCATED_HEAD
+    assert head.text == PAGE[:PAGE.index("</HEAD>") + len("</HEAD>")]
+    assert head.signature_hits.vendors("footprint") == ["klaviyo", "mailchimp"]
+    assert head.bytes_read < len(data)
+
+    stats = page_stream.get_page_stream_stats()
+    assert stats["pages"] == 2
+    assert stats["stopped_at_max_bytes"] == 1
+    assert stats["stopped_at_head"] == 1
+    assert stats["bytes_kept"] == 40 + len(head.text.encode("utf-8"))
+
+
+def test_read_page_body_stops_downloading():
+    """Test that the response stream is not read past the cap."""
+    response = _FakeResponse(PAGE.encode("utf-8") * 100)
+
+    page = asyncio.run(read_page_body(response, max_bytes=1000, head_only=False, chunk_size=100))
+
+    assert page.truncated == page_stream.TRUNCATED_MAX_BYTES
+    assert len(page.text.encode("utf-8")) <= 1000
+    assert response.content.reads == 11
@@ -0,0 +1,165 @@
+"""
+Test module for the PageSpeed Insights result store.
+
+This module contains tests for the PageSpeed result store.
+"""
+
+import asyncio
+import threading
+import time
+import pytest
+from arco.utils.pagespeed_store import PageSpeedRecord, PageSpeedStore
+
+
+def _psi_response(lcp_ms=2500.0, score=0.8):
+    """Build a minimal PageSpeed Insights response."""
+    return {
+        "lighthouseResult": {
+            "categories": {"performance": {"score": score}},
+            "audits": {
+                "largest-contentful-paint": {"numericValue": lcp_ms},
+                "cumulative-layout-shift": {"numericValue": 0.05},
+                "server-response-time": {"numericValue": 320.0}
+            }
+        }
+    }
+
+
+class _Fetcher:
+    """Fetcher that counts calls and yields to the loop before returning."""
+
+    def __init__(self, lcp_ms=2500.0):
+        self.lcp_ms = lcp_ms
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        return _psi_response(self.lcp_ms)
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Create a store backed by a temporary database."""
+    store = PageSpeedStore(path=str(tmp_path / "pagespeed.sqlite3"), fresh_ttl=60, max_stale=3600)
+    yield store
+    store.close()
+
+
+def test_pagespeed_store_serves_fresh_results(store):
+    """Test that a fresh result is served without calling PSI again."""
+    fetcher = _Fetcher()
+
+    first = asyncio.run(store.get("https://Example.com/", "mobile", fetcher))
+    second = asyncio.run(store.get("example.com", "mobile", fetcher))
+
+    assert fetcher.calls == 1
+    assert first.lcp == 2.5
+    assert first.score == 80.0
+    assert second.ttfb == 320.0
+    assert second.lighthouse == _psi_response()
+    assert store.get_stats()["hits"] == 1
+
+
+def test_pagespeed_record_keeps_zero_metrics():
+    """Test that a zero numericValue is kept rather than read as missing."""
+    data = _psi_response()
+    data["lighthouseResult"]["audits"]["cumulative-layout-shift"]["numericValue"] = 0
+
+    record = PageSpeedRecord.from_response("example.com", "mobile", data)
+
+    assert record.cls == 0.0
+    assert record.fid is None
+
+
+def test_pagespeed_store_coalesces_concurrent_requests(store):
+    """Test that concurrent requests for one domain share a single PSI call."""
+    fetcher = _Fetcher()
+
+    async def run():
+        return await asyncio.gather(*(store.get("example.com", "mobile", fetcher) for _ in range(5)))
+
+    results = asyncio.run(run())
+
+    assert fetcher.calls == 1
+    assert all(r.lcp == 2.5 for r in results)
+    assert store.get_stats()["coalesced"] == 4
+
+
+def test_pagespeed_store_serves_stale_while_revalidating(store):
+    """Test that stale results are served immediately and refreshed in the background."""
+    stale = PageSpeedRecord.from_response("example.com", "mobile", _psi_response(4000.0))
+    stale.fetched_at = time.time() - 120
+    store.save(stale)
+    fetcher = _Fetcher(lcp_ms=1800.0)
+
+    async def run():
+        served = await store.get("example.com", "mobile", fetcher)
+        await asyncio.sleep(0.05)
+        return served
+
+    served = asyncio.run(run())
+
+    assert served.lcp == 4.0
+    assert fetcher.calls == 1
+    assert store.load("example.com", "mobile").lcp == 1.8
+    assert store.get_stats()["stale_hits"] == 1
+
+
+def test_pagespeed_store_keeps_strategies_separate(store):
+    """Test that mobile and desktop results are stored independently."""
+    asyncio.run(store.get("example.com", "mobile", _Fetcher(lcp_ms=3000.0)))
+    asyncio.run(store.get("example.com", "desktop", _Fetcher(lcp_ms=1000.0)))
+
+    assert store.load("example.com", "mobile").lcp == 3.0
+    assert store.load("example.com", "desktop").lcp == 1.0
+
+
+def test_pagespeed_store_does_not_store_invalid_results(store):
+    """Test that a PSI response without LCP is returned but never stored."""
+    fetcher = _Fetcher(lcp_ms=None)
+
+    first = asyncio.run(store.get("example.com", "mobile", fetcher))
+    second = asyncio.run(store.get("example.com", "mobile", fetcher))
+
+    assert first is not None and not first.is_valid
+    assert second is not None and not second.is_valid
+    assert fetcher.calls == 2
+    assert store.load("example.com", "mobile") is None
+    assert store.get_stats()["invalid"] == 2
+
+    # A failed refresh keeps serving the last valid result
+    stale = PageSpeedRecord.from_response("example.com", "mobile", _psi_response(4000.0))
+    stale.fetched_at = time.time() - 120
+    store.save(stale)
+
+    async def run():
+        await store.get("example.com", "mobile", fetcher)
+        await asyncio.sleep(0.05)
+
+    asyncio.run(run())
+
+    assert fetcher.calls == 3
+    assert store.load("example.com", "mobile").lcp == 4.0
+
+
+def test_pagespeed_store_keeps_sqlite_off_the_event_loop(store, monkeypatch):
+    """Test that get() reads and writes the database from a worker thread."""
+    loop_threads = set()
+    load, save = store.load, store.save
+
+    def record(method):
+        def wrapper(*args, **kwargs):
+            loop_threads.add(threading.current_thread() is threading.main_thread())
+            return method(*args, **kwargs)
+        return wrapper
+
+    monkeypatch.setattr(store, "load", record(load))
+    monkeypatch.setattr(store, "save", record(save))
+    fetcher = _Fetcher()
+
+    asyncio.run(store.get("example.com", "mobile", fetcher))
+    asyncio.run(store.get("example.com", "mobile", fetcher))
+
+    assert loop_threads == {False}
+    assert fetcher.calls == 1
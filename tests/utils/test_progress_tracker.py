@@ -0,0 +1,172 @@
+"""
+Test module for the progress tracker.
+
+This module contains tests for journaled lead progress tracking.
+"""
+
+import json
+import threading
+import pytest
+from arco.utils.progress_tracker import ProgressTracker, ProgressStage
+
+
+@pytest.fixture
+def open_tracker(tmp_path):
+    """Open (or reopen) a tracker on a temporary storage directory."""
+    def open_tracker(**kwargs):
+        ProgressTracker._instance = None
+        return ProgressTracker(storage_dir=str(tmp_path), **kwargs)
+
+    yield open_tracker
+    ProgressTracker._instance = None
+
+
+def test_progress_tracker_replays_journal(open_tracker):
+    """Test that leads, stages and errors survive a restart."""
+    tracker = open_tracker()
+    lead_id = tracker.add_lead("glow.com", "Glow")
+    tracker.update_stage(lead_id, ProgressStage.ENRICHED_BASIC, {"source": "apollo_csv"})
+    tracker.update_stage(lead_id, ProgressStage.ANALYZED)
+    tracker.add_error(lead_id, ProgressStage.ANALYZED, "timeout")
+
+    assert tracker.add_lead("glow.com") == lead_id
+    assert tracker.update_stage(lead_id, "unknown") is False
+
+    reopened = open_tracker()
+    lead = reopened.get_lead_by_domain("glow.com")
+
+    assert lead.lead_id == lead_id
+    assert lead.current_stage == ProgressStage.ANALYZED
+    assert lead.metadata == {ProgressStage.ENRICHED_BASIC: {"source": "apollo_csv"}}
+    assert lead.stage_history == tracker.get_lead(lead_id).stage_history
+    assert [error["message"] for error in lead.errors] == ["timeout"]
+    assert reopened.add_lead("glow.com") == lead_id
+
+
+def test_progress_tracker_compacts_journal(open_tracker):
+    """Test that the journal is folded into snapshots once it reaches the threshold."""
+    tracker = open_tracker(compact_threshold=3)
+    first = tracker.add_lead("glow.com")
+    tracker.update_stage(first, ProgressStage.QUALIFIED)
+    second = tracker.add_lead("irongym.com")
+    tracker.update_stage(second, ProgressStage.CONTACTED)
+
+    snapshots, events, _ = tracker.journal.load()
+    assert len(snapshots) == 2
+    assert [event for _, _, event, _ in events] == ["stage"]
+
+    reopened = open_tracker()
+    assert reopened.get_lead(first).current_stage == ProgressStage.QUALIFIED
+    assert reopened.get_lead(second).current_stage == ProgressStage.CONTACTED
+
+
+def test_progress_tracker_imports_legacy_json_once(tmp_path, open_tracker):
+    """Test that the JSON file of earlier versions is imported only once."""
+    (tmp_path / "lead_progress.json").write_text(json.dumps({"leads": [
+        {"lead_id": "lead-1", "domain": "glow.com", "current_stage": "qualified",
+         "stage_history": {"imported": {"timestamp": "2025-07-19T14:30:53", "duration": 0}}}
+    ]}))
+
+    tracker = open_tracker()
+    assert tracker.get_lead_by_domain("glow.com").current_stage == ProgressStage.QUALIFIED
+
+    tracker.clear()
+    assert open_tracker().get_lead("lead-1") is None
+
+
+def test_progress_tracker_shares_journal_between_writers(open_tracker):
+    """Test that trackers on one storage directory see each other's changes."""
+    first = open_tracker(compact_threshold=4)
+    second = open_tracker(compact_threshold=4)
+
+    lead_id = first.add_lead("glow.com")
+    assert second.add_lead("glow.com") == lead_id
+
+    second.update_stage(lead_id, ProgressStage.QUALIFIED)
+    assert first.get_lead(lead_id).current_stage == ProgressStage.QUALIFIED
+
+    # Compaction by one writer must not lose the other's events
+    for i in range(5):
+        first.update_stage(first.add_lead(f"store{i}.com"), ProgressStage.ANALYZED)
+    second.update_stage(lead_id, ProgressStage.CONTACTED)
+    assert first.get_stage_counts()[ProgressStage.ANALYZED] == 5
+    assert first.get_lead(lead_id).current_stage == ProgressStage.CONTACTED
+
+    second.clear()
+    assert first.get_lead_by_domain("glow.com") is None
+
+
+def test_progress_tracker_concurrent_threads(open_tracker):
+    """Test that concurrent updates from several threads are all kept."""
+    tracker = open_tracker(compact_threshold=25)
+
+    def worker(n):
+        for i in range(20):
+            lead_id = tracker.add_lead(f"store{i}.com")
+            tracker.update_stage(lead_id, ProgressStage.ENRICHED_BASIC, {f"worker{n}": i})
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    reopened = open_tracker()
+    assert len(reopened.leads) == 20
+    metadata = reopened.get_lead_by_domain("store7.com").metadata[ProgressStage.ENRICHED_BASIC]
+    assert metadata == {f"worker{n}": 7 for n in range(4)}
+
+
+def test_progress_tracker_incremental_analytics(open_tracker):
+    """Test that running aggregates match a full walk over the leads."""
+    tracker = open_tracker(compact_threshold=7)
+    path = [ProgressStage.ENRICHED_BASIC, ProgressStage.ANALYZED, ProgressStage.QUALIFIED]
+    for i in range(6):
+        lead_id = tracker.add_lead(f"store{i}.com")
+        for stage in path[:i % 4]:
+            tracker.update_stage(lead_id, stage)
+    tracker.update_stage(tracker.add_lead("store0.com"), ProgressStage.ANALYZED)
+
+    def walk(tracker):
+        counts, durations = {}, {}
+        for lead in tracker.leads.values():
+            counts[lead.current_stage] = counts.get(lead.current_stage, 0) + 1
+            for stage, entry in lead.stage_history.items():
+                if stage != lead.current_stage:
+                    durations.setdefault(stage, []).append(entry["duration"])
+        return counts, {stage: sum(values) / len(values) for stage, values in durations.items()}
+
+    for current in (tracker, open_tracker()):
+        counts, averages = walk(current)
+        assert {stage: n for stage, n in current.get_stage_counts().items() if n} == counts
+        assert {stage: avg for stage, avg in current.get_average_durations().items()
+                if stage in averages} == pytest.approx(averages)
+
+    transitions = tracker.get_transition_counts()
+    assert transitions[ProgressStage.IMPORTED][ProgressStage.ENRICHED_BASIC] == 4
+    assert transitions[ProgressStage.IMPORTED][ProgressStage.ANALYZED] == 1
+    assert transitions[ProgressStage.ANALYZED][ProgressStage.QUALIFIED] == 1
+
+    activity = tracker.get_recent_activity(3600)
+    assert activity[ProgressStage.IMPORTED] == 6
+    assert activity[ProgressStage.ANALYZED] == 3
+    assert tracker.get_summary()["activity"]["last_day"] == activity
+
+
+def test_progress_tracker_repeated_transitions_survive_compaction(open_tracker):
+    """Test that transitions a lead repeats are still counted once the journal is compacted."""
+    tracker = open_tracker(compact_threshold=4)
+    lead_id = tracker.add_lead("glow.com")
+    for stage in (ProgressStage.ANALYZED, ProgressStage.QUALIFIED) * 3:
+        tracker.update_stage(lead_id, stage)
+
+    snapshots, events, _ = tracker.journal.load()
+    assert len(snapshots) == 1 and len(events) < 7
+
+    live = tracker.get_transition_counts()
+    assert live[ProgressStage.ANALYZED][ProgressStage.QUALIFIED] == 3
+    assert live[ProgressStage.QUALIFIED][ProgressStage.ANALYZED] == 2
+
+    reopened = open_tracker()
+    assert reopened.get_transition_counts() == live
+    assert reopened.get_recent_activity(3600) == tracker.get_recent_activity(3600)
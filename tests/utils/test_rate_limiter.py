@@ -0,0 +1,60 @@
+"""
+Test module for the rate limiter.
+
+This module contains tests for the per-provider token bucket scheduler.
+"""
+
+import asyncio
+import time
+from arco.utils.rate_limiter import RateLimiter, parse_retry_after
+
+
+def test_rate_limiter_spaces_requests_after_burst():
+    """Test that callers beyond the burst wait for refilled tokens in order."""
+    limiter = RateLimiter({"api": {"requests": 20, "period": 1, "burst": 2}})
+
+    async def run():
+        start = time.monotonic()
+        await asyncio.gather(*(limiter.acquire("api") for _ in range(4)))
+        return time.monotonic() - start
+
+    elapsed = asyncio.run(run())
+
+    # Two requests go out immediately, the next two wait 50ms each
+    assert 0.08 <= elapsed < 0.5
+    assert limiter.get_stats()["api"]["acquired"] == 4
+
+
+def test_rate_limiter_rejects_beyond_max_wait():
+    """Test that max_wait returns False without consuming a slot."""
+    limiter = RateLimiter({"api": {"requests": 1, "period": 60}})
+
+    assert limiter.acquire_sync("api", max_wait=0) is True
+    assert limiter.acquire_sync("api", max_wait=0) is False
+    assert limiter.get_stats()["api"]["rejected"] == 1
+
+
+def test_rate_limiter_honors_retry_after():
+    """Test that a 429 with Retry-After pauses the provider."""
+    limiter = RateLimiter({"api": {"requests": 100, "period": 1}})
+
+    limiter.record_response("api", 429, {"Retry-After": "30"})
+
+    assert limiter.acquire_sync("api", max_wait=10) is False
+    assert limiter.get_stats()["api"]["throttled"] == 1
+
+
+def test_rate_limiter_ignores_unknown_providers():
+    """Test that providers without a quota are not limited."""
+    limiter = RateLimiter({})
+
+    assert asyncio.run(limiter.acquire("unknown")) is True
+    limiter.record_response("unknown", 429)
+
+
+def test_parse_retry_after():
+    """Test parsing Retry-After delays and HTTP dates."""
+    assert parse_retry_after("12") == 12.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
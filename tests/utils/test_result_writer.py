@@ -0,0 +1,55 @@
+"""
+Test module for the streaming result writer.
+
+This module contains tests for JSON Lines result output.
+"""
+
+import gzip
+import json
+import pytest
+
+from arco.utils import result_writer
+from arco.utils.result_writer import JSONLResultWriter, is_jsonl_path
+
+
+def _read_lines(path, opener=open):
+    """Read every JSON record of a JSON Lines file."""
+    with opener(path, "rt", encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+@pytest.mark.parametrize("name, opener", [("results.jsonl", open), ("results.jsonl.gz", gzip.open)])
+def test_result_writer_streams_records(tmp_path, name, opener):
+    """Test that prospects are readable before the trailer is written."""
+    writer = JSONLResultWriter(str(tmp_path / name))
+    writer.write({"domain": "glow.com", "qualification_score": 80})
+
+    if opener is open:
+        assert _read_lines(writer.path) == [{"domain": "glow.com", "qualification_score": 80}]
+
+    writer.write({"domain": "irongym.com", "qualification_score": 65})
+    path = writer.close({"pipeline_type": "standard", "stats": {"qualified_count": 2}})
+
+    records = _read_lines(path, opener)
+    assert [record["domain"] for record in records[:-1]] == ["glow.com", "irongym.com"]
+    assert records[-1]["_type"] == "trailer"
+    assert records[-1]["prospect_count"] == 2
+    assert records[-1]["stats"] == {"qualified_count": 2}
+
+    with pytest.raises(ValueError):
+        writer.write({"domain": "late.com"})
+
+
+@pytest.mark.skipif(not result_writer.ORJSON_AVAILABLE, reason="orjson is not installed")
+def test_result_writer_serializers_agree(tmp_path):
+    """Test that orjson and json output decode to the same records."""
+    record = {"domain": "glow.com", "technologies": ["Shopify"], "revenue": 1.5e6, "city": "São Paulo"}
+    for serializer in ("orjson", "json"):
+        with JSONLResultWriter(str(tmp_path / f"{serializer}.jsonl"), serializer=serializer) as writer:
+            writer.write(record)
+
+    orjson_records, json_records = (_read_lines(tmp_path / f"{name}.jsonl") for name in ("orjson", "json"))
+    assert orjson_records[0] == json_records[0] == record
+    assert orjson_records[-1]["complete"] is json_records[-1]["complete"] is True
+    assert is_jsonl_path("out/results.JSONL.gz")
+    assert not is_jsonl_path("out/results.json")
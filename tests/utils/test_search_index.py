@@ -0,0 +1,50 @@
+"""
+Test module for the search index.
+
+This module contains tests for the inverted full-text search index.
+"""
+
+import pytest
+from arco.utils.search_index import SearchIndex, tokenize
+
+
+@pytest.fixture
+def index():
+    """Create an index with a few store records."""
+    index = SearchIndex({"company": 3.0, "website": 2.0, "description": 1.0}, {"site": "website"})
+    index.add(1, {"company": "Glow Skincare", "website": "https://glow.myshopify.com",
+                  "description": "Vitamin C serum. Add to cart today"})
+    index.add(2, {"company": "Serum Labs", "website": "https://serumlabs.com",
+                  "description": "Clinical skincare serums"})
+    index.add(3, {"company": "Iron Gym", "website": "https://irongym.com",
+                  "description": "Home gym equipment, cart and checkout"})
+    return index
+
+
+def test_tokenize():
+    """Test that text is split into lowercase alphanumeric tokens."""
+    assert tokenize("Add-to-Cart $25.00 USD") == ["add", "to", "cart", "25", "00", "usd"]
+    assert tokenize("") == []
+
+
+def test_search_ranks_field_and_prefix_matches(index):
+    """Test that exact matches in heavier fields rank first and prefixes match."""
+    results = index.search("serum")
+
+    assert [doc_id for doc_id, _ in results] == [2, 1]
+    assert [doc_id for doc_id, _ in index.search("skin")] == [1, 2]
+
+
+def test_search_requires_every_clause(index):
+    """Test multi-term, phrase and field-scoped queries."""
+    assert [doc_id for doc_id, _ in index.search('"add to cart" site:myshopify.com "serum"')] == [1]
+    assert [doc_id for doc_id, _ in index.search('"cart and checkout"')] == [3]
+    assert index.search('"to add cart"') == []
+    assert [doc_id for doc_id, _ in index.search("site:serum")] == [2]
+    assert index.search("serum gym") == []
+
+
+def test_search_limit_and_empty_query(index):
+    """Test result limits and that an empty query returns every document."""
+    assert len(index.search("skincare", limit=1)) == 1
+    assert [doc_id for doc_id, _ in index.search("")] == [1, 2, 3]
@@ -0,0 +1,78 @@
+"""
+Test module for the signature matcher.
+
+This module contains tests for scanning pages for every vendor and
+technology signature in one pass.
+"""
+
+import random
+import re
+
+import pytest
+
+from arco.utils import signatures
+from arco.utils.signatures import SIGNATURES, RegexSignature, SignatureMatcher, scan_signatures
+
+PAGE = (
+    '<script src="https://static.klaviyo.com/onsite/js/klaviyo.js"></script>'
+    '<link href="//cdn.shopify.com/s/files/theme.css">'
+    '<script src="https://us12.api.mailchimp.com/x.js"></script>'
+    '<div data-yotpo="yotpo.com/v1/subscription-widget"></div>'
+    '<script src="/js/jQuery-3.6.0.min.js"></script>'
+)
+
+
+@pytest.fixture(params=["aho-corasick", "find"])
+def matcher(request, monkeypatch):
+    """Compile the registry with each literal search backend."""
+    if request.param == "aho-corasick":
+        pytest.importorskip("ahocorasick")
+    else:
+        monkeypatch.setattr(signatures, "AHOCORASICK_AVAILABLE", False)
+    return SignatureMatcher()
+
+
+def _legacy_vendors(group, page):
+    """Detect the vendors of a group with one search per signature."""
+    page = page.lower()
+    return [
+        vendor for vendor, vendor_signatures in SIGNATURES[group].items()
+        if any(re.search(signature.pattern, page) if isinstance(signature, RegexSignature) else signature in page
+               for signature in vendor_signatures)
+    ]
+
+
+def test_scan_reports_every_match_with_offsets(matcher):
+    """Test that overlapping literals and anchored regexes all report their offsets."""
+    hits = matcher.scan(PAGE)
+    lowered = PAGE.lower()
+
+    assert hits.get("static.klaviyo.com") == [lowered.index("static.klaviyo.com")]
+    assert hits.get("klaviyo.com") == [lowered.index("klaviyo.com")]
+    assert hits.get("klaviyo") == [m.start() for m in re.finditer("klaviyo", lowered)]
+    assert hits.get("zendesk.com") == []
+
+    assert hits.vendors("footprint") == ["klaviyo", "mailchimp", "yotpo", "shopify"]
+    assert hits.vendors("leak_scanner") == ["mailchimp", "yotpo_subscriptions"]
+    assert list(hits.group("leak_scanner")["mailchimp"]) == [SIGNATURES["leak_scanner"]["mailchimp"][1]]
+    assert hits.vendors("technology") == ["jquery"]
+    assert hits.first_match(SIGNATURES["technology"]["jquery"][0]).group(1) == "3.6.0"
+    assert matcher.scan("jquery.min.js").first_match(SIGNATURES["technology"]["jquery"][0]) is None
+
+    # Regex signatures are not run without their anchors
+    assert matcher.scan("us12.api.example.com yotpo.com").vendors("leak_scanner") == []
+
+
+def test_scan_matches_per_signature_search(matcher):
+    """Test that one scan finds the same vendors as searching for each signature."""
+    rng = random.Random(5)
+    vocabulary = [signature for vendors in SIGNATURES.values() for vendor_signatures in vendors.values()
+                  for signature in vendor_signatures if isinstance(signature, str)]
+    vocabulary += ["lorem", "ipsum", "<div>", "US7.API.MAILCHIMP.COM", "yotpo.com/subscription", "Shopify"]
+
+    for _ in range(50):
+        page = " ".join(rng.choice(vocabulary) for _ in range(rng.randint(0, 15)))
+        hits = matcher.scan(page)
+        for group in SIGNATURES:
+            assert hits.vendors(group) == _legacy_vendors(group, page)
+        assert hits.offsets == scan_signatures(page.lower(), lowered=True).offsets